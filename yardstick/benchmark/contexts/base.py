@@ -132,6 +132,21 @@ class Context(object):
         """Undeploy context."""
         self._delete_context()
 
+    def get_checkpoint(self):
+        """Return the handles of the deployed context, stored in the task
+        checkpoint (e.g. a stack ID)
+        """
+        return {}
+
+    def resume(self, handles):  # pylint: disable=unused-argument
+        """Reattach to a context deployed by an interrupted task
+
+        By default, the context is deployed again.
+
+        :param handles: (dict) handles returned by ``get_checkpoint``
+        """
+        self.deploy()
+
     def _delete_context(self):
         Context.list.remove(self)
 
@@ -335,10 +335,7 @@ class HeatContext(Context):
         """deploys template into a stack using cloud"""
         LOG.info("Deploying context '%s' START", self.name)
 
-        self.key_filename = ''.join(
-            [consts.YARDSTICK_ROOT_PATH,
-             'yardstick/resources/files/yardstick_key-',
-             self.name])
+        self._set_key_filename()
         # Permissions may have changed since creation; this can be fixed. If we
         # overwrite the file, we lose future access to VMs using this key.
         # As long as the file exists, even if it is unreadable, keep it intact
@@ -362,6 +359,42 @@ class HeatContext(Context):
         else:
             self.stack = self._create_new_stack(heat_template)
 
+        self._update_servers()
+
+        LOG.info("Deploying context '%s' DONE", self.name)
+
+    def get_checkpoint(self):
+        """Return the name and ID of the deployed stack"""
+        if not self.stack:
+            return {}
+        return {'stack_name': self.stack.name, 'stack_id': self.stack.uuid}
+
+    def resume(self, handles):
+        """Reattach to the stack deployed by an interrupted task
+
+        The stack is deployed again if it does not exist anymore.
+        """
+        stack = None
+        if handles.get('stack_name'):
+            stack = self._retrieve_existing_stack(handles['stack_name'])
+        if not stack or stack.uuid != handles.get('stack_id'):
+            LOG.warning("Stack of context '%s' not found, deploying it again",
+                        self.name)
+            self.deploy()
+            return
+
+        LOG.info("Resuming context '%s' on stack %s", self.name, stack.uuid)
+        self._set_key_filename()
+        self.stack = stack
+        self._update_servers()
+
+    def _set_key_filename(self):
+        self.key_filename = ''.join(
+            [consts.YARDSTICK_ROOT_PATH,
+             'yardstick/resources/files/yardstick_key-',
+             self.name])
+
+    def _update_servers(self):
         # TODO: use Neutron to get segmentation-id
         self.get_neutron_info()
 
@@ -374,8 +407,6 @@ class HeatContext(Context):
                 server.public_ip = \
                     self.stack.outputs[server.floating_ip["stack_name"]]
 
-        LOG.info("Deploying context '%s' DONE", self.name)
-
     @staticmethod
     def _port_net_is_existing(port_info):
         net_flags = port_info.get('net_flags', {})
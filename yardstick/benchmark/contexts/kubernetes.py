@@ -10,7 +10,6 @@
 import collections
 import logging
 import pkg_resources
-import time
 
 import paramiko
 
@@ -38,6 +37,8 @@ class KubernetesContext(ctx_base.Context):
         self.key_path = ''
         self.public_key_path = ''
         self.template = None
+        self._cache = None
+        self._node_ip = None
         super(KubernetesContext, self).__init__(host_name_separator='-')
 
     def init(self, attrs):
@@ -51,6 +52,7 @@ class KubernetesContext(ctx_base.Context):
         self._networks = collections.OrderedDict(
             (net_name, model.Network(net_name, self, network))
             for net_name, network in networks.items())
+        self._cache = k8s_utils.NamespaceCache()
 
     def deploy(self):
         LOG.info('Creating ssh key')
@@ -61,8 +63,6 @@ class KubernetesContext(ctx_base.Context):
         LOG.info('Launch containers')
         self._create_rcs()
         self._create_services()
-        time.sleep(1)
-        self.template.get_rc_pods()
 
         self._wait_until_running()
 
@@ -77,18 +77,12 @@ class KubernetesContext(ctx_base.Context):
         super(KubernetesContext, self).undeploy()
 
     def _wait_until_running(self):
-        while not all(self._check_pod_status(p) for p in self.template.pods):
-            time.sleep(1)
-
-    def _check_pod_status(self, pod):
-        status = k8s_utils.read_pod_status(pod)
-        LOG.debug('%s:%s', pod, status)
-        if status == 'Failed':
-            LOG.error('Pod %s status is failed', pod)
-            raise RuntimeError
-        if status != 'Running':
-            return False
-        return True
+        rcs = list(self.template.rcs)
+        try:
+            self._cache.wait_running(rcs)
+        finally:
+            # the pods are deleted on undeploy, even if they are not running
+            self.template.pods = self._cache.get_pod_names(rcs)
 
     def _create_services(self):
         for obj in self.template.service_objs:
@@ -175,7 +169,7 @@ class KubernetesContext(ctx_base.Context):
         return {
             'name': name,
             'ip': self._get_node_ip(),
-            'private_ip': k8s_utils.get_pod_by_name(name).status.pod_ip,
+            'private_ip': self._cache.get_pod(name).status.pod_ip,
             'ssh_port': node_port,
             'user': 'root',
             'key_filename': self.key_path,
@@ -211,7 +205,10 @@ class KubernetesContext(ctx_base.Context):
                 for name in rc.networks}
 
     def _get_node_ip(self):
-        return k8s_utils.get_node_list().items[0].status.addresses[0].address
+        if not self._node_ip:
+            node = k8s_utils.get_node_list().items[0]
+            self._node_ip = node.status.addresses[0].address
+        return self._node_ip
 
     def _get_physical_nodes(self):
         return None
@@ -221,7 +218,7 @@ class KubernetesContext(ctx_base.Context):
 
     def _get_service_ports(self, name):
         service_name = '{}-service'.format(name)
-        service = k8s_utils.get_service_by_name(service_name)
+        service = self._cache.get_service_spec(service_name)
         if not service:
             raise exceptions.KubernetesServiceObjectNotDefined()
         ports = []
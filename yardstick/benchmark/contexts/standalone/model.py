@@ -28,6 +28,7 @@ from yardstick.common import constants
 from yardstick.common import exceptions
 from yardstick.common import yaml_loader
 from yardstick.network_services.utils import PciAddress
+from yardstick.network_services.helpers import host_topology
 from yardstick.network_services.helpers.cpu import CpuSysCores
 
 
@@ -427,32 +428,37 @@ class StandaloneContextHelper(object):
 
     @classmethod
     def get_nic_details(cls, connection, networks, dpdk_devbind):
-        for key, ports in networks.items():
-            if key == "mgmt":
-                continue
+        phy_networks = {key: ports for key, ports in networks.items()
+                        if key != "mgmt"}
 
-            phy_ports = ports['phy_port']
-            phy_driver = ports.get('phy_driver', None)
-            driver = cls.get_kernel_module(connection, phy_ports, phy_driver)
+        # Make sure that ports are bound to kernel drivers e.g. i40e/ixgbe
+        bind_cmd = "{dpdk_devbind} --force -b {driver} {port}"
+        lshw_cmd = "lshw -c network -businfo | grep '{port}'"
 
-            # Make sure that ports are bound to kernel drivers e.g. i40e/ixgbe
-            bind_cmd = "{dpdk_devbind} --force -b {driver} {port}"
-            lshw_cmd = "lshw -c network -businfo | grep '{port}'"
-            link_show_cmd = "ip -s link show {interface}"
+        for ports in phy_networks.values():
+            phy_driver = ports.get('phy_driver', None)
+            ports['driver'] = cls.get_kernel_module(
+                connection, ports['phy_port'], phy_driver)
 
             cmd = bind_cmd.format(dpdk_devbind=dpdk_devbind,
-                                  driver=driver, port=ports['phy_port'])
+                                  driver=ports['driver'],
+                                  port=ports['phy_port'])
             connection.execute(cmd)
 
-            out = connection.execute(lshw_cmd.format(port=phy_ports))[1]
-            interface = out.split()[1]
+        # the interfaces of all the ports are read in one probe
+        host_topology.invalidate(connection)
+        topology = host_topology.get(connection)
 
-            connection.execute(link_show_cmd.format(interface=interface))
+        for ports in phy_networks.values():
+            interface = None
+            if topology:
+                interface = topology.get_interface(ports['phy_port'])
+            if interface is None:
+                out = connection.execute(
+                    lshw_cmd.format(port=ports['phy_port']))[1]
+                interface = out.split()[1]
 
-            ports.update({
-                'interface': str(interface),
-                'driver': driver
-            })
+            ports['interface'] = str(interface)
         LOG.info(networks)
 
         return networks
@@ -25,6 +25,7 @@ from yardstick.benchmark.contexts import base
 from yardstick.benchmark.contexts.standalone import model
 from yardstick.common import exceptions
 from yardstick.network_services import utils
+from yardstick.network_services.helpers import host_topology
 from yardstick.network_services.utils import get_nsb_option
 
 
@@ -114,12 +115,15 @@ class OvsDpdkContext(base.Context):
         for port in self.networks.values():
             cmd_list.append(bind_cmd.format(port=port.get('phy_port')))
 
-        for cmd in cmd_list:
-            LOG.info(cmd)
-            exit_status, _, stderr = self.connection.execute(
-                cmd, timeout=self.CMD_TIMEOUT)
-            if exit_status:
-                raise exceptions.OVSSetupError(command=cmd, error=stderr)
+        try:
+            for cmd in cmd_list:
+                LOG.info(cmd)
+                exit_status, _, stderr = self.connection.execute(
+                    cmd, timeout=self.CMD_TIMEOUT)
+                if exit_status:
+                    raise exceptions.OVSSetupError(command=cmd, error=stderr)
+        finally:
+            host_topology.invalidate(self.connection)
 
     def start_ovs_serverswitch(self):
         vpath = self.ovs_properties.get("vpath")
@@ -263,6 +267,7 @@ class OvsDpdkContext(base.Context):
             return
 
         self.connection = ssh.SSH.from_node(self.host_mgmt)
+        host_topology.check_boot(self.connection)
 
         # Check dpdk/ovs version, if not present install
         self.check_ovs_dpdk_env()
@@ -294,11 +299,16 @@ class OvsDpdkContext(base.Context):
             phy_driver = port.get("driver")
             self.connection.execute(bind_cmd.format(
                 dpdk_devbind=self.dpdk_devbind, driver=phy_driver, port=vpci))
+        host_topology.invalidate(self.connection)
 
         # Todo: NFVi undeploy (sriov, vswitch, ovs etc) based on the config.
         for vm in self.vm_names:
             model.Libvirt.check_if_vm_exists_and_delete(vm, self.connection)
 
+    def get_checkpoint(self):
+        """Return the names of the VMs; on resume, they are deployed again"""
+        return {'vm_names': list(self.vm_names)}
+
     def _get_physical_nodes(self):
         return self.nfvi_host
 
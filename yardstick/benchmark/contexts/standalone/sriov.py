@@ -21,6 +21,7 @@ from yardstick import ssh
 from yardstick.benchmark import contexts
 from yardstick.benchmark.contexts import base
 from yardstick.benchmark.contexts.standalone import model
+from yardstick.network_services.helpers import host_topology
 from yardstick.network_services.utils import get_nsb_option
 from yardstick.network_services.utils import PciAddress
 
@@ -80,6 +81,7 @@ class SriovContext(base.Context):
             return
 
         self.connection = ssh.SSH.from_node(self.host_mgmt)
+        host_topology.check_boot(self.connection)
 
         #    Todo: NFVi deploy (sriov, vswitch, ovs etc) based on the config.
         model.StandaloneContextHelper.install_req_libs(self.connection)
@@ -107,6 +109,10 @@ class SriovContext(base.Context):
             build_vfs = "echo 0 > /sys/bus/pci/devices/{0}/sriov_numvfs"
             self.connection.execute(build_vfs.format(ports.get('phy_port')))
 
+    def get_checkpoint(self):
+        """Return the names of the VMs; on resume, they are deployed again"""
+        return {'vm_names': list(self.vm_names)}
+
     def _get_physical_nodes(self):
         return self.nfvi_host
 
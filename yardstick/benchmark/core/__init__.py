@@ -26,6 +26,10 @@ class Param(object):
         self.render_only = kwargs.get('render-only')
         self.output_file = kwargs.get('output-file', '/tmp/yardstick.out')
         self.suite = kwargs.get('suite')
+        self.suite_workers = kwargs.get('suite-workers')
+        self.profile = kwargs.get('profile')
+        self.checkpoint = kwargs.get('checkpoint')
+        self.deep = kwargs.get('deep')
         self.task_id = kwargs.get('task_id')
         self.yaml_name = kwargs.get('yaml_name')
 
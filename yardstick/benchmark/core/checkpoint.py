@@ -0,0 +1,135 @@
+##############################################################################
+# Copyright (c) 2018 Intel Corporation
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+"""Checkpoints of a task, to resume it after a crash
+
+The progress of a task is appended to its checkpoint file, one JSON entry
+per line, as it happens:
+
+    task:       the arguments of the task
+    context:    handles of a deployed context (see Context.get_checkpoint)
+    undeploy:   a context was undeployed
+    scenario:   a scenario of a test case finished, with its records and the
+                scenario outputs
+    testcase:   a test case finished, with its record in the task result
+
+A resumed task skips the test cases and scenarios which finished
+successfully, and reattaches to the deployed contexts (see Context.resume).
+The failed ones, e.g. a scenario whose runner worker died, are executed
+again.
+"""
+
+from collections import OrderedDict
+import logging
+import os
+import threading
+
+from oslo_serialization import jsonutils
+
+from yardstick.common import constants
+from yardstick.common import utils
+
+
+LOG = logging.getLogger(__name__)
+
+# task arguments stored to resume the task
+TASK_ARGS = ('inputfile', 'task_args', 'task_args_file', 'keep_deploy',
+             'output_file', 'suite', 'suite_workers', 'profile')
+
+
+def get_path(task_id):
+    return os.path.join(constants.TASK_LOG_DIR,
+                        '{}.checkpoint'.format(task_id))
+
+
+class TaskCheckpoint(object):
+    """Append-only checkpoint file of a task, and the state it records"""
+
+    def __init__(self, task_id, path=None):
+        self.task_id = task_id
+        self.path = path or get_path(task_id)
+        self._lock = threading.Lock()
+        self.args = {}
+        # {case name: test case record}, of the test cases which did not fail
+        self.testcases = OrderedDict()
+        # {context name: handles}
+        self.contexts = {}
+        # {case name: {scenario index: {'status', 'records', 'outputs'}}}
+        self.scenarios = {}
+
+    def load(self):
+        """Read the checkpoint file, return False if it does not exist"""
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path) as checkpoint_file:
+            for line in checkpoint_file:
+                try:
+                    entry = jsonutils.loads(line)
+                except ValueError:
+                    # the last entry may be truncated by a crash
+                    LOG.warning("Invalid checkpoint entry ignored: %s", line)
+                    break
+                self._apply(entry)
+        return True
+
+    def _apply(self, entry):
+        event = entry['event']
+        if event == 'task':
+            self.args = entry['args']
+        elif event == 'context':
+            self.contexts[entry['name']] = entry['handles']
+        elif event == 'undeploy':
+            self.contexts.pop(entry['name'], None)
+        elif event == 'scenario':
+            self.scenarios.setdefault(entry['case'], {})[entry['index']] = {
+                'status': entry['status'], 'records': entry['records'],
+                'outputs': entry['outputs']}
+        elif event == 'testcase':
+            if entry['testcase'].get('criteria') == 'FAIL':
+                # executed again, its successful scenarios are kept
+                self.testcases.pop(entry['case'], None)
+            else:
+                self.testcases[entry['case']] = entry['testcase']
+                self.scenarios.pop(entry['case'], None)
+
+    def _append(self, entry):
+        with self._lock:
+            self._apply(entry)
+            utils.makedirs(os.path.dirname(self.path))
+            with open(self.path, 'a') as checkpoint_file:
+                checkpoint_file.write(jsonutils.dumps(entry) + '\n')
+                checkpoint_file.flush()
+                os.fsync(checkpoint_file.fileno())
+
+    def start_task(self, args):
+        """Store the task arguments, see TASK_ARGS"""
+        self._append({'event': 'task',
+                      'args': {name: getattr(args, name, None)
+                               for name in TASK_ARGS}})
+
+    def context_deployed(self, context):
+        self._append({'event': 'context', 'name': context.name,
+                      'handles': context.get_checkpoint()})
+
+    def context_undeployed(self, context):
+        self._append({'event': 'undeploy', 'name': context.name})
+
+    def scenario_done(self, case_name, index, status, records, outputs):
+        self._append({'event': 'scenario', 'case': case_name,
+                      'index': index, 'status': status, 'records': records,
+                      'outputs': outputs})
+
+    def testcase_done(self, case_name, testcase):
+        self._append({'event': 'testcase', 'case': case_name,
+                      'testcase': testcase})
+
+    def get_scenarios(self, case_name):
+        """Return the successful scenarios of a test case, by index"""
+        return {index: scenario for index, scenario in
+                self.scenarios.get(case_name, {}).items()
+                if scenario['status'] == 0}
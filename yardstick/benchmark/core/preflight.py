@@ -0,0 +1,222 @@
+##############################################################################
+# Copyright (c) 2018 Intel Corporation
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+"""Pre-flight checks of the nodes of a task ("yardstick task validate --deep")
+
+The physical nodes of all the contexts are checked concurrently, each one
+with one SSH command running a probe script:
+
+    - SSH reachability
+    - PCI addresses of the node interfaces (or of the standalone context
+      "phy_port" networks) present
+    - drivers of the interfaces loaded or loadable
+    - free hugepages, for the nodes with DPDK interfaces
+    - NSB binaries provisioned, for the nodes with DPDK interfaces
+"""
+
+from collections import OrderedDict
+import json
+import logging
+import os
+import time
+
+from concurrent import futures
+import prettytable
+from six.moves import shlex_quote
+
+from yardstick import ssh
+from yardstick.common import exceptions
+from yardstick.network_services.helpers.dpdkbindnic_helper import \
+    DpdkBindHelper
+from yardstick.network_services import utils as ns_utils
+
+
+LOG = logging.getLogger(__name__)
+
+PROBE_CMD = '"$(command -v python3 || command -v python)"'
+PROBE_TIMEOUT = 30
+MAX_WORKERS = 32
+
+# interface fields used by the NSB test cases
+INTERFACE_FIELDS = ('vpci', 'driver', 'local_mac')
+DPDK_DRIVERS = ('igb_uio', 'vfio-pci', 'uio_pci_generic')
+
+# run on the node, with Python 2.7 or 3; the argument is the JSON encoded
+# checks, see get_node_checks
+PROBE_SCRIPT = r"""
+import glob
+import json
+import os
+import subprocess
+import sys
+
+
+def read(path, default=None):
+    try:
+        with open(path) as f:
+            return f.read()
+    except (IOError, OSError):
+        return default
+
+
+def driver_loadable(driver):
+    if (os.path.exists('/sys/bus/pci/drivers/' + driver) or
+            os.path.exists('/sys/module/' + driver.replace('-', '_'))):
+        return True
+    try:
+        with open(os.devnull, 'w') as devnull:
+            return subprocess.call(['modinfo', driver], stdout=devnull,
+                                   stderr=devnull) == 0
+    except OSError:
+        return False
+
+
+def binary_found(binary):
+    if os.path.isabs(binary):
+        return os.access(binary, os.X_OK)
+    return any(os.access(os.path.join(path, binary), os.X_OK)
+               for path in os.environ.get('PATH', '').split(os.pathsep))
+
+
+checks = json.loads(sys.argv[1])
+hugepages_free_kb = 0
+for size_path in glob.glob('/sys/kernel/mm/hugepages/hugepages-*kB'):
+    size_kb = int(size_path.rsplit('-', 1)[1][:-2])
+    free = int(read(size_path + '/free_hugepages', 0))
+    hugepages_free_kb += size_kb * free
+
+sys.stdout.write(json.dumps({
+    'pci': dict((pci, os.path.exists('/sys/bus/pci/devices/' + pci))
+                for pci in checks['pci']),
+    'drivers': dict((driver, driver_loadable(driver))
+                    for driver in checks['drivers']),
+    'binaries': dict((binary, binary_found(binary))
+                     for binary in checks['binaries']),
+    'hugepages_free_kb': hugepages_free_kb,
+}))
+"""
+
+
+def _normalize_pci(pci):
+    # the PCI domain is optional in the pod files
+    return pci if pci.count(':') > 1 else '0000:' + pci
+
+
+def get_node_checks(node, context=None):
+    """Return the checks of a node, and the errors found in its definition
+
+    :param node: (dict) node, as defined in the pod file
+    :param context: context of the node; the "phy_port" of the standalone
+                    context networks are checked on its nodes
+    :return: ({'pci': [...], 'drivers': [...], 'binaries': [...],
+              'hugepages': bool}, [error, ...])
+    """
+    errors = []
+    pci = []
+    drivers = []
+    for name, interface in sorted(node.get('interfaces', {}).items()):
+        missing = [field for field in INTERFACE_FIELDS
+                   if field not in interface]
+        if missing:
+            errors.append('interface %s: missing %s' %
+                          (name, ', '.join(missing)))
+        if interface.get('vpci'):
+            pci.append(_normalize_pci(interface['vpci']))
+        if interface.get('driver'):
+            drivers.append(interface['driver'])
+
+    networks = getattr(context, 'networks', None) or {}
+    for network in networks.values():
+        if isinstance(network, dict) and network.get('phy_port'):
+            pci.append(_normalize_pci(network['phy_port']))
+
+    dpdk = any(driver in DPDK_DRIVERS for driver in drivers)
+    binaries = []
+    if dpdk:
+        bin_path = ns_utils.get_nsb_option('bin_path', '')
+        binaries.append(os.path.join(bin_path, DpdkBindHelper.DPDK_DEVBIND))
+    checks = {'pci': sorted(set(pci)), 'drivers': sorted(set(drivers)),
+              'binaries': binaries, 'hugepages': dpdk}
+    return checks, errors
+
+
+def check_node(node, checks, timeout=PROBE_TIMEOUT):
+    """Run the probe of a node, return the list of errors found"""
+    try:
+        connection = ssh.SSH.from_node(node)
+    except (KeyError, exceptions.SSHError) as e:
+        return ['invalid SSH parameters: %s' % e]
+    try:
+        status, stdout, stderr = connection.execute(
+            '%s - %s' % (PROBE_CMD, shlex_quote(json.dumps(checks))),
+            stdin=PROBE_SCRIPT, timeout=timeout)
+    except (exceptions.SSHError, EnvironmentError) as e:
+        return ['SSH to %s failed: %s' % (node.get('ip'), e)]
+    finally:
+        connection.close()
+    if status:
+        return ['probe failed: %s' % stderr.strip()]
+    try:
+        result = json.loads(stdout)
+    except ValueError:
+        return ['invalid probe output: %s' % stdout]
+
+    errors = []
+    errors.extend('PCI device %s not found' % pci
+                  for pci, found in sorted(result['pci'].items()) if not found)
+    errors.extend('driver %s can not be loaded' % driver
+                  for driver, found in sorted(result['drivers'].items())
+                  if not found)
+    errors.extend('binary %s not found' % binary
+                  for binary, found in sorted(result['binaries'].items())
+                  if not found)
+    if checks['hugepages'] and not result['hugepages_free_kb']:
+        errors.append('no free hugepages')
+    return errors
+
+
+def _check_one(context_name, node, context):
+    start = time.time()
+    checks, errors = get_node_checks(node, context)
+    errors.extend(check_node(node, checks))
+    return OrderedDict([('context', context_name),
+                        ('node', node.get('name')),
+                        ('host', node.get('ip')),
+                        ('errors', errors),
+                        ('duration', time.time() - start)])
+
+
+def run(contexts, max_workers=MAX_WORKERS):
+    """Check the physical nodes of the contexts concurrently
+
+    :return: list of reports, one per node: {'context', 'node', 'host',
+             'errors', 'duration'}
+    """
+    nodes = []
+    for context in contexts:
+        # pylint: disable=protected-access
+        for node in context._get_physical_nodes() or []:
+            nodes.append((context.name, node, context))
+    if not nodes:
+        return []
+
+    workers = min(max_workers, len(nodes))
+    with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda args: _check_one(*args), nodes))
+
+
+def format_reports(reports):
+    """Return the reports as a table"""
+    table = prettytable.PrettyTable(['Context', 'Node', 'Host', 'Time (s)',
+                                     'Result'])
+    table.align = 'l'
+    for report in reports:
+        table.add_row([report['context'], report['node'], report['host'],
+                       '%.2f' % report['duration'],
+                       '\n'.join(report['errors']) or 'OK'])
+    return table.get_string()
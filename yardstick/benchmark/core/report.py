@@ -15,6 +15,8 @@ from __future__ import print_function
 from __future__ import absolute_import
 
 import ast
+import collections
+import datetime
 import re
 import uuid
 
@@ -26,7 +28,9 @@ from django.template import Template
 
 from oslo_utils import encodeutils
 from oslo_utils import uuidutils
+from yardstick.common import chunked_result
 from yardstick.common import constants as consts
+from yardstick.common import utils
 from yardstick.common.html_template import template
 from yardstick.common.utils import cliargs
 
@@ -75,15 +79,45 @@ class Report(object):
         else:
             raise KeyError("Task ID or Test case not found..")
 
+    def _get_chunked_tasks(self, input_file):
+        """Read the records of the test case from a chunked result file
+
+        :return: (field keys, records) in the InfluxDB query format
+        """
+        reader = chunked_result.ChunkedResultReader(input_file,
+                                                    task_id=str(self.task_id))
+        fieldkeys = collections.OrderedDict()
+        tasks = []
+        for _, _, record in reader.iter_records(case=self.yaml_name):
+            fields = utils.flatten_dict_key(record.get('data', {}))
+            task = {key: value if isinstance(value, (int, float)) or
+                    value is None else repr(value)
+                    for key, value in fields.items()}
+            task['time'] = datetime.datetime.utcfromtimestamp(
+                record['timestamp']).isoformat() + 'Z'
+            tasks.append(task)
+            fieldkeys.update((key, None) for key in fields)
+        if not tasks:
+            raise KeyError("Test case not found..")
+        for task in tasks:
+            for key in fieldkeys:
+                task.setdefault(key, None)
+        return [{'fieldKey': key} for key in fieldkeys], tasks
+
     @cliargs("task_id", type=str, help=" task id", nargs=1)
     @cliargs("yaml_name", type=str, help=" Yaml file Name", nargs=1)
+    @cliargs("--input-file", dest="input_file", nargs=1,
+             help="chunked task result file to read instead of InfluxDB")
     def generate(self, args):
         """Start report generation."""
         self._validate(args.yaml_name[0], args.task_id[0])
 
-        self.db_fieldkeys = self._get_fieldkeys()
-
-        self.db_task = self._get_tasks()
+        if getattr(args, 'input_file', None):
+            self.db_fieldkeys, self.db_task = self._get_chunked_tasks(
+                args.input_file[0])
+        else:
+            self.db_fieldkeys = self._get_fieldkeys()
+            self.db_task = self._get_tasks()
 
         field_keys = []
         temp_series = []
@@ -96,11 +130,12 @@ class Report(object):
             self.Timestamp = []
             series = {}
             values = []
+            if not isinstance(key, str):
+                key = str(key, 'utf8')
             for task in self.db_task:
                 task_time = encodeutils.to_utf8(task['time'])
                 if not isinstance(task_time, str):
                     task_time = str(task_time, 'utf8')
-                    key = str(key, 'utf8')
                 task_time = task_time[11:]
                 head, _, tail = task_time.partition('.')
                 task_time = head + "." + tail[:6]
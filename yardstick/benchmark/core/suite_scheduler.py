@@ -0,0 +1,181 @@
+##############################################################################
+# Copyright (c) 2018 Intel Corporation
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+"""Resource-aware scheduler running the test cases of a suite in parallel
+
+Each test case of a suite is executed in its own worker process. A test case
+holds a set of resource locks (contexts, pod files, nodes and any resource
+declared in the suite file, e.g. NIC PCI addresses); two test cases sharing
+at least one lock never run at the same time. The profiling spans and the
+OpenStack clients stats of a worker are sent back with its test case record.
+"""
+
+import logging
+import multiprocessing
+import time
+
+from six import moves
+
+from yardstick.common import openstack_utils
+from yardstick.common import profiler
+
+
+LOG = logging.getLogger(__name__)
+
+
+def get_task_locks(task, declared=None):
+    """Return the set of resource locks needed to run a parsed task
+
+    :param task: (dict) task returned by ``TaskParser.parse_task``
+    :param declared: (list) resources declared in the suite file for this
+                     test case, e.g. ``pci:0000:05:00.0``
+    :return: (set) resource lock names
+    """
+    locks = set(declared or [])
+    for context in task['contexts']:
+        locks.add('context:{}'.format(context.name))
+        if context.file_path:
+            locks.add('pod:{}'.format(context.file_path))
+
+    for scenario in task['scenarios']:
+        nodes = list((scenario.get('nodes') or {}).values())
+        nodes.extend(scenario.get('targets') or [])
+        nodes.extend(scenario[key] for key in ('host', 'target')
+                     if key in scenario)
+        locks.update('node:{}'.format(node) for node in nodes
+                     if isinstance(node, str))
+    return locks
+
+
+class SuiteCase(object):
+    """A test case of a suite, waiting to be scheduled"""
+
+    def __init__(self, index, name, locks):
+        self.index = index
+        self.name = name
+        self.locks = frozenset(locks)
+        self.process = None
+        self.start_time = None
+        # profiling spans recorded by the worker process
+        self.spans = []
+
+
+class SuiteScheduler(object):
+    """Run suite test cases in parallel worker processes
+
+    ``run_case`` is called in the worker process with the ``SuiteCase``
+    index and must return the test case record, as stored in the task result
+    ``testcases`` section. The profiling spans recorded by ``run_case`` are
+    stored in the ``SuiteCase.spans`` of the parent process, and the OpenStack
+    clients stats of the worker are added to the ones of the parent process.
+    """
+
+    POLL_INTERVAL = 1
+
+    def __init__(self, run_case, max_workers):
+        self._run_case = run_case
+        self._max_workers = max(1, int(max_workers))
+        self._queue = multiprocessing.Queue()
+        self._running = {}
+        self._records = {}
+        self._durations = {}
+        self.wall_time = None
+        self.serial_time = None
+
+    def _worker(self, case):
+        # drop the spans inherited from the parent process
+        profiler.reset()
+        start_time = time.time()
+        try:
+            record = self._run_case(case.index)
+        except Exception:  # pylint: disable=broad-except
+            LOG.exception('Testcase: "%s" FAILED!!!', case.name)
+            record = {'criteria': 'FAIL', 'tc_data': []}
+        self._queue.put((case.index, record, time.time() - start_time,
+                         profiler.get_spans(),
+                         openstack_utils.get_clients_stats()))
+
+    def _locked(self):
+        locks = set()
+        for case in self._running.values():
+            locks.update(case.locks)
+        return locks
+
+    def _start_ready(self, pending):
+        """Start every pending case whose locks are free, in suite order"""
+        locked = self._locked()
+        for case in list(pending):
+            if len(self._running) >= self._max_workers:
+                break
+            if case.locks & locked:
+                continue
+            pending.remove(case)
+            locked.update(case.locks)
+            case.start_time = time.time()
+            case.process = multiprocessing.Process(
+                target=self._worker, name='suite-{}'.format(case.name),
+                args=(case,))
+            case.process.start()
+            self._running[case.index] = case
+            LOG.info('Testcase "%s" started (%d running)', case.name,
+                     len(self._running))
+
+    def _finish(self, index, record, duration, spans=None,
+                clients_stats=None):
+        case = self._running.pop(index)
+        case.process.join()
+        case.spans = list(spans or [])
+        openstack_utils.add_clients_stats(clients_stats or {})
+        self._records[index] = record
+        self._durations[index] = duration
+        LOG.info('Testcase "%s" finished in %d secs', case.name, duration)
+
+    def _collect(self):
+        """Wait for, at least, one running case to finish"""
+        try:
+            self._finish(*self._queue.get(True, self.POLL_INTERVAL))
+        except moves.queue.Empty:
+            pass
+
+        # a worker sends its record before exiting: after draining the queue,
+        # any worker which exited before the drain and is still running died
+        exited = [index for index, case in self._running.items()
+                  if case.process.exitcode is not None]
+        while True:
+            try:
+                self._finish(*self._queue.get_nowait())
+            except moves.queue.Empty:
+                break
+
+        for index in (i for i in exited if i in self._running):
+            case = self._running[index]
+            LOG.error('Testcase "%s" worker died, exit code %s',
+                      case.name, case.process.exitcode)
+            self._finish(index, {'criteria': 'FAIL', 'tc_data': []},
+                         time.time() - case.start_time)
+
+    def run(self, cases):
+        """Run the suite cases, return the records ordered as in the suite
+
+        :param cases: (list) ``SuiteCase`` objects
+        :return: (list) tuples (``SuiteCase``, record)
+        """
+        pending = list(cases)
+        start_time = time.time()
+        while pending or self._running:
+            self._start_ready(pending)
+            self._collect()
+
+        wall_time = time.time() - start_time
+        serial_time = sum(self._durations.values())
+        LOG.info('Suite finished in %d secs, serial execution time %d secs '
+                 '(speedup %.2f)', wall_time, serial_time,
+                 serial_time / wall_time if wall_time else 1.0)
+        self.wall_time = wall_time
+        self.serial_time = serial_time
+        return [(case, self._records[case.index]) for case in cases]
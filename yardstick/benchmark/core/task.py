@@ -24,15 +24,24 @@ from jinja2 import Environment
 
 from yardstick.benchmark import contexts
 from yardstick.benchmark.contexts import base as base_context
+from yardstick.benchmark import core
+from yardstick.benchmark.core import checkpoint
+from yardstick.benchmark.core import preflight
+from yardstick.benchmark.core import suite_scheduler
 from yardstick.benchmark.runners import base as base_runner
 from yardstick.common.constants import CONF_FILE
 from yardstick.common.yaml_loader import yaml_load
 from yardstick.dispatcher.base import Base as DispatcherBase
+from yardstick.dispatcher import file as file_dispatcher
+from yardstick.common import chunked_result
 from yardstick.common import constants
 from yardstick.common import exceptions as y_exc
+from yardstick.common import openstack_utils
+from yardstick.common import profiler
 from yardstick.common import task_template
 from yardstick.common import utils
 from yardstick.common.html_template import report_template
+from yardstick.network_services.vnf_generic import scale_out
 
 output_file_default = "/tmp/yardstick.out"
 test_cases_dir_default = "tests/opnfv/test_cases/"
@@ -48,6 +57,8 @@ class Task(object):     # pragma: no cover
     def __init__(self):
         self.contexts = []
         self.outputs = {}
+        self.profile = False
+        self.checkpoint = None
 
     def _set_dispatchers(self, output_config):
         dispatchers = output_config.get('DEFAULT', {}).get('dispatcher',
@@ -55,16 +66,24 @@ class Task(object):     # pragma: no cover
         out_types = [s.strip() for s in dispatchers.split(',')]
         output_config['DEFAULT']['dispatcher'] = out_types
 
-    def start(self, args, **kwargs):  # pylint: disable=unused-argument
-        """Start a benchmark scenario."""
+    def start(self, args, resume=False, **kwargs):  # pylint: disable=unused-argument
+        """Start a benchmark scenario.
+
+        :param resume: the task is resumed, see ``resume``
+        """
 
         atexit.register(self.atexit_handler)
 
         task_id = getattr(args, 'task_id')
         self.task_id = task_id if task_id else str(uuid.uuid4())
+        self.profile = bool(getattr(args, 'profile', False))
 
         self._set_log()
 
+        if getattr(args, 'checkpoint', False) and not self.checkpoint:
+            self.checkpoint = checkpoint.TaskCheckpoint(self.task_id)
+            self.checkpoint.start_task(args)
+
         try:
             output_config = utils.parse_ini_file(CONF_FILE)
         except Exception:  # pylint: disable=broad-except
@@ -79,87 +98,220 @@ class Task(object):     # pragma: no cover
 
         # update dispatcher list
         if 'file' in output_config['DEFAULT']['dispatcher']:
-            result = {'status': 0, 'result': {}}
-            utils.write_json_to_file(args.output_file, result)
+            file_dispatcher.FileDispatcher(output_config).start_task(resume)
 
         total_start_time = time.time()
+        profiler.reset()
         parser = TaskParser(args.inputfile[0])
 
-        if args.suite:
-            # 1.parse suite, return suite_params info
-            task_files, task_args, task_args_fnames = parser.parse_suite()
-        else:
-            task_files = [parser.path]
-            task_args = [args.task_args]
-            task_args_fnames = [args.task_args_file]
+        with profiler.span('parse'):
+            if args.suite:
+                # 1.parse suite, return suite_params info
+                task_files, task_args, task_args_fnames = parser.parse_suite()
+            else:
+                task_files = [parser.path]
+                task_args = [args.task_args]
+                task_args_fnames = [args.task_args_file]
 
-        LOG.debug("task_files:%s, task_args:%s, task_args_fnames:%s",
-                  task_files, task_args, task_args_fnames)
+            LOG.debug("task_files:%s, task_args:%s, task_args_fnames:%s",
+                      task_files, task_args, task_args_fnames)
 
-        if args.parse_only:
-            sys.exit(0)
+            if args.parse_only:
+                sys.exit(0)
 
-        testcases = {}
-        tasks = self._parse_tasks(parser, task_files, args, task_args,
-                                  task_args_fnames)
+            testcases = {}
+            tasks = self._parse_tasks(parser, task_files, args, task_args,
+                                      task_args_fnames)
 
-        # Execute task files.
-        for i, _ in enumerate(task_files):
-            one_task_start_time = time.time()
-            self.contexts.extend(tasks[i]['contexts'])
-            if not tasks[i]['meet_precondition']:
-                LOG.info('"meet_precondition" is %s, please check environment',
-                         tasks[i]['meet_precondition'])
-                continue
+        # the runner and suite worker processes reuse this authentication
+        openstack_utils.authenticate()
 
-            try:
-                success, data = self._run(tasks[i]['scenarios'],
-                                          tasks[i]['run_in_parallel'],
-                                          output_config)
-            except KeyboardInterrupt:
-                raise
-            except Exception:  # pylint: disable=broad-except
-                LOG.error('Testcase: "%s" FAILED!!!', tasks[i]['case_name'],
-                          exc_info=True)
-                testcases[tasks[i]['case_name']] = {'criteria': 'FAIL',
-                                                    'tc_data': []}
-            else:
-                if success:
-                    LOG.info('Testcase: "%s" SUCCESS!!!', tasks[i]['case_name'])
-                    testcases[tasks[i]['case_name']] = {'criteria': 'PASS',
-                                                        'tc_data': data}
-                else:
-                    LOG.error('Testcase: "%s" FAILED!!!', tasks[i]['case_name'],
-                              exc_info=True)
-                    testcases[tasks[i]['case_name']] = {'criteria': 'FAIL',
-                                                        'tc_data': data}
-
-            if args.keep_deploy:
-                # keep deployment, forget about stack
-                # (hide it for exit handler)
-                self.contexts = []
-            else:
-                for context in self.contexts[::-1]:
-                    context.undeploy()
-                self.contexts = []
-            one_task_end_time = time.time()
-            LOG.info("Task %s finished in %d secs", task_files[i],
-                     one_task_end_time - one_task_start_time)
+        suite_workers = int(getattr(args, 'suite_workers', None) or 1)
+        if args.suite and suite_workers > 1:
+            with profiler.span('suite', workers=suite_workers):
+                testcases = self._run_suite_parallel(
+                    tasks, parser.task_resources, suite_workers,
+                    output_config, args.keep_deploy)
+        else:
+            # Execute task files.
+            for i, _ in enumerate(task_files):
+                one_task_start_time = time.time()
+                self.contexts.extend(tasks[i]['contexts'])
+                if not tasks[i]['meet_precondition']:
+                    LOG.info('"meet_precondition" is %s, please check '
+                             'environment', tasks[i]['meet_precondition'])
+                    continue
+
+                with profiler.span('testcase', case=tasks[i]['case_name']):
+                    testcases[tasks[i]['case_name']] = self._run_task(
+                        tasks[i], output_config, args.keep_deploy)
+                one_task_end_time = time.time()
+                LOG.info("Task %s finished in %d secs", task_files[i],
+                         one_task_end_time - one_task_start_time)
 
         result = self._get_format_result(testcases)
+        result['result']['profile'] = list(profiler.get_spans())
 
-        self._do_output(output_config, result)
-        self._generate_reporting(result)
+        with profiler.span('output'):
+            self._do_output(output_config, result)
+        with profiler.span('report'):
+            self._generate_reporting(result)
 
         total_end_time = time.time()
         LOG.info("Total finished in %d secs",
                  total_end_time - total_start_time)
+        LOG.info("Task profile:\n%s",
+                 profiler.format_spans(profiler.get_spans()))
+        clients_stats = openstack_utils.get_clients_stats()
+        if any(clients_stats.values()):
+            LOG.info("OpenStack clients: %(auth)d authentications, "
+                     "%(hit)d cache hits, %(miss)d misses", clients_stats)
 
         LOG.info('To generate report, execute command "yardstick report '
                  'generate %s <YAML_NAME>"', self.task_id)
         LOG.info("Task ALL DONE, exiting")
         return result
 
+    def resume(self, args, **kwargs):
+        """Resume an interrupted task from its checkpoint
+
+        The finished test cases and scenarios are not executed again, and
+        the deployed contexts are reattached.
+        """
+        task_checkpoint = checkpoint.TaskCheckpoint(args.task_id)
+        if not task_checkpoint.load():
+            raise y_exc.TaskCheckpointNotFound(task_id=args.task_id,
+                                               path=task_checkpoint.path)
+        self.checkpoint = task_checkpoint
+
+        task_args = core.Param({})
+        for name, value in task_checkpoint.args.items():
+            setattr(task_args, name, value)
+        task_args.task_id = args.task_id
+        LOG.info("Resuming task %s, %d test cases finished", args.task_id,
+                 len(task_checkpoint.testcases))
+        return self.start(task_args, resume=True, **kwargs)
+
+    def validate(self, args, **kwargs):  # pylint: disable=unused-argument
+        """Validate a task or suite file without running it
+
+        The task files are rendered and parsed, and the contexts initialized
+        from their pod files. With "deep", the physical nodes of the contexts
+        are checked concurrently too (see preflight).
+
+        :return: the pre-flight reports of the nodes
+        :raises: TaskValidationFailed if a node check failed
+        """
+        self.task_id = getattr(args, 'task_id', None) or str(uuid.uuid4())
+        parser = TaskParser(args.inputfile[0])
+        if args.suite:
+            task_files, task_args, task_args_fnames = parser.parse_suite()
+        else:
+            task_files = [parser.path]
+            task_args = [args.task_args]
+            task_args_fnames = [args.task_args_file]
+
+        tasks = self._parse_tasks(parser, task_files, args, task_args,
+                                  task_args_fnames)
+        LOG.info("%d task files are valid", len(tasks))
+        if not getattr(args, 'deep', False):
+            return []
+
+        contexts = [context for task in tasks for context in task['contexts']]
+        start_time = time.time()
+        reports = preflight.run(contexts)
+        LOG.info("Nodes checked in %.2f secs:\n%s", time.time() - start_time,
+                 preflight.format_reports(reports))
+        failed = ['%s.%s' % (report['node'], report['context'])
+                  for report in reports if report['errors']]
+        if failed:
+            raise y_exc.TaskValidationFailed(nodes=', '.join(failed))
+        return reports
+
+    def _run_task(self, task, output_config, keep_deploy):
+        """Run the scenarios of a parsed task file
+
+        The task contexts must be stored in ``self.contexts``; they are
+        undeployed at the end, unless ``keep_deploy`` is set.
+
+        :return: (dict) test case record, as stored in the task result
+        """
+        case_name = task['case_name']
+        if self.checkpoint and case_name in self.checkpoint.testcases:
+            LOG.info('Testcase: "%s" finished before the task was resumed',
+                     case_name)
+            self.contexts = []
+            return self.checkpoint.testcases[case_name]
+
+        try:
+            success, data = self._run(task['scenarios'],
+                                      task['run_in_parallel'],
+                                      output_config, case_name=case_name)
+        except KeyboardInterrupt:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            LOG.error('Testcase: "%s" FAILED!!!', task['case_name'],
+                      exc_info=True)
+            testcase = {'criteria': 'FAIL', 'tc_data': []}
+        else:
+            if success:
+                LOG.info('Testcase: "%s" SUCCESS!!!', task['case_name'])
+                testcase = {'criteria': 'PASS', 'tc_data': data}
+            else:
+                LOG.error('Testcase: "%s" FAILED!!!', task['case_name'],
+                          exc_info=True)
+                testcase = {'criteria': 'FAIL', 'tc_data': data}
+
+        if keep_deploy:
+            # keep deployment, forget about stack
+            # (hide it for exit handler)
+            self.contexts = []
+        else:
+            for context in self.contexts[::-1]:
+                with profiler.span('undeploy', context=context.name):
+                    context.undeploy()
+                if self.checkpoint:
+                    self.checkpoint.context_undeployed(context)
+            self.contexts = []
+        if self.checkpoint:
+            self.checkpoint.testcase_done(case_name, testcase)
+        if file_dispatcher.is_chunked(output_config):
+            # the records buffered by a suite worker process would be lost
+            # when it exits
+            chunked_result.flush_all()
+        return testcase
+
+    def _run_suite_parallel(self, tasks, task_resources, suite_workers,
+                            output_config, keep_deploy):
+        """Run the suite tasks in parallel worker processes
+
+        Tasks sharing a resource (context, pod file, node or any resource
+        declared in the suite file) are never executed at the same time.
+        """
+        cases = []
+        for idx, task in enumerate(tasks):
+            if not task['meet_precondition']:
+                LOG.info('"meet_precondition" is %s, please check environment',
+                         task['meet_precondition'])
+                continue
+            locks = suite_scheduler.get_task_locks(task, task_resources[idx])
+            cases.append(suite_scheduler.SuiteCase(idx, task['case_name'],
+                                                   locks))
+
+        def run_case(idx):
+            self._set_log(case_name=tasks[idx]['case_name'])
+            self.outputs = {}
+            self.contexts = list(tasks[idx]['contexts'])
+            with profiler.span('testcase', case=tasks[idx]['case_name']):
+                return self._run_task(tasks[idx], output_config, keep_deploy)
+
+        scheduler = suite_scheduler.SuiteScheduler(run_case, suite_workers)
+        testcases = OrderedDict()
+        for case, record in scheduler.run(cases):
+            testcases[case.name] = record
+            profiler.add_spans(case.spans)
+        return testcases
+
     def _generate_reporting(self, result):
         env = Environment()
         with open(constants.REPORTING_FILE, 'w') as f:
@@ -167,12 +319,14 @@ class Task(object):     # pragma: no cover
 
         LOG.info("Report can be found in '%s'", constants.REPORTING_FILE)
 
-    def _set_log(self):
+    def _set_log(self, case_name=None):
         log_format = '%(asctime)s %(name)s %(filename)s:%(lineno)d %(levelname)s %(message)s'
         log_formatter = logging.Formatter(log_format)
 
         utils.makedirs(constants.TASK_LOG_DIR)
-        log_path = os.path.join(constants.TASK_LOG_DIR, '{}.log'.format(self.task_id))
+        log_name = ('{}-{}'.format(self.task_id, case_name) if case_name
+                    else self.task_id)
+        log_path = os.path.join(constants.TASK_LOG_DIR, '{}.log'.format(log_name))
         log_handler = logging.FileHandler(log_path)
         log_handler.setFormatter(log_formatter)
         log_handler.setLevel(logging.DEBUG)
@@ -235,20 +389,45 @@ class Task(object):     # pragma: no cover
 
     def _do_output(self, output_config, result):
         dispatchers = DispatcherBase.get(output_config)
-        dispatchers = (d for d in dispatchers if d.__dispatcher_type__ != 'Influxdb')
 
         for dispatcher in dispatchers:
-            dispatcher.flush_result_data(result)
-
-    def _run(self, scenarios, run_in_parallel, output_config):
-        """Deploys context and calls runners"""
+            dispatcher_type = dispatcher.__dispatcher_type__
+            with profiler.span('dispatcher', dispatcher=dispatcher_type):
+                if dispatcher_type != 'Influxdb':
+                    dispatcher.flush_result_data(result)
+                elif result['result'].get('profile'):
+                    # test case records are uploaded to InfluxDB by the
+                    # runners, as they are produced
+                    dispatcher.upload_profile(result)
+
+    def _run(self, scenarios, run_in_parallel, output_config, case_name=None):
+        """Deploys context and calls runners
+
+        If the task is checkpointed, the contexts deployed before the task
+        was interrupted are reattached and the finished scenarios skipped.
+        """
+        handles = self.checkpoint.contexts if self.checkpoint else {}
         for context in self.contexts:
-            context.deploy()
+            with profiler.span('deploy', context=context.name):
+                if context.name in handles:
+                    context.resume(handles[context.name])
+                else:
+                    context.deploy()
+            if self.checkpoint:
+                self.checkpoint.context_deployed(context)
 
         background_runners = []
 
         task_success = True
         result = []
+        finished = (self.checkpoint.get_scenarios(case_name)
+                    if self.checkpoint else {})
+        for index in sorted(finished):
+            LOG.info('Scenario NO.%s finished before the task was resumed',
+                     index + 1)
+            result.extend(finished[index]['records'])
+            self.outputs.update(finished[index]['outputs'])
+
         # Start all background scenarios
         for scenario in filter(_is_background_scenario, scenarios):
             scenario["runner"] = dict(type="Duration", duration=1000000000)
@@ -257,30 +436,39 @@ class Task(object):     # pragma: no cover
 
         runners = []
         if run_in_parallel:
-            for scenario in scenarios:
-                if not _is_background_scenario(scenario):
+            for index, scenario in enumerate(scenarios):
+                if not (_is_background_scenario(scenario) or
+                        index in finished):
                     runner = self.run_one_scenario(scenario, output_config)
-                    runners.append(runner)
+                    runners.append((index, runner))
 
             # Wait for runners to finish
-            for runner in runners:
+            for index, runner in runners:
+                # the records of the other runners drained meanwhile are
+                # checkpointed with this scenario
+                first_record = len(result)
                 status = runner_join(runner, background_runners, self.outputs, result)
                 if status != 0:
                     LOG.error("%s runner status %s", runner.__execution_type__, status)
                     task_success = False
+                self._checkpoint_scenario(case_name, index, status,
+                                          result[first_record:])
                 LOG.info("Runner ended")
         else:
             # run serially
-            for scenario in scenarios:
-                if not _is_background_scenario(scenario):
+            for index, scenario in enumerate(scenarios):
+                if not (_is_background_scenario(scenario) or
+                        index in finished):
+                    first_record = len(result)
                     runner = self.run_one_scenario(scenario, output_config)
                     status = runner_join(runner, background_runners, self.outputs, result)
                     if status != 0:
                         LOG.error('Scenario NO.%s: "%s" ERROR!',
-                                  scenarios.index(scenario) + 1,
-                                  scenario.get('type'))
+                                  index + 1, scenario.get('type'))
                         LOG.error("%s runner status %s", runner.__execution_type__, status)
                         task_success = False
+                    self._checkpoint_scenario(case_name, index, status,
+                                              result[first_record:])
                     LOG.info("Runner ended")
 
         # Abort background runners
@@ -299,11 +487,19 @@ class Task(object):     # pragma: no cover
             print("Background task ended")
         return task_success, result
 
+    def _checkpoint_scenario(self, case_name, index, status, records):
+        if self.checkpoint:
+            self.checkpoint.scenario_done(case_name, index, status, records,
+                                          dict(self.outputs))
+
     def atexit_handler(self):
         """handler for process termination"""
         base_runner.Runner.terminate_all()
 
-        if self.contexts:
+        if self.contexts and self.checkpoint:
+            LOG.info('Contexts kept deployed, to resume the task execute '
+                     'command "yardstick task resume %s"', self.task_id)
+        elif self.contexts:
             LOG.info("Undeploying all contexts")
             for context in self.contexts[::-1]:
                 context.undeploy()
@@ -346,6 +542,7 @@ class Task(object):     # pragma: no cover
         """run one scenario using context"""
         runner_cfg = scenario_cfg["runner"]
         runner_cfg['output_config'] = output_config
+        runner_cfg['profile'] = self.profile
 
         options = scenario_cfg.get('options', {})
         scenario_cfg['options'] = self._parse_options(options)
@@ -438,6 +635,7 @@ class TaskParser(object):       # pragma: no cover
 
     def __init__(self, path):
         self.path = path
+        self.task_resources = []
 
     def _meet_constraint(self, task, cur_pod, cur_installer):
         if "constraint" in task:
@@ -489,6 +687,7 @@ class TaskParser(object):       # pragma: no cover
         valid_task_files = []
         valid_task_args = []
         valid_task_args_fnames = []
+        valid_task_resources = []
 
         for task in cfg["test_cases"]:
             # 1.check file_name
@@ -507,7 +706,10 @@ class TaskParser(object):       # pragma: no cover
             task_args, task_args_fnames = self._get_task_para(task, cur_pod)
             valid_task_args.append(task_args)
             valid_task_args_fnames.append(task_args_fnames)
+            # 4.fetch the resources locked by the test case, if any
+            valid_task_resources.append(task.get('resources', []))
 
+        self.task_resources = valid_task_resources
         return valid_task_files, valid_task_args, valid_task_args_fnames
 
     def _render_task(self, task_args, task_args_file):
@@ -581,6 +783,7 @@ class TaskParser(object):       # pragma: no cover
             # relative to task path
             scenario["task_path"] = os.path.dirname(self.path)
 
+            self._set_scale_out_nodes(scenario, _contexts)
             self._change_node_names(scenario, _contexts)
 
         # TODO we need something better here, a class that represent the file
@@ -590,6 +793,31 @@ class TaskParser(object):       # pragma: no cover
                 'contexts': _contexts,
                 'rendered': rendered}
 
+    @staticmethod
+    def _set_scale_out_nodes(scenario, _contexts):
+        """Default the nodes of a scenario with a scale-out topology
+
+        A scenario "topology" given as a mapping is built by NSPerf (see
+        yardstick.network_services.vnf_generic.scale_out). Unless the scenario
+        lists its nodes, they are tg__0, tg__1 and vnf__<n>, deployed in the
+        first context:
+        scenario:
+          topology:
+            num_vnfs: 2
+          nodes:
+            tg__0: tg_0.yardstick
+            tg__1: tg_1.yardstick
+            vnf__0: vnf_0.yardstick
+            vnf__1: vnf_1.yardstick
+        """
+        topology = scenario.get('topology')
+        if (not isinstance(topology, collections.Mapping) or
+                'nodes' in scenario or not _contexts):
+            return
+        scenario['nodes'] = scale_out.generate_nodes(
+            topology.get('num_vnfs'),
+            context_name=_contexts[0].assigned_name)
+
     @staticmethod
     def _change_node_names(scenario, _contexts):
         """Change the node names in a scenario, depending on the context config
@@ -38,35 +38,16 @@ from six.moves import range
 
 from yardstick.benchmark.runners import base
 from yardstick.common import exceptions as y_exc
+from yardstick.common import openstack_utils
 
 LOG = logging.getLogger(__name__)
 
 
-def _worker_process(queue, cls, method_name, scenario_cfg,
-                    context_cfg, aborted, output_queue):
+POINT_QUEUE_TIMEOUT = 1
 
-    sequence = 1
-
-    runner_cfg = scenario_cfg['runner']
 
-    interval = runner_cfg.get("interval", 1)
-    if 'options' in scenario_cfg:
-        options = scenario_cfg['options']
-    else:  # options must be instatiated if not present in yaml
-        options = {}
-        scenario_cfg['options'] = options
-
-    runner_cfg['runner_id'] = os.getpid()
-
-    LOG.info("worker START, class %s", cls)
-
-    benchmark = cls(scenario_cfg, context_cfg)
-    benchmark.setup()
-    method = getattr(benchmark, method_name)
-
-    sla_action = None
-    if "sla" in scenario_cfg:
-        sla_action = scenario_cfg["sla"].get("action", "assert")
+def _get_loop_iter(runner_cfg):
+    """Return the parameter names and the iterator over their values"""
 
     # To both be able to include the stop value and handle backwards stepping
     def margin(start, stop):
@@ -89,6 +70,209 @@ def _worker_process(queue, cls, method_name, scenario_cfg,
         LOG.warning("iter_type unrecognized: %s", iter_type)
         raise TypeError("iter_type unrecognized: %s" % iter_type)
 
+    return param_names, loop_iter
+
+
+def _get_interval(cls, runner_cfg):
+    """Return the time to wait after each scenario invocation
+
+    A stateless scenario, whose invocations do not depend on the previous
+    ones, does not need to wait between them.
+    """
+    if getattr(cls, '__stateless__', False):
+        return 0
+    return runner_cfg.get("interval", 1)
+
+
+def _sweep_worker(cls, method_name, scenario_cfg, context_cfg, param_names,
+                  reuse_setup, sla_action, point_queue, record_queue, stop,
+                  stats_queue):
+    """Entrypoint for a parallel sweep worker process
+
+    Runs the points read from "point_queue" until a None point is received or
+    the sweep is stopped. If "reuse_setup" is set, the scenario is set up once
+    and reused for all the points run by this worker. The OpenStack clients
+    stats of the worker are put in "stats_queue" when it ends.
+    """
+    try:
+        options = scenario_cfg['options']
+        interval = _get_interval(cls, scenario_cfg['runner'])
+        benchmark = None
+
+        while not stop.is_set():
+            point = point_queue.get()
+            if point is None or stop.is_set():
+                break
+            sequence, comb_values = point
+
+            if not benchmark:
+                benchmark = cls(scenario_cfg, context_cfg)
+                benchmark.setup()
+            method = getattr(benchmark, method_name)
+
+            for i, value in enumerate(comb_values):
+                options[param_names[i]] = value
+
+            data = {}
+            errors = ""
+            result = None
+            sla_assert = False
+
+            start = time.time()
+            try:
+                result = method(data)
+            except y_exc.SLAValidationError as error:
+                if sla_action == "assert":
+                    sla_assert = True
+                    errors = error.args
+                elif sla_action == "monitor":
+                    LOG.warning("SLA validation failed: %s", error.args)
+                    errors = error.args
+            except Exception as e:  # pylint: disable=broad-except
+                errors = traceback.format_exc()
+                LOG.exception(e)
+            duration = time.time() - start
+
+            time.sleep(interval)
+
+            record_queue.put((sequence, data, errors, result, duration,
+                              sla_assert))
+
+            if not reuse_setup:
+                benchmark.teardown()
+                benchmark = None
+
+        if benchmark:
+            benchmark.teardown()
+    finally:
+        stats_queue.put(openstack_utils.get_clients_stats())
+
+
+def _parallel_sweep(queue, cls, method_name, scenario_cfg, context_cfg,
+                    aborted, output_queue, sla_action):
+    """Fan the sweep points out across a pool of worker processes
+
+    The benchmark records are emitted in the sweep order, regardless of the
+    order the points finish in.
+    """
+    runner_cfg = scenario_cfg['runner']
+    workers = runner_cfg['workers']
+    reuse_setup = runner_cfg.get('reuse_setup', True)
+    param_names, loop_iter = _get_loop_iter(runner_cfg)
+
+    point_queue = multiprocessing.Queue()
+    record_queue = multiprocessing.Queue()
+    stats_queue = multiprocessing.Queue()
+    stop = multiprocessing.Event()
+    num_points = 0
+    for num_points, comb_values in enumerate(loop_iter, 1):
+        point_queue.put((num_points, comb_values))
+    for _ in range(workers):
+        point_queue.put(None)
+
+    processes = [multiprocessing.Process(
+        name="{}-sweep-{}".format(multiprocessing.current_process().name, i),
+        target=_sweep_worker,
+        args=(cls, method_name, scenario_cfg, context_cfg, param_names,
+              reuse_setup, sla_action, point_queue, record_queue, stop,
+              stats_queue))
+        for i in range(workers)]
+    for process in processes:
+        process.start()
+
+    sla_error = None
+    finished = {}
+    sequence = 1
+    while sequence <= num_points and not stop.is_set():
+        if aborted.is_set():
+            break
+        try:
+            point = record_queue.get(True, POINT_QUEUE_TIMEOUT)
+        except six.moves.queue.Empty:
+            if not any(process.is_alive() for process in processes):
+                LOG.error("All sweep workers exited, %d points not run",
+                          num_points - sequence + 1)
+                break
+            continue
+        finished[point[0]] = point[1:]
+
+        # emit the records in order
+        while sequence in finished and not stop.is_set():
+            data, errors, result, duration, sla_assert = \
+                finished.pop(sequence)
+            if result:
+                output_queue.put(result)
+            queue.put({
+                'timestamp': time.time(),
+                'sequence': sequence,
+                'duration': duration,
+                'data': data,
+                'errors': errors
+            })
+            LOG.debug("runner=%(runner)s seq=%(sequence)s END",
+                      {"runner": runner_cfg["runner_id"],
+                       "sequence": sequence})
+            sequence += 1
+
+            if sla_assert:
+                sla_error = errors
+                stop.set()
+            elif errors and sla_action is None:
+                stop.set()
+
+    # the pending points and the records of the points run after the sweep
+    # stopped are discarded
+    stop.set()
+    point_queue.cancel_join_thread()
+    while any(process.is_alive() for process in processes):
+        try:
+            record_queue.get(True, POINT_QUEUE_TIMEOUT)
+        except six.moves.queue.Empty:
+            pass
+    for process in processes:
+        process.join()
+    while not stats_queue.empty():
+        openstack_utils.add_clients_stats(stats_queue.get())
+
+    if sla_error:
+        raise y_exc.SLAValidationError(
+            case_name=scenario_cfg['type'], error_msg=sla_error)
+
+
+def _worker_process(queue, cls, method_name, scenario_cfg,
+                    context_cfg, aborted, output_queue):
+
+    sequence = 1
+
+    runner_cfg = scenario_cfg['runner']
+
+    interval = _get_interval(cls, runner_cfg)
+    if 'options' in scenario_cfg:
+        options = scenario_cfg['options']
+    else:  # options must be instatiated if not present in yaml
+        options = {}
+        scenario_cfg['options'] = options
+
+    runner_cfg['runner_id'] = os.getpid()
+
+    LOG.info("worker START, class %s", cls)
+
+    sla_action = None
+    if "sla" in scenario_cfg:
+        sla_action = scenario_cfg["sla"].get("action", "assert")
+
+    if runner_cfg.get('workers', 1) > 1:
+        _parallel_sweep(queue, cls, method_name, scenario_cfg, context_cfg,
+                        aborted, output_queue, sla_action)
+        LOG.info("worker END")
+        return
+
+    benchmark = cls(scenario_cfg, context_cfg)
+    benchmark.setup()
+    method = getattr(benchmark, method_name)
+
+    param_names, loop_iter = _get_loop_iter(runner_cfg)
+
     # Populate options and run the requested method for each value combination
     for comb_values in loop_iter:
 
@@ -104,6 +288,7 @@ def _worker_process(queue, cls, method_name, scenario_cfg,
         data = {}
         errors = ""
 
+        start = time.time()
         try:
             result = method(data)
         except y_exc.SLAValidationError as error:
@@ -119,12 +304,14 @@ def _worker_process(queue, cls, method_name, scenario_cfg,
         else:
             if result:
                 output_queue.put(result)
+        duration = time.time() - start
 
         time.sleep(interval)
 
         benchmark_output = {
             'timestamp': time.time(),
             'sequence': sequence,
+            'duration': duration,
             'data': data,
             'errors': errors
         }
@@ -157,10 +344,22 @@ class ArithmeticRunner(base.Runner):
     """Run a scenario arithmetically stepping input value(s)
 
   Parameters
-    interval - time to wait between each scenario invocation
+    interval - time to wait between each scenario invocation; not applied
+               to stateless scenarios
         type:    int
         unit:    seconds
         default: 1 sec
+    workers - number of worker processes running the sweep points in
+              parallel. Only for scenarios whose invocations are independent
+              from each other. The records are emitted in the sweep order
+        type:    int
+        unit:    na
+        default: 1
+    reuse_setup - in parallel mode, set up the scenario once per worker
+                  instead of once per sweep point
+        type:    bool
+        unit:    na
+        default: True
     iter_type: - Iteration type of input parameter(s): nested_for_loops
                  or tuple_loops
         type:    string
@@ -195,7 +394,7 @@ class ArithmeticRunner(base.Runner):
         name = "{}-{}-{}".format(self.__execution_type__, scenario_cfg.get("type"), os.getpid())
         self.process = multiprocessing.Process(
             name=name,
-            target=_worker_process,
+            target=self._profiled(_worker_process),
             args=(self.result_queue, cls, method, scenario_cfg,
                   context_cfg, self.aborted, self.output_queue))
         self.process.start()
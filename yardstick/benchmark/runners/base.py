@@ -15,9 +15,12 @@
 #
 # This is a modified copy of ``rally/rally/benchmark/runners/base.py``
 
+import cProfile
+import functools
 import importlib
 import logging
 import multiprocessing
+import os
 import subprocess
 import time
 import traceback
@@ -25,11 +28,15 @@ import traceback
 from six import moves
 
 from yardstick.benchmark.scenarios import base as base_scenario
+from yardstick.common import constants
 from yardstick.common import messaging
 from yardstick.common.messaging import payloads
 from yardstick.common.messaging import producer
+from yardstick.common import openstack_utils
+from yardstick.common import profiler
 from yardstick.common import utils
 from yardstick.dispatcher.base import Base as DispatcherBase
+from yardstick.dispatcher import file as file_dispatcher
 
 
 log = logging.getLogger(__name__)
@@ -80,6 +87,35 @@ def _periodic_action(interval, command, queue):
         queue.put({'periodic-action-data': data})
 
 
+def _profiled_worker(target, profile_queue, profile_dir, record_queue,
+                     *args):
+    """entrypoint for the runner worker processes, collecting their spans
+
+    If "profile_dir" is set, the worker is run under cProfile and its
+    statistics are dumped in "<profile_dir>/<process name>.prof". The
+    intermediate records of the scenarios (see Scenario.emit_record) are
+    put in "record_queue". The spans are sent in "profile_queue" with the
+    OpenStack clients stats of the worker.
+    """
+    profiler.reset()
+    base_scenario.set_record_queue(record_queue)
+    process_name = multiprocessing.current_process().name
+    try:
+        with profiler.span('worker', process=process_name):
+            if not profile_dir:
+                target(*args)
+                return
+            prof = cProfile.Profile()
+            try:
+                prof.runcall(target, *args)
+            finally:
+                prof.dump_stats(os.path.join(
+                    profile_dir, '{}.prof'.format(process_name)))
+    finally:
+        profile_queue.put((profiler.get_spans(),
+                           openstack_utils.get_clients_stats()))
+
+
 class Runner(object):
     runners = []
 
@@ -144,7 +180,10 @@ class Runner(object):
         self.periodic_action_process = None
         self.output_queue = multiprocessing.Queue()
         self.result_queue = multiprocessing.Queue()
+        self.profile_queue = multiprocessing.Queue()
         self.process = None
+        self._start_time = None
+        self._profile_spans = []
         self.aborted = multiprocessing.Event()
         Runner.runners.append(self)
 
@@ -207,8 +246,25 @@ class Runner(object):
                       self.result_queue))
             self.periodic_action_process.start()
 
+        self._start_time = time.time()
+        self._profile_spans = []
         self._run_benchmark(cls, "run", scenario_cfg, context_cfg)
 
+    def _profiled(self, target):
+        """Wrap a worker process target to collect its profiling spans
+
+        When the task is started with "--profile", the worker process is
+        also run under cProfile.
+        """
+        profile_dir = None
+        if self.config.get('profile'):
+            profile_dir = os.path.join(constants.TASK_LOG_DIR,
+                                       '{}-profile'.format(self.task_id))
+            utils.makedirs(profile_dir)
+        return functools.partial(_profiled_worker, target,
+                                 self.profile_queue, profile_dir,
+                                 self.result_queue)
+
     def abort(self):
         """Abort the execution of a scenario"""
         self.aborted.set()
@@ -224,10 +280,13 @@ class Runner(object):
             # drain the queue while we are running otherwise we won't terminate
             outputs.update(self.get_output())
             result.extend(self.get_result())
+            self._profile_spans.extend(self.get_profile())
             self.process.join(interval)
         # drain after the process has exited
         outputs.update(self.get_output())
         result.extend(self.get_result())
+        self._profile_spans.extend(self.get_profile())
+        self._add_profile_span()
 
         self.process.terminate()
         if self.periodic_action_process:
@@ -248,11 +307,38 @@ class Runner(object):
                 pass
         return result
 
+    def get_profile(self):
+        """Return the worker spans, adding up the worker clients stats"""
+        spans = []
+        while not self.profile_queue.empty():
+            try:
+                worker_spans, clients_stats = self.profile_queue.get(True, 1)
+            except moves.queue.Empty:
+                pass
+            else:
+                spans.extend(worker_spans)
+                openstack_utils.add_clients_stats(clients_stats)
+        return spans
+
+    def _add_profile_span(self):
+        """Record the runner execution, with its worker spans, once"""
+        if self._start_time is None:
+            return
+        profiler.add_span('runner', self._start_time,
+                          time.time() - self._start_time,
+                          children=self._profile_spans,
+                          runner=self.__execution_type__,
+                          scenario=self.config.get('object', ''))
+        self._start_time = None
+
     def get_result(self):
         result = []
 
         dispatcher = self.config['output_config']['DEFAULT']['dispatcher']
         output_in_influxdb = 'influxdb' in dispatcher
+        output_in_file = ('file' in dispatcher and
+                          file_dispatcher.is_chunked(
+                              self.config['output_config']))
 
         while not self.result_queue.empty():
             log.debug("result_queue size %s", self.result_queue.qsize())
@@ -262,7 +348,10 @@ class Runner(object):
                 pass
             else:
                 if output_in_influxdb:
-                    self._output_to_influxdb(one_record)
+                    with profiler.timer('influxdb'):
+                        self._output_to_influxdb(one_record)
+                if output_in_file:
+                    self._output_to_file(one_record)
 
                 result.append(one_record)
         return result
@@ -272,6 +361,12 @@ class Runner(object):
         dispatcher = next((d for d in dispatchers if d.__dispatcher_type__ == 'Influxdb'))
         dispatcher.upload_one_record(record, self.case_name, '', task_id=self.task_id)
 
+    def _output_to_file(self, record):
+        dispatchers = DispatcherBase.get(self.config['output_config'])
+        dispatcher = next((d for d in dispatchers if d.__dispatcher_type__ == 'File'))
+        dispatcher.upload_one_record(record, self.case_name, '', task_id=self.task_id,
+                                     scenario=self.config.get('object'))
+
 
 class RunnerProducer(producer.MessagingProducer):
     """Class implementing the message producer for runners"""
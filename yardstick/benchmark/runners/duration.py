@@ -21,11 +21,14 @@
 
 from __future__ import absolute_import
 import os
+import math
 import multiprocessing
 import logging
 import traceback
 import time
 
+from concurrent import futures
+
 from yardstick.benchmark.runners import base
 from yardstick.common import exceptions as y_exc
 
@@ -33,29 +36,48 @@ LOG = logging.getLogger(__name__)
 
 
 QUEUE_PUT_TIMEOUT = 10
+# shortest interval of the fixed rate mode, in seconds
+MIN_INTERVAL = 0.1
 
+# time.monotonic is not available in Python 2.7
+_monotonic = getattr(time, 'monotonic', time.time)
 
-def _worker_process(queue, cls, method_name, scenario_cfg,
-                    context_cfg, aborted, output_queue):
 
-    sequence = 1
+def _run_method(method, sla_action, output_queue):
+    """Run the scenario method once, return the data and errors of the run
+
+    The SLAValidationError is raised if the SLA action is "assert".
+    """
+    data = {}
+    errors = ""
+    try:
+        result = method(data)
+    except y_exc.SLAValidationError as error:
+        # SLA validation failed in scenario, determine what to do now
+        if sla_action == "assert":
+            raise
+        elif sla_action == "monitor":
+            LOG.warning("SLA validation failed: %s", error.args)
+            errors = error.args
+    # catch all exceptions because with multiprocessing we can have un-picklable exception
+    # problems  https://bugs.python.org/issue9400
+    except Exception:  # pylint: disable=broad-except
+        errors = traceback.format_exc()
+        LOG.exception("")
+    else:
+        if result:
+            # add timeout for put so we don't block test
+            # if we do timeout we don't care about dropping individual KPIs
+            output_queue.put(result, True, QUEUE_PUT_TIMEOUT)
+    return data, errors
 
-    runner_cfg = scenario_cfg['runner']
 
+def _fixed_delay_loop(queue, benchmark, method, runner_cfg, sla_action,
+                      aborted, output_queue):
+    """Run the method, waiting "interval" seconds around each run"""
+    sequence = 1
     interval = runner_cfg.get("interval", 1)
     duration = runner_cfg.get("duration", 60)
-    LOG.info("Worker START, duration is %ds", duration)
-    LOG.debug("class is %s", cls)
-
-    runner_cfg['runner_id'] = os.getpid()
-
-    benchmark = cls(scenario_cfg, context_cfg)
-    benchmark.setup()
-    method = getattr(benchmark, method_name)
-
-    sla_action = None
-    if "sla" in scenario_cfg:
-        sla_action = scenario_cfg["sla"].get("action", "assert")
 
     start = time.time()
     timeout = start + duration
@@ -64,31 +86,9 @@ def _worker_process(queue, cls, method_name, scenario_cfg,
         LOG.debug("runner=%(runner)s seq=%(sequence)s START",
                   {"runner": runner_cfg["runner_id"], "sequence": sequence})
 
-        data = {}
-        errors = ""
-
         benchmark.pre_run_wait_time(interval)
 
-        try:
-            result = method(data)
-        except y_exc.SLAValidationError as error:
-            # SLA validation failed in scenario, determine what to do now
-            if sla_action == "assert":
-                benchmark.teardown()
-                raise
-            elif sla_action == "monitor":
-                LOG.warning("SLA validation failed: %s", error.args)
-                errors = error.args
-        # catch all exceptions because with multiprocessing we can have un-picklable exception
-        # problems  https://bugs.python.org/issue9400
-        except Exception:  # pylint: disable=broad-except
-            errors = traceback.format_exc()
-            LOG.exception("")
-        else:
-            if result:
-                # add timeout for put so we don't block test
-                # if we do timeout we don't care about dropping individual KPIs
-                output_queue.put(result, True, QUEUE_PUT_TIMEOUT)
+        data, errors = _run_method(method, sla_action, output_queue)
 
         benchmark.post_run_wait_time(interval)
 
@@ -107,9 +107,112 @@ def _worker_process(queue, cls, method_name, scenario_cfg,
         sequence += 1
 
         if (errors and sla_action is None) or time.time() > timeout or aborted.is_set():
-            LOG.info("Worker END")
             break
 
+
+def _fixed_rate_loop(queue, method, runner_cfg, sla_action, aborted,
+                     output_queue):
+    """Run the method every "interval" seconds, whatever its run time
+
+    The n-th run is scheduled at start + n * interval, on the monotonic
+    clock. Up to "max_overlap" runs are in progress at once; a deadline
+    reached while they are all in progress is missed and counted, it does
+    not delay the next runs.
+    """
+    interval = float(runner_cfg.get("interval", 1))
+    if interval < MIN_INTERVAL:
+        LOG.warning("Interval %ss is too short, using %ss", interval,
+                    MIN_INTERVAL)
+        interval = MIN_INTERVAL
+    duration = runner_cfg.get("duration", 60)
+    max_overlap = max(int(runner_cfg.get("max_overlap", 1)), 1)
+    num_deadlines = max(int(math.ceil(duration / interval)), 1)
+
+    def run(sequence, scheduled, missed):
+        LOG.debug("runner=%(runner)s seq=%(sequence)s START",
+                  {"runner": runner_cfg["runner_id"], "sequence": sequence})
+        actual = time.time()
+        data, errors = _run_method(method, sla_action, output_queue)
+        benchmark_output = {
+            'timestamp': time.time(),
+            'scheduled_timestamp': scheduled,
+            'actual_timestamp': actual,
+            'missed_deadlines': missed,
+            'sequence': sequence,
+            'data': data,
+            'errors': errors
+        }
+        queue.put(benchmark_output, True, QUEUE_PUT_TIMEOUT)
+        LOG.debug("runner=%(runner)s seq=%(sequence)s END",
+                  {"runner": runner_cfg["runner_id"], "sequence": sequence})
+        return errors
+
+    def stop_on_errors(done):
+        # result() raises the SLAValidationError of the "assert" action
+        return any([future.result() and sla_action is None
+                    for future in done])
+
+    executor = futures.ThreadPoolExecutor(max_workers=max_overlap)
+    running = set()
+    missed = 0
+    sequence = 1
+    start = _monotonic()
+    start_time = time.time()
+    try:
+        for deadline in range(num_deadlines):
+            delay = start + deadline * interval - _monotonic()
+            if aborted.wait(max(delay, 0)):
+                break
+            done = {future for future in running if future.done()}
+            running -= done
+            if stop_on_errors(done):
+                break
+            if len(running) >= max_overlap:
+                missed += 1
+                LOG.warning("runner=%s deadline %s missed, %s runs in "
+                            "progress", runner_cfg["runner_id"], deadline,
+                            len(running))
+                continue
+            running.add(executor.submit(
+                run, sequence, start_time + deadline * interval, missed))
+            sequence += 1
+        stop_on_errors(futures.wait(running).done)
+    finally:
+        executor.shutdown(wait=True)
+    LOG.info("%s runs, %s deadlines missed", sequence - 1, missed)
+
+
+def _worker_process(queue, cls, method_name, scenario_cfg,
+                    context_cfg, aborted, output_queue):
+
+    runner_cfg = scenario_cfg['runner']
+
+    duration = runner_cfg.get("duration", 60)
+    LOG.info("Worker START, duration is %ss", duration)
+    LOG.debug("class is %s", cls)
+
+    runner_cfg['runner_id'] = os.getpid()
+
+    benchmark = cls(scenario_cfg, context_cfg)
+    benchmark.setup()
+    method = getattr(benchmark, method_name)
+
+    sla_action = None
+    if "sla" in scenario_cfg:
+        sla_action = scenario_cfg["sla"].get("action", "assert")
+
+    try:
+        if runner_cfg.get("fixed_rate"):
+            _fixed_rate_loop(queue, method, runner_cfg, sla_action, aborted,
+                             output_queue)
+        else:
+            _fixed_delay_loop(queue, benchmark, method, runner_cfg,
+                              sla_action, aborted, output_queue)
+    except y_exc.SLAValidationError:
+        benchmark.teardown()
+        raise
+    LOG.info("Worker END")
+
     try:
         benchmark.teardown()
     except Exception:
@@ -135,9 +238,20 @@ If the scenario ends before the time has elapsed, it will be started again.
         unit:    seconds
         default: 1 sec
     interval - time to wait between each scenario invocation
-        type:    int
+        type:    float
         unit:    seconds
         default: 1 sec
+    fixed_rate - start the scenario every "interval" seconds, instead of
+                 waiting "interval" seconds between the invocations; the
+                 records have the scheduled and actual timestamps of the
+                 invocation. The shortest interval is 0.1 sec
+        type:    bool
+        default: False
+    max_overlap - in fixed rate mode, number of invocations that can be in
+                  progress at once; a start time reached while they all are
+                  in progress is missed and counted
+        type:    int
+        default: 1
     """
     __execution_type__ = 'Duration'
 
@@ -145,7 +259,7 @@ If the scenario ends before the time has elapsed, it will be started again.
         name = "{}-{}-{}".format(self.__execution_type__, scenario_cfg.get("type"), os.getpid())
         self.process = multiprocessing.Process(
             name=name,
-            target=_worker_process,
+            target=self._profiled(_worker_process),
             args=(self.result_queue, cls, method, scenario_cfg,
                   context_cfg, self.aborted, self.output_queue))
         self.process.start()
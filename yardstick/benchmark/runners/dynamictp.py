@@ -32,6 +32,126 @@ from yardstick.common import exceptions as y_exc
 LOG = logging.getLogger(__name__)
 
 
+class RateSearch(object):
+    """Search for the max rate passing the SLA of a scenario
+
+    The search first brackets the max rate, growing the rate by "growth"
+    while the trials pass, then narrows the bracket, trying the rate at
+    "ratio" of it (0.5 for a bisection, 0.618 for a golden-section search),
+    until it is smaller than "delta" pps or, if defined, than "resolution"
+    times its upper bound.
+
+    The result of every trial is kept in a memo shared between iterations; a
+    trial whose rate is closer than delta/2 to an already tested one is not
+    run again and the bracket of a new iteration starts from the memo.
+    """
+
+    def __init__(self, trial, initial_rate, delta=1000, resolution=None,
+                 growth=1.5, ratio=0.5, max_sequences=10, reuse=True):
+        self._trial = trial
+        self._initial_rate = initial_rate
+        self._delta = delta
+        self._resolution = resolution
+        self._growth = growth
+        self._ratio = ratio
+        self._max_sequences = max_sequences
+        self._reuse = reuse
+        # requested pps -> (actual pps, passed, data, errors)
+        self.memo = {}
+        self._sender_max = None
+
+    def _lookup(self, rate):
+        if not (self._reuse and self.memo):
+            return None
+        nearest = min(self.memo, key=lambda pps: abs(pps - rate))
+        if abs(nearest - rate) < self._delta / 2.0:
+            return self.memo[nearest]
+        return None
+
+    def _bracket(self):
+        """Return the (max passing, min failing) rates in the memo"""
+        low, high, low_data = 0, None, None
+        if not self._reuse:
+            return low, high, low_data
+        for actual, passed, data, _ in self.memo.values():
+            if passed and actual > low:
+                low, low_data = actual, data
+            elif not passed:
+                high = actual if high is None else min(high, actual)
+        if self._sender_max is not None:
+            high = (self._sender_max if high is None
+                    else min(high, self._sender_max))
+        return low, high, low_data
+
+    def _converged(self, low, high):
+        if high is None:
+            return False
+        if high <= low or high - low < self._delta:
+            return True
+        return bool(self._resolution and
+                    (high - low) < self._resolution * high)
+
+    def _next_rate(self, low, high):
+        if high is None:
+            return int(max(self._initial_rate, low * self._growth))
+        return int(low + (high - low) * self._ratio)
+
+    def search(self, steps):
+        """Run one search iteration
+
+        :param steps: (list) the record of each step of the search is
+                      appended to it: requested and actual pps, ppm, SLA
+                      result, whether the trial was reused and its duration
+        :return: (tuple) data of the max passing trial, or of the last trial
+                 if none passed, and the errors of the last trial
+        """
+        low, high, low_data = self._bracket()
+        data, errors = {}, ""
+        sequence = 0
+        while sequence < self._max_sequences and \
+                not self._converged(low, high):
+            sequence += 1
+            rate = self._next_rate(low, high)
+            start = time.time()
+            trial = self._lookup(rate)
+            reused = trial is not None
+            if not reused:
+                trial = self._trial(rate)
+            actual, passed, data, errors = trial
+            if not errors:
+                self.memo[rate] = trial
+            steps.append({'sequence': sequence,
+                          'pps': rate,
+                          'actual_pps': actual,
+                          'ppm': data.get('ppm'),
+                          'sla_pass': passed,
+                          'reused': reused,
+                          'time': time.time() - start})
+            LOG.debug("sequence: %s rate: %s actual: %s pass: %s reused: %s",
+                      sequence, rate, actual, passed, reused)
+            if errors:
+                break
+
+            bracket = low, high
+            if passed:
+                # the sender could not go faster than the previous trials
+                if actual - low < self._delta and \
+                        rate - actual >= self._delta:
+                    LOG.debug("Sender reached max tput: %s", actual)
+                    self._sender_max = max(low, actual)
+                    high = self._sender_max
+                if actual > low:
+                    low, low_data = actual, data
+            else:
+                high = actual if high is None else min(high, actual)
+
+            if reused and bracket == (low, high):
+                # the rates left in the bracket were already tested
+                break
+
+        return (low_data or data), errors
+
+
 def _worker_process(queue, cls, method_name, scenario_cfg,
                     context_cfg, aborted):  # pragma: no cover
 
@@ -39,7 +159,6 @@ def _worker_process(queue, cls, method_name, scenario_cfg,
     iterations = runner_cfg.get("iterations", 1)
     interval = runner_cfg.get("interval", 1)
     run_step = runner_cfg.get("run_step", "setup,run,teardown")
-    delta = runner_cfg.get("delta", 1000)
     options_cfg = scenario_cfg['options']
     initial_rate = options_cfg.get("pps", 1000000)
     LOG.info("worker START, class %s", cls)
@@ -56,87 +175,64 @@ def _worker_process(queue, cls, method_name, scenario_cfg,
                'scenario_cfg': scenario_cfg,
                'context_cfg': context_cfg})
 
+    def trial(rate):
+        if aborted.is_set():
+            return 0, False, {}, "aborted"
+        scenario_cfg['options']['pps'] = rate
+        data = {}
+        errors = ""
+        passed = True
+        try:
+            method(data)
+        except y_exc.SLAValidationError as error:
+            LOG.warning("SLA validation failed: %s", error.args)
+            passed = False
+        except Exception as e:  # pylint: disable=broad-except
+            errors = traceback.format_exc()
+            LOG.exception(e)
+        time.sleep(interval)
+        return data.get('packets_per_second', 0), passed, data, errors
+
+    rate_search = RateSearch(
+        trial, initial_rate,
+        delta=runner_cfg.get("delta", 1000),
+        resolution=runner_cfg.get("resolution"),
+        growth=runner_cfg.get("growth", 1.5),
+        ratio=runner_cfg.get("ratio", 0.5),
+        max_sequences=runner_cfg.get("max_sequences", 10),
+        reuse=runner_cfg.get("reuse_trials", True))
+
     if "run" in run_step:
         iterator = 0
-        search_max = initial_rate
-        search_min = 0
         while iterator < iterations:
-            search_min = int(search_min / 2)
-            scenario_cfg['options']['pps'] = search_max
-            search_max_found = False
-            max_throuput_found = False
-            sequence = 0
-
-            last_min_data = {'packets_per_second': 0}
-
-            while True:
-                sequence += 1
-
-                data = {}
-                errors = ""
-                too_high = False
-
-                LOG.debug("sequence: %s search_min: %s search_max: %s",
-                          sequence, search_min, search_max)
-
-                try:
-                    method(data)
-                except y_exc.SLAValidationError as error:
-                    LOG.warning("SLA validation failed: %s", error.args)
-                    too_high = True
-                except Exception as e:  # pylint: disable=broad-except
-                    errors = traceback.format_exc()
-                    LOG.exception(e)
-
-                actual_pps = data['packets_per_second']
-
-                if too_high:
-                    search_max = actual_pps
-
-                    if not search_max_found:
-                        search_max_found = True
-                else:
-                    last_min_data = data
-                    search_min = actual_pps
-
-                    # Check if the actual rate is well below the asked rate
-                    if scenario_cfg['options']['pps'] > actual_pps * 1.5:
-                        search_max = actual_pps
-                        LOG.debug("Sender reached max tput: %s", search_max)
-                    elif not search_max_found:
-                        search_max = int(actual_pps * 1.5)
-
-                if ((search_max - search_min) < delta) or \
-                   (search_max <= search_min) or (10 <= sequence):
-                    if last_min_data['packets_per_second'] > 0:
-                        data = last_min_data
-
-                    benchmark_output = {
-                        'timestamp': time.time(),
-                        'sequence': sequence,
-                        'data': data,
-                        'errors': errors
-                    }
-
-                    record = {
-                        'runner_id': runner_cfg['runner_id'],
-                        'benchmark': benchmark_output
-                    }
-
-                    queue.put(record)
-                    max_throuput_found = True
-
-                if errors or aborted.is_set() or max_throuput_found:
-                    LOG.info("worker END")
-                    break
-
-                if not search_max_found:
-                    scenario_cfg['options']['pps'] = search_max
-                else:
-                    scenario_cfg['options']['pps'] = \
-                        (search_max - search_min) / 2 + search_min
-
-                time.sleep(interval)
+            start = time.time()
+            steps = []
+            data, errors = rate_search.search(steps)
+
+            for step in steps:
+                step['iteration'] = iterator
+                queue.put({'runner_id': runner_cfg['runner_id'],
+                           'search_step': step})
+
+            benchmark_output = {
+                'timestamp': time.time(),
+                'sequence': len(steps),
+                'data': data,
+                'errors': errors,
+                'search': {
+                    'trials': sum(1 for step in steps if not step['reused']),
+                    'reused_trials': sum(1 for step in steps
+                                         if step['reused']),
+                    'time': time.time() - start
+                }
+            }
+
+            queue.put({'runner_id': runner_cfg['runner_id'],
+                       'benchmark': benchmark_output})
+
+            if errors or aborted.is_set():
+                LOG.info("worker END")
+                break
 
             iterator += 1
             LOG.debug("iterator: %s iterations: %s", iterator, iterations)
@@ -165,10 +261,33 @@ If the scenario ends before the time has elapsed, it will be started again.
         type:    int
         unit:    seconds
         default: 1 sec
-    delta - stop condition for the search.
+    delta - stop condition for the search; trials closer than delta/2 to an
+            already tested rate are reused
         type:	 int
         unit:	 pps
         default: 1000 pps
+    resolution - relative stop condition for the search, as a fraction of
+                 the upper bound of the search bracket
+        type:    float
+        unit:    na
+        default: None
+    growth - rate multiplier used to bracket the max throughput
+        type:    float
+        unit:    na
+        default: 1.5
+    ratio - position of the next rate inside the search bracket, 0.5 for a
+            bisection, 0.618 for a golden-section search
+        type:    float
+        unit:    na
+        default: 0.5
+    max_sequences - max number of steps per iteration
+        type:    int
+        unit:    na
+        default: 10
+    reuse_trials - share the trial results between iterations
+        type:    bool
+        unit:    na
+        default: True
     """
     __execution_type__ = 'Dynamictp'
 
@@ -176,7 +295,7 @@ If the scenario ends before the time has elapsed, it will be started again.
         name = "{}-{}-{}".format(self.__execution_type__, scenario_cfg.get("type"), os.getpid())
         self.process = multiprocessing.Process(
             name=name,
-            target=_worker_process,
+            target=self._profiled(_worker_process),
             args=(self.result_queue, cls, method, scenario_cfg,
                   context_cfg, self.aborted))
         self.process.start()
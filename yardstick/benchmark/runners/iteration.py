@@ -159,7 +159,7 @@ If the scenario ends before the time has elapsed, it will be started again.
         name = "{}-{}-{}".format(self.__execution_type__, scenario_cfg.get("type"), os.getpid())
         self.process = multiprocessing.Process(
             name=name,
-            target=_worker_process,
+            target=self._profiled(_worker_process),
             args=(self.result_queue, cls, method, scenario_cfg,
                   context_cfg, self.aborted, self.output_queue))
         self.process.start()
@@ -25,11 +25,11 @@ import time
 import traceback
 
 import os
+from six import moves
 
 from yardstick.benchmark.runners import base as base_runner
 from yardstick.common import exceptions
 from yardstick.common import messaging
-from yardstick.common import utils
 from yardstick.common.messaging import consumer
 from yardstick.common.messaging import payloads
 
@@ -74,7 +74,8 @@ class RunnerIterationIPCConsumer(consumer.MessagingConsumer):
 
     def __init__(self, _id, ctx_ids):
         self._id = _id
-        self._queue = multiprocessing.Queue()
+        # the endpoints are called by the RPC server threads of this process
+        self._queue = moves.queue.Queue()
         endpoints = [RunnerIterationIPCEndpoint(_id, ctx_ids, self._queue)]
         super(RunnerIterationIPCConsumer, self).__init__(
             messaging.TOPIC_TG, ctx_ids, endpoints)
@@ -99,11 +100,35 @@ class RunnerIterationIPCConsumer(consumer.MessagingConsumer):
             'ctx2': [kpi0, kpi1, kpi2]}    --> return True
         """
         while not self._queue.empty():
-            msg = self._queue.get(True, 1)
-            if msg['action'] == messaging.TG_METHOD_ITERATION:
-                id_iter_list = self._kpi_per_id[msg['id']]
-                id_iter_list.append(msg['payload'].kpi)
+            self._process_message(self._queue.get(True, 1))
 
+        return self._all_kpis_received()
+
+    def wait_all_kpis_received_in_iteration(self, timeout):
+        """Wait until all producers have sent the ITERATION msg
+
+        The messages are processed as soon as they are received, instead of
+        polling ``is_all_kpis_received_in_iteration``.
+
+        :param timeout: (float) seconds to wait
+        :raises: WaitTimeout if the KPIs are not received in time
+        """
+        end = time.time() + timeout
+        while not self._all_kpis_received():
+            remaining = end - time.time()
+            if remaining <= 0:
+                raise exceptions.WaitTimeout
+            try:
+                msg = self._queue.get(True, remaining)
+            except moves.queue.Empty:
+                raise exceptions.WaitTimeout
+            self._process_message(msg)
+
+    def _process_message(self, msg):
+        if msg['action'] == messaging.TG_METHOD_ITERATION:
+            self._kpi_per_id[msg['id']].append(msg['payload'].kpi)
+
+    def _all_kpis_received(self):
         return all(len(id_iter_list) == self.iteration_index
                    for id_iter_list in self._kpi_per_id.values())
 
@@ -142,12 +167,13 @@ def _worker_process(queue, cls, method_name, scenario_cfg,
         result = None
         errors = ''
         mq_consumer.iteration_index = iteration_index
+        iteration_start = time.time()
         mq_producer.start_iteration()
 
         try:
-            utils.wait_until_true(
-                mq_consumer.is_all_kpis_received_in_iteration,
-                timeout=timeout, sleep=2)
+            mq_consumer.wait_all_kpis_received_in_iteration(timeout)
+            # time from the iteration start to the last KPI received
+            data['iteration_latency'] = time.time() - iteration_start
             result = method(data)
         except Exception:  # pylint: disable=broad-except
             errors = traceback.format_exc()
@@ -199,7 +225,7 @@ class IterationIPCRunner(base_runner.Runner):
             self.__execution_type__, scenario_cfg.get('type'), os.getpid())
         self.process = multiprocessing.Process(
             name=name,
-            target=_worker_process,
+            target=self._profiled(_worker_process),
             args=(self.result_queue, cls, method, scenario_cfg,
                   context_cfg, self.aborted, self.output_queue))
         self.process.start()
@@ -178,6 +178,6 @@ If the scenario ends before the time has elapsed, it will be started again.
         name = "{}-{}-{}".format(self.__execution_type__, scenario_cfg.get("type"), os.getpid())
         self.process = multiprocessing.Process(
             name=name,
-            target=self._worker_run,
+            target=self._profiled(self._worker_run),
             args=(cls, method, scenario_cfg, context_cfg))
         self.process.start()
@@ -14,15 +14,31 @@
 #    under the License.
 
 import abc
+import logging
 import time
 
 import six
+from six import moves
 from stevedore import extension
 
 import yardstick.common.utils as utils
 from yardstick.common import exceptions as y_exc
 
 
+LOG = logging.getLogger(__name__)
+
+QUEUE_PUT_TIMEOUT = 10
+
+# queue of the runner records, set in the runner worker processes
+_record_queue = None
+
+
+def set_record_queue(queue):
+    """Set the queue where the intermediate records are put"""
+    global _record_queue  # pylint: disable=global-statement
+    _record_queue = queue
+
+
 def _iter_scenario_classes(scenario_type=None):
     """Generator over all 'Scenario' subclasses
 
@@ -42,6 +58,10 @@ def _iter_scenario_classes(scenario_type=None):
 @six.add_metaclass(abc.ABCMeta)
 class Scenario(object):
 
+    # A stateless scenario "run" method does not depend on the previous
+    # invocations, thus the runners don't need to wait between them
+    __stateless__ = False
+
     def setup(self):
         """Default setup implementation for Scenario classes"""
         pass
@@ -67,6 +87,30 @@ class Scenario(object):
             raise y_exc.SLAValidationError(
                 case_name=self.__scenario_type__, error_msg=error_msg)
 
+    def emit_record(self, data, timestamp=None, errors=''):
+        """Send an intermediate record, e.g. a sample of a long "run" call
+
+        The record is dispatched like the records of the "run" calls, with
+        no sequence number. It is dropped if the scenario is not run by a
+        runner worker or if the runner does not drain its queue.
+
+        :return: True if the record was sent
+        """
+        if _record_queue is None:
+            return False
+        record = {
+            'timestamp': time.time() if timestamp is None else timestamp,
+            'sequence': None,
+            'data': data,
+            'errors': errors
+        }
+        try:
+            _record_queue.put(record, True, QUEUE_PUT_TIMEOUT)
+        except moves.queue.Full:
+            LOG.debug("Record queue full, dropping record %s", record)
+            return False
+        return True
+
     @staticmethod
     def get_types():
         """return a list of known runner type (class) names"""
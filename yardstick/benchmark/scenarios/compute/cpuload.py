@@ -19,6 +19,9 @@ from six.moves import map, zip
 
 import yardstick.ssh as ssh
 from yardstick.benchmark.scenarios import base
+from yardstick.benchmark.scenarios.compute import metrics_agent
+from yardstick.benchmark.scenarios.compute import metrics_agent_client
+from yardstick.common import exceptions
 
 LOG = logging.getLogger(__name__)
 
@@ -38,6 +41,10 @@ class CPULoad(base.Scenario):
     Load averages are read from the file '/proc/loadavg'
     on the Linux host.
 
+    Unless 'agent' is disabled, '/proc/loadavg' and '/proc/stat' are
+    sampled by a metrics agent started once on the host, instead of
+    running SSH commands for each measurement.
+
     Parameters
           interval - Time interval to measure CPU usage.
 
@@ -51,11 +58,20 @@ class CPULoad(base.Scenario):
           unit:       N/A
           default:    1
 
+          agent - Use the metrics agent, falling back to SSH commands
+          if it can't be started.
+
+          type:       [bool]
+          unit:       N/A
+          default:    True
+
     """
 
     __scenario_type__ = "CPUload"
 
     MPSTAT_FIELD_SIZE = 10
+    MPSTAT_FIELDS = ['%usr', '%nice', '%sys', '%idle', '%iowait',
+                     '%irq', '%soft', '%steal', '%guest', '%gnice']
 
     def __init__(self, scenario_cfg, context_cfg):
         """Scenario construction."""
@@ -64,6 +80,8 @@ class CPULoad(base.Scenario):
         self.setup_done = False
         self.has_mpstat = False
         self.has_count = False
+        self.agent = None
+        self._cpu_timestamp = None
 
     def setup(self):
         """Scenario setup."""
@@ -89,8 +107,30 @@ class CPULoad(base.Scenario):
         else:
             self.has_count = False
 
+        if options.get("agent", True):
+            self.agent = self._start_agent()
+
         self.setup_done = True
 
+    def _start_agent(self):
+        """Start the metrics agent, return None if it can't be started"""
+        agent = metrics_agent_client.MetricsAgent(
+            self.client, interval=self.interval if self.interval > 0 else 1)
+        try:
+            agent.start()
+        except (exceptions.MetricsAgentError, exceptions.SSHError) as e:
+            LOG.warning("Metrics agent not started, using SSH commands: %s",
+                        e)
+            agent.stop()
+            return None
+        return agent
+
+    def teardown(self):
+        """Scenario teardown."""
+        if self.agent:
+            self.agent.stop()
+            self.agent = None
+
     def _execute_command(self, cmd):
         """Execute a command on server."""
         LOG.info("Executing: %s", cmd)
@@ -102,7 +142,14 @@ class CPULoad(base.Scenario):
 
     def _get_loadavg(self):
         """Get system load."""
-        return {'loadavg': self._execute_command("cat /proc/loadavg").split()}
+        if not self.agent:
+            return {'loadavg':
+                    self._execute_command("cat /proc/loadavg").split()}
+
+        _, sections = self.agent.get_samples()[-1]
+        row = sections[metrics_agent.SECTION_LOADAVG][0]
+        return {'loadavg': ['%.2f' % (value / 100.0) for value in row[:3]] +
+                           ['%d/%d' % (row[3], row[4]), str(row[5])]}
 
     def _get_cpu_usage_mpstat(self):
         """Get processor usage using mpstat."""
@@ -182,33 +229,53 @@ class CPULoad(base.Scenario):
         return {'mpstat_maximun': maximum, 'mpstat_minimum': minimum,
                 'mpstat_average': average}
 
+    @staticmethod
+    def _agent_cpu_stats(sample):
+        """Return the CPU rows of an agent sample as /proc/stat tokens"""
+        return [['cpu' if row[0] < 0 else 'cpu%d' % row[0]] + row[1:]
+                for row in sample[1][metrics_agent.SECTION_CPU]]
+
     def _get_cpu_usage(self):
         """Get processor usage from /proc/stat."""
-        fields = ['%usr', '%nice', '%sys', '%idle', '%iowait',
-                  '%irq', '%soft', '%steal', '%guest', '%gnice']
-
-        cmd = "grep '^cpu[0-9 ].' /proc/stat"
-
-        if self.interval > 0:
-            previous = self._execute_command(cmd).splitlines()
-            time.sleep(self.interval)
-            current = self._execute_command(cmd).splitlines()
+        if self.agent:
+            if self.interval > 0:
+                # consecutive samples, not used together in a previous run
+                samples = self.agent.get_samples(
+                    2, newer_than=self._cpu_timestamp)
+                self._cpu_timestamp = samples[0][0]
+                previous = self._agent_cpu_stats(samples[0])
+            else:
+                samples = self.agent.get_samples()
+                previous = None
+            current = self._agent_cpu_stats(samples[-1])
         else:
-            current = self._execute_command(cmd).splitlines()
-            previous = current
+            cmd = "grep '^cpu[0-9 ].' /proc/stat"
 
-        mpstat = {}
+            if self.interval > 0:
+                previous = self._execute_command(cmd).splitlines()
+                time.sleep(self.interval)
+                current = self._execute_command(cmd).splitlines()
+                previous = [line.split() for line in previous]
+            else:
+                current = self._execute_command(cmd).splitlines()
+                previous = None
+            current = [line.split() for line in current]
+
+        return {'mpstat': self._calc_cpu_usage(previous, current)}
 
-        for (prev, cur) in zip(previous, current):
+    def _calc_cpu_usage(self, previous, current):
+        """Compute the usage between two lists of /proc/stat cpu tokens
 
-            # Split string to list tokens
-            cur_list = cur.split()
-            prev_list = prev.split()
+        Without previous statistics, the usage since boot is computed.
+        """
+        mpstat = {}
 
+        for (prev_list, cur_list) in zip(previous or [None] * len(current),
+                                         current):
             cpu = cur_list[0]
 
             cur_stats = list(map(int, cur_list[1:]))
-            if self.interval > 0:
+            if prev_list:
                 prev_stats = list(map(int, prev_list[1:]))
             else:
                 prev_stats = [0] * len(cur_stats)
@@ -235,9 +302,9 @@ class CPULoad(base.Scenario):
 
             load = list(map(_percent, cur_stats, prev_stats))
 
-            mpstat[cpu] = dict(list(zip(fields, load)))
+            mpstat[cpu] = dict(list(zip(self.MPSTAT_FIELDS, load)))
 
-        return {'mpstat': mpstat}
+        return mpstat
 
     def run(self, result):
         """Read processor statistics."""
@@ -14,6 +14,9 @@ import logging
 import yardstick.ssh as ssh
 
 from yardstick.benchmark.scenarios import base
+from yardstick.benchmark.scenarios.compute import metrics_agent
+from yardstick.benchmark.scenarios.compute import metrics_agent_client
+from yardstick.common import exceptions
 from six.moves import zip
 
 LOG = logging.getLogger(__name__)
@@ -24,7 +27,9 @@ class MEMLoad(base.Scenario):
 
     This scenario reads memory usage statistics on a Linux host.
 
-    memory usage statistics are read using the utility 'free'.
+    memory usage statistics are read using the utility 'free', or unless
+    'agent' is disabled, from the '/proc/meminfo' samples of a metrics agent
+    started once on the host.
 
     Parameters
         interval - Time interval to measure memory usage.
@@ -37,14 +42,25 @@ class MEMLoad(base.Scenario):
         type:       [int]
         unit:       N/A
         default:    1
+
+        agent - Use the metrics agent, falling back to 'free' if it can't
+        be started.
+        type:       [bool]
+        unit:       N/A
+        default:    True
     """
     __scenario_type__ = "MEMORYload"
 
+    FREE_FIELDS = ['total', 'used', 'free', 'shared', 'buff/cache',
+                   'available']
+
     def __init__(self, scenario_cfg, context_cfg):
         """Scenario construction."""
         self.scenario_cfg = scenario_cfg
         self.context_cfg = context_cfg
         self.setup_done = False
+        self.agent = None
+        self._mem_timestamp = None
 
     def setup(self):
         """Scenario setup."""
@@ -53,8 +69,31 @@ class MEMLoad(base.Scenario):
         self.client = ssh.SSH.from_node(host, defaults={"user": "ubuntu"})
         self.client.wait(timeout=600)
 
+        options = self.scenario_cfg.get('options', {})
+        if options.get("agent", True):
+            self.agent = self._start_agent(options.get("interval", 1),
+                                           options.get("count", 1))
+
         self.setup_done = True
 
+    def _start_agent(self, interval, count):
+        """Start the metrics agent, return None if it can't be started"""
+        agent = metrics_agent_client.MetricsAgent(
+            self.client, interval=interval, depth=max(60, 2 * count))
+        try:
+            agent.start()
+        except (exceptions.MetricsAgentError, exceptions.SSHError) as e:
+            LOG.warning("Metrics agent not started, using 'free': %s", e)
+            agent.stop()
+            return None
+        return agent
+
+    def teardown(self):
+        """Scenario teardown."""
+        if self.agent:
+            self.agent.stop()
+            self.agent = None
+
     def _execute_command(self, cmd):
         """Execute a command on server."""
         LOG.info("Executing: %s", cmd)
@@ -68,10 +107,6 @@ class MEMLoad(base.Scenario):
         fields = []
         free = {}
         ite = 0
-        average = {'total': 0, 'used': 0, 'free': 0, 'buff/cache': 0,
-                   'shared': 0}
-        maximum = {'total': 0, 'used': 0, 'free': 0, 'buff/cache': 0,
-                   'shared': 0}
 
         for row in result.split('\n'):
             line = row.split()
@@ -86,6 +121,15 @@ class MEMLoad(base.Scenario):
                 if values and len(values) == len(fields):
                     free[memory] = dict(list(zip(fields, values)))
 
+        return self._aggregate(free)
+
+    @staticmethod
+    def _aggregate(free):
+        average = {'total': 0, 'used': 0, 'free': 0, 'buff/cache': 0,
+                   'shared': 0}
+        maximum = {'total': 0, 'used': 0, 'free': 0, 'buff/cache': 0,
+                   'shared': 0}
+
         for entry in free:
             for item in average:
                 average[item] += int(free[entry][item])
@@ -99,12 +143,37 @@ class MEMLoad(base.Scenario):
 
         return {'free': free, 'average': average, 'max': maximum}
 
+    def _get_agent_mem_usage(self, count):
+        """Get memory usage from the metrics agent /proc/meminfo samples"""
+        samples = self.agent.get_samples(count,
+                                         newer_than=self._mem_timestamp)
+        self._mem_timestamp = samples[-1][0]
+
+        free = {}
+        for ite, (_, sections) in enumerate(samples):
+            meminfo = dict(zip(metrics_agent.MEMINFO_FIELDS,
+                               sections[metrics_agent.SECTION_MEMINFO][0]))
+            # same computation as 'free', in kB
+            buff_cache = (meminfo['Buffers'] + meminfo['Cached'] +
+                          meminfo['SReclaimable'])
+            values = [meminfo['MemTotal'],
+                      meminfo['MemTotal'] - meminfo['MemFree'] - buff_cache,
+                      meminfo['MemFree'], meminfo['Shmem'], buff_cache,
+                      meminfo['MemAvailable']]
+            free['memory' + str(ite)] = dict(
+                zip(self.FREE_FIELDS, [str(value) for value in values]))
+
+        return self._aggregate(free)
+
     def _get_mem_usage(self):
         """Get memory usage using free."""
         options = self.scenario_cfg['options']
         interval = options.get("interval", 1)
         count = options.get("count", 1)
 
+        if self.agent:
+            return self._get_agent_mem_usage(count)
+
         cmd = "free -c '%s' -s '%s'" % (count, interval)
 
         result = self._execute_command(cmd)
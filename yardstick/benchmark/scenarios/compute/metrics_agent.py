@@ -0,0 +1,178 @@
+##############################################################################
+# Copyright (c) 2018 Intel Corporation
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+"""Metrics agent, sampling the /proc counters of a host
+
+This script is uploaded to the host and started once by the compute
+scenarios; it must only depend on the Python standard library (2.7 and 3).
+
+The counters are sampled at a fixed rate into a ring buffer, and the
+samples are streamed on stdout as binary frames:
+
+    frame header:    magic (2s), timestamp (d), number of sections (H)
+    section header:  section id (B), rows (H), columns (H)
+    section values:  rows * columns signed integers (q)
+
+If stdout is not read fast enough, the oldest samples are dropped. The
+agent exits when stdout is closed.
+"""
+
+import argparse
+import collections
+import os
+import struct
+import sys
+import threading
+import time
+
+
+MAGIC = b'YM'
+FRAME_HEADER = struct.Struct('!2sdH')
+SECTION_HEADER = struct.Struct('!BHH')
+VALUE_SIZE = struct.calcsize('!q')
+
+# /proc/stat "cpu" lines: CPU index (-1 for all the CPUs) and CPU_COLUMNS
+# jiffies counters (user, nice, system, idle, iowait, irq, softirq, steal,
+# guest, guest_nice)
+SECTION_CPU = 1
+CPU_COLUMNS = 10
+# /proc/loadavg: 1, 5 and 15 minutes load averages * 100, running and total
+# number of processes, last PID
+SECTION_LOADAVG = 2
+# /proc/meminfo: MEMINFO_FIELDS, in kB
+SECTION_MEMINFO = 3
+MEMINFO_FIELDS = ('MemTotal', 'MemFree', 'MemAvailable', 'Buffers', 'Cached',
+                  'SReclaimable', 'Shmem')
+
+
+def read_cpu():
+    rows = []
+    with open('/proc/stat') as proc_file:
+        for line in proc_file.read().splitlines():
+            if not line.startswith('cpu'):
+                break
+            fields = line.split()
+            index = -1 if fields[0] == 'cpu' else int(fields[0][3:])
+            values = [int(value) for value in fields[1:CPU_COLUMNS + 1]]
+            rows.append([index] + values + [0] * (CPU_COLUMNS - len(values)))
+    return rows
+
+
+def read_loadavg():
+    with open('/proc/loadavg') as proc_file:
+        fields = proc_file.read().split()
+    running, total = fields[3].split('/')
+    return [[int(round(float(value) * 100)) for value in fields[:3]] +
+            [int(running), int(total), int(fields[4])]]
+
+
+def read_meminfo():
+    values = dict.fromkeys(MEMINFO_FIELDS, 0)
+    with open('/proc/meminfo') as proc_file:
+        for line in proc_file.read().splitlines():
+            name, value = line.split(':', 1)
+            if name in values:
+                values[name] = int(value.split()[0])
+    return [[values[name] for name in MEMINFO_FIELDS]]
+
+
+SOURCES = ((SECTION_CPU, read_cpu),
+           (SECTION_LOADAVG, read_loadavg),
+           (SECTION_MEMINFO, read_meminfo))
+
+
+def encode_sample(timestamp, sections):
+    """Encode one sample, "sections" is a list of (section id, rows)"""
+    chunks = [FRAME_HEADER.pack(MAGIC, timestamp, len(sections))]
+    for section_id, rows in sections:
+        columns = len(rows[0]) if rows else 0
+        chunks.append(SECTION_HEADER.pack(section_id, len(rows), columns))
+        chunks.append(struct.pack('!%dq' % (len(rows) * columns),
+                                  *[value for row in rows for value in row]))
+    return b''.join(chunks)
+
+
+def decode_frames(buf):
+    """Decode the complete frames at the beginning of a buffer
+
+    :return: (samples, number of bytes decoded), a sample being a tuple
+             (timestamp, {section id: rows})
+    """
+    samples = []
+    offset = 0
+    while len(buf) - offset >= FRAME_HEADER.size:
+        start = offset
+        magic, timestamp, count = FRAME_HEADER.unpack_from(buf, offset)
+        if magic != MAGIC:
+            raise ValueError('Invalid metrics agent frame')
+        offset += FRAME_HEADER.size
+        sections = {}
+        for _ in range(count):
+            if len(buf) - offset < SECTION_HEADER.size:
+                return samples, start
+            section_id, rows, columns = SECTION_HEADER.unpack_from(buf,
+                                                                   offset)
+            offset += SECTION_HEADER.size
+            size = rows * columns
+            if len(buf) - offset < size * VALUE_SIZE:
+                return samples, start
+            values = struct.unpack_from('!%dq' % size, buf, offset)
+            offset += size * VALUE_SIZE
+            sections[section_id] = [list(values[row:row + columns])
+                                    for row in range(0, size, columns)]
+        samples.append((timestamp, sections))
+    return samples, offset
+
+
+def sample(ring, ready, interval):
+    """Sample the counters every "interval" seconds, without drift"""
+    next_time = time.time()
+    while True:
+        timestamp = time.time()
+        frame = encode_sample(timestamp, [(section_id, read())
+                                          for section_id, read in SOURCES])
+        with ready:
+            ring.append(frame)
+            ready.notify()
+        next_time += interval
+        time.sleep(max(next_time - time.time(), 0))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--interval', type=float, default=1.0)
+    parser.add_argument('--depth', type=int, default=60)
+    parser.add_argument('--pidfile')
+    args = parser.parse_args(argv)
+
+    if args.pidfile:
+        with open(args.pidfile, 'w') as pid_file:
+            pid_file.write(str(os.getpid()))
+
+    ring = collections.deque(maxlen=args.depth)
+    ready = threading.Condition()
+    sampler = threading.Thread(target=sample,
+                               args=(ring, ready, args.interval))
+    sampler.daemon = True
+    sampler.start()
+
+    out = getattr(sys.stdout, 'buffer', sys.stdout)
+    while True:
+        with ready:
+            while not ring:
+                ready.wait()
+            frame = ring.popleft()
+        try:
+            out.write(frame)
+            out.flush()
+        except (IOError, OSError):
+            return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,147 @@
+##############################################################################
+# Copyright (c) 2018 Intel Corporation
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+"""Client of the metrics agent, see metrics_agent.py
+
+The agent is uploaded and started once on a host, then streams its samples
+over a single long-lived SSH channel. The samples are decoded in a
+background thread into a ring buffer, where the scenarios read them instead
+of running one SSH command per measurement.
+"""
+
+import collections
+import io
+import logging
+import threading
+import time
+import uuid
+
+import pkg_resources
+
+from yardstick.benchmark.scenarios.compute import metrics_agent
+from yardstick.common import exceptions
+
+
+LOG = logging.getLogger(__name__)
+
+
+class FrameReader(io.RawIOBase):
+    """Binary stream decoding the agent frames as they are written"""
+
+    def __init__(self, callback):
+        super(FrameReader, self).__init__()
+        self._callback = callback
+        self._buffer = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._buffer.extend(data)
+        samples, consumed = metrics_agent.decode_frames(bytes(self._buffer))
+        del self._buffer[:consumed]
+        for sample in samples:
+            self._callback(sample)
+        return len(data)
+
+
+class MetricsAgent(object):
+    """Metrics agent running on a host
+
+    A sample is a tuple (timestamp, {section id: rows}), see
+    metrics_agent.decode_frames.
+    """
+
+    START_TIMEOUT = 30
+
+    def __init__(self, client, interval=1, depth=60):
+        self.client = client
+        self.interval = interval
+        self.depth = depth
+        self._samples = collections.deque(maxlen=depth)
+        self._ready = threading.Condition()
+        self._thread = None
+        self._exit_status = None
+        name = 'yardstick_metrics_agent_%s' % uuid.uuid4().hex[:8]
+        self.script = '/tmp/%s.py' % name
+        self.pidfile = '/tmp/%s.pid' % name
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Upload and start the agent, wait for its first sample"""
+        script = pkg_resources.resource_filename(
+            'yardstick.benchmark.scenarios.compute', 'metrics_agent.py')
+        self.client._put_file_shell(script, self.script)
+        cmd = ('"$(command -v python3 || command -v python)" %s '
+               '--interval %s --depth %s --pidfile %s' %
+               (self.script, self.interval, self.depth, self.pidfile))
+        LOG.info("Starting metrics agent: %s", cmd)
+        self._thread = threading.Thread(target=self._run, args=(cmd, ))
+        self._thread.daemon = True
+        self._thread.start()
+        self.get_samples(timeout=self.START_TIMEOUT)
+
+    def _run(self, cmd):
+        try:
+            self._exit_status = self.client.run(
+                cmd, stdout=FrameReader(self._add_sample), timeout=0,
+                raise_on_error=False)
+        except Exception:  # pylint: disable=broad-except
+            LOG.exception("Metrics agent channel failed")
+        finally:
+            with self._ready:
+                self._ready.notify_all()
+
+    def _add_sample(self, sample):
+        with self._ready:
+            self._samples.append(sample)
+            self._ready.notify_all()
+
+    def get_samples(self, count=1, newer_than=None, timeout=None):
+        """Return the "count" latest samples, newer than "newer_than"
+
+        Wait for the agent to send the missing samples, up to "timeout"
+        seconds (by default, the time needed to sample them).
+        """
+        if count > self.depth:
+            raise exceptions.MetricsAgentError(
+                host=self.client.host,
+                error_msg='%s samples requested, ring buffer depth is %s' %
+                (count, self.depth))
+        if timeout is None:
+            timeout = (count + 1) * self.interval + self.START_TIMEOUT
+        deadline = time.time() + timeout
+
+        def _ready():
+            if len(self._samples) < count:
+                return False
+            return (newer_than is None or
+                    self._samples[-count][0] > newer_than)
+
+        with self._ready:
+            while not _ready():
+                remaining = deadline - time.time()
+                if remaining <= 0 or not self.running:
+                    raise exceptions.MetricsAgentError(
+                        host=self.client.host,
+                        error_msg='no sample received, exit status %s' %
+                        self._exit_status)
+                self._ready.wait(remaining)
+            return list(self._samples)[-count:]
+
+    def stop(self):
+        """Stop the agent and remove its files"""
+        if self._thread is None:
+            return
+        self.client.execute('kill $(cat %s); rm -f %s %s' %
+                            (self.pidfile, self.pidfile, self.script))
+        self._thread.join(self.START_TIMEOUT)
+        self._thread = None
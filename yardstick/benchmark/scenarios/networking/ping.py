@@ -31,6 +31,11 @@ class Ping(base.Scenario):
         type:    int
         unit:    bytes
         default: 56
+    parallel - ping all the destinations concurrently, with a single remote
+        command, instead of one command per destination
+        type:    bool
+        unit:    na
+        default: True
     """
 
     __scenario_type__ = "Ping"
@@ -38,12 +43,16 @@ class Ping(base.Scenario):
     PING_ERROR_RTT = 999999
 
     TARGET_SCRIPT = 'ping_benchmark.bash'
+    PARALLEL_TARGET_SCRIPT = 'ping_parallel_benchmark.bash'
 
     def __init__(self, scenario_cfg, context_cfg):
         self.scenario_cfg = scenario_cfg
         self.context_cfg = context_cfg
         self.target_script = pkg_resources.resource_filename(
             'yardstick.benchmark.scenarios.networking', Ping.TARGET_SCRIPT)
+        self.parallel_target_script = pkg_resources.resource_filename(
+            'yardstick.benchmark.scenarios.networking',
+            Ping.PARALLEL_TARGET_SCRIPT)
         host = self.context_cfg['host']
 
         self.connection = ssh.SSH.from_node(host, defaults={"user": "ubuntu"})
@@ -66,21 +75,19 @@ class Ping(base.Scenario):
         ping_result = {"rtt": rtt_result}
         sla_max_rtt = self.scenario_cfg.get("sla", {}).get("max_rtt")
 
-        for pos, dest in enumerate(dest_list):
+        parallel = self.scenario_cfg.get('options', {}).get('parallel', True)
+        if parallel and len(dest_list) > 1:
+            outputs = self._ping_parallel(dest_list, options)
+        else:
+            # one destination at a time, to stop at the first SLA failure
+            outputs = (self._ping(dest, options) for dest in dest_list)
+
+        for pos, stdout in enumerate(outputs):
             if 'targets' in self.scenario_cfg:
                 target_vm = self.scenario_cfg['targets'][pos]
             else:
                 target_vm = self.scenario_cfg['target']
 
-            LOG.debug("ping %s %s", options, dest)
-            with open(self.target_script, "r") as stdin_file:
-                exit_status, stdout, stderr = self.connection.execute(
-                    "/bin/sh -s {0} {1}".format(dest, options),
-                    stdin=stdin_file)
-
-            if exit_status != 0:
-                raise RuntimeError(stderr)
-
             if isinstance(target_vm, dict):
                 target_vm_name = target_vm.get("name")
             else:
@@ -110,6 +117,38 @@ class Ping(base.Scenario):
                                 "packet dropped rtt %f"
                                 % (rtt_result[target_vm_name]))
 
+    def _ping(self, dest, options):
+        """Ping a destination, return the round trip time or ''"""
+        LOG.debug("ping %s %s", options, dest)
+        with open(self.target_script, "r") as stdin_file:
+            exit_status, stdout, stderr = self.connection.execute(
+                "/bin/sh -s {0} {1}".format(dest, options),
+                stdin=stdin_file)
+
+        if exit_status != 0:
+            raise RuntimeError(stderr)
+        return stdout
+
+    def _ping_parallel(self, dest_list, options):
+        """Ping all the destinations at once
+
+        :return: the round trip time of each destination, or ''
+        """
+        LOG.debug("ping %s %s", options, " ".join(dest_list))
+        with open(self.parallel_target_script, "r") as stdin_file:
+            exit_status, stdout, stderr = self.connection.execute(
+                "/bin/sh -s '{0}' {1}".format(options, " ".join(dest_list)),
+                stdin=stdin_file)
+
+        if exit_status != 0:
+            raise RuntimeError(stderr)
+        rtts = {}
+        for line in stdout.splitlines():
+            fields = line.split()
+            if fields:
+                rtts[fields[0]] = fields[1] if len(fields) > 1 else ''
+        return [rtts.get(dest, '') for dest in dest_list]
+
 
 def _test():    # pragma: no cover
     """internal test function"""
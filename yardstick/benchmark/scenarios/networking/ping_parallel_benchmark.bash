@@ -0,0 +1,28 @@
+#!/bin/bash
+
+##############################################################################
+# Copyright (c) 2018 Intel Corporation
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+# Run a single ping command towards several destinations concurrently and
+# outputs one "<destination> <round trip time>" line per destination; the
+# round trip time is empty if the packet is lost
+
+set -e
+
+options=$1
+shift
+
+for destination in "$@"; do
+    (
+        rtt=$(ping -c 1 $options $destination | grep ttl | awk -F [=\ ] '{printf $10}')
+        echo "$destination $rtt"
+    ) &
+done
+
+wait
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import copy
 import ipaddress
 from itertools import chain
@@ -27,9 +28,14 @@ from yardstick.benchmark.contexts import base as context_base
 from yardstick.benchmark.scenarios import base as scenario_base
 from yardstick.common.constants import LOG_DIR
 from yardstick.common import exceptions
+from yardstick.common import profiler
 from yardstick.common.process import terminate_children
 from yardstick.common import utils
 from yardstick.network_services.collector.subscriber import Collector
+from yardstick.network_services.helpers.dpdkbindnic_helper import \
+    DpdkBindHelper
+from yardstick.network_services.helpers import host_topology
+from yardstick.network_services.vnf_generic import scale_out
 from yardstick.network_services.vnf_generic import vnfdgen
 from yardstick.network_services.vnf_generic.vnf.base import GenericVNF
 from yardstick.network_services import traffic_profile
@@ -50,11 +56,16 @@ class NetworkServiceTestCase(scenario_base.Scenario):
 
     __scenario_type__ = "NSPerf"
 
+    # VNF implementing classes found, by VNF model ID
+    _vnf_impls = {}
+
     def __init__(self, scenario_cfg, context_cfg):  # pragma: no cover
         super(NetworkServiceTestCase, self).__init__()
         self.scenario_cfg = scenario_cfg
         self.context_cfg = context_cfg
 
+        # VNF descriptors of the topology, by member-vnf-index
+        self._vnfds = {}
         self._render_topology()
         self.vnfs = []
         self.collector = None
@@ -165,6 +176,11 @@ class NetworkServiceTestCase(scenario_base.Scenario):
             return infile.read()
 
     def _render_topology(self):
+        if isinstance(self.scenario_cfg["topology"], collections.Mapping):
+            # built, instead of rendered from a file
+            self.topology = scale_out.generate_topology(
+                **self.scenario_cfg["topology"])
+            return
         topology = self._get_topology()
         topology_args = self.scenario_cfg.get('extra_args', {})
         topolgy_data = {
@@ -173,15 +189,15 @@ class NetworkServiceTestCase(scenario_base.Scenario):
         topology_yaml = vnfdgen.generate_vnfd(topology, topolgy_data)
         self.topology = topology_yaml["nsd:nsd-catalog"]["nsd"][0]
 
+    def _index_topology(self):
+        self._vnfds = {vnfd["member-vnf-index"]: vnfd
+                       for vnfd in self.topology["constituent-vnfd"]}
+
     def _find_vnf_name_from_id(self, vnf_id):  # pragma: no cover
-        return next((vnfd["vnfd-id-ref"]
-                     for vnfd in self.topology["constituent-vnfd"]
-                     if vnf_id == vnfd["member-vnf-index"]), None)
+        return self._vnfds.get(vnf_id, {}).get("vnfd-id-ref")
 
     def _find_vnfd_from_vnf_idx(self, vnf_id):  # pragma: no cover
-        return next((vnfd
-                     for vnfd in self.topology["constituent-vnfd"]
-                     if vnf_id == vnfd["member-vnf-index"]), None)
+        return self._vnfds.get(vnf_id)
 
     @staticmethod
     def find_node_if(nodes, name, if_name, vld_id):  # pragma: no cover
@@ -196,6 +212,19 @@ class NetworkServiceTestCase(scenario_base.Scenario):
         return intf
 
     def _resolve_topology(self):
+        self._index_topology()
+        try:
+            nodes = self.context_cfg["nodes"]
+            # just load the networks, by VLD ID
+            vld_networks = {n.get('vld_id', name): n for name, n in
+                            self.context_cfg["networks"].items()}
+        except KeyError:
+            LOG.exception("")
+            raise exceptions.IncorrectConfig(
+                error_msg='Required interface not found, topology file '
+                          'corrupted')
+
+        links = []
         for vld in self.topology["vld"]:
             try:
                 node0_data, node1_data = vld["vnfd-connection-point-ref"]
@@ -211,7 +240,6 @@ class NetworkServiceTestCase(scenario_base.Scenario):
             node1_if_name = node1_data["vnfd-connection-point-ref"]
 
             try:
-                nodes = self.context_cfg["nodes"]
                 node0_if = self.find_node_if(nodes, node0_name, node0_if_name, vld["id"])
                 node1_if = self.find_node_if(nodes, node1_name, node1_if_name, vld["id"])
 
@@ -233,10 +261,6 @@ class NetworkServiceTestCase(scenario_base.Scenario):
                 node0_if["peer_ifname"] = node1_if_name
                 node1_if["peer_ifname"] = node0_if_name
 
-                # just load the network
-                vld_networks = {n.get('vld_id', name): n for name, n in
-                                self.context_cfg["networks"].items()}
-
                 node0_if["network"] = vld_networks.get(vld["id"], {})
                 node1_if["network"] = vld_networks.get(vld["id"], {})
 
@@ -251,38 +275,21 @@ class NetworkServiceTestCase(scenario_base.Scenario):
                 raise exceptions.IncorrectConfig(
                     error_msg='Required interface not found, topology file '
                               'corrupted')
+            links.append((node0_if, node1_if))
 
-        for vld in self.topology['vld']:
-            try:
-                node0_data, node1_data = vld["vnfd-connection-point-ref"]
-            except (ValueError, TypeError):
-                raise exceptions.IncorrectConfig(
-                    error_msg='Topology file corrupted, wrong endpoint count '
-                              'for connection')
-
-            node0_name = self._find_vnf_name_from_id(node0_data["member-vnf-index-ref"])
-            node1_name = self._find_vnf_name_from_id(node1_data["member-vnf-index-ref"])
-
-            node0_if_name = node0_data["vnfd-connection-point-ref"]
-            node1_if_name = node1_data["vnfd-connection-point-ref"]
-
-            nodes = self.context_cfg["nodes"]
-            node0_if = self.find_node_if(nodes, node0_name, node0_if_name, vld["id"])
-            node1_if = self.find_node_if(nodes, node1_name, node1_if_name, vld["id"])
-
-            # add peer interface dict, but remove circular link
-            # TODO: don't waste memory
+        # once all the links are resolved, add peer interface dict, but
+        # remove circular link
+        # TODO: don't waste memory
+        for node0_if, node1_if in links:
             node0_copy = node0_if.copy()
             node1_copy = node1_if.copy()
             node0_if["peer_intf"] = node1_copy
             node1_if["peer_intf"] = node0_copy
 
     def _update_context_with_topology(self):  # pragma: no cover
-        for vnfd in self.topology["constituent-vnfd"]:
-            vnf_idx = vnfd["member-vnf-index"]
-            vnf_name = self._find_vnf_name_from_id(vnf_idx)
-            vnfd = self._find_vnfd_from_vnf_idx(vnf_idx)
-            self.context_cfg["nodes"][vnf_name].update(vnfd)
+        self._index_topology()
+        for vnfd in self._vnfds.values():
+            self.context_cfg["nodes"][vnfd["vnfd-id-ref"]].update(vnfd)
 
     def _generate_pod_yaml(self):  # pragma: no cover
         context_yaml = os.path.join(LOG_DIR, "pod-{}.yaml".format(self.scenario_cfg['task_id']))
@@ -326,6 +333,11 @@ class NetworkServiceTestCase(scenario_base.Scenario):
         :param vnf_model_id: parsed vnfd model ID field
         :return: subclass of GenericVNF
         """
+        try:
+            return cls._vnf_impls[vnf_model_id]
+        except KeyError:
+            pass
+
         utils.import_modules_from_package(
             "yardstick.network_services.vnf_generic.vnf")
         expected_name = vnf_model_id
@@ -339,7 +351,8 @@ class NetworkServiceTestCase(scenario_base.Scenario):
                 classes_found.append(name)
 
         try:
-            return next(impl())
+            cls._vnf_impls[vnf_model_id] = next(impl())
+            return cls._vnf_impls[vnf_model_id]
         except StopIteration:
             pass
 
@@ -387,6 +400,8 @@ class NetworkServiceTestCase(scenario_base.Scenario):
             context_cfg = self.context_cfg
 
         vnfs = []
+        # the VNFs of a scale-out topology share their model file
+        vnf_models = {}
         # we assume OrderedDict for consistency in instantiation
         for node_name, node in context_cfg["nodes"].items():
             LOG.debug(node)
@@ -395,9 +410,11 @@ class NetworkServiceTestCase(scenario_base.Scenario):
             except KeyError:
                 LOG.debug("no model for %s, skipping", node_name)
                 continue
-            file_path = scenario_cfg['task_path']
-            with utils.open_relative_file(file_name, file_path) as stream:
-                vnf_model = stream.read()
+            if file_name not in vnf_models:
+                file_path = scenario_cfg['task_path']
+                with utils.open_relative_file(file_name, file_path) as stream:
+                    vnf_models[file_name] = stream.read()
+            vnf_model = vnf_models[file_name]
             vnfd = vnfdgen.generate_vnfd(vnf_model, node)
             # TODO: here add extra context_cfg["nodes"] regardless of template
             vnfd = vnfd["vnfd:vnfd-catalog"]["vnfd"][0]
@@ -416,14 +433,35 @@ class NetworkServiceTestCase(scenario_base.Scenario):
         self.vnfs = vnfs
         return vnfs
 
+    def _probe_hosts(self):
+        """Probe the hosts of the VNFs concurrently, one SSH call each
+
+        The VNFs then find the PCI, netdev and DPDK binding information of
+        their host in the host topology cache, instead of probing it one
+        VNF after the other.
+        """
+        hosts = []
+        for vnf in self.vnfs:
+            setup_helper = getattr(vnf, 'setup_helper', None)
+            bind_helper = getattr(setup_helper, 'dpdk_bind_helper', None)
+            if isinstance(bind_helper, DpdkBindHelper):
+                hosts.append((bind_helper.ssh_helper,
+                              bind_helper.dpdk_devbind))
+        host_topology.prefetch(hosts)
+
     def setup(self):
         """Setup infrastructure, provission VNFs & start traffic"""
         # 1. Verify if infrastructure mapping can meet topology
-        self.map_topology_to_infrastructure()
+        with profiler.span('map_topology'):
+            self.map_topology_to_infrastructure()
         # 1a. Load VNF models
-        self.load_vnf_models()
+        with profiler.span('load_vnf_models'):
+            self.load_vnf_models()
         # 1b. Fill traffic profile with information from topology
         self._fill_traffic_profile()
+        # 1c. Probe the hosts of the VNFs concurrently
+        with profiler.span('probe_hosts'):
+            self._probe_hosts()
 
         # 2. Provision VNFs
 
@@ -434,9 +472,11 @@ class NetworkServiceTestCase(scenario_base.Scenario):
         try:
             for vnf in chain(traffic_runners, non_traffic_runners):
                 LOG.info("Instantiating %s", vnf.name)
-                vnf.instantiate(self.scenario_cfg, self.context_cfg)
+                with profiler.span('instantiate', vnf=vnf.name):
+                    vnf.instantiate(self.scenario_cfg, self.context_cfg)
                 LOG.info("Waiting for %s to instantiate", vnf.name)
-                vnf.wait_for_instantiate()
+                with profiler.span('wait_for_instantiate', vnf=vnf.name):
+                    vnf.wait_for_instantiate()
         except:
             LOG.exception("")
             for vnf in self.vnfs:
@@ -449,16 +489,20 @@ class NetworkServiceTestCase(scenario_base.Scenario):
         # 3. Run experiment
         # Start listeners first to avoid losing packets
         for traffic_gen in traffic_runners:
-            traffic_gen.listen_traffic(self.traffic_profile)
+            with profiler.span('listen_traffic', vnf=traffic_gen.name):
+                traffic_gen.listen_traffic(self.traffic_profile)
 
         # register collector with yardstick for KPI collection.
-        self.collector = Collector(self.vnfs, context_base.Context.get_physical_nodes())
-        self.collector.start()
+        with profiler.span('start_collector'):
+            self.collector = Collector(
+                self.vnfs, context_base.Context.get_physical_nodes())
+            self.collector.start()
 
         # Start the actual traffic
         for traffic_gen in traffic_runners:
             LOG.info("Starting traffic on %s", traffic_gen.name)
-            traffic_gen.run_traffic(self.traffic_profile)
+            with profiler.span('run_traffic', vnf=traffic_gen.name):
+                traffic_gen.run_traffic(self.traffic_profile)
             self._mq_ids.append(traffic_gen.get_mq_producer_id())
 
     def get_mq_ids(self):  # pragma: no cover
@@ -477,7 +521,24 @@ class NetworkServiceTestCase(scenario_base.Scenario):
         # so if we have any fatal error it must be raised via these methods
         # otherwise we will not terminate
 
-        result.update(self.collector.get_kpi())
+        with profiler.timer('collect_kpi'):
+            result.update(self.collector.get_kpi())
+        self._emit_steady_state_samples(result)
+
+    def _emit_steady_state_samples(self, result):
+        """Send the samples of the steady state traffic generators, one
+        intermediate record each, as they were taken
+
+        The samples that can not be sent are left in the result.
+        """
+        for name, kpi in result.items():
+            if not isinstance(kpi, dict) or 'steady_state' not in kpi:
+                continue
+            unsent = [sample for sample in kpi.pop('steady_state')
+                      if not self.emit_record({name: {'steady_state': sample}},
+                                              timestamp=sample['timestamp'])]
+            if unsent:
+                kpi['steady_state'] = unsent
 
     def teardown(self):
         """ Stop the collector and terminate VNF & TG instance
@@ -490,7 +551,8 @@ class NetworkServiceTestCase(scenario_base.Scenario):
                 self.collector.stop()
                 for vnf in self.vnfs:
                     LOG.info("Stopping %s", vnf.name)
-                    vnf.terminate()
+                    with profiler.span('terminate', vnf=vnf.name):
+                        vnf.terminate()
                 LOG.debug("all VNFs terminated: %s", ", ".join(vnf.name for vnf in self.vnfs))
             finally:
                 terminate_children()
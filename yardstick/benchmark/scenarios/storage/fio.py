@@ -9,6 +9,7 @@
 from __future__ import absolute_import
 from __future__ import print_function
 
+import collections
 import logging
 
 import pkg_resources
@@ -20,6 +21,31 @@ from yardstick.benchmark.scenarios import base
 LOG = logging.getLogger(__name__)
 
 
+class FioReportReader(object):
+    """Text stream splitting the fio JSON reports as they are written
+
+    With "--status-interval", fio writes a full JSON report at each interval
+    and a final one when the jobs end; the closing brace of each report is
+    alone on its line.
+    """
+
+    REPORT_END = '\n}\n'
+
+    def __init__(self, callback):
+        self._callback = callback
+        self._buffer = ''
+
+    def write(self, data):
+        self._buffer += data
+        reports = self._buffer.split(self.REPORT_END)
+        self._buffer = reports.pop()
+        for report in reports:
+            # skip the notes fio may write before the report
+            start = report.find('{')
+            if start >= 0:
+                self._callback(jsonutils.loads(report[start:] + '}'))
+
+
 class Fio(base.Scenario):
     """Execute fio benchmark in a host
 
@@ -72,11 +98,23 @@ class Fio(base.Scenario):
         type:    int
         unit:    na
         default: 1
+    status_interval - interval of the intermediate fio reports; each report
+        is sent as a record with the bandwidth, IOPS and mean latency
+        measured since the previous one
+        type:    int
+        unit:    seconds
+        default: None (only the final report)
+    percentiles - add the completion latency percentiles to the results
+        type:    boolean
+        unit:    na
+        default: False
 
     Read link below for more fio args description:
         http://www.bluestop.org/fio/HOWTO.txt
     """
     __scenario_type__ = "Fio"
+    # each fio run is self-contained and has its own ramp time
+    __stateless__ = True
 
     TARGET_SCRIPT = "fio_benchmark.bash"
 
@@ -148,6 +186,7 @@ class Fio(base.Scenario):
 
         if self.job_file:
             cmd = "sudo fio job_file.ini --output-format=json"
+            directions = ["read", "write"]
         else:
             filename = self.options.get("filename", "/home/ubuntu/data.raw")
             bs = self.options.get("bs", "4k")
@@ -179,31 +218,31 @@ class Fio(base.Scenario):
                        % (filename, direct, bs, iodepth, rw, rwmixwrite, size, ramp_time, numjobs,
                           runtime, name, default_args)
             cmd = "sudo bash fio.sh %s %s" % (filename, cmd_args)
-
-        LOG.debug("Executing command: %s", cmd)
-        status, stdout, stderr = self.client.execute(cmd, timeout=timeout)
-        if status:
-            raise RuntimeError(stderr)
-
-        raw_data = jsonutils.loads(stdout)
-
-        if self.job_file:
-            result["read_bw"] = raw_data["jobs"][0]["read"]["bw"]
-            result["read_iops"] = raw_data["jobs"][0]["read"]["iops"]
-            result["read_lat"] = raw_data["jobs"][0]["read"]["lat"]["mean"]
-            result["write_bw"] = raw_data["jobs"][0]["write"]["bw"]
-            result["write_iops"] = raw_data["jobs"][0]["write"]["iops"]
-            result["write_lat"] = raw_data["jobs"][0]["write"]["lat"]["mean"]
+            directions = [direction for direction, patterns in
+                          (("read", ["read", "randread", "rw", "randrw"]),
+                           ("write", ["write", "randwrite", "rw", "randrw"]))
+                          if rw in patterns]
+
+        status_interval = self.options.get("status_interval")
+        if status_interval:
+            cmd += " --status-interval=%s" % status_interval
+            raw_data = self._run_streaming(cmd, timeout, directions)
         else:
-            # The bandwidth unit is KB/s, and latency unit is us
-            if rw in ["read", "randread", "rw", "randrw"]:
-                result["read_bw"] = raw_data["jobs"][0]["read"]["bw"]
-                result["read_iops"] = raw_data["jobs"][0]["read"]["iops"]
-                result["read_lat"] = raw_data["jobs"][0]["read"]["lat"]["mean"]
-            if rw in ["write", "randwrite", "rw", "randrw"]:
-                result["write_bw"] = raw_data["jobs"][0]["write"]["bw"]
-                result["write_iops"] = raw_data["jobs"][0]["write"]["iops"]
-                result["write_lat"] = raw_data["jobs"][0]["write"]["lat"]["mean"]
+            LOG.debug("Executing command: %s", cmd)
+            status, stdout, stderr = self.client.execute(cmd, timeout=timeout)
+            if status:
+                raise RuntimeError(stderr)
+            raw_data = jsonutils.loads(stdout)
+
+        # The bandwidth unit is KB/s, and latency unit is us
+        for direction in directions:
+            stats = raw_data["jobs"][0][direction]
+            result[direction + "_bw"] = stats["bw"]
+            result[direction + "_iops"] = stats["iops"]
+            result[direction + "_lat"] = self._lat_mean(stats)
+            if self.options.get("percentiles"):
+                result[direction + "_clat_percentiles"] = \
+                    self._clat_percentiles(stats)
 
         if "sla" in self.scenario_cfg:
             sla_error = ""
@@ -225,6 +264,87 @@ class Fio(base.Scenario):
 
             self.verify_SLA(sla_error == "", sla_error)
 
+    def _run_streaming(self, cmd, timeout, directions):
+        """Run fio, sending a record per intermediate report
+
+        :return: the final report
+        """
+        reports = collections.deque(maxlen=1)
+
+        def _on_report(report):
+            previous = reports[0]["jobs"][0] if reports else None
+            job = report["jobs"][0]
+            data = {"elapsed": job.get("elapsed")}
+            for direction in directions:
+                data.update(self._interval_stats(
+                    direction, previous and previous[direction],
+                    job[direction]))
+                if self.options.get("percentiles"):
+                    data[direction + "_clat_percentiles"] = \
+                        self._clat_percentiles(job[direction])
+            reports.append(report)
+            self.emit_record(data)
+
+        LOG.debug("Executing command: %s", cmd)
+        stderr = bytearray()
+        status = self.client.run(cmd, stdout=FioReportReader(_on_report),
+                                 stderr=stderr, timeout=timeout,
+                                 raise_on_error=False)
+        if status:
+            raise RuntimeError(stderr.decode("utf-8", "replace"))
+        if not reports:
+            raise RuntimeError("No fio report received")
+        return reports[0]
+
+    @staticmethod
+    def _lat_mean(stats):
+        """Mean latency in us, fio >= 3.0 reports it in ns"""
+        if "lat_ns" in stats:
+            return stats["lat_ns"]["mean"] / 1000.0
+        return stats["lat"]["mean"]
+
+    @staticmethod
+    def _clat_percentiles(stats):
+        """Completion latency percentiles in us, {"99.9": ..., ...}"""
+        if "clat_ns" in stats:
+            percentiles, scale = stats["clat_ns"].get("percentile", {}), 1000.0
+        else:
+            percentiles, scale = stats["clat"].get("percentile", {}), 1
+        return {"%g" % float(percentile): value / scale
+                for percentile, value in percentiles.items()}
+
+    @classmethod
+    def _interval_stats(cls, direction, previous, current):
+        """Bandwidth, IOPS and mean latency between two fio reports
+
+        The fio reports are cumulative since the start of the jobs; fio < 3.0
+        reports "io_bytes" in KB and no "total_ios".
+        """
+
+        def _counters(stats):
+            if not stats:
+                return 0, 0, 0, 0
+            runtime = stats["runtime"]
+            kbytes = stats.get("io_kbytes")
+            if kbytes is None:
+                kbytes = stats["io_bytes"]
+            ios = stats.get("total_ios")
+            if ios is None:
+                ios = stats["iops"] * runtime / 1000.0
+            return runtime, kbytes, ios, cls._lat_mean(stats) * ios
+
+        runtime, kbytes, ios, lat_sum = [
+            current_value - previous_value for current_value, previous_value
+            in zip(_counters(current), _counters(previous))]
+        if runtime <= 0:
+            bw = iops = 0
+        else:
+            bw = kbytes * 1000.0 / runtime
+            iops = ios * 1000.0 / runtime
+        return {direction + "_bw": bw,
+                direction + "_iops": iops,
+                direction + "_lat": lat_sum / ios if ios > 0 else 0}
+
 
 def _test():
     """internal test function"""
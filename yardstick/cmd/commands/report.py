@@ -27,6 +27,8 @@ class ReportCommands(object):   # pragma: no cover
 
     @cliargs("task_id", type=str, help=" task id", nargs=1)
     @cliargs("yaml_name", type=str, help=" Yaml file Name", nargs=1)
+    @cliargs("--input-file", dest="input_file", nargs=1,
+             help="chunked task result file to read instead of InfluxDB")
     def do_generate(self, args):
         """Start a benchmark scenario."""
         param = change_osloobj_to_paras(args)
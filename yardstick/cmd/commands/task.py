@@ -45,13 +45,55 @@ class TaskCommands(object):     # pragma: no cover
              output_file_default, default=output_file_default)
     @cliargs("--suite", help="process test suite file instead of a task file",
              action="store_true")
+    @cliargs("--suite-workers", dest="suite_workers", type=int, default=1,
+             help="number of test cases of a suite executed in parallel; "
+             "test cases sharing a resource are never executed at the same "
+             "time")
+    @cliargs("--profile", help="dump the cProfile statistics of the runner "
+             "worker processes in the task log directory",
+             action="store_true")
+    @cliargs("--checkpoint", help="checkpoint the task progress in the task "
+             "log directory and keep the contexts deployed if the task is "
+             "interrupted, to resume it with \"yardstick task resume\"",
+             action="store_true")
     def do_start(self, args, **kwargs):
         param = change_osloobj_to_paras(args)
         self.output_file = param.output_file
 
         LOG.info('Task START')
+        self._run_task(Task().start, param, **kwargs)
+
+    @cliargs("task_id", type=str, help="ID of the task to resume")
+    def do_resume(self, args, **kwargs):
+        """Resume a task started with "--checkpoint" and interrupted"""
+        param = change_osloobj_to_paras(args)
+        self.output_file = output_file_default
+
+        LOG.info('Task RESUME')
+        self._run_task(Task().resume, param, **kwargs)
+
+    @cliargs("inputfile", type=str, help="path to task or suite file", nargs=1)
+    @cliargs("--task-args", dest="task_args",
+             help="Input task args (dict in json). These args are used"
+             "to render input task that is jinja2 template.")
+    @cliargs("--task-args-file", dest="task_args_file",
+             help="Path to the file with input task args (dict in "
+             "json/yaml). These args are used to render input"
+             "task that is jinja2 template.")
+    @cliargs("--suite", help="process test suite file instead of a task file",
+             action="store_true")
+    @cliargs("--deep", help="check the nodes of the contexts too: SSH "
+             "access, PCI devices, drivers, hugepages and NSB binaries",
+             action="store_true")
+    def do_validate(self, args, **kwargs):
+        """Validate a task or suite file without running it"""
+        param = change_osloobj_to_paras(args)
+        Task().validate(param, **kwargs)
+        LOG.info('Task VALID')
+
+    def _run_task(self, run, param, **kwargs):
         try:
-            result = Task().start(param, **kwargs)
+            result = run(param, **kwargs)
         except Exception as e:  # pylint: disable=broad-except
             self._write_error_data(e)
             LOG.info('Task FAILED')
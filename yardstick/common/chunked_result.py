@@ -0,0 +1,312 @@
+##############################################################################
+# Copyright (c) 2018 Intel Corporation
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+"""Chunked binary format of the task results
+
+The records of a task are appended to the file by chunks while the task
+runs; the task result, without its records, is appended when it ends:
+
+    file header:    MAGIC (4s), VERSION (B)
+    chunk header:   chunk type (B), size (I), number of records (I)
+    chunk:          zlib compressed JSON
+
+A RECORDS chunk holds records of one task, test case and scenario, by
+column:
+
+    {"task_id": ..., "case": ..., "scenario": ...,
+     "columns": [[path, rows, values], ...]}
+
+"path" is the list of the keys of a value in the records (e.g. ["data",
+"rtt", "ares"]), "rows" the indexes of the records having this value in the
+chunk, or None if all of them have it.
+
+A RESULT chunk holds the task result, as written in the JSON file, with
+empty "tc_data" lists. The file is read by chunk, through a memory map; a
+chunk truncated by a crash is ignored.
+
+The file is started again by each task (see init_file), unless the task is
+resumed. The processes running the test cases of a task append their
+chunks to it, under an exclusive lock. The reader only returns the chunks
+of one task, by default the last one written.
+"""
+
+from __future__ import print_function
+
+import argparse
+import collections
+import fcntl
+import logging
+import mmap
+import os
+import struct
+import sys
+import time
+import zlib
+
+from oslo_serialization import jsonutils
+
+from yardstick.common import utils
+
+
+LOG = logging.getLogger(__name__)
+
+MAGIC = b'YSCR'
+VERSION = 1
+FILE_HEADER = struct.Struct('!4sB')
+CHUNK_HEADER = struct.Struct('!BII')
+
+CHUNK_RECORDS = 1
+CHUNK_RESULT = 2
+
+
+def is_chunked(path):
+    """Check if a file is in the chunked result format"""
+    try:
+        with open(path, 'rb') as result_file:
+            return result_file.read(len(MAGIC)) == MAGIC
+    except IOError:
+        return False
+
+
+def init_file(path, resume=False):
+    """Start the result file of a task, replacing any previous output
+
+    :param resume: a resumed task appends to its chunked result file
+    """
+    if resume and is_chunked(path):
+        return
+    utils.makedirs(os.path.dirname(path) or '.')
+    with open(path, 'wb') as result_file:
+        result_file.write(FILE_HEADER.pack(MAGIC, VERSION))
+
+
+def _get_task_id(chunk_type, content):
+    if chunk_type == CHUNK_RECORDS:
+        return content.get('task_id')
+    result = content.get('result')
+    return result.get('task_id') if isinstance(result, dict) else None
+
+
+def _encode_columns(records):
+    columns = collections.OrderedDict()
+
+    def _add(path, row, value):
+        if isinstance(value, dict) and value:
+            for key, item in value.items():
+                _add(path + (key, ), row, item)
+        else:
+            columns.setdefault(path, ([], []))
+            columns[path][0].append(row)
+            columns[path][1].append(value)
+
+    for row, record in enumerate(records):
+        for key, value in record.items():
+            _add((key, ), row, value)
+
+    return [[list(path), None if len(rows) == len(records) else rows, values]
+            for path, (rows, values) in columns.items()]
+
+
+def _decode_columns(columns, count):
+    records = [{} for _ in range(count)]
+    for path, rows, values in columns:
+        for row, value in zip(range(count) if rows is None else rows,
+                              values):
+            record = records[row]
+            for key in path[:-1]:
+                record = record.setdefault(key, {})
+            record[path[-1]] = value
+    return records
+
+
+class ChunkedResultWriter(object):
+    """Append the records of a task by chunks
+
+    The records are buffered and written when "chunk_records" of them are
+    buffered or when the oldest one is older than "flush_interval" seconds.
+    """
+
+    def __init__(self, path, task_id=None, chunk_records=1000,
+                 flush_interval=10):
+        self.path = path
+        self.task_id = task_id
+        self.chunk_records = chunk_records
+        self.flush_interval = flush_interval
+        self._buffers = collections.OrderedDict()
+        self._buffered = 0
+        self._first_buffered = None
+        if not is_chunked(path):
+            init_file(path)
+
+    def _write_chunk(self, chunk_type, count, content):
+        data = zlib.compress(jsonutils.dump_as_bytes(content))
+        with open(self.path, 'ab') as result_file:
+            # the test cases of a suite may append to the file concurrently
+            fcntl.flock(result_file.fileno(), fcntl.LOCK_EX)
+            result_file.write(
+                CHUNK_HEADER.pack(chunk_type, len(data), count) + data)
+
+    def add_record(self, record, case, scenario=None):
+        self._buffers.setdefault((case, scenario), []).append(record)
+        self._buffered += 1
+        if self._first_buffered is None:
+            self._first_buffered = time.time()
+        if (self._buffered >= self.chunk_records or
+                time.time() - self._first_buffered >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """Write the buffered records"""
+        for (case, scenario), records in self._buffers.items():
+            self._write_chunk(CHUNK_RECORDS, len(records), {
+                'task_id': self.task_id, 'case': case, 'scenario': scenario,
+                'columns': _encode_columns(records)})
+        self._buffers.clear()
+        self._buffered = 0
+        self._first_buffered = None
+
+    def write_result(self, result):
+        """Write the task result, its records are not written again"""
+        self.flush()
+        result = dict(result)
+        if isinstance(result.get('result'), dict):
+            result['result'] = dict(result['result'])
+            result['result']['testcases'] = {
+                case: dict(testcase, tc_data=[]) for case, testcase in
+                result['result'].get('testcases', {}).items()}
+        self._write_chunk(CHUNK_RESULT, 0, result)
+
+
+_WRITERS = {}
+
+
+def get_writer(path, task_id=None, **kwargs):
+    """Return the writer of a file and task, shared in the process"""
+    if (path, task_id) not in _WRITERS:
+        _WRITERS[(path, task_id)] = ChunkedResultWriter(path, task_id,
+                                                        **kwargs)
+    return _WRITERS[(path, task_id)]
+
+
+def flush_all():
+    """Write the records buffered by the writers of the process"""
+    for writer in _WRITERS.values():
+        writer.flush()
+
+
+class ChunkedResultReader(object):
+    """Read a chunked result file through a memory map
+
+    Only the chunks of the task "task_id" are read, by default of the last
+    task written to the file.
+    """
+
+    def __init__(self, path, task_id=None):
+        self.path = path
+        self.task_id = task_id
+
+    def _iter_chunks(self):
+        with open(self.path, 'rb') as result_file:
+            if os.fstat(result_file.fileno()).st_size < FILE_HEADER.size:
+                raise ValueError('%s is not a chunked result' % self.path)
+            buf = mmap.mmap(result_file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                magic, _ = FILE_HEADER.unpack_from(buf, 0)
+                if magic != MAGIC:
+                    raise ValueError('%s is not a chunked result' % self.path)
+                offset = FILE_HEADER.size
+                while offset + CHUNK_HEADER.size <= len(buf):
+                    chunk_type, size, count = CHUNK_HEADER.unpack_from(
+                        buf, offset)
+                    offset += CHUNK_HEADER.size
+                    if offset + size > len(buf):
+                        LOG.warning("Truncated chunk ignored in %s",
+                                    self.path)
+                        return
+                    yield chunk_type, count, buf[offset:offset + size]
+                    offset += size
+            finally:
+                buf.close()
+
+    def get_task_id(self):
+        """Return the ID of the task read, the last one written by default"""
+        if self.task_id is None:
+            last_chunk = None
+            for last_chunk in self._iter_chunks():
+                pass
+            if last_chunk:
+                chunk_type, _, data = last_chunk
+                self.task_id = _get_task_id(
+                    chunk_type, jsonutils.loads(zlib.decompress(data)))
+        return self.task_id
+
+    def _iter_content(self, chunk_type):
+        task_id = self.get_task_id()
+        for current_type, count, data in self._iter_chunks():
+            if current_type == chunk_type:
+                content = jsonutils.loads(zlib.decompress(data))
+                if _get_task_id(chunk_type, content) == task_id:
+                    yield count, content
+
+    def iter_records(self, case=None):
+        """Yield (case, scenario, record) of all the records, or the records
+        of a test case
+        """
+        for count, chunk in self._iter_content(CHUNK_RECORDS):
+            if case is not None and chunk['case'] != case:
+                continue
+            for record in _decode_columns(chunk['columns'], count):
+                yield chunk['case'], chunk['scenario'], record
+
+    def iter_column(self, path, case=None):
+        """Yield the values of a column, e.g. ["data", "rtt"], without
+        decoding the records; the records without it are skipped
+        """
+        path = list(path)
+        for _, chunk in self._iter_content(CHUNK_RECORDS):
+            if case is not None and chunk['case'] != case:
+                continue
+            for column_path, _, values in chunk['columns']:
+                if column_path == path:
+                    for value in values:
+                        yield value
+
+    def get_result(self):
+        """Return the last task result written, None if there is none"""
+        result = None
+        for _, result in self._iter_content(CHUNK_RESULT):
+            pass
+        return result
+
+    def to_json(self):
+        """Return the task result in the JSON file format"""
+        result = self.get_result() or {'status': 0, 'result': {}}
+        testcases = result['result'].setdefault('testcases', {})
+        for case, _, record in self.iter_records():
+            testcases.setdefault(case, {'criteria': 'UNKNOWN', 'tc_data': []})
+            testcases[case].setdefault('tc_data', []).append(record)
+        return result
+
+
+def convert_to_json(path, json_path):
+    """Convert a chunked result file to the JSON file format"""
+    utils.write_json_to_file(json_path, ChunkedResultReader(path).to_json())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Convert a chunked task result to JSON')
+    parser.add_argument('input', help='chunked task result file')
+    parser.add_argument('output', help='JSON file to write')
+    args = parser.parse_args(argv)
+    convert_to_json(args.input, args.output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
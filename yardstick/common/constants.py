@@ -78,6 +78,8 @@ LOG_DIR = get_param('dir.log', '/tmp/yardstick/')
 YARDSTICK_ROOT_PATH = dirname(
     dirname(abspath(pkg_resources.resource_filename(__name__, "")))) + sep
 TASK_LOG_DIR = get_param('dir.tasklog', '/var/log/yardstick/')
+CONFIG_CACHE_DIR = get_param('dir.config_cache',
+                             '/tmp/yardstick/config_cache')
 CONF_SAMPLE_DIR = join(REPOS_DIR, 'etc/yardstick/')
 ANSIBLE_DIR = join(REPOS_DIR, 'ansible')
 ANSIBLE_ROLES_PATH = join(REPOS_DIR, 'ansible/roles/')
@@ -127,6 +129,10 @@ GRAFANA_IMAGE = get_param('grafana.image', 'grafana/grafana')
 GRAFANA_TAG = get_param('grafana.tag', '4.4.3')
 GRAFANA_MAPPING_PORT = 1948
 
+# message queue
+MQ_TRANSPORT = get_param('mq.transport', 'rabbit')
+MQ_SOCKET_DIR = get_param('mq.socket_dir', '/tmp/yardstick/mq')
+
 # api
 API_PORT = 5000
 DOCKER_URL = 'unix://var/run/docker.sock'
@@ -118,6 +118,10 @@ class TrafficProfileRate(YardstickException):
     message = 'Traffic profile rate must be "<number>[fps|%]"'
 
 
+class TrafficCommandNotSupported(YardstickException):
+    message = 'Traffic control command "%(command)s" is not supported'
+
+
 class DPDKSetupDriverError(YardstickException):
     message = '"igb_uio" driver is not loaded'
 
@@ -191,6 +195,10 @@ class StackCreationInterrupt(YardstickException):
     message = 'Stack create interrupted.'
 
 
+class MetricsAgentError(YardstickException):
+    message = 'Metrics agent on host %(host)s: %(error_msg)s'
+
+
 class TaskRenderArgumentError(YardstickException):
     message = 'Error reading the task input arguments'
 
@@ -203,6 +211,14 @@ class TaskRenderError(YardstickException):
     message = 'Failed to render template:\n%(input_task)s'
 
 
+class TaskCheckpointNotFound(YardstickException):
+    message = 'No checkpoint found for task %(task_id)s in %(path)s'
+
+
+class TaskValidationFailed(YardstickException):
+    message = 'Task validation failed on nodes: %(nodes)s'
+
+
 class RunnerIterationIPCSetupActionNeeded(YardstickException):
     message = ('IterationIPC needs the "setup" action to retrieve the VNF '
                'handling processes PIDs to receive the messages sent')
@@ -241,6 +257,10 @@ class KubernetesSSHPortNotDefined(YardstickException):
     message = 'Port 22 needs to be defined'
 
 
+class KubernetesPodFailed(YardstickException):
+    message = 'Kubernetes pod %(pod)s failed: %(reason)s'
+
+
 class KubernetesServiceObjectNotDefined(YardstickException):
     message = 'ServiceObject is not defined'
 
@@ -401,6 +421,10 @@ class IxNetworkFieldNotPresentInStackItem(YardstickException):
     message = 'Field "%(field_name)s" not present in stack item %(stack_item)s'
 
 
+class IxNetworkStatisticNotPresent(YardstickException):
+    message = 'Statistic "%(caption)s" not present in view %(view)s'
+
+
 class SLAValidationError(YardstickException):
     message = '%(case_name)s SLA validation failed. Error: %(error_msg)s'
 
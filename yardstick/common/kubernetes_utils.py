@@ -7,9 +7,12 @@
 # http://www.apache.org/licenses/LICENSE-2.0
 ##############################################################################
 import logging
+import os
+import time
 
 from kubernetes import client
 from kubernetes import config
+from kubernetes import watch
 from kubernetes.client.rest import ApiException
 
 from yardstick.common import constants as consts
@@ -19,29 +22,42 @@ from yardstick.common import exceptions
 LOG = logging.getLogger(__name__)
 LOG.setLevel(logging.DEBUG)
 
+POD_WAIT_TIMEOUT = 600
+# container "waiting" reasons of the pods that will not start on their own
+POD_FAILED_REASONS = {'CrashLoopBackOff', 'CreateContainerConfigError',
+                      'ErrImageNeverPull', 'ImagePullBackOff',
+                      'InvalidImageName'}
 
-def get_core_api():     # pragma: no cover
-    try:
-        config.load_kube_config(config_file=consts.K8S_CONF_FILE)
-    except IOError:
-        raise exceptions.KubernetesConfigFileNotFound()
-    return client.CoreV1Api()
+# API client of each process: the kubeconfig file is loaded once and the
+# connection pool is shared by all the APIs
+_API_CLIENTS = {}
+
+
+def get_api_client():
+    pid = os.getpid()
+    if pid not in _API_CLIENTS:
+        try:
+            config.load_kube_config(config_file=consts.K8S_CONF_FILE)
+        except IOError:
+            raise exceptions.KubernetesConfigFileNotFound()
+        _API_CLIENTS[pid] = client.ApiClient()
+    return _API_CLIENTS[pid]
+
+
+def clear_api_client():
+    _API_CLIENTS.clear()
+
+
+def get_core_api():
+    return client.CoreV1Api(get_api_client())
 
 
 def get_extensions_v1beta_api():
-    try:
-        config.load_kube_config(config_file=consts.K8S_CONF_FILE)
-    except IOError:
-        raise exceptions.KubernetesConfigFileNotFound()
-    return client.ApiextensionsV1beta1Api()
+    return client.ApiextensionsV1beta1Api(get_api_client())
 
 
 def get_custom_objects_api():
-    try:
-        config.load_kube_config(config_file=consts.K8S_CONF_FILE)
-    except IOError:
-        raise exceptions.KubernetesConfigFileNotFound()
-    return client.CustomObjectsApi()
+    return client.CustomObjectsApi(get_api_client())
 
 
 def get_node_list(**kwargs):        # pragma: no cover
@@ -327,6 +343,126 @@ def get_pod_by_name(name):  # pragma: no cover
     return next((n for n in pod_list.items if n.metadata.name.startswith(name)), None)
 
 
+def get_pod_failure(pod):
+    """Return the reason of a pod failure, None if the pod has not failed"""
+    if pod.status.phase == 'Failed':
+        return pod.status.reason or 'Failed'
+    for container in pod.status.container_statuses or []:
+        waiting = container.state.waiting if container.state else None
+        if waiting and waiting.reason in POD_FAILED_REASONS:
+            return waiting.reason
+
+
+class NamespaceCache(object):
+    """Cache of the pods and services of a namespace
+
+    The pods and the services are listed once; while waiting for the pods
+    to run, a single watch stream of the namespace keeps the pods up to date,
+    as an informer does. A lookup missing the cache lists them again.
+    """
+
+    def __init__(self, namespace='default'):
+        self.namespace = namespace
+        self._pods = None
+        self._services = None
+        self._resource_version = None
+
+    def refresh(self):
+        core_v1_api = get_core_api()
+        try:
+            pod_list = core_v1_api.list_namespaced_pod(self.namespace)
+            service_list = core_v1_api.list_namespaced_service(
+                self.namespace)
+        except ApiException:
+            raise exceptions.KubernetesApiException(action='list',
+                                                    resource='Pod, Service')
+        self._pods = {pod.metadata.name: pod for pod in pod_list.items}
+        self._services = {service.metadata.name: service
+                          for service in service_list.items}
+        self._resource_version = pod_list.metadata.resource_version
+
+    def get_pods(self, app):
+        """Return the pods of a replication controller ("app" label)"""
+        if self._pods is None:
+            self.refresh()
+        return [pod for _, pod in sorted(self._pods.items())
+                if (pod.metadata.labels or {}).get('app') == app]
+
+    def get_pod_names(self, apps):
+        return [pod.metadata.name for app in apps
+                for pod in self.get_pods(app)]
+
+    def get_pod(self, app):
+        """Return the first pod of a replication controller, None if the
+        replication controller has no pod
+        """
+        pods = self.get_pods(app)
+        if not pods:
+            self.refresh()
+            pods = self.get_pods(app)
+        return pods[0] if pods else None
+
+    def get_service_spec(self, name):
+        """Return the spec of a service, None if it does not exist"""
+        if self._services is None or name not in self._services:
+            self.refresh()
+        service = self._services.get(name)
+        return service.spec if service else None
+
+    def _all_running(self, apps):
+        pods = {app: self.get_pods(app) for app in apps}
+        for pod in (pod for app_pods in pods.values() for pod in app_pods):
+            reason = get_pod_failure(pod)
+            if reason:
+                raise exceptions.KubernetesPodFailed(pod=pod.metadata.name,
+                                                     reason=reason)
+        return all(app_pods and all(pod.status.phase == 'Running'
+                                    for pod in app_pods)
+                   for app_pods in pods.values())
+
+    def _update_pod(self, event):
+        if event['type'] == 'ERROR':
+            # e.g. the resource version is too old: list the pods again
+            LOG.debug('Pod watch error: %s', event['raw_object'])
+            self.refresh()
+            return
+        pod = event['object']
+        LOG.debug('Pod %s %s: %s', pod.metadata.name, event['type'],
+                  pod.status.phase)
+        self._resource_version = pod.metadata.resource_version
+        if event['type'] == 'DELETED':
+            self._pods.pop(pod.metadata.name, None)
+        else:
+            self._pods[pod.metadata.name] = pod
+
+    def wait_running(self, apps, timeout=POD_WAIT_TIMEOUT):
+        """Wait until all the pods of the replication controllers run
+
+        :param apps: (list) names of the replication controllers
+        :param timeout: (int) seconds to wait
+        :raises: ``KubernetesPodFailed`` as soon as a pod fails,
+                 ``WaitTimeout`` if the pods are not running in time
+        """
+        end_time = time.time() + timeout
+        self.refresh()
+        watcher = watch.Watch()
+        while not self._all_running(apps):
+            remaining = int(end_time - time.time())
+            if remaining <= 0:
+                raise exceptions.WaitTimeout()
+            try:
+                for event in watcher.stream(
+                        get_core_api().list_namespaced_pod, self.namespace,
+                        resource_version=self._resource_version,
+                        timeout_seconds=remaining):
+                    self._update_pod(event)
+                    if self._all_running(apps):
+                        watcher.stop()
+            except ApiException:
+                raise exceptions.KubernetesApiException(action='watch',
+                                                        resource='Pod')
+
+
 def get_volume_types():
     """Return the "volume" types supported by the current API"""
     return [vtype for vtype in client.V1Volume.attribute_map.values()
@@ -1,6 +1,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from yardstick.common import constants
+
+# MQ transports:
+#   - rabbit: oslo.messaging RPC through RabbitMQ, see below
+#   - unix: brokerless, through Unix domain sockets in SOCKET_DIR, for the
+#           producers and consumers running in the same host
+TRANSPORT_RABBIT = 'rabbit'
+TRANSPORT_UNIX = 'unix'
+TRANSPORT = constants.MQ_TRANSPORT
+SOCKET_DIR = constants.MQ_SOCKET_DIR
+
 # MQ is statically configured:
 #   - MQ service: RabbitMQ
 #   - user/password: yardstick/yardstick
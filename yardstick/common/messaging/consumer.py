@@ -20,6 +20,7 @@ import oslo_messaging
 import six
 
 from yardstick.common import messaging
+from yardstick.common.messaging import unix
 
 
 LOG = logging.getLogger(__name__)
@@ -44,7 +45,7 @@ class MessagingConsumer(object):
     the messages published by a `MessagingNotifier`.
     """
 
-    def __init__(self, topic, ids, endpoints, fanout=True):
+    def __init__(self, topic, ids, endpoints, fanout=True, transport=None):
         """Init function.
 
         :param topic: (string) MQ exchange topic
@@ -56,11 +57,19 @@ class MessagingConsumer(object):
         :param fanout: (bool) MQ clients may request that a copy of the message
                        be delivered to all servers listening on a topic by
                        setting fanout to ``True``, rather than just one of them
+        :param transport: (string) MQ transport, ``messaging.TRANSPORT`` by
+                          default; with ``messaging.TRANSPORT_UNIX`` the
+                          messages are always delivered to all the consumers
         :returns: `MessagingConsumer` class object
         """
 
         self._ids = ids
         self._endpoints = endpoints
+        if (transport or messaging.TRANSPORT) == messaging.TRANSPORT_UNIX:
+            self._transport = None
+            self._target = None
+            self._server = unix.UnixSocketServer(topic, self._endpoints)
+            return
         self._transport = oslo_messaging.get_rpc_transport(
             cfg.CONF, url=messaging.TRANSPORT_URL)
         self._target = oslo_messaging.Target(topic=topic, fanout=fanout,
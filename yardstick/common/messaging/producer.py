@@ -21,6 +21,7 @@ import oslo_messaging
 import six
 
 from yardstick.common import messaging
+from yardstick.common.messaging import unix
 
 
 LOG = logging.getLogger(__name__)
@@ -34,7 +35,7 @@ class MessagingProducer(object):
     messages in a message queue.
     """
 
-    def __init__(self, topic, _id=os.getpid(), fanout=True):
+    def __init__(self, topic, _id=os.getpid(), fanout=True, transport=None):
         """Init function.
 
         :param topic: (string) MQ exchange topic
@@ -42,11 +43,18 @@ class MessagingProducer(object):
         :param fanout: (bool) MQ clients may request that a copy of the message
                        be delivered to all servers listening on a topic by
                        setting fanout to ``True``, rather than just one of them
+        :param transport: (string) MQ transport, ``messaging.TRANSPORT`` by
+                          default
         :returns: `MessagingNotifier` class object
         """
         self._topic = topic
         self._id = _id
         self._fanout = fanout
+        if (transport or messaging.TRANSPORT) == messaging.TRANSPORT_UNIX:
+            self._transport = None
+            self._target = None
+            self._notifier = unix.UnixSocketClient(topic)
+            return
         self._transport = oslo_messaging.get_rpc_transport(
             cfg.CONF, url=messaging.TRANSPORT_URL)
         self._target = oslo_messaging.Target(topic=topic, fanout=fanout,
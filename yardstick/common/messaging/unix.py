@@ -0,0 +1,160 @@
+# Copyright (c) 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Brokerless MQ transport through Unix domain sockets
+
+Each consumer of a topic binds a datagram socket in the topic directory,
+SOCKET_DIR/<topic>/. A producer sends each message to all the sockets of
+the directory, like an oslo.messaging fanout cast, without going through a
+broker. The producers and the consumers must run in the same host.
+
+The message is the JSON encoded context, method name and payload of the
+cast; the server calls the method of its endpoints, in its own thread, as
+the oslo.messaging "threading" executor does.
+"""
+
+import errno
+import glob
+import logging
+import os
+import socket
+import threading
+import uuid
+
+from oslo_serialization import jsonutils
+
+from yardstick.common import messaging
+from yardstick.common import utils
+
+
+LOG = logging.getLogger(__name__)
+
+MAX_MESSAGE_SIZE = 1024 * 1024
+SEND_TIMEOUT = 10
+
+
+def _get_topic_dir(topic, socket_dir=None):
+    return os.path.join(socket_dir or messaging.SOCKET_DIR, topic)
+
+
+class UnixSocketServer(object):
+    """Receive the messages cast to a topic and dispatch them to endpoints
+
+    Implements the start/stop/wait API of the oslo.messaging RPC server.
+    """
+
+    def __init__(self, topic, endpoints, socket_dir=None):
+        self._topic_dir = _get_topic_dir(topic, socket_dir)
+        self._endpoints = endpoints
+        self._path = None
+        self._socket = None
+        self._thread = None
+        self._stopped = threading.Event()
+
+    @property
+    def path(self):
+        return self._path
+
+    def start(self):
+        if self._thread:
+            return
+        utils.makedirs(self._topic_dir)
+        self._path = os.path.join(
+            self._topic_dir,
+            '{}-{}.sock'.format(os.getpid(), uuid.uuid4().hex[:8]))
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._socket.bind(self._path)
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run,
+                                        name='mq-' + self._path)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stop receiving messages, the pending ones are dropped"""
+        if not self._thread or self._stopped.is_set():
+            return
+        self._stopped.set()
+        # wake up the receiving thread
+        wakeup = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            wakeup.sendto(b'', self._path)
+        except socket.error:
+            pass
+        finally:
+            wakeup.close()
+        utils.remove_file(self._path)
+
+    def wait(self):
+        """Wait for the receiving thread to end, once stopped"""
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        try:
+            while not self._stopped.is_set():
+                data = self._socket.recv(MAX_MESSAGE_SIZE)
+                if data and not self._stopped.is_set():
+                    self._dispatch(data)
+        finally:
+            self._socket.close()
+
+    def _dispatch(self, data):
+        try:
+            message = jsonutils.loads(data)
+            method = message['method']
+        except (ValueError, KeyError, TypeError):
+            LOG.warning('Invalid MQ message ignored: %s', data)
+            return
+        # same access policy as oslo_messaging.DefaultRPCAccessPolicy
+        if method.startswith('_'):
+            LOG.warning('Private method %s can not be called', method)
+            return
+        for endpoint in self._endpoints:
+            endpoint_method = getattr(endpoint, method, None)
+            if callable(endpoint_method):
+                try:
+                    endpoint_method(message.get('ctxt', {}),
+                                    **message.get('kwargs', {}))
+                except Exception:  # pylint: disable=broad-except
+                    LOG.exception('Exception in MQ endpoint %s', method)
+                return
+        LOG.warning('No MQ endpoint implements %s', method)
+
+
+class UnixSocketClient(object):
+    """Cast messages to all the consumers of a topic
+
+    Implements the "cast" API of the oslo.messaging RPC client.
+    """
+
+    def __init__(self, topic, socket_dir=None):
+        self._topic_dir = _get_topic_dir(topic, socket_dir)
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._socket.settimeout(SEND_TIMEOUT)
+
+    def cast(self, ctxt, method, **kwargs):
+        data = jsonutils.dump_as_bytes(
+            {'ctxt': ctxt, 'method': method, 'kwargs': kwargs})
+        for path in glob.glob(os.path.join(self._topic_dir, '*.sock')):
+            try:
+                self._socket.sendto(data, path)
+            except socket.timeout:
+                LOG.warning('MQ consumer %s is not receiving, message %s '
+                            'dropped', path, method)
+            except socket.error as e:
+                if e.errno not in (errno.ECONNREFUSED, errno.ENOENT):
+                    raise
+                # the consumer ended without removing its socket
+                utils.remove_file(path)
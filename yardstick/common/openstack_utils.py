@@ -7,16 +7,21 @@
 # http://www.apache.org/licenses/LICENSE-2.0
 ##############################################################################
 
+import collections
 import copy
 import logging
 import os
+import threading
 
 from cinderclient import client as cinderclient
 from novaclient import client as novaclient
 from glanceclient import client as glanceclient
+from keystoneauth1 import exceptions as ks_exceptions
 from keystoneauth1 import loading
 from keystoneauth1 import session
 from neutronclient.neutron import client as neutronclient
+from os_client_config import cloud_config as cloud_config_module
+from oslo_serialization import jsonutils
 import shade
 from shade import exc
 
@@ -53,14 +58,97 @@ def get_credentials():
     return creds
 
 
+# *********************************************
+#   CLIENTS CACHE
+# *********************************************
+# The sessions and clients are cached per process and per configuration.
+# Their connection pools can't be shared with the forked processes (the
+# runners), so they are dropped after a fork. The authentication plugins,
+# holding the token and the service catalog, are kept: keystoneauth reuses a
+# token until it is about to expire, in the forked processes too. The task
+# authenticates before forking (see authenticate), and the forked processes
+# send their stats back to it (see add_clients_stats).
+_AUTH_PLUGINS = {}
+_CLOUD_CONFIGS = {}
+_CLIENTS = {}
+_CLIENTS_STATS = collections.Counter()
+_CLIENTS_LOCK = threading.RLock()
+_CLIENTS_PID = [os.getpid()]
+
+
+def _config_key(*config):
+    return jsonutils.dumps(config, sort_keys=True)
+
+
+def _check_fork():
+    if _CLIENTS_PID[0] != os.getpid():
+        _CLIENTS_PID[0] = os.getpid()
+        _CLIENTS.clear()
+        _CLIENTS_STATS.clear()
+
+
+def _count_auth(auth):
+    """Count the authentications done by a keystoneauth plugin"""
+    get_auth_ref = auth.get_auth_ref
+
+    def _get_auth_ref(*args, **kwargs):
+        _CLIENTS_STATS['auth'] += 1
+        return get_auth_ref(*args, **kwargs)
+
+    auth.get_auth_ref = _get_auth_ref
+    return auth
+
+
+def _get_cached(key, create):
+    with _CLIENTS_LOCK:
+        _check_fork()
+        if key in _CLIENTS:
+            _CLIENTS_STATS['hit'] += 1
+        else:
+            _CLIENTS_STATS['miss'] += 1
+            _CLIENTS[key] = create()
+        return _CLIENTS[key]
+
+
+def get_clients_stats():
+    """Return the authentications, cache hits and misses of this process"""
+    with _CLIENTS_LOCK:
+        _check_fork()
+        return {name: _CLIENTS_STATS[name] for name in ('auth', 'hit', 'miss')}
+
+
+def add_clients_stats(stats):
+    """Add the stats of another process, e.g. a runner worker, to this one"""
+    with _CLIENTS_LOCK:
+        _check_fork()
+        _CLIENTS_STATS.update(stats)
+
+
+def clear_clients():
+    """Drop the cached clients, sessions and authentications"""
+    with _CLIENTS_LOCK:
+        _AUTH_PLUGINS.clear()
+        _CLOUD_CONFIGS.clear()
+        _CLIENTS.clear()
+        _CLIENTS_STATS.clear()
+
+
 def get_session_auth():
-    loader = loading.get_plugin_loader('password')
+    """Return the keystoneauth password plugin of the credentials
+
+    The plugin is shared by the sessions of the same credentials.
+    """
     creds = get_credentials()
-    auth = loader.load_from_options(**creds)
-    return auth
+    key = _config_key(creds)
+    with _CLIENTS_LOCK:
+        if key not in _AUTH_PLUGINS:
+            loader = loading.get_plugin_loader('password')
+            _AUTH_PLUGINS[key] = _count_auth(
+                loader.load_from_options(**creds))
+        return _AUTH_PLUGINS[key]
 
 
-def get_session():
+def _create_session():
     auth = get_session_auth()
     try:
         cacert = os.environ['OS_CACERT']
@@ -72,6 +160,19 @@ def get_session():
         return session.Session(auth=auth, verify=cacert)
 
 
+def get_session():
+    """Return the keystoneauth session of the credentials, cached"""
+    key = _config_key('session', get_credentials(),
+                      os.environ.get('OS_CACERT'), os.getenv('OS_INSECURE'))
+    return _get_cached(key, _create_session)
+
+
+def _get_session_client(client_class, version):
+    sess = get_session()
+    key = ('client', client_class.__module__, version, id(sess))
+    return _get_cached(key, lambda: client_class(version, session=sess))
+
+
 def get_endpoint(service_type, endpoint_type='publicURL'):
     auth = get_session_auth()
     # for multi-region, we need to specify region
@@ -83,6 +184,24 @@ def get_endpoint(service_type, endpoint_type='publicURL'):
                                           "OS_REGION_NAME"))
 
 
+def authenticate():
+    """Authenticate the credentials of the environment, if any
+
+    The token and the service catalog of the session plugin and of the
+    default shade cloud are fetched once, before the runner processes are
+    forked, so the scenarios creating their clients in those processes don't
+    authenticate again.
+    """
+    if not os.environ.get('OS_AUTH_URL'):
+        return
+    try:
+        get_session_auth().get_access(get_session())
+        get_shade_client().keystone_session.get_token()
+    except (ks_exceptions.ClientException, exc.OpenStackCloudException):
+        log.warning('OpenStack authentication failed, each scenario will '
+                    'authenticate on its own', exc_info=True)
+
+
 # *********************************************
 #   CLIENTS
 # *********************************************
@@ -107,8 +226,7 @@ def get_cinder_client_version():      # pragma: no cover
 
 
 def get_cinder_client():      # pragma: no cover
-    sess = get_session()
-    return cinderclient.Client(get_cinder_client_version(), session=sess)
+    return _get_session_client(cinderclient.Client, get_cinder_client_version())
 
 
 def get_nova_client_version():      # pragma: no cover
@@ -122,8 +240,7 @@ def get_nova_client_version():      # pragma: no cover
 
 
 def get_nova_client():      # pragma: no cover
-    sess = get_session()
-    return novaclient.Client(get_nova_client_version(), session=sess)
+    return _get_session_client(novaclient.Client, get_nova_client_version())
 
 
 def get_neutron_client_version():   # pragma: no cover
@@ -137,8 +254,7 @@ def get_neutron_client_version():   # pragma: no cover
 
 
 def get_neutron_client():   # pragma: no cover
-    sess = get_session()
-    return neutronclient.Client(get_neutron_client_version(), session=sess)
+    return _get_session_client(neutronclient.Client, get_neutron_client_version())
 
 
 def get_glance_client_version():    # pragma: no cover
@@ -152,8 +268,7 @@ def get_glance_client_version():    # pragma: no cover
 
 
 def get_glance_client():    # pragma: no cover
-    sess = get_session()
-    return glanceclient.Client(get_glance_client_version(), session=sess)
+    return _get_session_client(glanceclient.Client, get_glance_client_version())
 
 
 def get_shade_client(**os_cloud_config):
@@ -168,18 +283,44 @@ def get_shade_client(**os_cloud_config):
                             "shade.openstack_cloud" method.
     :return: ``shade.OpenStackCloud`` object.
     """
-    params = copy.deepcopy(constants.OS_CLOUD_DEFAULT_CONFIG)
-    params.update(os_cloud_config)
-    return shade.openstack_cloud(**params)
+    return _get_shade_cloud('openstack', shade.openstack_cloud,
+                            shade.OpenStackCloud, os_cloud_config)
+
 
 def get_shade_operator_client(**os_cloud_config):
     """Get Shade Operator cloud client
 
     :return: ``shade.OperatorCloud`` object.
     """
+    return _get_shade_cloud('operator', shade.operator_cloud,
+                            shade.OperatorCloud, os_cloud_config)
+
+
+def _get_shade_cloud(cloud_type, cloud_factory, cloud_class, os_cloud_config):
+    """Return a cached shade cloud client
+
+    A forked process creates its own client, from the cloud configuration
+    of the parent process and with its authentication plugin.
+    """
     params = copy.deepcopy(constants.OS_CLOUD_DEFAULT_CONFIG)
     params.update(os_cloud_config)
-    return shade.operator_cloud(**params)
+    key = _config_key('shade', cloud_type, params)
+
+    def _create():
+        cloud_config = _CLOUD_CONFIGS.get(key)
+        if cloud_config:
+            return cloud_class(cloud_config=cloud_config_module.CloudConfig(
+                cloud_config.name, cloud_config.region, cloud_config.config,
+                force_ipv4=cloud_config.force_ipv4,
+                auth_plugin=cloud_config.get_auth()))
+        cloud = cloud_factory(**params)
+        cloud_config = getattr(cloud, 'cloud_config', None)
+        if cloud_config and cloud_config.get_auth():
+            _count_auth(cloud_config.get_auth())
+            _CLOUD_CONFIGS[key] = cloud_config
+        return cloud
+
+    return _get_cached(key, _create)
 
 
 # *********************************************
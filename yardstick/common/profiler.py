@@ -0,0 +1,135 @@
+##############################################################################
+# Copyright (c) 2018 Intel Corporation
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+"""Lightweight span based profiler
+
+A span measures the wall time of one phase of a task: parsing, context
+deployment, scenario runner, VNF instantiation, result output... A span
+started while another one is open is recorded as its child. Timers add up
+the time of short and repeated operations (e.g. the upload of one record)
+into the open span, instead of creating one span per call.
+
+Spans are plain dictionaries, so they can be sent between processes and
+stored in the task result::
+
+    {'name': 'deploy', 'tags': {'context': 'demo'}, 'start': 1530000000.0,
+     'duration': 42.1, 'timers': {}, 'children': []}
+"""
+
+import contextlib
+import time
+
+
+class Profiler(object):
+    """Collect nested spans, in the current process"""
+
+    def __init__(self):
+        self._spans = []
+        self._stack = []
+
+    def reset(self):
+        """Drop the recorded spans, e.g. the ones inherited by a fork"""
+        self._spans = []
+        self._stack = []
+
+    def _children(self):
+        return self._stack[-1]['children'] if self._stack else self._spans
+
+    @staticmethod
+    def _new_span(name, start, duration=None, children=None, **tags):
+        return {'name': name, 'tags': tags, 'start': start,
+                'duration': duration, 'timers': {},
+                'children': list(children or [])}
+
+    @contextlib.contextmanager
+    def span(self, name, **tags):
+        """Record the execution of the block as a span"""
+        span = self._new_span(name, time.time(), **tags)
+        self._children().append(span)
+        self._stack.append(span)
+        try:
+            yield span
+        finally:
+            # the stack may have been reset inside the block
+            if self._stack and self._stack[-1] is span:
+                self._stack.pop()
+            span['duration'] = time.time() - span['start']
+
+    def add_span(self, name, start, duration, children=None, **tags):
+        """Record a span measured by the caller, e.g. in another process"""
+        span = self._new_span(name, start, duration, children, **tags)
+        self._children().append(span)
+        return span
+
+    def add_spans(self, spans):
+        """Add the spans recorded in another process to the open span"""
+        self._children().extend(spans)
+
+    def add_time(self, name, duration):
+        """Add one timed operation to the open span"""
+        if not self._stack:
+            return
+        timer = self._stack[-1]['timers'].setdefault(
+            name, {'count': 0, 'total': 0.0})
+        timer['count'] += 1
+        timer['total'] += duration
+
+    @contextlib.contextmanager
+    def timer(self, name):
+        """Add the execution time of the block to the open span"""
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.time() - start)
+
+    def get_spans(self):
+        """Return the root spans recorded so far"""
+        return self._spans
+
+
+def iter_spans(spans, path=''):
+    """Yield (path, span) for all the spans of a tree, depth first
+
+    The path of a span is the slash separated names of its ancestors and
+    its own name, e.g. "testcase/runner/worker/instantiate".
+    """
+    for span in spans:
+        span_path = '/'.join((path, span['name'])) if path else span['name']
+        yield span_path, span
+        for item in iter_spans(span['children'], span_path):
+            yield item
+
+
+def format_spans(spans):
+    """Return a printable tree of the spans and their durations"""
+    lines = []
+    for path, span in iter_spans(spans):
+        tags = ', '.join('{}={}'.format(key, value) for key, value
+                         in sorted(span['tags'].items()))
+        duration = span['duration']
+        lines.append('{}{} {}{}'.format(
+            '  ' * path.count('/'), span['name'],
+            'open' if duration is None else '{:.3f}s'.format(duration),
+            ' ({})'.format(tags) if tags else ''))
+        for name, timer in sorted(span['timers'].items()):
+            lines.append('{}{} x{} {:.3f}s'.format(
+                '  ' * (path.count('/') + 1), name, timer['count'],
+                timer['total']))
+    return '\n'.join(lines)
+
+
+_PROFILER = Profiler()
+
+reset = _PROFILER.reset
+span = _PROFILER.span
+add_span = _PROFILER.add_span
+add_spans = _PROFILER.add_spans
+add_time = _PROFILER.add_time
+timer = _PROFILER.timer
+get_spans = _PROFILER.get_spans
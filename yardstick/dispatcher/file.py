@@ -19,20 +19,60 @@
 from __future__ import absolute_import
 
 from yardstick.dispatcher.base import Base as DispatchBase
+from yardstick.common import chunked_result
 from yardstick.common import constants as consts
 from yardstick.common import utils
 
 
+FORMAT_JSON = 'json'
+FORMAT_CHUNKED = 'chunked'
+
+
+def is_chunked(conf):
+    """Check if the file dispatcher writes the chunked result format"""
+    return conf.get('dispatcher_file', {}).get('format') == FORMAT_CHUNKED
+
+
 class FileDispatcher(DispatchBase):
     """Dispatcher class for recording data to a file.
+
+    With "format = chunked", the records are appended to the file while the
+    task runs, see yardstick.common.chunked_result.
     """
 
     __dispatcher_type__ = "File"
 
     def __init__(self, conf):
         super(FileDispatcher, self).__init__(conf)
-        self.target = conf['dispatcher_file'].get('file_path',
-                                                  consts.DEFAULT_OUTPUT_FILE)
+        file_conf = conf['dispatcher_file']
+        self.target = file_conf.get('file_path', consts.DEFAULT_OUTPUT_FILE)
+        self.chunked = is_chunked(conf)
+        self.chunk_records = int(file_conf.get('chunk_records', 1000))
+
+    def _get_writer(self, task_id):
+        return chunked_result.get_writer(self.target, task_id=task_id,
+                                         chunk_records=self.chunk_records)
+
+    def start_task(self, resume=False):
+        """Start the output file of a task
+
+        :param resume: a resumed task appends to its chunked output file
+        """
+        if self.chunked:
+            chunked_result.init_file(self.target, resume=resume)
+        else:
+            utils.write_json_to_file(self.target,
+                                     {'status': 0, 'result': {}})
+
+    def upload_one_record(self, data, case, tc_criteria, task_id=None,
+                          scenario=None):
+        # pylint: disable=unused-argument
+        if self.chunked:
+            self._get_writer(task_id).add_record(data, case, scenario)
 
     def flush_result_data(self, data):
-        utils.write_json_to_file(self.target, data)
+        if self.chunked:
+            task_id = data.get('result', {}).get('task_id')
+            self._get_writer(task_id).write_result(data)
+        else:
+            utils.write_json_to_file(self.target, data)
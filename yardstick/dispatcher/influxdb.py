@@ -16,6 +16,7 @@ import os
 import requests
 from requests import ConnectionError
 
+from yardstick.common import profiler
 from yardstick.common import utils
 from third_party.influxdb.influxdb_line_protocol import make_lines
 from yardstick.dispatcher.base import Base as DispatchBase
@@ -29,6 +30,8 @@ class InfluxdbDispatcher(DispatchBase):
 
     __dispatcher_type__ = "Influxdb"
 
+    PROFILE_MEASUREMENT = 'yardstick_profile'
+
     def __init__(self, conf):
         super(InfluxdbDispatcher, self).__init__(conf)
         db_conf = conf['dispatcher_influxdb']
@@ -70,7 +73,36 @@ class InfluxdbDispatcher(DispatchBase):
 
         line = self._data_to_line_protocol(data, case, tc_criteria)
         LOG.debug('Test result line format : %s', line)
+        self._post(line)
+
+    def upload_profile(self, data):
+        """Upload the profiling spans of a task result, one point per span"""
+        result = data['result']
+        self.tags = result['info']
+        self.task_id = result['task_id']
 
+        points = []
+        for path, span in profiler.iter_spans(result.get('profile', [])):
+            if span['duration'] is None:
+                continue
+            tags = {key: str(value) for key, value in span['tags'].items()}
+            tags.update(span=path, task_id=self.task_id)
+            fields = {'duration': span['duration']}
+            fields.update(utils.flatten_dict_key(
+                {'timers': span['timers']}))
+            points.append({
+                'measurement': self.PROFILE_MEASUREMENT,
+                'fields': fields,
+                'time': self._get_nano_timestamp(
+                    {'timestamp': span['start']}),
+                'tags': tags,
+            })
+
+        if points:
+            self._post(make_lines({'points': points, 'tags': self.tags})
+                       .encode('utf-8'))
+
+    def _post(self, line):
         try:
             res = requests.post(self.influxdb_url,
                                 data=line,
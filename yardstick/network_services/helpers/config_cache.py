@@ -0,0 +1,114 @@
+# Copyright (c) 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cache of the configuration files generated for the VNFs
+
+The configuration of a VNF is rendered from a template and from the VNF
+interfaces and options; the same inputs always give the same bytes. The
+rendered configurations are kept by the digest of their inputs, in memory
+and in CACHE_DIR, so that the next VNFs, iterations or tasks with the same
+inputs don't build them again.
+
+The digest covers the version of the network services code too: a
+configuration cached by a previous version is never reused.
+"""
+
+import hashlib
+import logging
+import os
+
+from oslo_serialization import jsonutils
+
+from yardstick.common import constants
+from yardstick.common import utils
+
+
+LOG = logging.getLogger(__name__)
+
+CACHE_DIR = constants.CONFIG_CACHE_DIR
+# the package rendering the configurations
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_CACHE = {}
+_code_signature = []
+
+
+def _get_code_signature():
+    if not _code_signature:
+        for dir_path, _, file_names in sorted(os.walk(CODE_DIR)):
+            for file_name in sorted(file_names):
+                if file_name.endswith('.py'):
+                    stat = os.stat(os.path.join(dir_path, file_name))
+                    _code_signature.append(
+                        (os.path.relpath(os.path.join(dir_path, file_name),
+                                         CODE_DIR),
+                         stat.st_size, stat.st_mtime))
+    return _code_signature
+
+
+def read_file(path):
+    """Return the content of a template file, as an input of get_key"""
+    with open(path) as template_file:
+        return template_file.read()
+
+
+def get_key(*inputs):
+    """Return the key of a configuration, the digest of its inputs
+
+    :param inputs: JSON serializable inputs of the configuration
+    """
+    data = jsonutils.dumps([_get_code_signature(), inputs], sort_keys=True)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def get(key):
+    """Return the cached configuration, None if not cached"""
+    if key in _CACHE:
+        return _CACHE[key]
+    try:
+        with open(os.path.join(CACHE_DIR, key)) as cache_file:
+            value = jsonutils.loads(cache_file.read())
+    except (IOError, OSError, ValueError):
+        return None
+    _CACHE[key] = value
+    return value
+
+
+def put(key, value):
+    """Cache a JSON serializable configuration"""
+    _CACHE[key] = value
+    path = os.path.join(CACHE_DIR, key)
+    # written and renamed, the readers never see a partial file
+    tmp_path = '{}.{}'.format(path, os.getpid())
+    try:
+        utils.makedirs(CACHE_DIR)
+        with open(tmp_path, 'w') as cache_file:
+            cache_file.write(jsonutils.dumps(value))
+        os.rename(tmp_path, path)
+    except (IOError, OSError):
+        LOG.debug("Failed to write the configuration cache %s", path,
+                  exc_info=True)
+
+
+def memoize(key, build):
+    """Return the cached configuration, calling build() if not cached"""
+    value = get(key)
+    if value is None:
+        value = build()
+        put(key, value)
+    return value
+
+
+def clear():
+    """Drop the configurations cached in memory"""
+    _CACHE.clear()
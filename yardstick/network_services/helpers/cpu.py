@@ -15,6 +15,8 @@
 
 import io
 
+from yardstick.network_services.helpers import host_topology
+
 
 class CpuSysCores(object):
 
@@ -42,13 +44,20 @@ class CpuSysCores(object):
         return core_details
 
     def get_core_socket(self):
-        lines = self.connection.execute("lscpu")[1].split(u'\n')
+        topology = host_topology.get(self.connection)
+        if topology and topology.lscpu:
+            lines = topology.lscpu.split(u'\n')
+        else:
+            lines = self.connection.execute("lscpu")[1].split(u'\n')
         num_cores = self._get_core_details(lines)
         for num in num_cores:
             self.core_map["cores_per_socket"] = num["Core(s) per socket"]
             self.core_map["thread_per_core"] = num["Thread(s) per core"]
 
-        lines = self._open_cpuinfo()
+        if topology and topology.cpuinfo:
+            lines = topology.cpuinfo.splitlines()
+        else:
+            lines = self._open_cpuinfo()
         core_details = self._get_core_details(lines)
         for core in core_details:
             for k, v in core.items():
@@ -20,6 +20,7 @@ from itertools import chain
 
 from yardstick.common import exceptions
 from yardstick.common.utils import validate_non_string_sequence
+from yardstick.network_services.helpers import host_topology
 
 
 NETWORK_KERNEL = 'network_kernel'
@@ -345,10 +346,22 @@ printf "%s/driver:" $1 ; basename $(readlink -s $1/device/driver); } \
         return {interface['vpci']: interface['driver']
                 for interface in chain.from_iterable(self.dpdk_status.values())}
 
+    def _get_topology(self):
+        # the PCI, netdev and DPDK binding information of the host, read in
+        # one SSH call and shared by the VNFs of the host
+        return host_topology.get(self.ssh_helper, self.dpdk_devbind)
+
     def read_status(self):
+        topology = self._get_topology()
+        if topology and topology.dpdk_status is not None:
+            return self._parse_dpdk_status_output(topology.dpdk_status)
         return self._parse_dpdk_status_output(self._dpdk_execute(self._status_cmd)[1])
 
     def find_net_devices(self):
+        topology = self._get_topology()
+        if topology:
+            return topology.netdevs
+
         exit_status, stdout, _ = self.ssh_helper.execute(self.FIND_NETDEVICE_STRING)
         if exit_status != 0:
             return {}
@@ -356,18 +369,46 @@ printf "%s/driver:" $1 ; basename $(readlink -s $1/device/driver); } \
         return self.parse_netdev_info(stdout)
 
     def bind(self, pci_addresses, driver, force=True):
-        # accept single PCI or sequence of PCI
-        pci_addresses = validate_non_string_sequence(pci_addresses, [pci_addresses])
-
-        cmd = self.DPDK_BIND_CMD.format(dpdk_devbind=self.dpdk_devbind,
-                                        driver=driver,
-                                        vpci=' '.join(list(pci_addresses)),
-                                        force='--force' if force else '')
+        return self.bind_drivers({driver: pci_addresses}, force)
+
+    def bind_drivers(self, driver_pci_addresses, force=True):
+        """Bind PCI devices to drivers, in one SSH call
+
+        The devices already bound to their driver, in the last status read,
+        are skipped; the others are bound with one dpdk-devbind invocation
+        per driver.
+
+        :param driver_pci_addresses: (dict) driver: PCI address or list of
+                                     PCI addresses
+        :return: True if any device was bound
+        """
+        current_drivers = self.interface_driver_map
+        cmds = []
+        for driver, pci_addresses in sorted(driver_pci_addresses.items()):
+            # accept single PCI or sequence of PCI
+            pci_addresses = validate_non_string_sequence(pci_addresses,
+                                                         [pci_addresses])
+            pci_addresses = [pci for pci in pci_addresses
+                             if current_drivers.get(pci) != driver]
+            if pci_addresses:
+                cmds.append(self.DPDK_BIND_CMD.format(
+                    dpdk_devbind=self.dpdk_devbind, driver=driver,
+                    vpci=' '.join(pci_addresses),
+                    force='--force' if force else ''))
+        if not cmds:
+            LOG.debug("PCI devices already bound: %s", driver_pci_addresses)
+            return False
+
+        cmd = ' && '.join(cmds)
         LOG.debug(cmd)
-        self._dpdk_execute(cmd)
+        try:
+            self._dpdk_execute(cmd)
+        finally:
+            host_topology.invalidate(self.ssh_helper)
 
         # update the inner status dict
         self.read_status()
+        return True
 
     def probe_real_kernel_drivers(self):
         self.read_status()
@@ -407,6 +448,11 @@ printf "%s/driver:" $1 ; basename $(readlink -s $1/device/driver); } \
             self.used_drivers.setdefault(driver, []).append(vpci)
 
     def get_real_kernel_driver(self, pci):
+        topology = self._get_topology()
+        kernel_modules = topology.kernel_modules if topology else None
+        if kernel_modules is not None and pci in kernel_modules:
+            return kernel_modules[pci]
+
         out = self.ssh_helper.execute('lspci -k -s %s' % pci)[1]
         match = self.KERNEL_DRIVER_RE.search(out)
         if match:
@@ -423,5 +469,4 @@ printf "%s/driver:" $1 ; basename $(readlink -s $1/device/driver); } \
         self.real_kernel_interface_driver_map = {pci: driver for pci, driver in iter1 if driver}
 
     def rebind_drivers(self, force=True):
-        for driver, vpcis in self.used_drivers.items():
-            self.bind(vpcis, driver, force)
+        self.bind_drivers(self.used_drivers, force)
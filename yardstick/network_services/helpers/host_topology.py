@@ -0,0 +1,302 @@
+# Copyright (c) 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Per host cache of the CPU, NUMA, NIC and hugepages topology
+
+The topology of a host is read in one SSH round trip, by a probe script
+returning JSON, and cached for the whole task. The cached topology of a
+host is dropped when its NICs are bound to other drivers (see invalidate)
+or when its boot ID changes (see check_boot).
+"""
+
+import json
+import logging
+
+from concurrent import futures
+
+from yardstick.common import utils
+
+
+LOG = logging.getLogger(__name__)
+
+PROBE_CMD = '"$(command -v python3 || command -v python)" -'
+BOOT_ID_PATH = '/proc/sys/kernel/random/boot_id'
+NIC_ID_FIELDS = ('vendor', 'device', 'subsystem_vendor', 'subsystem_device')
+MAX_WORKERS = 32
+
+# run on the host, with Python 2.7 or 3; the optional arguments are the
+# command returning the DPDK NIC binding status
+PROBE_SCRIPT = r"""
+import glob
+import json
+import os
+import subprocess
+import sys
+
+
+def read(path, default=None):
+    try:
+        with open(path) as f:
+            return f.read()
+    except (IOError, OSError):
+        return default
+
+
+def run(cmd):
+    env = dict(os.environ, LC_ALL='C')
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE, env=env)
+    except OSError:
+        return None
+    out = proc.communicate()[0].decode('utf-8', 'replace')
+    return out if proc.returncode == 0 else None
+
+
+def kernel_modules():
+    # kernel module of the PCI devices, even if bound to a DPDK driver
+    out = run(['lspci', '-Dk'])
+    if out is None:
+        return None
+    modules = {}
+    pci = None
+    for line in out.splitlines():
+        if line and not line[0].isspace():
+            pci = line.split(' ', 1)[0]
+            if 'Virtio network device' in line:
+                modules[pci] = 'virtio-pci'
+        elif pci and line.strip().startswith('Kernel modules:'):
+            modules[pci] = line.split(':', 1)[1].split(',')[0].strip()
+    return modules
+
+
+def hugepages(path):
+    sizes = {}
+    for size_path in glob.glob(path + '/hugepages-*kB'):
+        sizes[size_path.rsplit('-', 1)[1][:-2]] = {
+            'total': int(read(size_path + '/nr_hugepages', 0)),
+            'free': int(read(size_path + '/free_hugepages', 0))}
+    return sizes
+
+
+nodes = {}
+for path in glob.glob('/sys/devices/system/node/node[0-9]*'):
+    nodes[path.rsplit('node', 1)[1]] = {
+        'cpulist': read(path + '/cpulist', '').strip(),
+        'hugepages': hugepages(path + '/hugepages')}
+
+nics = {}
+modules = kernel_modules()
+for path in glob.glob('/sys/bus/pci/devices/*'):
+    if not read(path + '/class', '').startswith('0x02'):
+        continue
+    pci = os.path.basename(path)
+    driver = None
+    if os.path.exists(path + '/driver'):
+        driver = os.path.basename(os.path.realpath(path + '/driver'))
+    # virtio NICs have their interfaces below the virtio device
+    netdevs = {}
+    for net_path in (glob.glob(path + '/net') +
+                     glob.glob(path + '/virtio*/net')):
+        for interface in os.listdir(net_path):
+            netdevs[interface] = dict(
+                (name, read(os.path.join(net_path, interface, name),
+                            '').strip())
+                for name in ('address', 'operstate', 'ifindex'))
+    nic = {
+        'driver': driver,
+        'numa_node': int(read(path + '/numa_node', '-1')),
+        'interfaces': sorted(netdevs),
+        'netdevs': netdevs,
+        'kernel_module': modules.get(pci) if modules is not None else None}
+    for name in ('vendor', 'device', 'subsystem_vendor', 'subsystem_device'):
+        nic[name] = read(os.path.join(path, name), '').strip()
+    nics[pci] = nic
+
+sys.stdout.write(json.dumps({
+    'boot_id': read('/proc/sys/kernel/random/boot_id', '').strip(),
+    'cpuinfo': read('/proc/cpuinfo'),
+    'lscpu': run(['lscpu']),
+    'nodes': nodes,
+    'hugepages': hugepages('/sys/kernel/mm/hugepages'),
+    'nics': nics,
+    'lspci': modules is not None,
+    'dpdk_status': run(sys.argv[1:]) if len(sys.argv) > 1 else None,
+}))
+"""
+
+
+class HostTopology(object):
+    """Topology of a host, as returned by the probe script"""
+
+    def __init__(self, data, dpdk_devbind=None):
+        self.data = data
+        self.dpdk_devbind = dpdk_devbind
+        self._socket_topology = None
+
+    @property
+    def boot_id(self):
+        return self.data['boot_id']
+
+    @property
+    def cpuinfo(self):
+        """Content of /proc/cpuinfo"""
+        return self.data['cpuinfo']
+
+    @property
+    def lscpu(self):
+        """Output of "lscpu", None if it failed"""
+        return self.data['lscpu']
+
+    @property
+    def nodes(self):
+        """NUMA nodes: {node: {'cpulist': ..., 'hugepages': ...}}"""
+        return self.data['nodes']
+
+    @property
+    def hugepages(self):
+        """Hugepages per size in kB: {size: {'total': ..., 'free': ...}}"""
+        return self.data['hugepages']
+
+    @property
+    def nics(self):
+        """Network PCI devices: {pci: {'driver', 'numa_node', 'interfaces',
+        'netdevs', 'kernel_module', 'vendor', 'device', ...}}"""
+        return self.data['nics']
+
+    @property
+    def dpdk_status(self):
+        """Output of "dpdk-devbind --status", None if not probed or failed"""
+        return self.data['dpdk_status']
+
+    @property
+    def socket_topology(self):
+        if self._socket_topology is None:
+            self._socket_topology = utils.SocketTopology.parse_cpuinfo(
+                self.cpuinfo)
+        return self._socket_topology
+
+    @property
+    def netdevs(self):
+        """Kernel interfaces of the NICs, by name, with the fields read by
+        DpdkBindHelper.find_net_devices"""
+        netdevs = {}
+        for pci, nic in self.nics.items():
+            for interface, netdev in nic.get('netdevs', {}).items():
+                netdev = dict(netdev, interface_name=interface,
+                              pci_bus_id=pci, driver=nic['driver'],
+                              numa_node=str(nic['numa_node']))
+                netdev.update((name, nic[name]) for name in NIC_ID_FIELDS
+                              if name in nic)
+                netdevs[interface] = netdev
+        return netdevs
+
+    @property
+    def kernel_modules(self):
+        """Kernel drivers of the NICs, even if bound to a DPDK driver:
+        {pci: driver}; None if "lspci" failed"""
+        if not self.data.get('lspci'):
+            return None
+        return {pci: nic.get('kernel_module')
+                for pci, nic in self.nics.items()}
+
+    def get_interface(self, pci):
+        """Return the kernel interface of a NIC, None if it has none"""
+        interfaces = self.nics.get(pci, {}).get('interfaces')
+        return interfaces[0] if interfaces else None
+
+
+_CACHE = {}
+
+
+def _key(connection):
+    return connection.host, connection.port
+
+
+def probe(connection, dpdk_devbind=None):
+    """Read the topology of a host, return None if the probe failed"""
+    cmd = PROBE_CMD
+    if dpdk_devbind:
+        cmd = '%s %s --status' % (cmd, dpdk_devbind)
+    status, stdout, stderr = connection.execute(cmd, stdin=PROBE_SCRIPT)
+    if status:
+        LOG.warning("Failed to probe the host topology: %s", stderr)
+        return None
+    try:
+        return HostTopology(json.loads(stdout), dpdk_devbind)
+    except (ValueError, TypeError):
+        LOG.warning("Invalid host topology: %s", stdout)
+        return None
+
+
+def get(connection, dpdk_devbind=None, refresh=False):
+    """Return the cached topology of a host, probing it if needed
+
+    :param dpdk_devbind: path of the dpdk-devbind tool, to probe the DPDK NIC
+                         binding status too
+    :param refresh: probe the host even if its topology is cached
+    :return: HostTopology, or None if the host can't be probed; the failure
+             is cached too, so the callers can fall back on their own
+             commands without probing again
+    """
+    key = _key(connection)
+    if key in _CACHE and not refresh:
+        topology = _CACHE[key]
+        if (topology is None or not dpdk_devbind or
+                topology.dpdk_devbind == dpdk_devbind):
+            return topology
+    topology = _CACHE[key] = probe(connection, dpdk_devbind)
+    return topology
+
+
+def _prefetch_one(connection, dpdk_devbind):
+    try:
+        get(connection, dpdk_devbind)
+    except Exception:  # pylint: disable=broad-except
+        # not cached, the caller will probe the host again
+        LOG.warning("Failed to probe the host %s", connection.host,
+                    exc_info=True)
+
+
+def prefetch(hosts, max_workers=MAX_WORKERS):
+    """Probe the topology of several hosts concurrently, one SSH call each
+
+    :param hosts: iterable of (connection, dpdk_devbind); a host reached by
+                  several connections is probed once
+    """
+    unique_hosts = {}
+    for connection, dpdk_devbind in hosts:
+        unique_hosts.setdefault(_key(connection), (connection, dpdk_devbind))
+    if not unique_hosts:
+        return
+    workers = min(max_workers, len(unique_hosts))
+    with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(lambda args: _prefetch_one(*args),
+                          unique_hosts.values()))
+
+
+def invalidate(connection):
+    """Drop the cached topology of a host, e.g. after rebinding its NICs"""
+    _CACHE.pop(_key(connection), None)
+
+
+def check_boot(connection):
+    """Drop the cached topology of a host rebooted since it was probed"""
+    topology = _CACHE.get(_key(connection))
+    if not topology:
+        return
+    boot_id = connection.execute('cat %s' % BOOT_ID_PATH)[1].strip()
+    if boot_id != topology.boot_id:
+        LOG.info("Host %s rebooted, dropping its cached topology",
+                 connection.host)
+        invalidate(connection)
@@ -0,0 +1,168 @@
+# Copyright (c) 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Latency histograms and percentiles of the traffic generators
+
+The latencies are recorded in nanoseconds in a log-linear histogram, as in
+an HDR histogram: the values lower than 2 ** sub_bucket_bits are counted
+exactly, the higher ones in buckets whose width is 1 / 2 ** (sub_bucket_bits
+- 1) of their value at most. The memory used is fixed, whatever the number
+of latencies recorded, and the histograms of several cores or ports are
+merged by adding their counts.
+
+The latencies of a traffic generator histogram bucket are recorded at the
+upper bound of the bucket, so the percentiles are never under-reported.
+"""
+
+import math
+
+
+# name and value of the percentiles reported
+PERCENTILES = (('p50', 50.0), ('p99', 99.0), ('p99_9', 99.9),
+               ('p99_99', 99.99))
+NSEC_PER_USEC = 1000.0
+# width of the lowest TRex histogram buckets, in usec
+TREX_BUCKET_WIDTH = 10
+
+
+class LatencyHistogram(object):
+    """Fixed memory histogram of latencies, in nanoseconds"""
+
+    def __init__(self, sub_bucket_bits=7, max_value_bits=40):
+        """Initialize the histogram
+
+        :param sub_bucket_bits: (int) precision of the buckets; with 7 bits,
+                                the relative error is below 1/64
+        :param max_value_bits: (int) the highest value recorded is
+                               2 ** max_value_bits - 1, the higher ones are
+                               recorded as it
+        """
+        self.sub_bucket_bits = sub_bucket_bits
+        self.max_value_bits = max_value_bits
+        self._sub_bucket_count = 1 << sub_bucket_bits
+        self._half_count = self._sub_bucket_count >> 1
+        self._max_value = (1 << max_value_bits) - 1
+        self.counts = [0] * (self._sub_bucket_count + self._half_count *
+                             (max_value_bits - sub_bucket_bits))
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def _get_index(self, value):
+        if value < self._sub_bucket_count:
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits
+        return (self._sub_bucket_count + (shift - 1) * self._half_count +
+                (value >> shift) - self._half_count)
+
+    def _get_highest_value(self, index):
+        """Return the highest value counted in a bucket"""
+        if index < self._sub_bucket_count:
+            return index
+        shift, offset = divmod(index - self._sub_bucket_count,
+                               self._half_count)
+        return ((offset + self._half_count + 1) << (shift + 1)) - 1
+
+    def record(self, value, count=1):
+        """Record a latency, in nanoseconds, "count" times"""
+        if count <= 0:
+            return
+        value = min(max(int(value), 0), self._max_value)
+        self.counts[self._get_index(value)] += count
+        self.total += count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other):
+        """Add the latencies of another histogram, with the same precision"""
+        if (other.sub_bucket_bits, other.max_value_bits) != (
+                self.sub_bucket_bits, self.max_value_bits):
+            raise ValueError('Histograms with different precisions')
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+        return self
+
+    def get_value_at_percentile(self, percentile):
+        """Return the latency, in nanoseconds, at a percentile
+
+        :return: (int) highest value of the bucket holding the percentile,
+                 None if no latency was recorded
+        """
+        if not self.total:
+            return None
+        target = max(1, int(math.ceil(self.total * percentile / 100.0)))
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return min(self._get_highest_value(index), self.max)
+
+    def get_percentiles(self, percentiles=PERCENTILES):
+        """Return the percentiles of the latency, in microseconds
+
+        :return: (dict) percentile name and value; empty if no latency was
+                 recorded
+        """
+        if not self.total:
+            return {}
+        return {name: self.get_value_at_percentile(percentile) / NSEC_PER_USEC
+                for name, percentile in percentiles}
+
+
+def _get_trex_bucket_upper_bound(bucket):
+    """Return the upper bound of a TRex histogram bucket, in usec
+
+    A TRex bucket is named after its lower bound; the buckets are 10 usec
+    wide up to 100 usec, 100 usec wide up to 1 msec, and so on.
+    """
+    if bucket < TREX_BUCKET_WIDTH:
+        return TREX_BUCKET_WIDTH
+    return bucket + 10 ** int(math.floor(math.log10(bucket)))
+
+
+def from_trex_latency(pg_latencies):
+    """Return the histogram of TRex flow latency statistics
+
+    :param pg_latencies: (list) "latency" statistics of the streams (pg_id),
+                         with a "histogram" of bucket (usec): count
+    """
+    histogram = LatencyHistogram()
+    for pg_latency in (pg_latency for pg_latency in pg_latencies
+                       if pg_latency):
+        for bucket, count in pg_latency.get('histogram', {}).items():
+            histogram.record(
+                _get_trex_bucket_upper_bound(float(bucket)) * NSEC_PER_USEC,
+                int(count))
+    return histogram
+
+
+def from_prox_buckets(buckets, bucket_size, hz):
+    """Return the histogram of PROX latency buckets
+
+    :param buckets: (dict) bucket index: count; a bucket holds the latencies
+                    between index << bucket_size and (index + 1) <<
+                    bucket_size TSC cycles
+    :param bucket_size: (int) PROX "bucket size"
+    :param hz: (int) TSC frequency
+    """
+    histogram = LatencyHistogram()
+    for index, count in buckets.items():
+        cycles = (index + 1) << bucket_size
+        histogram.record(cycles * 1e9 / hz, count)
+    return histogram
@@ -17,7 +17,6 @@ from __future__ import absolute_import
 import ipaddress
 import logging
 import os
-import sys
 from collections import OrderedDict, defaultdict
 from itertools import chain, repeat
 
@@ -182,7 +181,8 @@ class MultiPortConfig(object):
         self.vnf_type = vnf_type
         self.pipe_line = 0
         self.vnfd_helper = vnfd_helper
-        self.write_parser = ConfigParser()
+        # the pipeline sections of the configuration: {section: {name: value}}
+        self.write_parser = OrderedDict()
         self.read_parser = ConfigParser()
         self.read_parser.read(config_tpl)
         self.master_core = self.read_parser.get("PIPELINE0", "core")
@@ -204,6 +204,7 @@ class MultiPortConfig(object):
         self.all_ports = []
         self.port_pair_list = []
         self.lb_to_port_pair_mapping = {}
+        self.eal_config = ''
         self.init_eal()
 
         self.lb_index = None
@@ -234,8 +235,7 @@ class MultiPortConfig(object):
         vpci = (v['virtual-interface']["vpci"] for v in self.vnfd_helper.interfaces)
         lines.extend('w = {0}\n'.format(item) for item in vpci)
         lines.append('\n')
-        with open(self.tmp_file, 'w') as fh:
-            fh.writelines(lines)
+        self.eal_config = ''.join(lines)
 
     def update_timer(self):
         timer_tpl = self.get_config_tpl_data('TIMER')
@@ -262,15 +262,21 @@ class MultiPortConfig(object):
                 self.pipeline_counter = self.read_parser.getint(section, 'core')
                 self.txrx_pipeline = self.read_parser.getint(section, 'core')
                 return
-            self.write_parser.add_section(section)
-            for name, value in self.read_parser.items(section):
-                self.write_parser.set(section, name, value)
+            self.write_parser[section] = OrderedDict(self.read_parser.items(section))
 
     def update_write_parser(self, data):
         section = "PIPELINE{0}".format(self.pipeline_counter)
-        self.write_parser.add_section(section)
-        for name, value in data.items():
-            self.write_parser.set(section, name, value)
+        self.write_parser[section] = OrderedDict(data)
+
+    def render_config(self):
+        """Render the pipeline sections, in the ConfigParser format"""
+        lines = []
+        for section, data in self.write_parser.items():
+            lines.append('[{}]\n'.format(section))
+            lines.extend('{} = {}\n'.format(name, str(value).replace('\n', '\n\t'))
+                         for name, value in data.items())
+            lines.append('\n')
+        return ''.join(lines)
 
     def get_worker_threads(self, worker_threads):
         if self.worker_config == '1t':
@@ -476,7 +482,7 @@ class MultiPortConfig(object):
         self.init_write_parser_template()
 
         # use master core for master, don't use self.start_core
-        self.write_parser.set('PIPELINE0', 'core', self.gen_core(self.master_core))
+        self.write_parser['PIPELINE0']['core'] = self.gen_core(self.master_core)
         arpicmp_data = self.generate_arpicmp_data()
         self.arpicmp_tpl.update(arpicmp_data)
         self.update_write_parser(self.arpicmp_tpl)
@@ -530,6 +536,7 @@ class MultiPortConfig(object):
             self.vnf_tpl = self.get_config_tpl_data(self.vnf_type)
 
     def generate_config(self):
+        """Generate the configuration, return it and write it in tmp_file"""
         self._port_pairs = PortPairs(self.vnfd_helper.interfaces)
         self.port_pair_list = self._port_pairs.port_pair_list
         self.all_ports = self._port_pairs.all_ports
@@ -537,9 +544,11 @@ class MultiPortConfig(object):
         self.get_lb_count()
         self.generate_lb_to_port_pair_mapping()
         self.generate_config_data()
-        self.write_parser.write(sys.stdout)
-        with open(self.tmp_file, 'a') as tfh:
-            self.write_parser.write(tfh)
+        config = self.eal_config + self.render_config()
+        LOG.debug("%s configuration:\n%s", self.vnf_type, config)
+        with open(self.tmp_file, 'w') as tfh:
+            tfh.write(config)
+        return config
 
     def generate_link_config(self):
         def build_args(port):
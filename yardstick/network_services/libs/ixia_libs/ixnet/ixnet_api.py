@@ -49,6 +49,19 @@ TRAFFIC_STATUS_STOPPED = 'stopped'
 
 SUPPORTED_PROTO = [PROTO_UDP]
 
+# traffic state polling interval, in seconds
+POLL_INTERVAL_MIN = 0.1
+POLL_INTERVAL_MAX = 1
+
+
+def get_poll_interval(duration):
+    """Return the traffic state polling interval for a trial duration
+
+    A tenth of the duration, between POLL_INTERVAL_MIN and POLL_INTERVAL_MAX,
+    so the end of short trials is not detected up to one second late.
+    """
+    return min(POLL_INTERVAL_MAX, max(POLL_INTERVAL_MIN, duration / 10.0))
+
 
 # NOTE(ralonsoh): this pragma will be removed in the last patch of this series
 class IxNextgen(object):  # pragma: no cover
@@ -100,6 +113,7 @@ class IxNextgen(object):  # pragma: no cover
         self._cfg = None
         self._params = None
         self._bidir = None
+        self.poll_interval = POLL_INTERVAL_MAX
 
     @property
     def ixnet(self):  # pragma: no cover
@@ -547,10 +561,35 @@ class IxNextgen(object):  # pragma: no cover
 
         self.ixnet.commit()
 
+    def _get_view_rows(self, view_obj):
+        """Return the column captions and all the rows of a statistics view
+
+        The view is read by page, one call per page instead of one call per
+        column.
+        """
+        page_obj = view_obj + '/page'
+        captions = self.ixnet.getAttribute(page_obj, '-columnCaptions')
+        total_pages = int(self.ixnet.getAttribute(page_obj, '-totalPages'))
+        rows = []
+        for page in range(1, total_pages + 1):
+            if total_pages > 1:
+                self.ixnet.setAttribute(page_obj, '-currentPage', page)
+                self.ixnet.commit()
+            # each row is a list of sub-rows (drill down), the first one holds
+            # the values of the row
+            rows.extend(row[0] for row in
+                        self.ixnet.getAttribute(page_obj, '-rowValues') if row)
+        return captions, rows
+
     def _build_stats_map(self, view_obj, name_map):
-        return {data_yardstick: self.ixnet.execute(
-            'getColumnValues', view_obj, data_ixia)
-            for data_yardstick, data_ixia in name_map.items()}
+        captions, rows = self._get_view_rows(view_obj)
+        columns = {caption: index for index, caption in enumerate(captions)}
+        missing = sorted(set(name_map.values()) - set(columns))
+        if missing:
+            raise exceptions.IxNetworkStatisticNotPresent(
+                caption=', '.join(missing), view=view_obj)
+        return {data_yardstick: [row[columns[data_ixia]] for row in rows]
+                for data_yardstick, data_ixia in name_map.items()}
 
     def get_statistics(self):
         """Retrieve port and flow statistics
@@ -579,10 +618,12 @@ class IxNextgen(object):  # pragma: no cover
         if self.is_traffic_running():
             self.ixnet.execute('stop', '/traffic')
             # pylint: disable=unnecessary-lambda
-            utils.wait_until_true(lambda: self.is_traffic_stopped())
+            utils.wait_until_true(lambda: self.is_traffic_stopped(),
+                                  sleep=self.poll_interval)
 
         self.ixnet.execute('generate', traffic_items)
         self.ixnet.execute('apply', '/traffic')
         self.ixnet.execute('start', '/traffic')
         # pylint: disable=unnecessary-lambda
-        utils.wait_until_true(lambda: self.is_traffic_running())
+        utils.wait_until_true(lambda: self.is_traffic_running(),
+                              sleep=self.poll_interval)
@@ -45,6 +45,9 @@ class TrafficProfileConfig(object):
         self.upper_bound = tprofile.get('upper_bound')
         self.step_interval = tprofile.get('step_interval')
         self.enable_latency = tprofile.get('enable_latency', False)
+        # run the traffic continuously, at a rate changed on the fly, instead
+        # of in trials
+        self.steady_state = tprofile.get('steady_state', False)
 
     def _parse_rate(self, rate):
         """Parse traffic profile rate
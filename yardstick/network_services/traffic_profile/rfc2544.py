@@ -20,6 +20,7 @@ from trex_stl_lib import trex_stl_packet_builder_scapy
 from trex_stl_lib import trex_stl_streams
 
 from yardstick.common import constants
+from yardstick.network_services.helpers import latency as latency_helper
 from yardstick.network_services.traffic_profile import trex_traffic_profile
 
 
@@ -69,7 +70,11 @@ class PortPgIDMap(object):
 
 
 class RFC2544Profile(trex_traffic_profile.TrexProfile):
-    """TRex RFC2544 traffic profile"""
+    """TRex RFC2544 traffic profile
+
+    The streams are created and added to the ports in the first trial and
+    left on them; the next trials start them again with a rate multiplier.
+    """
 
     TOLERANCE_LIMIT = 0.01
 
@@ -80,21 +85,29 @@ class RFC2544Profile(trex_traffic_profile.TrexProfile):
         self.max_rate = self.config.frame_rate
         self.min_rate = 0
         self.drop_percent_max = 0
+        self._ports = None
+        self._port_pg_id = None
+        self._streams_rate = None
 
     def register_generator(self, generator):
         self.generator = generator
+        # the generator removes all the streams before running the traffic
+        self._ports = None
 
     def stop_traffic(self, traffic_generator=None):
-        """"Stop traffic injection, reset counters and remove streams"""
+        """Stop traffic injection and clear the counters
+
+        The streams are not removed, the next trial uses them again.
+        """
         if traffic_generator is not None and self.generator is None:
             self.generator = traffic_generator
 
         self.generator.client.stop()
-        self.generator.client.reset()
-        self.generator.client.remove_all_streams()
+        self.generator.client.clear_stats(ports=self._ports)
 
     def execute_traffic(self, traffic_generator=None):
-        """Generate the stream and run traffic on the given ports
+        """Generate the streams, in the first trial, and run traffic on the
+        given ports at the trial rate
 
         :param traffic_generator: (TrexTrafficGenRFC) traffic generator
         :return ports: (list of int) indexes of ports
@@ -105,6 +118,28 @@ class RFC2544Profile(trex_traffic_profile.TrexProfile):
         if traffic_generator is not None and self.generator is None:
             self.generator = traffic_generator
 
+        if self._ports is None:
+            self._ports, self._port_pg_id = self._add_streams()
+            self._streams_rate = self.rate
+
+        # a steady state traffic runs until it is stopped
+        duration = -1 if self.config.steady_state else self.config.duration
+        self.generator.client.start(ports=self._ports, mult=self._get_mult(),
+                                    duration=duration, force=True)
+        return self._ports, self._port_pg_id
+
+    def _get_mult(self):
+        """Return the TRex rate multiplier of the streams for the trial rate"""
+        if not self._streams_rate:
+            return '1'
+        return '{:.8f}'.format(float(self.rate) / self._streams_rate)
+
+    def _add_streams(self):
+        """Create the streams of each port, at the current rate, and add them
+
+        :return: (list of int) indexes of the ports, (PortPgIDMap) port
+                 indexes and pg_id map
+        """
         port_pg_id = PortPgIDMap()
         ports = []
         for vld_id, intfs in sorted(self.generator.networks.items()):
@@ -122,10 +157,6 @@ class RFC2544Profile(trex_traffic_profile.TrexProfile):
                                                self.rate, port_pg_id,
                                                self.config.enable_latency)
                 self.generator.client.add_streams(profile, ports=[port_num])
-
-        self.generator.client.start(ports=ports,
-                                    duration=self.config.duration,
-                                    force=True)
         return ports, port_pg_id
 
     def _create_profile(self, profile_data, rate, port_pg_id, enable_latency):
@@ -310,6 +341,11 @@ class RFC2544Profile(trex_traffic_profile.TrexProfile):
 
         latency = {port_num: value['latency']
                    for port_num, value in samples[-1].items()}
+        # the latency counters are cleared at the end of each trial: the
+        # last sample holds the latencies of the whole trial
+        histogram = latency_helper.from_trex_latency(
+            pg_latency for port_latency in latency.values()
+            for pg_latency in port_latency.values())
 
         output = {
             'TxThroughput': tx_rate_fps,
@@ -318,6 +354,7 @@ class RFC2544Profile(trex_traffic_profile.TrexProfile):
             'Throughput': throughput,
             'DropPercentage': self.drop_percent_max,
             'Rate': last_rate,
-            'Latency': latency
+            'Latency': latency,
+            'LatencyPercentiles': histogram.get_percentiles()
         }
         return completed, output
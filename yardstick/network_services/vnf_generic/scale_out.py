@@ -0,0 +1,130 @@
+# Copyright (c) 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Scale-out network service topologies
+
+Builds the same topology as the *-topology-3node-scale-out.yaml templates of
+the scale-out test cases, without rendering a file: the traffic generator
+tg__0 sends the traffic to N VNFs, each one connected by uplink_<n> to the
+port xe<n> of tg__0 and by downlink_<n> to the port xe<n> of tg__1::
+
+    tg__0 xe<n> <-- uplink_<n> --> xe0 vnf__<n> xe1 <-- downlink_<n> --> xe<n> tg__1
+
+A NSPerf scenario builds it when its "topology" is a mapping of the
+generate_topology arguments instead of a file name::
+
+    topology:
+      num_vnfs: 32
+      vnf_model: ../../vnf_descriptors/acl_vnf.yaml
+
+If the scenario has no "nodes", the task parser defaults them with
+generate_nodes to tg__0, tg__1 and vnf__<n> in the first context of the task.
+"""
+
+from collections import OrderedDict
+
+from yardstick.common import exceptions
+
+
+TG_MODEL = '../../vnf_descriptors/tg_rfc2544_tpl.yaml'
+TG_RX_MODEL = '../../vnf_descriptors/udp_replay_vnf.yaml'
+# member-vnf-index of the first VNF, after the two traffic generators
+FIRST_VNF_INDEX = 2
+
+
+def _connection_point(vnf_index, vnfd_id, if_name):
+    return OrderedDict([('member-vnf-index-ref', str(vnf_index)),
+                        ('vnfd-connection-point-ref', if_name),
+                        ('vnfd-id-ref', vnfd_id)])
+
+
+def _vld(vld_id, name, node0, node1):
+    return OrderedDict([('id', vld_id),
+                        ('name', name),
+                        ('type', 'ELAN'),
+                        ('vnfd-connection-point-ref', [node0, node1])])
+
+
+def _get_num_vnfs(num_vnfs):
+    try:
+        num_vnfs = int(num_vnfs)
+    except (TypeError, ValueError):
+        num_vnfs = 0
+    if num_vnfs < 1:
+        raise exceptions.IncorrectConfig(
+            error_msg='Scale-out topology needs at least one VNF')
+    return num_vnfs
+
+
+def generate_topology(num_vnfs, vnf_model, tg_model=TG_MODEL,
+                      tg_rx_model=TG_RX_MODEL):
+    """Return the network service descriptor of a scale-out topology
+
+    :param num_vnfs: (int) number of VNFs
+    :param vnf_model: VNF model file of the VNFs, relative to the task file
+    :param tg_model: VNF model file of the sending traffic generator
+    :param tg_rx_model: VNF model file of the receiving traffic generator
+    :return: (dict) network service descriptor, as the "nsd" items of a
+             topology file
+    """
+    num_vnfs = _get_num_vnfs(num_vnfs)
+    name = '{}-vnf-correlated'.format(num_vnfs)
+    constituent_vnfds = [
+        OrderedDict([('member-vnf-index', '0'), ('vnfd-id-ref', 'tg__0'),
+                     ('VNF model', tg_model)]),
+        OrderedDict([('member-vnf-index', '1'), ('vnfd-id-ref', 'tg__1'),
+                     ('VNF model', tg_rx_model)]),
+    ]
+    vlds = []
+    for vnf_num in range(num_vnfs):
+        vnf_index = vnf_num + FIRST_VNF_INDEX
+        vnfd_id = 'vnf__{}'.format(vnf_num)
+        constituent_vnfds.append(
+            OrderedDict([('member-vnf-index', str(vnf_index)),
+                         ('vnfd-id-ref', vnfd_id),
+                         ('VNF model', vnf_model)]))
+        port = 'xe{}'.format(vnf_num)
+        vlds.append(_vld(
+            'uplink_{}'.format(vnf_num),
+            'tg__0 to {} link {}'.format(vnfd_id, vnf_num),
+            _connection_point(0, 'tg__0', port),
+            _connection_point(vnf_index, vnfd_id, 'xe0')))
+        vlds.append(_vld(
+            'downlink_{}'.format(vnf_num),
+            '{} to tg__1 link {}'.format(vnfd_id, vnf_num),
+            _connection_point(vnf_index, vnfd_id, 'xe1'),
+            _connection_point(1, 'tg__1', port)))
+
+    return OrderedDict([('id', name),
+                        ('name', name),
+                        ('short-name', name),
+                        ('description', name),
+                        ('constituent-vnfd', constituent_vnfds),
+                        ('vld', vlds)])
+
+
+def generate_nodes(num_vnfs, context_name='yardstick'):
+    """Return the scenario "nodes" of a scale-out topology
+
+    :param num_vnfs: (int) number of VNFs
+    :param context_name: name of the context deploying the nodes
+    :return: (dict) topology node name: context server name
+    """
+    num_vnfs = _get_num_vnfs(num_vnfs)
+    nodes = OrderedDict(
+        ('tg__{}'.format(tg_num), 'tg_{}.{}'.format(tg_num, context_name))
+        for tg_num in range(2))
+    nodes.update(
+        ('vnf__{}'.format(vnf_num), 'vnf_{}.{}'.format(vnf_num, context_name))
+        for vnf_num in range(num_vnfs))
+    return nodes
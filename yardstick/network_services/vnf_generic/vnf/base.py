@@ -15,7 +15,10 @@
 import abc
 
 import logging
+import time
+
 import six
+from six.moves import queue
 
 from yardstick.common import messaging
 from yardstick.common.messaging import consumer
@@ -47,13 +50,15 @@ class QueueFileWrapper(object):
     def write(self, chunk):
         """ write chunk to output queue """
         self.buf.append(chunk)
-        # flush on prompt or if we exceed bufsize
-
-        size = sum(len(c) for c in self.buf)
-        if self.prompt in chunk or size > self.bufsize:
-            out = ''.join(self.buf)
+        # flush on prompt or if we exceed bufsize; the prompt could be split
+        # between the buffered data and the new chunk
+        out = ''.join(self.buf)
+        tail = out[-(len(chunk) + len(self.prompt)):]
+        if self.prompt in tail or len(out) > self.bufsize:
             self.buf = []
             self.q_out.put(out)
+        else:
+            self.buf = [out]
 
     def close(self):
         """ close multiprocessing queue """
@@ -65,6 +70,73 @@ class QueueFileWrapper(object):
             self.q_out.get()
 
 
+class VnfConsole(object):
+    """Prompt-aware channel to the interactive console of a VNF
+
+    The console output is read from the output queue of a QueueFileWrapper
+    and split in responses, each one ended by the VNF prompt. A command
+    returns as soon as its prompt is received, without waiting a fixed time.
+    Several commands can be pipelined, sending all of them at once and
+    reading back one response per command.
+    """
+
+    def __init__(self, q_in, q_out, prompt):
+        self.q_in = q_in
+        self.q_out = q_out
+        self.prompt = prompt
+        self._buf = ''
+
+    def clear(self):
+        """Discard any pending console output"""
+        self._buf = ''
+        while True:
+            try:
+                self.q_out.get_nowait()
+            except queue.Empty:
+                break
+
+    def send(self, *cmds):
+        """Send one or several commands to the VNF, without waiting"""
+        self.q_in.put(''.join('{}\r\n'.format(cmd) for cmd in cmds))
+
+    def iter_responses(self, count, timeout):
+        """Yield the next "count" responses, as they are received
+
+        Once "timeout" seconds are elapsed, the output received so far is
+        yielded as the last response.
+        """
+        deadline = time.time() + timeout
+        while count > 0:
+            index = self._buf.find(self.prompt)
+            if index >= 0:
+                index += len(self.prompt)
+                response, self._buf = self._buf[:index], self._buf[index:]
+                count -= 1
+                yield response
+                continue
+
+            remaining = deadline - time.time()
+            try:
+                self._buf += self.q_out.get(True, max(remaining, 0))
+            except queue.Empty:
+                LOG.debug("VNF console timeout, %d responses missing", count)
+                response, self._buf = self._buf, ''
+                yield response
+                return
+
+    def execute(self, cmd, timeout):
+        """Send a command and return its output, ended by the prompt"""
+        self.clear()
+        self.send(cmd)
+        return ''.join(self.iter_responses(1, timeout))
+
+    def execute_many(self, cmds, timeout):
+        """Pipeline several commands, yield (cmd, output) as they complete"""
+        self.clear()
+        self.send(*cmds)
+        return six.moves.zip(cmds, self.iter_responses(len(cmds), timeout))
+
+
 class VnfdHelper(dict):
 
     def __init__(self, *args, **kwargs):
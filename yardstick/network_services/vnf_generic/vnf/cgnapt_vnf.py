@@ -112,11 +112,11 @@ class CgnaptApproxVnf(SampleVNF):
         # p <pipeline id> entry addm <prv_ipv4/6> prvport> <pub_ip> <pub_port> <phy_port> <ttl>
         # <no_of_entries> <end_prv_port> <end_pub_port>
         cmd_template = "p {0} entry addm {1} 1 {2} 1 0 32 65535 65535 65535"
+        cmds = []
         for gw, ip in zip(gw_ips, ip_iter):
-            cmd = cmd_template.format(pipeline, gw, ip)
+            cmds.append(cmd_template.format(pipeline, gw, ip))
             pipeline += worker_threads
             pipeline += offset
-            LOG.info(cmd)
-            self.vnf_execute(cmd)
+        self.vnf_execute_many(cmds)
 
         time.sleep(WAIT_FOR_STATIC_NAPT)
@@ -32,6 +32,9 @@ from six.moves import zip, StringIO
 
 from yardstick.common import utils
 from yardstick.common.utils import SocketTopology, join_non_strings, try_int
+from yardstick.network_services.helpers import config_cache
+from yardstick.network_services.helpers import host_topology
+from yardstick.network_services.helpers import latency as latency_helper
 from yardstick.network_services.helpers.iniparser import ConfigParser
 from yardstick.network_services.vnf_generic.vnf.sample_vnf import ClientResourceHelper
 from yardstick.network_services.vnf_generic.vnf.sample_vnf import DpdkVnfSetupEnvHelper
@@ -51,6 +54,11 @@ BITS_PER_BYTE = 8
 RETRY_SECONDS = 60
 RETRY_INTERVAL = 1
 
+# PROX default latency "bucket size": the bucket N holds the latencies
+# between N << 11 and (N + 1) << 11 TSC cycles
+PROX_LAT_BUCKET_SIZE = 11
+PROX_LAT_BUCKET_RE = re.compile(r'Bucket \[(\d+)\]: (\d+)')
+
 CONFIGURATION_OPTIONS = (
     # dict key           section     key               default value
     ('pktSizes', 'general', 'pkt_sizes', '64,128,256,512,1024,1280,1518'),
@@ -126,7 +134,16 @@ class TotStatsTuple(namedtuple('TotStats', 'rx,tx,tsc,hz')):
 class ProxTestDataTuple(namedtuple('ProxTestDataTuple', 'tolerated,tsc_hz,delta_rx,'
                                                         'delta_tx,delta_tsc,'
                                                         'latency,rx_total,tx_total,'
-                                                        'requested_pps')):
+                                                        'requested_pps,'
+                                                        'latency_percentiles')):
+
+    def __new__(cls, tolerated, tsc_hz, delta_rx, delta_tx, delta_tsc,
+                latency, rx_total, tx_total, requested_pps,
+                latency_percentiles=None):
+        return super(ProxTestDataTuple, cls).__new__(
+            cls, tolerated, tsc_hz, delta_rx, delta_tx, delta_tsc, latency,
+            rx_total, tx_total, requested_pps, latency_percentiles)
+
     @property
     def pkt_loss(self):
         try:
@@ -182,6 +199,8 @@ class ProxTestDataTuple(namedtuple('ProxTestDataTuple', 'tolerated,tsc_hz,delta_
             samples.update(port_samples)
 
         samples.update((key, value) for key, value in zip(latency_keys, self.latency))
+        if self.latency_percentiles:
+            samples["LatencyPercentiles"] = self.latency_percentiles
         return samples
 
     def log_data(self, logger=None):
@@ -519,6 +538,32 @@ class ProxSocketHelper(object):
 
         return lat_min, lat_max, lat_avg
 
+    def get_lines(self, timeout=0.01):
+        """Read all the lines received, until no data is received in timeout"""
+        data = ''
+        while select.select([self._sock], [], [], timeout)[0]:
+            received = self._sock.recv(4096).decode('utf-8')
+            if not received:
+                break
+            data += received
+        return data.splitlines()
+
+    def lat_buckets(self, cores, task=0):
+        """Get the latency histogram buckets from the remote system
+
+        :return: (dict) bucket index and number of packets, added for all
+                 the cores
+        """
+        buckets = {}
+        for core in cores:
+            self.put_command("lat packets {} {}\n".format(core, task))
+            for match in (PROX_LAT_BUCKET_RE.search(line)
+                          for line in self.get_lines()):
+                if match:
+                    index, count = int(match.group(1)), int(match.group(2))
+                    buckets[index] = buckets.get(index, 0) + count
+        return buckets
+
     def get_all_tot_stats(self):
         self.put_command("tot stats\n")
         all_stats_str = self.get_data().split(",")
@@ -737,68 +782,65 @@ class ProxDpdkVnfSetupEnvHelper(DpdkVnfSetupEnvHelper):
         prox_config.parse()
 
         # Ensure MAC is set "hardware"
-        all_ports = self.vnfd_helper.port_pairs.all_ports
         # use dpdk port number
-        for port_name in all_ports:
-            port_num = self.vnfd_helper.port_num(port_name)
-            port_section_name = "port {}".format(port_num)
-            for section_name, section in sections:
-                if port_section_name != section_name:
-                    continue
+        hardware_sections = {
+            "port {}".format(self.vnfd_helper.port_num(port_name))
+            for port_name in self.vnfd_helper.port_pairs.all_ports}
 
-                for section_data in section:
-                    if section_data[0] == "mac":
-                        section_data[1] = "hardware"
+        interfaces = {}
 
-        # search for dst mac
-        for _, section in sections:
-            for section_data in section:
-                item_key, item_val = section_data
-                if item_val.startswith("@@dst_mac"):
-                    tx_port_iter = re.finditer(r'\d+', item_val)
-                    tx_port_no = int(next(tx_port_iter).group(0))
-                    intf = self.vnfd_helper.find_interface_by_port(tx_port_no)
-                    mac = intf["virtual-interface"]["dst_mac"]
-                    section_data[1] = mac.replace(":", " ", 6)
-
-                if item_key == "dst mac" and item_val.startswith("@@"):
-                    tx_port_iter = re.finditer(r'\d+', item_val)
-                    tx_port_no = int(next(tx_port_iter).group(0))
-                    intf = self.vnfd_helper.find_interface_by_port(tx_port_no)
-                    mac = intf["virtual-interface"]["dst_mac"]
-                    section_data[1] = mac
-
-                if item_val.startswith("@@src_mac"):
-                    tx_port_iter = re.finditer(r'\d+', item_val)
-                    tx_port_no = int(next(tx_port_iter).group(0))
-                    intf = self.vnfd_helper.find_interface_by_port(tx_port_no)
-                    mac = intf["virtual-interface"]["local_mac"]
-                    section_data[1] = mac.replace(":", " ", 6)
-
-                if item_key == "src mac" and item_val.startswith("@@"):
-                    tx_port_iter = re.finditer(r'\d+', item_val)
-                    tx_port_no = int(next(tx_port_iter).group(0))
-                    intf = self.vnfd_helper.find_interface_by_port(tx_port_no)
-                    mac = intf["virtual-interface"]["local_mac"]
-                    section_data[1] = mac
-
-        # if addition file specified in prox config
-        if not self.additional_files:
-            return sections
+        def get_mac(item_val, mac_key):
+            tx_port_no = int(re.search(r'\d+', item_val).group(0))
+            if tx_port_no not in interfaces:
+                interfaces[tx_port_no] = self.vnfd_helper.find_interface_by_port(
+                    tx_port_no)["virtual-interface"]
+            return interfaces[tx_port_no][mac_key]
 
+        # the port, MAC and additional file overlays, in one pass
         for section_name, section in sections:
             for section_data in section:
-                try:
-                    if section_data[0].startswith("dofile"):
-                        section_data[0] = self._insert_additional_file(section_data[0])
+                item_key, item_val = section_data
+                if item_key == "mac" and section_name in hardware_sections:
+                    section_data[1] = "hardware"
+                else:
+                    # search for dst mac
+                    if item_val.startswith("@@dst_mac"):
+                        section_data[1] = get_mac(item_val, "dst_mac").replace(":", " ", 6)
+
+                    if item_key == "dst mac" and item_val.startswith("@@"):
+                        section_data[1] = get_mac(item_val, "dst_mac")
+
+                    if item_val.startswith("@@src_mac"):
+                        section_data[1] = get_mac(item_val, "local_mac").replace(":", " ", 6)
 
-                    if section_data[1].startswith("dofile"):
-                        section_data[1] = self._insert_additional_file(section_data[1])
-                except:  # pylint: disable=bare-except
-                    pass
+                    if item_key == "src mac" and item_val.startswith("@@"):
+                        section_data[1] = get_mac(item_val, "local_mac")
+
+                # if addition file specified in prox config
+                if self.additional_files:
+                    self._insert_additional_files(section_data)
 
         return sections
 
+    def _insert_additional_files(self, section_data):
+        try:
+            if section_data[0].startswith("dofile"):
+                section_data[0] = self._insert_additional_file(section_data[0])
+
+            if section_data[1].startswith("dofile"):
+                section_data[1] = self._insert_additional_file(section_data[1])
+        except:  # pylint: disable=bare-except
+            pass
+
+    def _get_prox_config(self, config_path):
+        # the PROX configuration only depends on these inputs, it is built
+        # once for all the VNFs, iterations and tasks using them
+        key = config_cache.get_key(
+            type(self).__name__, config_cache.read_file(config_path),
+            self.vnfd_helper.interfaces, self.additional_files)
+        return config_cache.memoize(
+            key, lambda: self.generate_prox_config_file(config_path))
+
     @staticmethod
     def write_prox_lua(lua_config):
         """
@@ -902,7 +944,7 @@ class ProxDpdkVnfSetupEnvHelper(DpdkVnfSetupEnvHelper):
             remote_prox_file = self.copy_to_target(key_prox_path, base_prox_file)
             self.additional_files[base_prox_file] = remote_prox_file
 
-        self._prox_config_data = self.generate_prox_config_file(config_path)
+        self._prox_config_data = self._get_prox_config(config_path)
         # copy config to queue so we can read it from traffic_runner process
         self.config_queue.put(self._prox_config_data)
         self.remote_path = self.upload_prox_config(config_file, self._prox_config_data)
@@ -956,6 +998,8 @@ class ProxResourceHelper(ClientResourceHelper):
         self.step_delta = 1
         self.step_time = 0.5
         self._test_type = None
+        self._steady_state_cores = None
+        self._steady_state_pkt_size = None
 
     @property
     def sut(self):
@@ -971,10 +1015,18 @@ class ProxResourceHelper(ClientResourceHelper):
 
     def run_traffic(self, traffic_profile, *args):
         self._queue.cancel_join_thread()
+        self._samples_queue.cancel_join_thread()
         self.lower = 0.0
         self.upper = 100.0
 
         traffic_profile.init(self._queue)
+        if traffic_profile.config.steady_state:
+            try:
+                self._run_steady_state(traffic_profile, *args)
+            finally:
+                self.sut.stop_all()
+            return
+
         # this frees up the run_traffic loop
         self.client_started.value = 1
 
@@ -989,6 +1041,52 @@ class ProxResourceHelper(ClientResourceHelper):
             LOG.debug("tg_prox done")
             self._terminated.value = 1
 
+    def _start_steady_state(self, traffic_profile):
+        """Start the generator cores, with the first packet size of the
+        profile, at its frame rate"""
+        profile_helper = traffic_profile.make_profile_helper(self)
+        self._steady_state_cores = profile_helper.test_cores
+        pkt_size = next(iter(traffic_profile.pkt_sizes), 64)
+        # as in ProxProfile.execute_traffic
+        if pkt_size < traffic_profile.min_pkt_size:
+            pkt_size += traffic_profile.min_pkt_size - 64
+        self._steady_state_pkt_size = pkt_size
+        self._traffic_rate = traffic_profile.config.frame_rate
+        self._traffic_rate_unit = traffic_profile.config.rate_unit
+        self._traffic_paused = False
+
+        self.sut.stop_all()
+        self.sut.reset_stats()
+        self.sut.set_pkt_size(self._steady_state_cores,
+                              self._steady_state_pkt_size)
+        self._set_traffic_rate(self._traffic_rate)
+        self.sut.start_all()
+
+    def _set_traffic_rate(self, rate):
+        # the PROX speed of each core is a percentage of 10 Gbps
+        cores = self._steady_state_cores
+        if self._traffic_rate_unit != '%':
+            rate = (float(rate) / len(cores) * BITS_PER_BYTE *
+                    (self._steady_state_pkt_size + 20) * 100 /
+                    (constants.ONE_GIGABIT_IN_BITS * constants.NIC_GBPS_DEFAULT))
+        self.sut.set_speed(cores, rate)
+
+    def _pause_traffic(self):
+        self.sut.stop(self._steady_state_cores)
+
+    def _resume_traffic(self):
+        self.sut.start(self._steady_state_cores)
+
+    def _get_port_counters(self):
+        ports = list(self.vnfd_helper.ports_iter())
+        results = self.sut.multi_port_stats([port_num for _, port_num in ports])
+        counters = {}
+        for (port_name, _), result in zip(ports, results):
+            # the stats are not returned if PROX keeps sending corrupted data
+            if result:
+                counters[port_name] = (result[1], result[2])
+        return counters
+
     # For VNF use ResourceHelper method to collect KPIs directly.
     # for TG leave the superclass ClientResourceHelper collect_kpi_method intact
     def collect_collectd_kpi(self):
@@ -1063,6 +1161,7 @@ class ProxDataHelper(object):
         self.tsc_hz = None
         self.measured_stats = None
         self.latency = None
+        self.latency_percentiles = None
         self._totals_and_pps = None
         self.result_tuple = None
 
@@ -1128,6 +1227,7 @@ class ProxDataHelper(object):
             self.rx_total,
             self.tx_total,
             self.requested_pps,
+            self.latency_percentiles,
         )
         self.result_tuple.log_data()
 
@@ -1181,9 +1281,14 @@ class ProxProfileHelper(object):
     @property
     def cpu_topology(self):
         if not self._cpu_topology:
-            stdout = io.BytesIO()
-            self.ssh_helper.get_file_obj("/proc/cpuinfo", stdout)
-            self._cpu_topology = SocketTopology.parse_cpuinfo(stdout.getvalue().decode('utf-8'))
+            topology = host_topology.get(self.ssh_helper)
+            if topology and topology.cpuinfo:
+                self._cpu_topology = topology.socket_topology
+            else:
+                stdout = io.BytesIO()
+                self.ssh_helper.get_file_obj("/proc/cpuinfo", stdout)
+                self._cpu_topology = SocketTopology.parse_cpuinfo(
+                    stdout.getvalue().decode('utf-8'))
         return self._cpu_topology
 
     @property
@@ -1257,6 +1362,8 @@ class ProxProfileHelper(object):
                 # Getting statistics to calculate PPS at right speed....
                 data_helper.capture_tsc_hz()
                 data_helper.latency = self.get_latency()
+                data_helper.latency_percentiles = \
+                    self.get_latency_percentiles(data_helper.tsc_hz)
 
         return data_helper.result_tuple, data_helper.samples
 
@@ -1273,6 +1380,20 @@ class ProxProfileHelper(object):
             return self.sut.lat_stats(self._latency_cores)
         return []
 
+    def get_latency_percentiles(self, tsc_hz):
+        """
+        :return: latency percentiles of all the latency cores, in usec
+        :rtype: dict
+        """
+        if not self._latency_cores:
+            self._latency_cores = self.get_cores(self.PROX_CORE_LAT_MODE)
+
+        if not self._latency_cores:
+            return {}
+        buckets = self.sut.lat_buckets(self._latency_cores)
+        return latency_helper.from_prox_buckets(
+            buckets, PROX_LAT_BUCKET_SIZE, tsc_hz).get_percentiles()
+
     def terminate(self):
         pass
 
@@ -1518,6 +1639,8 @@ class ProxBngProfileHelper(ProxProfileHelper):
                 # Getting statistics to calculate PPS at right speed....
                 data_helper.capture_tsc_hz()
                 data_helper.latency = self.get_latency()
+                data_helper.latency_percentiles = \
+                    self.get_latency_percentiles(data_helper.tsc_hz)
 
         return data_helper.result_tuple, data_helper.samples
 
@@ -1708,6 +1831,8 @@ class ProxVpeProfileHelper(ProxProfileHelper):
                 # Getting statistics to calculate PPS at right speed....
                 data_helper.capture_tsc_hz()
                 data_helper.latency = self.get_latency()
+                data_helper.latency_percentiles = \
+                    self.get_latency_percentiles(data_helper.tsc_hz)
 
         return data_helper.result_tuple, data_helper.samples
 
@@ -1900,5 +2025,7 @@ class ProxlwAFTRProfileHelper(ProxProfileHelper):
                 # Getting statistics to calculate PPS at right speed....
                 data_helper.capture_tsc_hz()
                 data_helper.latency = self.get_latency()
+                data_helper.latency_percentiles = \
+                    self.get_latency_percentiles(data_helper.tsc_hz)
 
         return data_helper.result_tuple, data_helper.samples
@@ -22,6 +22,7 @@ import subprocess
 import time
 
 import six
+from six.moves import queue
 
 from trex_stl_lib.trex_stl_client import LoggerApi
 from trex_stl_lib.trex_stl_client import STLClient
@@ -32,6 +33,7 @@ from yardstick.common.process import check_if_process_failed
 from yardstick.common import utils
 from yardstick.common import yaml_loader
 from yardstick.network_services import constants
+from yardstick.network_services.helpers import config_cache
 from yardstick.network_services.helpers.dpdkbindnic_helper import DpdkBindHelper, DpdkNode
 from yardstick.network_services.helpers.samplevnf_helper import MultiPortConfig
 from yardstick.network_services.nfvi.resource import ResourceProfile
@@ -39,11 +41,21 @@ from yardstick.network_services.utils import get_nsb_option
 from yardstick.network_services.vnf_generic.vnf.base import GenericTrafficGen
 from yardstick.network_services.vnf_generic.vnf.base import GenericVNF
 from yardstick.network_services.vnf_generic.vnf.base import QueueFileWrapper
+from yardstick.network_services.vnf_generic.vnf.base import VnfConsole
 from yardstick.network_services.vnf_generic.vnf.vnf_ssh_helper import VnfSshHelper
 from yardstick.benchmark.contexts.node import NodeContext
 
 LOG = logging.getLogger(__name__)
 
+# control commands of the steady state traffic, see
+# ClientResourceHelper.send_traffic_command
+TRAFFIC_SET_RATE = 'set_rate'
+TRAFFIC_PAUSE = 'pause'
+TRAFFIC_RESUME = 'resume'
+TRAFFIC_MARK = 'mark'
+TRAFFIC_COMMANDS = (TRAFFIC_SET_RATE, TRAFFIC_PAUSE, TRAFFIC_RESUME,
+                    TRAFFIC_MARK)
+
 
 class SetupEnvHelper(object):
 
@@ -131,11 +143,6 @@ class DpdkVnfSetupEnvHelper(SetupEnvHelper):
         task_path = self.scenario_helper.task_path
 
         config_file = vnf_cfg.get('file')
-        lb_count = vnf_cfg.get('lb_count', 3)
-        lb_config = vnf_cfg.get('lb_config', 'SW')
-        worker_config = vnf_cfg.get('worker_config', '1C/1T')
-        worker_threads = vnf_cfg.get('worker_threads', 3)
-
         traffic_type = self.scenario_helper.all_options.get('traffic_type', 4)
         traffic_options = {
             'traffic_type': traffic_type,
@@ -152,42 +159,58 @@ class DpdkVnfSetupEnvHelper(SetupEnvHelper):
 
         config_tpl_cfg = utils.find_relative_file(self.DEFAULT_CONFIG_TPL_CFG,
                                                   task_path)
-        config_basename = posixpath.basename(self.CFG_CONFIG)
-        script_basename = posixpath.basename(self.CFG_SCRIPT)
+        config_data = None
+        if config_file:
+            with utils.open_relative_file(config_file, task_path) as infile:
+                config_data = infile.read()
+
+        # the configuration and the script only depend on these inputs, they
+        # are built once for all the VNFs, iterations and tasks using them
+        key = config_cache.get_key(
+            type(self).__name__, self.vnfd_helper.interfaces, vnf_cfg,
+            traffic_options, acl_options, self.socket,
+            config_cache.read_file(config_tpl_cfg), config_data)
+        configs = config_cache.memoize(key, lambda: self._generate_configs(
+            config_tpl_cfg, config_data, traffic_options, acl_options))
+        self.ssh_helper.upload_config_file(
+            posixpath.basename(self.CFG_CONFIG), configs['config'])
+        self.ssh_helper.upload_config_file(
+            posixpath.basename(self.CFG_SCRIPT), configs['script'])
+
+        LOG.info("Provision and start the %s", self.APP_NAME)
+        self._build_pipeline_kwargs()
+        return self.PIPELINE_COMMAND.format(**self.pipeline_kwargs)
+
+    def _generate_configs(self, config_tpl_cfg, config_data, traffic_options,
+                          acl_options):
+        vnf_cfg = self.scenario_helper.vnf_cfg
         multiport = MultiPortConfig(self.scenario_helper.topology,
                                     config_tpl_cfg,
-                                    config_basename,
+                                    posixpath.basename(self.CFG_CONFIG),
                                     self.vnfd_helper,
                                     self.VNF_TYPE,
-                                    lb_count,
-                                    worker_threads,
-                                    worker_config,
-                                    lb_config,
+                                    vnf_cfg.get('lb_count', 3),
+                                    vnf_cfg.get('worker_threads', 3),
+                                    vnf_cfg.get('worker_config', '1C/1T'),
+                                    vnf_cfg.get('lb_config', 'SW'),
                                     self.socket)
 
-        multiport.generate_config()
-        if config_file:
-            with utils.open_relative_file(config_file, task_path) as infile:
-                new_config = ['[EAL]']
-                vpci = []
-                for port in self.vnfd_helper.port_pairs.all_ports:
-                    interface = self.vnfd_helper.find_interface(name=port)
-                    vpci.append(interface['virtual-interface']["vpci"])
-                new_config.extend('w = {0}'.format(item) for item in vpci)
-                new_config = '\n'.join(new_config) + '\n' + infile.read()
-        else:
-            with open(self.CFG_CONFIG) as handle:
-                new_config = handle.read()
+        new_config = multiport.generate_config()
+        if config_data is None:
             new_config = self._update_traffic_type(new_config, traffic_options)
             new_config = self._update_packet_type(new_config, traffic_options)
-        self.ssh_helper.upload_config_file(config_basename, new_config)
-        self.ssh_helper.upload_config_file(script_basename,
-            multiport.generate_script(self.vnfd_helper,
-                                      self.get_flows_config(acl_options)))
-
-        LOG.info("Provision and start the %s", self.APP_NAME)
-        self._build_pipeline_kwargs()
-        return self.PIPELINE_COMMAND.format(**self.pipeline_kwargs)
+        else:
+            # the pipelines of the configuration file replace the generated ones
+            new_config = ['[EAL]']
+            vpci = []
+            for port in self.vnfd_helper.port_pairs.all_ports:
+                interface = self.vnfd_helper.find_interface(name=port)
+                vpci.append(interface['virtual-interface']["vpci"])
+            new_config.extend('w = {0}'.format(item) for item in vpci)
+            new_config = '\n'.join(new_config) + '\n' + config_data
+        script = multiport.generate_script(self.vnfd_helper,
+                                           self.get_flows_config(acl_options))
+        return {'config': new_config, 'script': script}
 
     def get_flows_config(self, options=None): # pylint: disable=unused-argument
         """No actions/rules (flows) by default"""
@@ -283,7 +306,9 @@ class DpdkVnfSetupEnvHelper(SetupEnvHelper):
         self.dpdk_bind_helper.read_status()
         self.dpdk_bind_helper.save_used_drivers()
 
-        self.dpdk_bind_helper.bind(self.bound_pci, 'igb_uio')
+        # nothing to wait for if the devices are already bound, e.g. by
+        # another VNF of the host
+        rebound = self.dpdk_bind_helper.bind(self.bound_pci, 'igb_uio')
 
         sorted_dpdk_pci_addresses = sorted(self.dpdk_bind_helper.dpdk_bound_pci_addresses)
         for dpdk_port_num, vpci in enumerate(sorted_dpdk_pci_addresses):
@@ -294,7 +319,8 @@ class DpdkVnfSetupEnvHelper(SetupEnvHelper):
                 intf['virtual-interface']['dpdk_port_num'] = int(dpdk_port_num)
             except:  # pylint: disable=bare-except
                 pass
-        time.sleep(2)
+        if rebound:
+            time.sleep(2)
 
     def get_local_iface_name_by_vpci(self, vpci):
         find_net_cmd = self.FIND_NET_CMD.format(vpci)
@@ -365,6 +391,7 @@ class ClientResourceHelper(ResourceHelper):
 
     RUN_DURATION = 60
     QUEUE_WAIT_TIME = 5
+    STEADY_STATE_INTERVAL = 1
     SYNC_PORT = 1
     ASYNC_PORT = 2
 
@@ -379,6 +406,13 @@ class ClientResourceHelper(ResourceHelper):
         self._queue = Queue()
         self._result = {}
         self._terminated = Value('i', 0)
+        # steady state traffic: control commands and per interval samples
+        self._control_queue = Queue()
+        self._samples_queue = Queue()
+        self._traffic_rate = None
+        self._traffic_rate_unit = None
+        self._traffic_paused = False
+        self._steady_state_ports = None
 
     def _build_ports(self):
         self.networks = self.vnfd_helper.port_pairs.networks
@@ -413,6 +447,7 @@ class ClientResourceHelper(ResourceHelper):
         # if we don't do this we can hang waiting for the queue to drain
         # have to do this in the subprocess
         self._queue.cancel_join_thread()
+        self._samples_queue.cancel_join_thread()
         # fixme: fix passing correct trex config file,
         # instead of searching the default path
         mq_producer.tg_method_started()
@@ -423,12 +458,15 @@ class ClientResourceHelper(ResourceHelper):
             self.client.remove_all_streams(self.all_ports)  # remove all streams
             traffic_profile.register_generator(self)
 
-            iteration_index = 0
-            while self._terminated.value == 0:
-                iteration_index += 1
-                if self._run_traffic_once(traffic_profile):
-                    self._terminated.value = 1
-                mq_producer.tg_method_iteration(iteration_index)
+            if traffic_profile.config.steady_state:
+                self._run_steady_state(traffic_profile, mq_producer)
+            else:
+                iteration_index = 0
+                while self._terminated.value == 0:
+                    iteration_index += 1
+                    if self._run_traffic_once(traffic_profile):
+                        self._terminated.value = 1
+                    mq_producer.tg_method_iteration(iteration_index)
 
             self.client.stop(self.all_ports)
             self.client.disconnect()
@@ -441,6 +479,140 @@ class ClientResourceHelper(ResourceHelper):
 
         mq_producer.tg_method_finished()
 
+    def _run_steady_state(self, traffic_profile, mq_producer=None):
+        """Run the traffic continuously, until the generator is terminated
+
+        The control commands (see send_traffic_command) are applied as soon
+        as they are received. Every STEADY_STATE_INTERVAL seconds, the deltas
+        of the port counters are queued as a sample, see
+        get_steady_state_samples, and sent in a MQ iteration message.
+        """
+        self._start_steady_state(traffic_profile)
+        self.client_started.value = 1
+
+        events = []
+        counters = self._get_port_counters()
+        last_time = time.time()
+        next_time = last_time + self.STEADY_STATE_INTERVAL
+        iteration_index = 0
+        while not self._terminated.value:
+            try:
+                command, kwargs = self._control_queue.get(
+                    True, max(next_time - time.time(), 0))
+            except queue.Empty:
+                pass
+            else:
+                self._apply_traffic_command(command, kwargs)
+                events.append(dict(kwargs, command=command,
+                                   timestamp=time.time()))
+                continue
+
+            now = time.time()
+            new_counters = self._get_port_counters()
+            sample = {'timestamp': now,
+                      'rate': self._traffic_rate,
+                      'paused': self._traffic_paused,
+                      'events': events,
+                      'ports': self._get_counter_deltas(
+                          counters, new_counters, now - last_time)}
+            self._samples_queue.put(sample)
+            iteration_index += 1
+            if mq_producer:
+                mq_producer.tg_method_iteration(iteration_index, kpi=sample)
+            events = []
+            counters, last_time = new_counters, now
+            # the next samples are not shifted by the time spent reading the
+            # counters; the ones missed, e.g. after a slow read, are skipped
+            next_time += self.STEADY_STATE_INTERVAL
+            if next_time < now:
+                next_time = now + self.STEADY_STATE_INTERVAL
+
+    @staticmethod
+    def _get_counter_deltas(start, end, interval):
+        """Return the packets received and sent by each port in an interval
+
+        :param start, end: (dict) port name: (in_packets, out_packets)
+        :param interval: (float) seconds elapsed between the two reads
+        """
+        deltas = {}
+        for port_name, (in_end, out_end) in end.items():
+            in_start, out_start = start.get(port_name, (in_end, out_end))
+            in_packets = in_end - in_start
+            out_packets = out_end - out_start
+            deltas[port_name] = {
+                'in_packets': in_packets,
+                'out_packets': out_packets,
+                'rx_throughput_fps': in_packets / interval if interval else 0.0,
+                'tx_throughput_fps': out_packets / interval if interval else 0.0,
+            }
+        return deltas
+
+    def _apply_traffic_command(self, command, kwargs):
+        if command == TRAFFIC_SET_RATE:
+            self._set_traffic_rate(kwargs['rate'])
+            self._traffic_rate = kwargs['rate']
+        elif command == TRAFFIC_PAUSE and not self._traffic_paused:
+            self._pause_traffic()
+            self._traffic_paused = True
+        elif command == TRAFFIC_RESUME and self._traffic_paused:
+            self._resume_traffic()
+            self._traffic_paused = False
+        LOG.info('Steady state traffic command %s %s', command, kwargs)
+
+    def _start_steady_state(self, traffic_profile):
+        """Start the traffic of the profile, at its frame rate"""
+        traffic_profile.execute_traffic(self)
+        self._steady_state_ports = self.client.get_active_ports()
+        self._traffic_rate = traffic_profile.config.frame_rate
+        self._traffic_rate_unit = traffic_profile.config.rate_unit
+        self._traffic_paused = False
+
+    def _set_traffic_rate(self, rate):
+        if self._traffic_rate_unit == '%':
+            mult = '{}%'.format(rate)
+        else:
+            mult = '{}pps'.format(rate)
+        self.client.update(ports=self._steady_state_ports, mult=mult)
+
+    def _pause_traffic(self):
+        self.client.pause(ports=self._steady_state_ports)
+
+    def _resume_traffic(self):
+        self.client.resume(ports=self._steady_state_ports)
+
+    def _get_port_counters(self):
+        """Return the packets received and sent by each port, by name"""
+        stats = self.get_stats(self.all_ports)
+        counters = {}
+        for port_name, port_num in self.vnfd_helper.ports_iter():
+            port_stats = stats.get(port_num, {})
+            counters[port_name] = (int(port_stats.get('ipackets', 0)),
+                                   int(port_stats.get('opackets', 0)))
+        return counters
+
+    def send_traffic_command(self, command, **kwargs):
+        """Send a control command to the steady state traffic
+
+        The commands are queued and applied, in order, by the traffic process:
+            - TRAFFIC_SET_RATE: change the rate to "rate", in the unit of the
+              traffic profile frame rate (fps or % of the line rate)
+            - TRAFFIC_PAUSE, TRAFFIC_RESUME: pause and resume the traffic
+            - TRAFFIC_MARK: only add an event, with the arguments, to the
+              next sample, e.g. the failure injected in a HA test
+        """
+        if command not in TRAFFIC_COMMANDS:
+            raise y_exceptions.TrafficCommandNotSupported(command=command)
+        self._control_queue.put((command, kwargs))
+
+    def get_steady_state_samples(self):
+        """Return the steady state traffic samples queued since last call"""
+        samples = []
+        while True:
+            try:
+                samples.append(self._samples_queue.get_nowait())
+            except queue.Empty:
+                return samples
+
     def terminate(self):
         self._terminated.value = 1  # stop client
 
@@ -661,10 +833,12 @@ class SampleVNF(GenericVNF):
         self.q_in = Queue()
         self.q_out = Queue()
         self.queue_wrapper = None
+        self.console = VnfConsole(self.q_in, self.q_out, self.VNF_PROMPT)
         self.run_kwargs = {}
         self.used_drivers = {}
         self.vnf_port_pairs = None
         self._vnf_process = None
+        self._collect_kpi_re = None
 
     def _start_vnf(self):
         self.queue_wrapper = QueueFileWrapper(self.q_in, self.q_out, self.VNF_PROMPT)
@@ -795,15 +969,34 @@ class SampleVNF(GenericVNF):
         self.ssh_helper.run(cmd, **self.run_kwargs)
 
     def vnf_execute(self, cmd, wait_time=2):
-        """ send cmd to vnf process """
+        """Send cmd to vnf process
 
+        Return the command output as soon as the VNF prompt is received, or
+        the output received after "wait_time" seconds.
+        """
         LOG.info("%s command: %s", self.APP_NAME, cmd)
-        self.q_in.put("{}\r\n".format(cmd))
-        time.sleep(wait_time)
-        output = []
-        while self.q_out.qsize() > 0:
-            output.append(self.q_out.get())
-        return "".join(output)
+        return self.console.execute(cmd, wait_time)
+
+    def vnf_execute_many(self, cmds, wait_time=2):
+        """Send several commands to vnf process in one round
+
+        The commands are pipelined and their outputs split by VNF prompt,
+        so the whole batch costs a single round trip. Return the list of
+        outputs, in the order of "cmds"; the output of the commands not
+        answered after "wait_time" seconds is empty.
+        """
+        LOG.info("%s commands: %s", self.APP_NAME, cmds)
+        outputs = [output for _, output
+                   in self.console.execute_many(cmds, wait_time)]
+        return outputs + [''] * (len(cmds) - len(outputs))
+
+    @property
+    def collect_kpi_re(self):
+        """COLLECT_KPI pattern, compiled once"""
+        if (self._collect_kpi_re is None or
+                self._collect_kpi_re.pattern != self.COLLECT_KPI):
+            self._collect_kpi_re = re.compile(self.COLLECT_KPI, re.MULTILINE)
+        return self._collect_kpi_re
 
     def _tear_down(self):
         pass
@@ -835,7 +1028,7 @@ class SampleVNF(GenericVNF):
         # we can't get KPIs if the VNF is down
         check_if_process_failed(self._vnf_process, 0.01)
         stats = self.get_stats()
-        m = re.search(self.COLLECT_KPI, stats, re.MULTILINE)
+        m = self.collect_kpi_re.search(stats)
         physical_node = Context.get_physical_node_from_server(
             self.scenario_helper.nodes[self.name])
 
@@ -962,9 +1155,32 @@ class SampleVNFTrafficGen(GenericTrafficGen):
             check_if_process_failed(proc)
 
         result["collect_stats"] = self.resource_helper.collect_kpi()
+        samples = self.resource_helper.get_steady_state_samples()
+        if samples:
+            result["steady_state"] = samples
         LOG.debug("%s collect KPIs %s", self.APP_NAME, result)
         return result
 
+    def set_traffic_rate(self, rate):
+        """Change the rate of the steady state traffic
+
+        :param rate: (float) in the unit of the traffic profile frame rate
+        """
+        self.resource_helper.send_traffic_command(TRAFFIC_SET_RATE, rate=rate)
+
+    def pause_traffic(self):
+        """Pause the steady state traffic"""
+        self.resource_helper.send_traffic_command(TRAFFIC_PAUSE)
+
+    def resume_traffic(self):
+        """Resume the steady state traffic"""
+        self.resource_helper.send_traffic_command(TRAFFIC_RESUME)
+
+    def mark_traffic_event(self, name, **kwargs):
+        """Add an event to the next steady state traffic sample"""
+        self.resource_helper.send_traffic_command(TRAFFIC_MARK, name=name,
+                                                  **kwargs)
+
     def terminate(self):
         """ After this method finishes, all traffic processes should stop. Mandatory.
 
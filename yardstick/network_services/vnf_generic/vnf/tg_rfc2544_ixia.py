@@ -108,6 +108,8 @@ class IxiaResourceHelper(ClientResourceHelper):
 
         self._build_ports()
         self._initialize_client()
+        self.client.poll_interval = ixnet_api.get_poll_interval(
+            traffic_profile.config.duration)
 
         mac = {}
         for port_name in self.vnfd_helper.port_pairs.all_ports:
@@ -126,7 +128,8 @@ class IxiaResourceHelper(ClientResourceHelper):
                 self.client_started.value = 1
                 # pylint: disable=unnecessary-lambda
                 utils.wait_until_true(lambda: self.client.is_traffic_stopped(),
-                                      timeout=traffic_profile.config.duration * 2)
+                                      timeout=traffic_profile.config.duration * 2,
+                                      sleep=self.client.poll_interval)
                 samples = self.generate_samples(traffic_profile.ports,
                                                 traffic_profile.config.duration)
 
@@ -19,6 +19,7 @@ import os
 import yaml
 
 from yardstick.common.utils import mac_address_to_hex_list, try_int
+from yardstick.network_services.helpers import latency
 from yardstick.network_services.utils import get_nsb_option
 from yardstick.network_services.vnf_generic.vnf.sample_vnf import SampleVNFTrafficGen
 from yardstick.network_services.vnf_generic.vnf.sample_vnf import ClientResourceHelper
@@ -188,6 +189,11 @@ class TrexResourceHelper(ClientResourceHelper):
                 latency_global = stats.get('latency', {})
                 pg_latency = latency_global.get(pg_id, {}).get('latency')
                 samples[pname]['latency'][pg_id] = pg_latency
+            histogram = latency.from_trex_latency(
+                samples[pname]['latency'].values())
+            if histogram.total:
+                samples[pname]['latency_percentiles'] = \
+                    histogram.get_percentiles()
 
         return samples
 
@@ -19,7 +19,6 @@ from __future__ import print_function
 
 import os
 import logging
-import re
 import posixpath
 
 from six.moves import configparser, zip
@@ -319,16 +318,19 @@ class VpeApproxVnf(SampleVNF):
         indexes_in = [1]
         indexes_drop = [2, 3]
         command = 'p {0} stats port {1} 0'
-        for index, direction in ((5, 'up'), (9, 'down')):
+        queries = [(direction, command.format(index, mode))
+                   for index, direction in ((5, 'up'), (9, 'down'))
+                   for mode in ('in', 'out')]
+        # all the port stats are queried in one round
+        outputs = self.vnf_execute_many([cmd for _, cmd in queries])
+        for (direction, _), stats in zip(queries, outputs):
             key_in = "pkt_in_{0}_stream".format(direction)
             key_drop = "pkt_drop_{0}_stream".format(direction)
-            for mode in ('in', 'out'):
-                stats = self.vnf_execute(command.format(index, mode))
-                match = re.search(self.COLLECT_KPI, stats, re.MULTILINE)
-                if not match:
-                    continue
-                result[key_in] += sum(int(match.group(x)) for x in indexes_in)
-                result[key_drop] += sum(int(match.group(x)) for x in indexes_drop)
+            match = self.collect_kpi_re.search(stats)
+            if not match:
+                continue
+            result[key_in] += sum(int(match.group(x)) for x in indexes_in)
+            result[key_drop] += sum(int(match.group(x)) for x in indexes_drop)
 
         LOG.debug("%s collect KPIs %s", self.APP_NAME, result)
         return result
@@ -463,6 +463,7 @@ class KubernetesTemplate(object):
                     for rc, cfg in servers_cfg.items()}
         self.rc_objs = [ReplicationControllerObject(
             rc, ssh_key=self.ssh_key, **cfg) for rc, cfg in self.rcs.items()]
+        self._rc_objs_by_name = {rc.name: rc for rc in self.rc_objs}
         self.service_objs = [ServiceNodePortObject(rc, **cfg)
                              for rc, cfg in self.rcs.items()]
         self.crd = [CustomResourceDefinitionObject(self.name, **crd)
@@ -483,5 +484,4 @@ class KubernetesTemplate(object):
 
     def get_rc_by_name(self, rc_name):
         """Returns a ``ReplicationControllerObject``, searching by name"""
-        for rc in (rc for rc in self.rc_objs if rc.name == rc_name):
-            return rc
+        return self._rc_objs_by_name.get(rc_name)
@@ -30,6 +30,8 @@ from oslo_serialization import jsonutils
 from six.moves import range
 from six.moves import zip
 
+from yardstick.common import chunked_result
+
 
 class Parser(object):
     """ Command-line argument and input file parser for yardstick-plot tool"""
@@ -91,6 +93,9 @@ class Parser(object):
             input_file = self.default_input_loc
 
         try:
+            if chunked_result.is_chunked(input_file):
+                self._parse_chunked_file(input_file)
+                return
             with open(input_file) as f:
                 for line in f:
                     record = jsonutils.loads(line)
@@ -99,6 +104,14 @@ class Parser(object):
             print((os.strerror(e.errno)))
             sys.exit(1)
 
+    def _parse_chunked_file(self, input_file):
+        """parse a chunked task result file, see chunked_result"""
+        reader = chunked_result.ChunkedResultReader(input_file)
+        for case, scenario, record in reader.iter_records():
+            runner_id = "%s/%s" % (case, scenario)
+            self.scenarios[runner_id] = scenario or ""
+            self._add_record({"runner_id": runner_id, "benchmark": record})
+
 
 class Plotter(object):
     """Graph plotter for scenario-specific results from yardstick framework"""
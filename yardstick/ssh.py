@@ -31,7 +31,7 @@ Execute command with huge output:
 
     class PseudoFile(io.RawIOBase):
         def write(chunk):
-            if "error" in chunk:
+            if b"error" in chunk:
                 email_admin(chunk)
 
     ssh = SSH("root", "example.com")
@@ -62,6 +62,7 @@ Eventlet:
     sshclient = eventlet.import_patched("yardstick.ssh")
 
 """
+import codecs
 import io
 import logging
 import os
@@ -77,6 +78,7 @@ from scp import SCPClient
 import six
 
 from yardstick.common import exceptions
+from yardstick.common import profiler
 from yardstick.common.utils import try_int, NON_NONE_DEFAULT, make_dict_from_map
 from yardstick.network_services.utils import provision_tool
 
@@ -102,6 +104,11 @@ class SSH(object):
 
     SSH_PORT = paramiko.config.SSH_PORT
     DEFAULT_WAIT_TIMEOUT = 120
+    # session receive window, paramiko default is 2 MB
+    WINDOW_SIZE = 16 * 2 ** 20
+    RECV_SIZE = 2 ** 18
+    STDIN_READ_SIZE = 2 ** 20
+    SELECT_TIMEOUT = 1
 
     @staticmethod
     def gen_keys(key_filename, bit_count=2048):
@@ -168,6 +175,10 @@ class SSH(object):
             logging.getLogger("paramiko").setLevel(logging.DEBUG)
         else:
             logging.getLogger("paramiko").setLevel(logging.WARN)
+        # log every chunk of data received, only for debugging
+        self.trace = os.environ.get("YARDSTICK_SSH_TRACE", "").lower() == "true"
+        # bytes and duration of the last command executed
+        self.run_stats = {}
 
     @classmethod
     def args_from_node(cls, node, overrides=None, defaults=None):
@@ -245,8 +256,10 @@ class SSH(object):
         :param cmd:             Command to be executed.
         :type cmd:              str
         :param stdin:           Open file or string to pass to stdin.
-        :param stdout:          Open file to connect to stdout.
-        :param stderr:          Open file to connect to stderr.
+        :param stdout:          Open file to connect to stdout, or bytearray
+                                or binary stream to collect the raw output.
+        :param stderr:          Open file to connect to stderr, or bytearray
+                                or binary stream to collect the raw output.
         :param raise_on_error:  If False then exit code will be return. If True
                                 then exception will be raized if non-zero code.
         :param timeout:         Timeout in seconds for command execution.
@@ -269,19 +282,40 @@ class SSH(object):
                          timeout=timeout,
                          keep_stdin_open=keep_stdin_open, pty=pty)
 
+    @staticmethod
+    def _get_writer(stream):
+        """Return a function writing received bytes to the output stream
+
+        The bytes are appended as is to a bytearray and written as is to
+        binary streams; other file objects receive text, decoded
+        incrementally so multibyte characters can be split between two
+        chunks.
+        """
+        if stream is None:
+            return lambda data: None
+        if isinstance(stream, bytearray):
+            return stream.extend
+        if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+            return stream.write
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        return lambda data: stream.write(decoder.decode(data))
+
     def _run(self, client, cmd, stdin=None, stdout=None, stderr=None,
              raise_on_error=True, timeout=3600,
              keep_stdin_open=False, pty=False):
 
         transport = client.get_transport()
-        session = transport.open_session()
+        session = transport.open_session(window_size=self.WINDOW_SIZE)
         if pty:
             session.get_pty()
         session.exec_command(cmd)
         start_time = time.time()
 
-        # encode on transmit, decode on receive
-        data_to_send = encodeutils.safe_encode("", incoming='utf-8')
+        write_stdout = self._get_writer(stdout)
+        write_stderr = self._get_writer(stderr)
+        stats = {'stdin': 0, 'stdout': 0, 'stderr': 0}
+        # data to send is sliced through a memoryview, without copies
+        data_to_send = memoryview(b'')
         stderr_data = None
 
         # If we have data to be sent to stdin then `select' should also
@@ -293,31 +327,33 @@ class SSH(object):
 
         while True:
             # Block until data can be read/write.
-            e = select.select([session], writes, [session], 1)[2]
+            e = select.select([session], writes, [session],
+                              self.SELECT_TIMEOUT)[2]
 
             if session.recv_ready():
-                data = encodeutils.safe_decode(session.recv(4096), 'utf-8')
-                self.log.debug("stdout: %r", data)
-                if stdout is not None:
-                    stdout.write(data)
+                data = session.recv(self.RECV_SIZE)
+                stats['stdout'] += len(data)
+                if self.trace:
+                    self.log.debug("stdout: %r", data)
+                write_stdout(data)
                 continue
 
             if session.recv_stderr_ready():
-                stderr_data = encodeutils.safe_decode(
-                    session.recv_stderr(4096), 'utf-8')
-                self.log.debug("stderr: %r", stderr_data)
-                if stderr is not None:
-                    stderr.write(stderr_data)
+                stderr_data = session.recv_stderr(self.RECV_SIZE)
+                stats['stderr'] += len(stderr_data)
+                if self.trace:
+                    self.log.debug("stderr: %r", stderr_data)
+                write_stderr(stderr_data)
                 continue
 
             if session.send_ready():
                 if stdin is not None and not stdin.closed:
                     if not data_to_send:
-                        stdin_txt = stdin.read(4096)
-                        if stdin_txt is None:
-                            stdin_txt = ''
-                        data_to_send = encodeutils.safe_encode(
-                            stdin_txt, incoming='utf-8')
+                        stdin_data = stdin.read(self.STDIN_READ_SIZE)
+                        if stdin_data is None:
+                            stdin_data = b''
+                        data_to_send = memoryview(encodeutils.safe_encode(
+                            stdin_data, incoming='utf-8'))
                         if not data_to_send:
                             # we may need to keep stdin open
                             if not keep_stdin_open:
@@ -326,7 +362,7 @@ class SSH(object):
                                 writes = []
                     if data_to_send:
                         sent_bytes = session.send(data_to_send)
-                        # LOG.debug("sent: %s" % data_to_send[:sent_bytes])
+                        stats['stdin'] += sent_bytes
                         data_to_send = data_to_send[sent_bytes:]
 
             if session.exit_status_ready():
@@ -340,11 +376,18 @@ class SSH(object):
                 raise exceptions.SSHError(error_msg='Socket error')
 
         exit_status = session.recv_exit_status()
+        stats['duration'] = time.time() - start_time
+        self.run_stats = stats
+        profiler.add_time('ssh', stats['duration'])
+        self.log.debug("Command '%s' exited with %s in %.3fs, bytes in %d, "
+                       "out %d, err %d", cmd, exit_status, stats['duration'],
+                       stats['stdin'], stats['stdout'], stats['stderr'])
         if exit_status != 0 and raise_on_error:
             fmt = "Command '%(cmd)s' failed with exit_status %(status)d."
             details = fmt % {"cmd": cmd, "status": exit_status}
             if stderr_data:
-                details += " Last stderr data: '%s'." % stderr_data
+                details += " Last stderr data: '%s'." % (
+                    encodeutils.safe_decode(stderr_data, errors='replace'))
             raise exceptions.SSHError(error_msg=details)
         return exit_status
 
@@ -359,15 +402,15 @@ class SSH(object):
 
         :returns: tuple (exit_status, stdout, stderr)
         """
-        stdout = six.moves.StringIO()
-        stderr = six.moves.StringIO()
+        # the output is collected as bytes and decoded once
+        stdout = bytearray()
+        stderr = bytearray()
 
         exit_status = self.run(cmd, stderr=stderr,
                                stdout=stdout, stdin=stdin,
                                timeout=timeout, raise_on_error=raise_on_error)
-        stdout.seek(0)
-        stderr.seek(0)
-        return exit_status, stdout.read(), stderr.read()
+        return (exit_status, encodeutils.safe_decode(bytes(stdout), 'utf-8'),
+                encodeutils.safe_decode(bytes(stderr), 'utf-8'))
 
     def wait(self, timeout=None, interval=1):
         """Wait for the host will be available via ssh."""
@@ -13,7 +13,9 @@
 # limitations under the License.
 
 import copy
+import logging
 import sys
+import timeit
 
 import mock
 import unittest
@@ -26,6 +28,9 @@ with mock.patch.dict(sys.modules, y_tests.STL_MOCKS):
     from yardstick.benchmark.scenarios.networking import vnf_generic
 
 
+LOG = logging.getLogger(__name__)
+
+
 TRAFFIC_PROFILE_1 = """
 schema: nsb:traffic_profile:0.1
 name: rfc2544
@@ -193,3 +198,95 @@ class VnfGenericTestCase(unittest.TestCase):
         self.assertEqual('vnf__0 to tg__0 link 2', vld[1]['name'])
         self.assertEqual('xe1',
                          vld[1]['vnfd-connection-point-ref'][0]['vnfd-connection-point-ref'])
+
+
+def _get_scale_out_context(num_vnfs):
+    def interface(node_num, port_num):
+        return {'local_ip': '10.{}.{}.{}'.format(port_num + 1, node_num % 2,
+                                                 node_num + 1),
+                'local_mac': '00:00:00:00:{:02x}:{:02x}'.format(node_num,
+                                                                port_num),
+                'netmask': '255.255.255.0',
+                'driver': 'i40e',
+                'vpci': '0000:05:00.{}'.format(port_num),
+                'dpdk_port_num': port_num}
+
+    nodes = {}
+    for tg_num in range(2):
+        nodes['tg__{}'.format(tg_num)] = {
+            'interfaces': {'xe{}'.format(port_num): interface(tg_num, port_num)
+                           for port_num in range(num_vnfs)}}
+    for vnf_num in range(num_vnfs):
+        nodes['vnf__{}'.format(vnf_num)] = {
+            'interfaces': {'xe{}'.format(port_num):
+                           interface(vnf_num + 2, port_num)
+                           for port_num in range(2)}}
+    networks = {}
+    for vnf_num in range(num_vnfs):
+        for link in ('uplink', 'downlink'):
+            vld_id = '{}_{}'.format(link, vnf_num)
+            networks[vld_id] = {'vld_id': vld_id, 'segmentation_id': vnf_num}
+    return {'nodes': nodes, 'networks': networks}
+
+
+class ScaleOutTestCase(unittest.TestCase):
+
+    VNF_MODEL = '../../vnf_descriptors/acl_vnf.yaml'
+
+    def _get_testcase(self, num_vnfs):
+        scenario_cfg = {'topology': {'num_vnfs': num_vnfs,
+                                     'vnf_model': self.VNF_MODEL},
+                        'task_path': 'fake_path',
+                        'traffic_profile': 'fake_fprofile_path'}
+        return vnf_generic.NetworkServiceTestCase(
+            scenario_cfg, _get_scale_out_context(num_vnfs))
+
+    def test_map_topology_to_infrastructure(self):
+        ns_testcase = self._get_testcase(32)
+
+        ns_testcase.map_topology_to_infrastructure()
+
+        nodes = ns_testcase.context_cfg['nodes']
+        tg_if = nodes['tg__0']['interfaces']['xe31']
+        vnf_if = nodes['vnf__31']['interfaces']['xe0']
+        self.assertEqual('uplink_31', tg_if['vld_id'])
+        self.assertEqual('vnf__31', tg_if['peer_name'])
+        self.assertEqual(vnf_if['local_mac'], tg_if['dst_mac'])
+        self.assertEqual(tg_if['local_ip'], vnf_if['dst_ip'])
+        self.assertEqual({'vld_id': 'uplink_31', 'segmentation_id': 31},
+                         vnf_if['network'])
+        self.assertEqual(vnf_if['local_mac'],
+                         tg_if['peer_intf']['local_mac'])
+        self.assertEqual(self.VNF_MODEL, nodes['vnf__31']['VNF model'])
+        self.assertEqual('downlink_31',
+                         nodes['tg__1']['interfaces']['xe31']['vld_id'])
+
+    def _time_resolve_topology(self, num_vnfs, repeat=5):
+        ns_testcase = self._get_testcase(num_vnfs)
+        contexts = [_get_scale_out_context(num_vnfs) for _ in range(repeat)]
+
+        def resolve():
+            ns_testcase.context_cfg = contexts.pop()
+            ns_testcase._resolve_topology()
+
+        return min(timeit.repeat(resolve, number=1, repeat=repeat))
+
+    def _count_resolve_topology_lookups(self, num_vnfs):
+        ns_testcase = self._get_testcase(num_vnfs)
+        with mock.patch.object(
+                ns_testcase, 'find_node_if',
+                wraps=ns_testcase.find_node_if) as mock_find_node_if, \
+                mock.patch.object(
+                    ns_testcase, '_find_vnf_name_from_id',
+                    wraps=ns_testcase._find_vnf_name_from_id) as mock_find_name:
+            ns_testcase._resolve_topology()
+        return mock_find_node_if.call_count, mock_find_name.call_count
+
+    def test__resolve_topology_benchmark(self):
+        # the lookups grow linearly with the VNF count: two links per VNF,
+        # two endpoints per link; the timings are only logged
+        for num_vnfs in (8, 16, 32, 64):
+            self.assertEqual((4 * num_vnfs, 4 * num_vnfs),
+                             self._count_resolve_topology_lookups(num_vnfs))
+            LOG.info('_resolve_topology with %s VNFs: %.6f s', num_vnfs,
+                     self._time_resolve_topology(num_vnfs))
@@ -13,8 +13,13 @@
 # limitations under the License.
 
 import multiprocessing
+import shutil
+import tempfile
 import time
 
+import mock
+
+from yardstick.common import messaging
 from yardstick.common.messaging import consumer
 from yardstick.common.messaging import payloads
 from yardstick.common.messaging import producer
@@ -39,18 +44,19 @@ class DummyEndpoint(consumer.NotificationHandler):
 
 class DummyConsumer(consumer.MessagingConsumer):
 
-    def __init__(self, _id, ctx_ids, queue):
+    def __init__(self, _id, ctx_ids, queue, transport=None):
         self._id = _id
         endpoints = [DummyEndpoint(_id, ctx_ids, queue)]
-        super(DummyConsumer, self).__init__(TOPIC, ctx_ids, endpoints)
+        super(DummyConsumer, self).__init__(TOPIC, ctx_ids, endpoints,
+                                            transport=transport)
 
 
 class DummyProducer(producer.MessagingProducer):
     pass
 
 
-def _run_consumer(_id, ctx_ids, queue):
-    _consumer = DummyConsumer(_id, ctx_ids, queue)
+def _run_consumer(_id, ctx_ids, queue, transport=None):
+    _consumer = DummyConsumer(_id, ctx_ids, queue, transport=transport)
     _consumer.start_rpc_server()
     _consumer.wait()
 
@@ -62,20 +68,20 @@ class MessagingTestCase(base.BaseFunctionalTestCase):
         for i in range(num_consumers):
             processes[i].terminate()
 
-    def test_run_five_consumers(self):
+    def _run_five_consumers(self, transport=None):
         output_queue = multiprocessing.Queue()
         num_consumers = 10
         ctx_1 = 100001
         ctx_2 = 100002
-        producers = [DummyProducer(TOPIC, _id=ctx_1),
-                     DummyProducer(TOPIC, _id=ctx_2)]
+        producers = [DummyProducer(TOPIC, _id=ctx_1, transport=transport),
+                     DummyProducer(TOPIC, _id=ctx_2, transport=transport)]
 
         processes = []
         for i in range(num_consumers):
             processes.append(multiprocessing.Process(
                 name='consumer_{}'.format(i),
                 target=_run_consumer,
-                args=(i, [ctx_1, ctx_2], output_queue)))
+                args=(i, [ctx_1, ctx_2], output_queue, transport)))
             processes[i].start()
         self.addCleanup(self._terminate_consumers, num_consumers, processes)
 
@@ -97,3 +103,12 @@ class MessagingTestCase(base.BaseFunctionalTestCase):
                 for message in ['message 0', 'message 1']:
                     msg = msg_template.format(i, message, ctx)
                     self.assertIn(msg, output)
+
+    def test_run_five_consumers(self):
+        self._run_five_consumers()
+
+    def test_run_five_consumers_unix(self):
+        socket_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, socket_dir)
+        with mock.patch.object(messaging, 'SOCKET_DIR', socket_dir):
+            self._run_five_consumers(transport=messaging.TRANSPORT_UNIX)
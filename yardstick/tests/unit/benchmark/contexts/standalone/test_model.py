@@ -25,6 +25,7 @@ from yardstick.benchmark.contexts.standalone import model
 from yardstick.common import exceptions
 from yardstick import constants
 from yardstick.network_services import utils
+from yardstick.network_services.helpers import host_topology
 
 
 XML_SAMPLE = """<?xml version="1.0"?>
@@ -430,6 +431,30 @@ class StandaloneContextHelperTestCase(unittest.TestCase):
         model.StandaloneContextHelper.get_nic_details(
             ssh_mock, self.NETWORKS, 'dpdk-devbind.py')
 
+    @mock.patch.object(host_topology, 'get')
+    @mock.patch.object(host_topology, 'invalidate')
+    def test_get_nic_details_topology(self, mock_invalidate, mock_get):
+        mock_get.return_value = host_topology.HostTopology({'nics': {
+            '0000:05:00.0': {'interfaces': ['ens5f0']},
+            '0000:05:00.1': {'interfaces': ['ens5f1']}}})
+        ssh_mock = mock.Mock()
+        ssh_mock.execute.return_value = (0, 'Kernel modules: i40e', '')
+        networks = copy.deepcopy(self.NETWORKS)
+
+        model.StandaloneContextHelper.get_nic_details(
+            ssh_mock, networks, 'dpdk-devbind.py')
+
+        self.assertEqual('ens5f0', networks['private_0']['interface'])
+        self.assertEqual('ens5f1', networks['public_0']['interface'])
+        self.assertEqual('i40e', networks['public_0']['driver'])
+        self.assertNotIn('interface', networks['mgmt'])
+        mock_invalidate.assert_called_once_with(ssh_mock)
+        mock_get.assert_called_once_with(ssh_mock)
+        # kernel module and bind commands for each port, no interface lookup
+        self.assertEqual(4, ssh_mock.execute.call_count)
+        ssh_mock.execute.assert_any_call(
+            'dpdk-devbind.py --force -b i40e 0000:05:00.0')
+
     def test_get_virtual_devices(self):
         pattern = "PCI_SLOT_NAME=0000:05:00.0"
         with mock.patch("yardstick.ssh.SSH") as ssh:
@@ -25,6 +25,7 @@ from yardstick.benchmark.contexts.standalone import model
 from yardstick.benchmark.contexts.standalone import ovs_dpdk
 from yardstick.common import exceptions
 from yardstick.network_services import utils
+from yardstick.network_services.helpers import host_topology
 
 
 class OvsDpdkContextTestCase(unittest.TestCase):
@@ -209,6 +210,7 @@ class OvsDpdkContextTestCase(unittest.TestCase):
         mock_check_hugepages.assert_called_once()
 
     @mock.patch('yardstick.ssh.SSH')
+    @mock.patch.object(host_topology, 'get', return_value=None)
     def test_deploy(self, *args):
         self.ovs_dpdk.vm_deploy = False
         self.assertIsNone(self.ovs_dpdk.deploy())
@@ -22,6 +22,7 @@ from yardstick.benchmark import contexts
 from yardstick.benchmark.contexts import base
 from yardstick.benchmark.contexts.standalone import model
 from yardstick.benchmark.contexts.standalone import sriov
+from yardstick.network_services.helpers import host_topology
 
 
 class SriovContextTestCase(unittest.TestCase):
@@ -90,6 +91,7 @@ class SriovContextTestCase(unittest.TestCase):
         self.assertIsNone(self.sriov.init(self.ATTRS))
 
     @mock.patch.object(ssh, 'SSH', return_value=(0, "a", ""))
+    @mock.patch.object(host_topology, 'get', return_value=None)
     def test_deploy(self, *args):
         # NOTE(ralonsoh): this test doesn't cover function execution.
         self.sriov.vm_deploy = False
@@ -339,6 +339,41 @@ class HeatContextTestCase(unittest.TestCase):
         mock_genkeys.assert_called_once_with(key_filename)
         mock_path_exists.assert_any_call(key_filename)
 
+    @mock.patch.object(heat.HeatContext, '_retrieve_existing_stack')
+    def test_resume(self, mock_retrieve_stack):
+        self.test_context._name_task_id = 'foo-12345678'
+        self.test_context.get_neutron_info = mock.Mock()
+        mock_retrieve_stack.return_value = mock.Mock(uuid='stack-id')
+
+        self.test_context.resume({'stack_name': 'foo-12345678',
+                                  'stack_id': 'stack-id'})
+
+        mock_retrieve_stack.assert_called_once_with('foo-12345678')
+        self.assertIs(mock_retrieve_stack.return_value,
+                      self.test_context.stack)
+        self.assertTrue(self.test_context.key_filename.endswith(
+            'yardstick_key-foo-12345678'))
+        self.test_context.get_neutron_info.assert_called_once()
+
+    @mock.patch.object(heat.HeatContext, 'deploy')
+    @mock.patch.object(heat.HeatContext, '_retrieve_existing_stack')
+    def test_resume_stack_replaced(self, mock_retrieve_stack, mock_deploy):
+        self.test_context._name_task_id = 'foo-12345678'
+        mock_retrieve_stack.return_value = mock.Mock(uuid='other-stack-id')
+
+        self.test_context.resume({'stack_name': 'foo-12345678',
+                                  'stack_id': 'stack-id'})
+        mock_deploy.assert_called_once()
+
+    def test_get_checkpoint(self):
+        self.assertEqual({}, self.test_context.get_checkpoint())
+
+        self.test_context.stack = mock.Mock(uuid='stack-id')
+        self.test_context.stack.name = 'foo-12345678'
+        self.assertEqual({'stack_name': 'foo-12345678',
+                          'stack_id': 'stack-id'},
+                         self.test_context.get_checkpoint())
+
     @mock.patch.object(heat, 'HeatTemplate', return_value='heat_template')
     @mock.patch.object(heat.HeatContext, '_add_resources_to_template')
     @mock.patch.object(os.path, 'exists', return_value=False)
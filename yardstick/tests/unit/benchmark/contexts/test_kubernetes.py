@@ -8,7 +8,6 @@
 ##############################################################################
 
 import collections
-import time
 
 import mock
 import unittest
@@ -110,22 +109,18 @@ class KubernetesTestCase(unittest.TestCase):
 
     @mock.patch.object(kubernetes.KubernetesContext, '_create_services')
     @mock.patch.object(kubernetes.KubernetesContext, '_wait_until_running')
-    @mock.patch.object(orchestrator_kubernetes.KubernetesTemplate,
-                       'get_rc_pods')
     @mock.patch.object(kubernetes.KubernetesContext, '_create_rcs')
     @mock.patch.object(kubernetes.KubernetesContext, '_set_ssh_key')
     @mock.patch.object(kubernetes.KubernetesContext, '_create_networks')
     @mock.patch.object(kubernetes.KubernetesContext, '_create_crd')
-    def test_deploy(self, mock_set_ssh_key, mock_create_rcs, mock_get_rc_pods,
+    def test_deploy(self, mock_set_ssh_key, mock_create_rcs,
                     mock_wait_until_running, mock_create_services,
                     mock_create_networks, mock_create_crd):
 
-        with mock.patch.object(time, 'sleep'):
-            self.k8s_context.deploy()
+        self.k8s_context.deploy()
         mock_set_ssh_key.assert_called_once()
         mock_create_rcs.assert_called_once()
         mock_create_services.assert_called_once()
-        mock_get_rc_pods.assert_called_once()
         mock_wait_until_running.assert_called_once()
         mock_create_networks.assert_called_once()
         mock_create_crd.assert_called_once()
@@ -143,17 +138,31 @@ class KubernetesTestCase(unittest.TestCase):
         mock_create.assert_called_once()
         mock_delete.assert_called_once()
 
-    @mock.patch.object(k8s_utils, 'read_pod_status')
-    def test_wait_until_running(self, mock_read_pod_status):
-
-        self.k8s_context.template.pods = ['server']
-        mock_read_pod_status.return_value = 'Running'
+    @mock.patch.object(k8s_utils.NamespaceCache, 'get_pod_names',
+                       return_value=['host-k8s-a1b2c'])
+    @mock.patch.object(k8s_utils.NamespaceCache, 'wait_running')
+    def test_wait_until_running(self, mock_wait_running, mock_get_pod_names):
         self.k8s_context._wait_until_running()
 
-    @mock.patch.object(k8s_utils, 'get_pod_by_name')
+        rcs = sorted(self.k8s_context.template.rcs)
+        mock_wait_running.assert_called_once_with(mock.ANY)
+        self.assertEqual(rcs, sorted(mock_wait_running.call_args[0][0]))
+        self.assertEqual(rcs, sorted(mock_get_pod_names.call_args[0][0]))
+        self.assertEqual(['host-k8s-a1b2c'], self.k8s_context.template.pods)
+
+    @mock.patch.object(k8s_utils.NamespaceCache, 'get_pod_names',
+                       return_value=['host-k8s-a1b2c'])
+    @mock.patch.object(k8s_utils.NamespaceCache, 'wait_running',
+                       side_effect=exceptions.WaitTimeout)
+    def test_wait_until_running_timeout(self, *args):
+        with self.assertRaises(exceptions.WaitTimeout):
+            self.k8s_context._wait_until_running()
+        self.assertEqual(['host-k8s-a1b2c'], self.k8s_context.template.pods)
+
+    @mock.patch.object(k8s_utils.NamespaceCache, 'get_pod')
     @mock.patch.object(kubernetes.KubernetesContext, '_get_node_ip')
-    def test_get_server(self, mock_get_node_ip, mock_get_pod_by_name):
-        mock_get_pod_by_name.return_value = Pod()
+    def test_get_server(self, mock_get_node_ip, mock_get_pod):
+        mock_get_pod.return_value = Pod()
         mock_get_node_ip.return_value = '172.16.10.131'
         with mock.patch.object(self.k8s_context, '_get_service_ports') as \
                 mock_get_sports:
@@ -162,6 +171,8 @@ class KubernetesTestCase(unittest.TestCase):
             server = self.k8s_context._get_server('server_name')
         self.assertEqual('server_name', server['name'])
         self.assertEqual(30000, server['ssh_port'])
+        self.assertEqual('172.16.10.131', server['private_ip'])
+        mock_get_pod.assert_called_once_with('server_name')
 
     @mock.patch.object(kubernetes.KubernetesContext, '_create_rc')
     def test_create_rcs(self, mock_create_rc):
@@ -185,7 +196,10 @@ class KubernetesTestCase(unittest.TestCase):
 
     @mock.patch.object(k8s_utils, 'get_node_list')
     def test_get_node_ip(self, mock_get_node_list):
-        self.k8s_context._get_node_ip()
+        node = mock_get_node_list.return_value.items[0]
+        node.status.addresses[0].address = '10.0.0.1'
+        self.assertEqual('10.0.0.1', self.k8s_context._get_node_ip())
+        self.assertEqual('10.0.0.1', self.k8s_context._get_node_ip())
         mock_get_node_list.assert_called_once()
 
     @mock.patch.object(orchestrator_kubernetes.ServiceNodePortObject, 'create')
@@ -252,12 +266,12 @@ class KubernetesTestCase(unittest.TestCase):
     def test__get_interfaces_no_rc(self, *args):
         self.assertEqual({}, self.k8s_context._get_interfaces('rc_name'))
 
-    @mock.patch.object(k8s_utils, 'get_service_by_name',
+    @mock.patch.object(k8s_utils.NamespaceCache, 'get_service_spec',
                        return_value=Service())
-    def test__get_service_ports(self, mock_get_service_by_name):
+    def test__get_service_ports(self, mock_get_service_spec):
         name = 'rc_name'
         service_ports = self.k8s_context._get_service_ports(name)
-        mock_get_service_by_name.assert_called_once_with(name + '-service')
+        mock_get_service_spec.assert_called_once_with(name + '-service')
         expected = {'node_port': 30000,
                     'port': constants.SSH_PORT,
                     'name': 'port_name',
@@ -265,7 +279,7 @@ class KubernetesTestCase(unittest.TestCase):
                     'target_port': constants.SSH_PORT}
         self.assertEqual(expected, service_ports[0])
 
-    @mock.patch.object(k8s_utils, 'get_service_by_name',
+    @mock.patch.object(k8s_utils.NamespaceCache, 'get_service_spec',
                        return_value=None)
     def test__get_service_ports_exception(self, *args):
         name = 'rc_name'
@@ -0,0 +1,105 @@
+##############################################################################
+# Copyright (c) 2018 Intel Corporation
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from yardstick.benchmark.core import checkpoint
+
+
+class TaskCheckpointTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.path = os.path.join(self.tmp_dir, 'task.checkpoint')
+        self.checkpoint = checkpoint.TaskCheckpoint('task_id', self.path)
+
+    def _load(self):
+        loaded = checkpoint.TaskCheckpoint('task_id', self.path)
+        self.assertTrue(loaded.load())
+        return loaded
+
+    def test_get_path(self):
+        with mock.patch.object(checkpoint.constants, 'TASK_LOG_DIR',
+                               '/var/log/yardstick'):
+            self.assertEqual('/var/log/yardstick/task_id.checkpoint',
+                             checkpoint.get_path('task_id'))
+
+    def test_load_no_checkpoint(self):
+        self.assertFalse(self.checkpoint.load())
+
+    def test_start_task(self):
+        args = mock.Mock(inputfile=['task.yaml'], task_args=None, suite=False)
+        self.checkpoint.start_task(args)
+
+        loaded = self._load()
+        self.assertEqual(set(checkpoint.TASK_ARGS), set(loaded.args))
+        self.assertEqual(['task.yaml'], loaded.args['inputfile'])
+        self.assertFalse(loaded.args['suite'])
+
+    def test_contexts(self):
+        context = mock.Mock()
+        context.name = 'demo-12345678'
+        context.get_checkpoint.return_value = {'stack_id': 'stack-id'}
+        other_context = mock.Mock()
+        other_context.name = 'other-12345678'
+        other_context.get_checkpoint.return_value = {}
+
+        self.checkpoint.context_deployed(context)
+        self.checkpoint.context_deployed(other_context)
+        self.checkpoint.context_undeployed(other_context)
+
+        expected = {'demo-12345678': {'stack_id': 'stack-id'}}
+        self.assertEqual(expected, self.checkpoint.contexts)
+        self.assertEqual(expected, self._load().contexts)
+
+    def test_scenarios(self):
+        self.checkpoint.scenario_done('tc001', 0, 0, [{'data': {'rtt': 1}}],
+                                      {'var': 1})
+        self.checkpoint.scenario_done('tc002', 1, 1, [], {})
+
+        loaded = self._load()
+        self.assertEqual({0: {'status': 0, 'records': [{'data': {'rtt': 1}}],
+                              'outputs': {'var': 1}}},
+                         loaded.get_scenarios('tc001'))
+        # the failed scenarios are executed again
+        self.assertEqual({}, loaded.get_scenarios('tc002'))
+        self.assertEqual({}, loaded.get_scenarios('tc003'))
+
+    def test_testcase_done(self):
+        self.checkpoint.scenario_done('tc001', 0, 0, [], {})
+        self.checkpoint.testcase_done('tc001', {'criteria': 'PASS',
+                                                'tc_data': []})
+
+        loaded = self._load()
+        self.assertEqual({'tc001': {'criteria': 'PASS', 'tc_data': []}},
+                         loaded.testcases)
+        self.assertEqual({}, loaded.get_scenarios('tc001'))
+
+    def test_testcase_failed(self):
+        self.checkpoint.scenario_done('tc001', 0, 0, [], {})
+        self.checkpoint.scenario_done('tc001', 1, 1, [], {})
+        self.checkpoint.testcase_done('tc001', {'criteria': 'FAIL',
+                                                'tc_data': []})
+
+        loaded = self._load()
+        self.assertEqual({}, loaded.testcases)
+        self.assertEqual([0], list(loaded.get_scenarios('tc001')))
+
+    def test_load_truncated_entry(self):
+        self.checkpoint.testcase_done('tc001', {'criteria': 'PASS'})
+        with open(self.path, 'a') as checkpoint_file:
+            checkpoint_file.write('{"event": "testcase", "ca')
+
+        self.assertEqual(['tc001'], list(self._load().testcases))
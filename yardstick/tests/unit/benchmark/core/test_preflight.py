@@ -0,0 +1,141 @@
+##############################################################################
+# Copyright (c) 2018 Intel Corporation
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+import json
+import subprocess
+import sys
+import unittest
+
+import mock
+
+from yardstick import ssh
+from yardstick.benchmark.core import preflight
+from yardstick.common import exceptions
+
+
+NODE = {
+    'name': 'tg__0',
+    'ip': '10.0.0.1',
+    'user': 'root',
+    'password': 'r00t',
+    'interfaces': {
+        'xe0': {'vpci': '0000:05:00.0', 'driver': 'igb_uio',
+                'local_mac': '00:00:00:00:00:01'},
+        'xe1': {'vpci': '05:00.1', 'driver': 'i40e'},
+    },
+}
+
+
+class PreflightTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._mock_ssh = mock.patch.object(ssh, 'SSH')
+        self.mock_ssh = self._mock_ssh.start()
+        self.addCleanup(self._mock_ssh.stop)
+        self.connection = self.mock_ssh.from_node.return_value
+        self.probe_result = {
+            'pci': {'0000:05:00.0': True, '0000:05:00.1': True},
+            'drivers': {'i40e': True, 'igb_uio': True},
+            'binaries': {'/opt/nsb_bin/dpdk-devbind.py': True},
+            'hugepages_free_kb': 2048}
+        self.connection.execute.return_value = (
+            0, json.dumps(self.probe_result), '')
+
+    def test_probe_script(self):
+        checks = {'pci': ['0000:ff:ff.7'], 'drivers': ['no_driver'],
+                  'binaries': ['sh', '/no/binary']}
+        proc = subprocess.Popen(
+            [sys.executable, '-', json.dumps(checks)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        output = proc.communicate(preflight.PROBE_SCRIPT.encode())[0]
+        result = json.loads(output.decode())
+
+        self.assertEqual({'0000:ff:ff.7': False}, result['pci'])
+        self.assertEqual({'no_driver': False}, result['drivers'])
+        self.assertEqual({'sh': True, '/no/binary': False},
+                         result['binaries'])
+        self.assertIn('hugepages_free_kb', result)
+
+    @mock.patch.object(preflight.ns_utils, 'get_nsb_option',
+                       return_value='/opt/nsb_bin')
+    def test_get_node_checks(self, *args):
+        checks, errors = preflight.get_node_checks(NODE)
+
+        self.assertEqual({'pci': ['0000:05:00.0', '0000:05:00.1'],
+                          'drivers': ['i40e', 'igb_uio'],
+                          'binaries': ['/opt/nsb_bin/dpdk-devbind.py'],
+                          'hugepages': True}, checks)
+        self.assertEqual(['interface xe1: missing local_mac'], errors)
+
+    def test_get_node_checks_standalone(self):
+        context = mock.Mock(networks={
+            'uplink_0': {'phy_port': '0000:06:00.0'},
+            'mgmt': {'cidr': '10.0.0.0/24'}})
+        checks, errors = preflight.get_node_checks(
+            {'name': 'host', 'ip': '10.0.0.1'}, context)
+
+        self.assertEqual({'pci': ['0000:06:00.0'], 'drivers': [],
+                          'binaries': [], 'hugepages': False}, checks)
+        self.assertEqual([], errors)
+
+    def test_check_node(self):
+        checks = {'pci': ['0000:05:00.0'], 'drivers': [], 'binaries': [],
+                  'hugepages': True}
+        self.assertEqual([], preflight.check_node(NODE, checks))
+
+        cmd = self.connection.execute.call_args[0][0]
+        self.assertTrue(cmd.startswith(preflight.PROBE_CMD + ' - '))
+        self.assertEqual(preflight.PROBE_SCRIPT,
+                         self.connection.execute.call_args[1]['stdin'])
+        self.connection.close.assert_called_once()
+
+    def test_check_node_errors(self):
+        self.probe_result.update({
+            'pci': {'0000:05:00.0': False}, 'drivers': {'igb_uio': False},
+            'binaries': {'dpdk-devbind.py': False}, 'hugepages_free_kb': 0})
+        self.connection.execute.return_value = (
+            0, json.dumps(self.probe_result), '')
+
+        self.assertEqual(['PCI device 0000:05:00.0 not found',
+                          'driver igb_uio can not be loaded',
+                          'binary dpdk-devbind.py not found',
+                          'no free hugepages'],
+                         preflight.check_node(NODE, {'hugepages': True}))
+
+    def test_check_node_unreachable(self):
+        self.connection.execute.side_effect = exceptions.SSHError(
+            error_msg='timeout')
+
+        errors = preflight.check_node(NODE, {})
+        self.assertEqual(1, len(errors))
+        self.assertIn('SSH to 10.0.0.1 failed', errors[0])
+
+    def test_check_node_probe_failed(self):
+        self.connection.execute.return_value = (127, '', 'not found\n')
+        self.assertEqual(['probe failed: not found'],
+                         preflight.check_node(NODE, {}))
+
+    def test_run(self):
+        contexts = [mock.Mock(), mock.Mock()]
+        contexts[0].name = 'ctx0'
+        contexts[0]._get_physical_nodes.return_value = [NODE]
+        contexts[0].networks = {}
+        contexts[1]._get_physical_nodes.return_value = None
+
+        reports = preflight.run(contexts)
+
+        self.assertEqual(1, len(reports))
+        self.assertEqual('ctx0', reports[0]['context'])
+        self.assertEqual('tg__0', reports[0]['node'])
+        self.assertEqual(['interface xe1: missing local_mac'],
+                         reports[0]['errors'])
+        self.assertIn('tg__0', preflight.format_reports(reports))
+
+    def test_run_no_nodes(self):
+        self.assertEqual([], preflight.run([]))
@@ -72,3 +72,33 @@ class ReportTestCase(unittest.TestCase):
         self.assertRaisesRegexp(KeyError, "Task ID", self.rep._get_fieldkeys)
         self.assertRaisesRegexp(KeyError, "Task ID", self.rep._get_tasks)
         # pylint: enable=deprecated-method
+
+    @mock.patch.object(report.chunked_result, 'ChunkedResultReader')
+    @mock.patch.object(report.Report, '_get_tasks')
+    @mock.patch.object(report.Report, '_validate')
+    def test_generate_input_file(self, mock_valid, mock_tasks, mock_reader):
+        mock_reader.return_value.iter_records.return_value = [
+            (FAKE_YAML_NAME, 'Ping', {'timestamp': 0, 'data': {'rtt': 0.5}}),
+            (FAKE_YAML_NAME, 'Ping', {'timestamp': 1, 'data': {}})]
+        self.param.input_file = ['yardstick.out']
+        self.rep.task_id = uuid.UUID(FAKE_TASK_ID)
+        self.rep.generate(self.param)
+
+        mock_valid.assert_called_once_with(FAKE_YAML_NAME, FAKE_TASK_ID)
+        mock_tasks.assert_not_called()
+        mock_reader.assert_called_once_with('yardstick.out',
+                                            task_id=FAKE_TASK_ID)
+        self.assertEqual([{'fieldKey': 'rtt'}], self.rep.db_fieldkeys)
+        self.assertEqual(
+            [{'rtt': 0.5, 'time': '1970-01-01T00:00:00Z'},
+             {'rtt': None, 'time': '1970-01-01T00:00:01Z'}],
+            self.rep.db_task)
+
+    @mock.patch.object(report.chunked_result, 'ChunkedResultReader')
+    def test_chunked_task_not_found(self, mock_reader):
+        mock_reader.return_value.iter_records.return_value = []
+        self.rep.yaml_name = FAKE_YAML_NAME
+        # pylint: disable=deprecated-method
+        self.assertRaisesRegexp(KeyError, "Test case",
+                                self.rep._get_chunked_tasks, 'yardstick.out')
+        # pylint: enable=deprecated-method
@@ -0,0 +1,126 @@
+##############################################################################
+# Copyright (c) 2018 Intel Corporation
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+import os
+import time
+import unittest
+
+import mock
+
+from yardstick.benchmark.core import suite_scheduler
+from yardstick.common import profiler
+
+
+class GetTaskLocksTestCase(unittest.TestCase):
+
+    def test_get_task_locks(self):
+        context = mock.Mock(file_path='/etc/yardstick/pod.yaml')
+        context.name = 'yardstick-1234'
+        task = {'contexts': [context],
+                'scenarios': [{'host': 'athena.demo',
+                               'targets': ['kratos.demo'],
+                               'nodes': {'tg__0': 'tg_0.yardstick'}},
+                              {'options': {}}]}
+
+        locks = suite_scheduler.get_task_locks(task, ['pci:0000:05:00.0'])
+        self.assertEqual({'pci:0000:05:00.0',
+                          'context:yardstick-1234',
+                          'pod:/etc/yardstick/pod.yaml',
+                          'node:athena.demo',
+                          'node:kratos.demo',
+                          'node:tg_0.yardstick'}, locks)
+
+    def test_get_task_locks_no_pod_file(self):
+        context = mock.Mock(file_path=None)
+        context.name = 'dummy'
+        locks = suite_scheduler.get_task_locks(
+            {'contexts': [context], 'scenarios': []})
+        self.assertEqual({'context:dummy'}, locks)
+
+
+class SuiteSchedulerTestCase(unittest.TestCase):
+
+    @staticmethod
+    def _run_case(index):
+        time.sleep(0.1)
+        with profiler.span('testcase', index=index):
+            pass
+        return {'criteria': 'PASS', 'tc_data': [{'index': index,
+                                                 'pid': os.getpid()}]}
+
+    def test_run(self):
+        cases = [suite_scheduler.SuiteCase(0, 'tc0', ['node:a']),
+                 suite_scheduler.SuiteCase(1, 'tc1', ['node:b']),
+                 suite_scheduler.SuiteCase(2, 'tc2', ['node:c'])]
+        scheduler = suite_scheduler.SuiteScheduler(self._run_case, 3)
+
+        results = scheduler.run(cases)
+
+        self.assertEqual(['tc0', 'tc1', 'tc2'],
+                         [case.name for case, _ in results])
+        self.assertEqual([0, 1, 2], [record['tc_data'][0]['index']
+                                     for _, record in results])
+        self.assertNotIn(os.getpid(), [record['tc_data'][0]['pid']
+                                       for _, record in results])
+        self.assertGreaterEqual(scheduler.serial_time, 0.3)
+        self.assertEqual([[('testcase', {'index': index})] for index in range(3)],
+                         [[(span['name'], span['tags']) for span in case.spans]
+                          for case, _ in results])
+
+    def test__start_ready_locked_resource(self):
+        cases = [suite_scheduler.SuiteCase(0, 'tc0', ['node:a']),
+                 suite_scheduler.SuiteCase(1, 'tc1', ['node:a', 'node:b']),
+                 suite_scheduler.SuiteCase(2, 'tc2', ['node:c'])]
+        scheduler = suite_scheduler.SuiteScheduler(mock.Mock(), 3)
+        pending = list(cases)
+
+        with mock.patch.object(suite_scheduler.multiprocessing, 'Process'):
+            scheduler._start_ready(pending)
+
+        self.assertEqual([cases[1]], pending)
+        self.assertEqual({0, 2}, set(scheduler._running))
+
+    def test__start_ready_max_workers(self):
+        cases = [suite_scheduler.SuiteCase(idx, 'tc', []) for idx in range(3)]
+        scheduler = suite_scheduler.SuiteScheduler(mock.Mock(), 2)
+        pending = list(cases)
+
+        with mock.patch.object(suite_scheduler.multiprocessing, 'Process'):
+            scheduler._start_ready(pending)
+
+        self.assertEqual([cases[2]], pending)
+
+    @mock.patch.object(suite_scheduler.openstack_utils, 'add_clients_stats')
+    def test__finish(self, mock_add_clients_stats):
+        case = suite_scheduler.SuiteCase(0, 'tc0', [])
+        case.process = mock.Mock()
+        scheduler = suite_scheduler.SuiteScheduler(mock.Mock(), 1)
+        scheduler._running[0] = case
+        clients_stats = {'auth': 1, 'hit': 4, 'miss': 2}
+
+        scheduler._finish(0, {'criteria': 'PASS'}, 1.0, [{'name': 'testcase'}],
+                          clients_stats)
+
+        self.assertEqual([{'name': 'testcase'}], case.spans)
+        self.assertEqual({'criteria': 'PASS'}, scheduler._records[0])
+        mock_add_clients_stats.assert_called_once_with(clients_stats)
+
+    def test__collect_dead_worker(self):
+        case = suite_scheduler.SuiteCase(0, 'tc0', [])
+        case.process = mock.Mock(exitcode=-9)
+        case.start_time = time.time()
+        scheduler = suite_scheduler.SuiteScheduler(mock.Mock(), 1)
+        scheduler.POLL_INTERVAL = 0.01
+        scheduler._running[0] = case
+
+        scheduler._collect()
+
+        self.assertEqual({}, scheduler._running)
+        self.assertEqual({'criteria': 'FAIL', 'tc_data': []},
+                         scheduler._records[0])
@@ -11,7 +11,9 @@ import copy
 import io
 import logging
 import os
+import shutil
 import sys
+import tempfile
 
 import mock
 import six
@@ -21,6 +23,7 @@ import uuid
 
 from yardstick.benchmark.contexts import base
 from yardstick.benchmark.contexts import dummy
+from yardstick.benchmark.core import checkpoint
 from yardstick.benchmark.core import task
 from yardstick.common import constants as consts
 from yardstick.common import exceptions
@@ -71,6 +74,18 @@ class TaskTestCase(unittest.TestCase):
                                                            dispatcher2])
         self.assertIsNone(t._do_output(output_config, {}))
 
+    @mock.patch.object(task, 'DispatcherBase')
+    def test__do_output_influxdb(self, mock_dispatcher):
+        t = task.Task()
+        dispatcher = mock.Mock(__dispatcher_type__='Influxdb')
+        mock_dispatcher.get.return_value = [dispatcher]
+        result = {'result': {'profile': [{'name': 'testcase'}]}}
+
+        t._do_output({}, result)
+
+        dispatcher.flush_result_data.assert_not_called()
+        dispatcher.upload_profile.assert_called_once_with(result)
+
     @mock.patch.object(base, 'Context')
     def test_parse_networks_from_nodes(self, mock_context):
         nodes = {
@@ -183,6 +198,193 @@ class TaskTestCase(unittest.TestCase):
         t._run([scenario], False, "yardstick.out")
         runner.run.assert_called_once()
 
+    @mock.patch.object(base, 'Context')
+    @mock.patch.object(task, 'base_runner')
+    def test_run_checkpoint(self, mock_base_runner, *args):
+        scenarios = [{'host': 'athena.demo', 'target': 'ares.demo',
+                      'runner': {'type': 'Duration'}, 'type': 'Ping'}
+                     for _ in range(2)]
+        context = mock.Mock()
+        context.name = 'demo-12345678'
+        context.__context_type__ = 'Dummy'
+        t = task.Task()
+        t.contexts = [context]
+        t.checkpoint = mock.Mock(contexts={'demo-12345678': {'id': 1}})
+        t.checkpoint.get_scenarios.return_value = {
+            0: {'status': 0, 'records': ['record0'], 'outputs': {'var': 1}}}
+        runner = mock.Mock()
+        runner.join.return_value = 0
+        runner.poll.side_effect = [None, 0]
+        runner.get_output.return_value = {}
+        runner.get_result.return_value = ['record1']
+        mock_base_runner.Runner.get.return_value = runner
+
+        success, result = t._run(scenarios, False, "yardstick.out",
+                                 case_name='tc001')
+
+        self.assertTrue(success)
+        context.resume.assert_called_once_with({'id': 1})
+        context.deploy.assert_not_called()
+        t.checkpoint.context_deployed.assert_called_once_with(context)
+        t.checkpoint.get_scenarios.assert_called_once_with('tc001')
+        # only the unfinished scenario is executed
+        runner.run.assert_called_once()
+        self.assertEqual(['record0', 'record1'], result)
+        self.assertEqual({'var': 1}, t.outputs)
+        t.checkpoint.scenario_done.assert_called_once_with(
+            'tc001', 1, 0, ['record1'], {'var': 1})
+
+    @mock.patch.object(base, 'Context')
+    @mock.patch.object(task, 'base_runner')
+    def test_run_resume_failed_scenario(self, mock_base_runner, *args):
+        scenarios = [{'host': 'athena.demo', 'target': 'ares.demo',
+                      'runner': {'type': 'Duration'}, 'type': 'Ping'}
+                     for _ in range(2)]
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        path = os.path.join(tmp_dir, 'task.checkpoint')
+        # the runner of the second scenario died
+        task_checkpoint = checkpoint.TaskCheckpoint('task_id', path)
+        task_checkpoint.scenario_done('tc001', 0, 0, ['record0'], {})
+        task_checkpoint.scenario_done('tc001', 1, -9, [], {})
+        task_checkpoint.testcase_done('tc001', {'criteria': 'FAIL',
+                                                'tc_data': ['record0']})
+        t = task.Task()
+        t.checkpoint = checkpoint.TaskCheckpoint('task_id', path)
+        t.checkpoint.load()
+        runner = mock.Mock()
+        runner.join.return_value = 0
+        runner.poll.side_effect = [None, 0]
+        runner.get_output.return_value = {}
+        runner.get_result.return_value = ['record1']
+        mock_base_runner.Runner.get.return_value = runner
+
+        testcase = t._run_task({'case_name': 'tc001', 'scenarios': scenarios,
+                                'run_in_parallel': False}, {}, False)
+
+        # only the failed scenario is executed again
+        runner.run.assert_called_once()
+        self.assertEqual({'criteria': 'PASS',
+                          'tc_data': ['record0', 'record1']}, testcase)
+        self.assertEqual({'tc001': testcase}, t.checkpoint.testcases)
+
+    def test_run_task_checkpoint_finished(self):
+        t = task.Task()
+        t.contexts = [mock.Mock()]
+        t.checkpoint = mock.Mock(testcases={'tc001': {'criteria': 'PASS'}})
+
+        with mock.patch.object(t, '_run') as mock_run:
+            self.assertEqual({'criteria': 'PASS'}, t._run_task(
+                {'case_name': 'tc001'}, {}, False))
+
+        mock_run.assert_not_called()
+        self.assertEqual([], t.contexts)
+
+    def test_run_task_checkpoint(self):
+        context = mock.Mock()
+        t = task.Task()
+        t.contexts = [context]
+        t.checkpoint = mock.Mock(testcases={})
+        with mock.patch.object(t, '_run', return_value=(True, [])):
+            t._run_task({'case_name': 'tc001', 'scenarios': [],
+                         'run_in_parallel': False}, {}, False)
+
+        context.undeploy.assert_called_once()
+        t.checkpoint.context_undeployed.assert_called_once_with(context)
+        t.checkpoint.testcase_done.assert_called_once_with(
+            'tc001', {'criteria': 'PASS', 'tc_data': []})
+
+    @mock.patch.object(task.chunked_result, 'flush_all')
+    def test_run_task_flush_chunked_records(self, mock_flush_all):
+        t = task.Task()
+        output_config = {'dispatcher_file': {'format': 'chunked'}}
+        with mock.patch.object(t, '_run', return_value=(True, [])):
+            t._run_task({'case_name': 'tc001', 'scenarios': [],
+                         'run_in_parallel': False}, output_config, False)
+
+        mock_flush_all.assert_called_once_with()
+
+    def test__run_suite_parallel_profile(self):
+        def _run_task(task_cfg, *args):
+            with task.profiler.span('runner'):
+                pass
+            return {'criteria': 'PASS', 'tc_data': [task_cfg['case_name']]}
+
+        t = task.Task()
+        t.task_id = 'task_id'
+        tasks = [{'case_name': name, 'meet_precondition': True,
+                  'contexts': [], 'scenarios': []}
+                 for name in ('tc001', 'tc002')]
+        task.profiler.reset()
+        self.addCleanup(task.profiler.reset)
+        with mock.patch.object(t, '_run_task', side_effect=_run_task), \
+                mock.patch.object(t, '_set_log'):
+            with task.profiler.span('suite'):
+                testcases = t._run_suite_parallel(tasks, [None, None], 2,
+                                                  {}, False)
+
+        self.assertEqual(['tc001', 'tc002'], list(testcases))
+        suite_span = task.profiler.get_spans()[0]
+        self.assertEqual(
+            [('testcase', {'case': 'tc001'}), ('testcase', {'case': 'tc002'})],
+            [(span['name'], span['tags']) for span in suite_span['children']])
+        self.assertEqual(['runner'], [
+            span['name'] for span in suite_span['children'][0]['children']])
+
+    @mock.patch.object(task.checkpoint, 'TaskCheckpoint')
+    def test_resume(self, mock_checkpoint):
+        mock_checkpoint.return_value.load.return_value = True
+        mock_checkpoint.return_value.args = {'inputfile': ['task.yaml'],
+                                             'suite': False}
+        t = task.Task()
+        with mock.patch.object(t, 'start') as mock_start:
+            t.resume(mock.Mock(task_id='task_id'))
+
+        mock_checkpoint.assert_called_once_with('task_id')
+        self.assertIs(mock_checkpoint.return_value, t.checkpoint)
+        self.assertTrue(mock_start.call_args[1]['resume'])
+        args = mock_start.call_args[0][0]
+        self.assertEqual(('task_id', ['task.yaml'], False),
+                         (args.task_id, args.inputfile, args.suite))
+
+    @mock.patch.object(task.checkpoint, 'TaskCheckpoint')
+    def test_resume_no_checkpoint(self, mock_checkpoint):
+        mock_checkpoint.return_value.load.return_value = False
+        with self.assertRaises(exceptions.TaskCheckpointNotFound):
+            task.Task().resume(mock.Mock(task_id='task_id'))
+
+    def _validate(self, deep, reports):
+        args = mock.Mock(inputfile=['task.yaml'], task_args=None,
+                         task_args_file=None, suite=False, render_only=None,
+                         task_id=None, deep=deep)
+        with mock.patch.object(task, 'TaskParser') as mock_parser, \
+                mock.patch.object(task.preflight, 'run',
+                                  return_value=reports) as mock_run:
+            mock_parser.return_value.path = 'task.yaml'
+            mock_parser.return_value.parse_task.return_value = {
+                'contexts': ['context']}
+            result = task.Task().validate(args)
+
+        if deep:
+            mock_run.assert_called_once_with(['context'])
+        else:
+            mock_run.assert_not_called()
+        return result
+
+    def test_validate(self):
+        self.assertEqual([], self._validate(False, None))
+
+    def test_validate_deep(self):
+        reports = [{'context': 'yardstick', 'node': 'tg', 'host': '10.0.0.1',
+                    'errors': [], 'duration': 0.5}]
+        self.assertEqual(reports, self._validate(True, reports))
+
+    def test_validate_deep_failed(self):
+        reports = [{'context': 'yardstick', 'node': 'tg', 'host': '10.0.0.1',
+                    'errors': ['no free hugepages'], 'duration': 0.5}]
+        with self.assertRaises(exceptions.TaskValidationFailed):
+            self._validate(True, reports)
+
     @mock.patch.object(os, 'environ')
     def test_check_precondition(self, mock_os_environ):
         cfg = {
@@ -215,6 +417,7 @@ class TaskTestCase(unittest.TestCase):
         self.assertIsNone(task_args[1])
         self.assertIsNone(task_args_fnames[0])
         self.assertIsNone(task_args_fnames[1])
+        self.assertEqual([[], []], t.task_resources)
 
     def test_parse_suite_no_constraint_with_args(self):
         SAMPLE_SCENARIO_PATH = "no_constraint_with_args_scenario_sample.yaml"
@@ -487,6 +690,36 @@ key2:
         self.parser._change_node_names(scenario, [my_context])
         self.assertIsNone(scenario['options']['server_name'])
 
+    def test__set_scale_out_nodes(self):
+        ctx_attrs = {
+            'name': 'demo',
+            'task_id': '1234567890'
+        }
+
+        my_context = dummy.DummyContext()
+        self.addCleanup(self._remove_contexts)
+        my_context.init(ctx_attrs)
+        scenario = {'topology': {'num_vnfs': 1,
+                                 'vnf_model': 'acl_vnf.yaml'}}
+
+        self.parser._set_scale_out_nodes(scenario, [my_context])
+        self.parser._change_node_names(scenario, [my_context])
+        self.assertEqual({'tg__0': 'tg_0.demo-12345678',
+                          'tg__1': 'tg_1.demo-12345678',
+                          'vnf__0': 'vnf_0.demo-12345678'},
+                         scenario['nodes'])
+
+    def test__set_scale_out_nodes_not_default(self):
+        my_context = mock.Mock(assigned_name='demo')
+        scenario = copy.deepcopy(self.scenario)
+        scenario['topology'] = {'num_vnfs': 1}
+        scenario_file = {'topology': 'topology.yaml'}
+
+        self.parser._set_scale_out_nodes(scenario, [my_context])
+        self.parser._set_scale_out_nodes(scenario_file, [my_context])
+        self.assertEqual(self.scenario['nodes'], scenario['nodes'])
+        self.assertNotIn('nodes', scenario_file)
+
     def test__parse_tasks(self):
         task_obj = task.Task()
         _uuid = uuid.uuid4()
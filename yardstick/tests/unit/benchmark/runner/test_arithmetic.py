@@ -14,6 +14,7 @@ import os
 import time
 
 from yardstick.benchmark.runners import arithmetic
+from yardstick.common import exceptions as y_exc
 
 
 class ArithmeticRunnerTest(unittest.TestCase):
@@ -69,9 +70,13 @@ class ArithmeticRunnerTest(unittest.TestCase):
                               {})
         mock_multiprocessing_process.assert_called_once_with(
             name='Arithmetic-some_type-101',
-            target=arithmetic._worker_process,
+            target=mock.ANY,
             args=(runner.result_queue, benchmark_cls, 'my_method',
                   self.scenario_cfg, {}, runner.aborted, runner.output_queue))
+        target = mock_multiprocessing_process.call_args[1]['target']
+        self.assertEqual((arithmetic._worker_process, runner.profile_queue, None,
+                          runner.result_queue),
+                         target.args)
 
     @mock.patch.object(os, 'getpid')
     def test__worker_process_runner_id(self, mock_os_getpid):
@@ -218,3 +223,82 @@ class ArithmeticRunnerTest(unittest.TestCase):
             self.assertEqual(result['sequence'], count)
             self.assertGreater(result['timestamp'], timestamp)
             timestamp = result['timestamp']
+
+    @mock.patch.object(time, 'sleep')
+    def test__worker_process_stateless_no_interval(self, mock_time_sleep):
+        self.scenario_cfg['runner']['interval'] = 99
+        self.benchmark_cls.__stateless__ = True
+
+        arithmetic._worker_process(mock.Mock(), self.benchmark_cls,
+                                   'my_method', self.scenario_cfg, {},
+                                   multiprocessing.Event(), mock.Mock())
+
+        mock_time_sleep.assert_has_calls([mock.call(0)] * 8)
+
+    def test__worker_process_parallel_sweep(self):
+        self.scenario_cfg['runner']['workers'] = 3
+
+        queue = multiprocessing.Queue()
+        output_queue = multiprocessing.Queue()
+        arithmetic._worker_process(queue, SweepScenario, 'run',
+                                   self.scenario_cfg, {},
+                                   multiprocessing.Event(), output_queue)
+        time.sleep(0.01)
+
+        records = []
+        while not queue.empty():
+            records.append(queue.get())
+        self.assertEqual(list(range(1, 9)),
+                         [record['sequence'] for record in records])
+        self.assertEqual([{'stride': stride, 'size': size}
+                          for stride in (64, 128)
+                          for size in (500, 1000, 1500, 2000)],
+                         [record['data'] for record in records])
+        for record in records:
+            self.assertEqual('', record['errors'])
+            self.assertGreaterEqual(record['duration'], 0)
+        outputs = set()
+        while not output_queue.empty():
+            outputs.add(output_queue.get()['pid'])
+        self.assertNotIn(os.getpid(), outputs)
+
+    def test__worker_process_parallel_sweep_sla_assert(self):
+        self.scenario_cfg['runner']['workers'] = 2
+        self.scenario_cfg['sla'] = {'action': 'assert', 'max_stride': 64}
+
+        queue = multiprocessing.Queue()
+        with self.assertRaises(y_exc.SLAValidationError):
+            arithmetic._worker_process(queue, SweepScenario, 'run',
+                                       self.scenario_cfg, {},
+                                       multiprocessing.Event(), mock.Mock())
+        time.sleep(0.01)
+
+        records = []
+        while not queue.empty():
+            records.append(queue.get())
+        self.assertEqual(list(range(1, 6)),
+                         [record['sequence'] for record in records])
+        self.assertTrue(records[-1]['errors'])
+
+
+class SweepScenario(object):
+
+    __stateless__ = True
+
+    def __init__(self, scenario_cfg, context_cfg):  # pylint: disable=unused-argument
+        self.scenario_cfg = scenario_cfg
+
+    def setup(self):
+        pass
+
+    def teardown(self):
+        pass
+
+    def run(self, data):
+        options = self.scenario_cfg['options']
+        data.update(options)
+        max_stride = self.scenario_cfg.get('sla', {}).get('max_stride')
+        if max_stride and options['stride'] > max_stride:
+            raise y_exc.SLAValidationError(case_name='sweep',
+                                           error_msg='stride')
+        return {'pid': os.getpid()}
@@ -13,10 +13,12 @@ import uuid
 import mock
 from oslo_config import cfg
 import oslo_messaging
+from six import moves
 import subprocess
 
 from yardstick.benchmark.runners import base as runner_base
 from yardstick.benchmark.runners import iteration
+from yardstick.benchmark.scenarios import base as base_scenario
 from yardstick.common import messaging
 from yardstick.common.messaging import payloads
 from yardstick.tests.unit import base as ut_base
@@ -94,12 +96,88 @@ class RunnerTestCase(ut_base.BaseUnitTestCase):
         actual_result = self.runner.get_result()
         self.assertEqual(idle_result, actual_result)
 
+    @mock.patch.object(runner_base.Runner, '_output_to_file')
+    def test_get_result_chunked_file(self, mock_output):
+        self.runner.config['output_config']['dispatcher_file'] = {
+            'format': 'chunked'}
+        self.runner.result_queue.put({'criteria': 'PASS'})
+
+        for _ in range(1000):
+            time.sleep(0.01)
+            if not self.runner.result_queue.empty():
+                break
+        self.assertEqual([{'criteria': 'PASS'}], self.runner.get_result())
+        mock_output.assert_called_once_with({'criteria': 'PASS'})
+
     def test__run_benchmark(self):
         runner = runner_base.Runner(mock.Mock())
 
         with self.assertRaises(NotImplementedError):
             runner._run_benchmark(mock.Mock(), mock.Mock(), mock.Mock(), mock.Mock())
 
+    def test__profiled_worker(self):
+        profile_queue = moves.queue.Queue()
+        target = mock.Mock()
+
+        record_queue = moves.queue.Queue()
+        self.addCleanup(base_scenario.set_record_queue, None)
+        runner_base._profiled_worker(target, profile_queue, None, record_queue,
+                                     'arg')
+
+        target.assert_called_once_with('arg')
+        self.assertIs(record_queue, base_scenario._record_queue)
+        spans, clients_stats = profile_queue.get_nowait()
+        self.assertEqual(['worker'], [span['name'] for span in spans])
+        self.assertEqual({'auth', 'hit', 'miss'}, set(clients_stats))
+
+    @mock.patch.object(runner_base.cProfile, 'Profile')
+    def test__profiled_worker_cprofile(self, mock_profile):
+        profile_queue = moves.queue.Queue()
+        target = mock.Mock()
+        mock_profile.return_value.runcall.side_effect = ValueError
+
+        with self.assertRaises(ValueError):
+            runner_base._profiled_worker(target, profile_queue, '/tmp/prof',
+                                         None, 'arg')
+
+        mock_profile.return_value.runcall.assert_called_once_with(target,
+                                                                  'arg')
+        mock_profile.return_value.dump_stats.assert_called_once_with(
+            '/tmp/prof/{}.prof'.format(
+                runner_base.multiprocessing.current_process().name))
+        self.assertEqual(1, len(profile_queue.get_nowait()[0]))
+
+    @mock.patch.object(runner_base.openstack_utils, 'add_clients_stats')
+    def test_get_profile(self, mock_add_clients_stats):
+        clients_stats = {'auth': 0, 'hit': 2, 'miss': 1}
+        self.runner.profile_queue = moves.queue.Queue()
+        self.runner.profile_queue.put(([{'name': 'worker'}], clients_stats))
+
+        self.assertEqual([{'name': 'worker'}], self.runner.get_profile())
+        mock_add_clients_stats.assert_called_once_with(clients_stats)
+
+    @mock.patch.object(runner_base.utils, 'makedirs')
+    def test__profiled(self, mock_makedirs):
+        self.runner.task_id = 'task_id'
+        self.assertIsNone(self.runner._profiled(mock.Mock()).args[2])
+
+        self.runner.config['profile'] = True
+        profile_dir = self.runner._profiled(mock.Mock()).args[2]
+        self.assertTrue(profile_dir.endswith('task_id-profile'))
+        mock_makedirs.assert_called_once_with(profile_dir)
+
+    @mock.patch.object(runner_base.profiler, 'add_span')
+    def test__add_profile_span(self, mock_add_span):
+        self.runner._start_time = time.time()
+        self.runner._profile_spans = [{'name': 'worker'}]
+
+        self.runner._add_profile_span()
+        self.runner._add_profile_span()
+
+        mock_add_span.assert_called_once_with(
+            'runner', mock.ANY, mock.ANY, children=[{'name': 'worker'}],
+            runner='Iteration', scenario='')
+
 
 class RunnerProducerTestCase(ut_base.BaseUnitTestCase):
 
@@ -67,9 +67,13 @@ class DurationRunnerTest(unittest.TestCase):
                               {})
         mock_multiprocessing_process.assert_called_once_with(
             name='Duration-some_type-101',
-            target=duration._worker_process,
+            target=mock.ANY,
             args=(runner.result_queue, benchmark_cls, 'my_method',
                   self.scenario_cfg, {}, runner.aborted, runner.output_queue))
+        target = mock_multiprocessing_process.call_args[1]['target']
+        self.assertEqual((duration._worker_process, runner.profile_queue, None,
+                          runner.result_queue),
+                         target.args)
 
     @mock.patch.object(os, 'getpid')
     def test__worker_process_runner_id(self, mock_os_getpid):
@@ -313,3 +317,107 @@ class DurationRunnerTest(unittest.TestCase):
         self.assertEqual(raised.exception.code, 1)
         self._assert_defaults__worker_run_setup_and_teardown()
         self._assert_defaults__worker_run_one_iteration()
+
+    def _get_records(self, queue):
+        return sorted((args[0] for args, _ in queue.put.call_args_list),
+                      key=lambda record: record['sequence'])
+
+    def test__worker_process_fixed_rate(self):
+        self.scenario_cfg['runner'] = {'interval': 0.1, 'duration': 0.5,
+                                       'fixed_rate': True}
+        self.benchmark.my_method = self.MyMethod()
+        queue = mock.Mock()
+
+        duration._worker_process(queue, self.benchmark_cls, 'my_method',
+                                 self.scenario_cfg, {},
+                                 multiprocessing.Event(), mock.Mock())
+
+        self._assert_defaults__worker_run_setup_and_teardown()
+        self.benchmark.pre_run_wait_time.assert_not_called()
+        self.benchmark.post_run_wait_time.assert_not_called()
+        records = self._get_records(queue)
+        self.assertEqual([1, 2, 3, 4, 5],
+                         [record['sequence'] for record in records])
+        for index, record in enumerate(records):
+            self.assertAlmostEqual(
+                records[0]['scheduled_timestamp'] + index * 0.1,
+                record['scheduled_timestamp'])
+            self.assertGreaterEqual(record['actual_timestamp'],
+                                    record['scheduled_timestamp'] - 0.01)
+            self.assertEqual(0, record['missed_deadlines'])
+            self.assertEqual({'my_key': 102 + index}, record['data'])
+
+    def test__worker_process_fixed_rate_missed_deadlines(self):
+        self.scenario_cfg['runner'] = {'interval': 0.1, 'duration': 0.6,
+                                       'fixed_rate': True}
+        self.benchmark.my_method = mock.Mock(
+            side_effect=lambda data: time.sleep(0.25))
+        queue = mock.Mock()
+
+        duration._worker_process(queue, self.benchmark_cls, 'my_method',
+                                 self.scenario_cfg, {},
+                                 multiprocessing.Event(), mock.Mock())
+
+        records = self._get_records(queue)
+        # the runs do not delay the next deadlines, they are missed
+        self.assertLess(len(records), 6)
+        self.assertEqual(2, records[1]['missed_deadlines'])
+        self.assertAlmostEqual(
+            records[0]['scheduled_timestamp'] + 0.3,
+            records[1]['scheduled_timestamp'])
+
+    def test__worker_process_fixed_rate_overlap(self):
+        self.scenario_cfg['runner'] = {'interval': 0.1, 'duration': 0.6,
+                                       'fixed_rate': True, 'max_overlap': 4}
+        self.benchmark.my_method = mock.Mock(
+            side_effect=lambda data: time.sleep(0.25))
+        queue = mock.Mock()
+
+        duration._worker_process(queue, self.benchmark_cls, 'my_method',
+                                 self.scenario_cfg, {},
+                                 multiprocessing.Event(), mock.Mock())
+
+        records = self._get_records(queue)
+        self.assertEqual(6, len(records))
+        self.assertEqual(0, records[-1]['missed_deadlines'])
+
+    def test__worker_process_fixed_rate_min_interval(self):
+        self.scenario_cfg['runner'] = {'interval': 0.01, 'duration': 0.2,
+                                       'fixed_rate': True}
+        queue = mock.Mock()
+
+        duration._worker_process(queue, self.benchmark_cls, 'my_method',
+                                 self.scenario_cfg, {},
+                                 multiprocessing.Event(), mock.Mock())
+
+        self.assertEqual(2, self.benchmark.my_method.call_count)
+
+    def test__worker_process_fixed_rate_broad_exception(self):
+        self.scenario_cfg['runner'] = {'interval': 0.1, 'duration': 0.5,
+                                       'fixed_rate': True}
+        self.benchmark.my_method = mock.Mock(
+            side_effect=y_exc.YardstickException)
+        queue = mock.Mock()
+
+        duration._worker_process(queue, self.benchmark_cls, 'my_method',
+                                 self.scenario_cfg, {},
+                                 multiprocessing.Event(), mock.Mock())
+
+        self._assert_defaults__worker_run_setup_and_teardown()
+        self.benchmark.my_method.assert_called_once_with({})
+        self.assertNotEqual('', self._get_records(queue)[0]['errors'])
+
+    def test__worker_process_fixed_rate_sla_validation_error_assert(self):
+        self.scenario_cfg['runner'] = {'interval': 0.1, 'duration': 0.5,
+                                       'fixed_rate': True}
+        self.scenario_cfg['sla'] = {'action': 'assert'}
+        self.benchmark.my_method = mock.Mock(
+            side_effect=y_exc.SLAValidationError)
+
+        with self.assertRaises(y_exc.SLAValidationError):
+            duration._worker_process(mock.Mock(), self.benchmark_cls,
+                                     'my_method', self.scenario_cfg, {},
+                                     multiprocessing.Event(), mock.Mock())
+
+        self._assert_defaults__worker_run_setup_and_teardown()
+        self.benchmark.my_method.assert_called_once_with({})
@@ -0,0 +1,117 @@
+##############################################################################
+# Copyright (c) 2018 Intel Corporation
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+import unittest
+
+from yardstick.benchmark.runners import dynamictp
+
+
+class FakeTrial(object):
+    """Trial passing up to "max_pps", the sender tops at "line_rate" pps"""
+
+    def __init__(self, max_pps, line_rate=10000000):
+        self.max_pps = max_pps
+        self.line_rate = line_rate
+        self.rates = []
+
+    def __call__(self, rate):
+        self.rates.append(rate)
+        actual = min(rate, self.line_rate)
+        data = {'packets_per_second': actual,
+                'ppm': 0 if actual <= self.max_pps else 100}
+        return actual, actual <= self.max_pps, data, ''
+
+
+class RateSearchTestCase(unittest.TestCase):
+
+    def test_search_bisection(self):
+        trial = FakeTrial(1234567)
+        rate_search = dynamictp.RateSearch(trial, 1000000, delta=1000,
+                                           max_sequences=50)
+        steps = []
+
+        data, errors = rate_search.search(steps)
+
+        self.assertEqual('', errors)
+        self.assertLessEqual(data['packets_per_second'], 1234567)
+        self.assertGreater(data['packets_per_second'], 1234567 - 1000)
+        self.assertEqual([1000000, 1500000], trial.rates[:2])
+        self.assertEqual(len(trial.rates), len(steps))
+        for key in ('sequence', 'pps', 'actual_pps', 'ppm', 'sla_pass',
+                    'reused', 'time'):
+            self.assertIn(key, steps[0])
+
+    def test_search_resolution(self):
+        rate_search = dynamictp.RateSearch(FakeTrial(1234567), 1000000,
+                                           delta=1, resolution=0.01,
+                                           max_sequences=50)
+        steps = []
+
+        data, _ = rate_search.search(steps)
+
+        self.assertGreater(data['packets_per_second'], 1234567 * 0.99)
+        self.assertLess(len(steps), 15)
+
+    def test_search_sender_limited(self):
+        trial = FakeTrial(5000000, line_rate=1200000)
+        rate_search = dynamictp.RateSearch(trial, 1000000, max_sequences=50)
+        steps = []
+
+        data, _ = rate_search.search(steps)
+
+        self.assertEqual(1200000, data['packets_per_second'])
+        self.assertEqual([1000000, 1500000, 1800000], trial.rates)
+
+    def test_search_max_sequences(self):
+        rate_search = dynamictp.RateSearch(FakeTrial(1234567), 1000000,
+                                           delta=1, max_sequences=4)
+        steps = []
+
+        rate_search.search(steps)
+
+        self.assertEqual(4, len(steps))
+
+    def test_search_reuse_between_iterations(self):
+        trial = FakeTrial(1234567)
+        rate_search = dynamictp.RateSearch(trial, 1000000, delta=1000,
+                                           max_sequences=50)
+        first_data, _ = rate_search.search([])
+        num_trials = len(trial.rates)
+        steps = []
+
+        data, _ = rate_search.search(steps)
+
+        self.assertEqual(first_data, data)
+        self.assertEqual(num_trials, len(trial.rates))
+        self.assertEqual([], steps)
+
+    def test_search_no_reuse(self):
+        trial = FakeTrial(1234567)
+        rate_search = dynamictp.RateSearch(trial, 1000000, delta=1000,
+                                           max_sequences=50, reuse=False)
+        rate_search.search([])
+        num_trials = len(trial.rates)
+
+        rate_search.search([])
+
+        self.assertEqual(2 * num_trials, len(trial.rates))
+
+    def test_search_errors(self):
+        def trial(_):
+            return 0, True, {}, 'error'
+
+        rate_search = dynamictp.RateSearch(trial, 1000000)
+        steps = []
+
+        data, errors = rate_search.search(steps)
+
+        self.assertEqual({}, data)
+        self.assertEqual('error', errors)
+        self.assertEqual(1, len(steps))
+        self.assertEqual({}, rate_search.memo)
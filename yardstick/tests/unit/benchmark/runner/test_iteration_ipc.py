@@ -18,8 +18,10 @@ import os
 import uuid
 
 import mock
+from six import moves
 
 from yardstick.benchmark.runners import iteration_ipc
+from yardstick.common import exceptions
 from yardstick.common import messaging
 from yardstick.common.messaging import payloads
 from yardstick.tests.unit import base as ut_base
@@ -113,6 +115,33 @@ class RunnerIterationIPCConsumerTestCase(ut_base.BaseUnitTestCase):
         self.consumer._queue.get.return_value = msg2
         self.assertTrue(self.consumer.is_all_kpis_received_in_iteration())
 
+    def test_wait_all_kpis_received_in_iteration(self):
+        payload = payloads.TrafficGeneratorPayload(
+            version=1, iteration=1, kpi={'rx': 1})
+        self.consumer._queue = moves.queue.Queue()
+        self.consumer._queue.put({'action': messaging.TG_METHOD_STARTED,
+                                  'id': self._ctx_ids[0], 'payload': payload})
+        for ctx_id in self._ctx_ids:
+            self.consumer._queue.put({'action': messaging.TG_METHOD_ITERATION,
+                                      'id': ctx_id, 'payload': payload})
+        self.consumer.iteration_index = 1
+
+        self.consumer.wait_all_kpis_received_in_iteration(1)
+        self.assertEqual({ctx_id: [{'rx': 1}] for ctx_id in self._ctx_ids},
+                         self.consumer._kpi_per_id)
+
+    def test_wait_all_kpis_received_in_iteration_timeout(self):
+        payload = payloads.TrafficGeneratorPayload(
+            version=1, iteration=1, kpi={})
+        self.consumer._queue = moves.queue.Queue()
+        self.consumer._queue.put({'action': messaging.TG_METHOD_ITERATION,
+                                  'id': self._ctx_ids[0], 'payload': payload})
+        self.consumer.iteration_index = 1
+
+        with self.assertRaises(exceptions.WaitTimeout):
+            self.consumer.wait_all_kpis_received_in_iteration(0.1)
+        self.assertEqual([{}], self.consumer._kpi_per_id[self._ctx_ids[0]])
+
 
 class IterationIPCRunnerTestCase(ut_base.BaseUnitTestCase):
 
@@ -124,13 +153,17 @@ class IterationIPCRunnerTestCase(ut_base.BaseUnitTestCase):
         scenario_cfg = {'type': 'scenario_type'}
         context_cfg = 'context_cfg'
         name = '%s-%s-%s' % ('IterationIPC', 'scenario_type', 12345678)
-        runner = iteration_ipc.IterationIPCRunner(mock.ANY)
+        runner = iteration_ipc.IterationIPCRunner({})
         mock_getpid.reset_mock()
 
         runner._run_benchmark('class', method, scenario_cfg, context_cfg)
         mock_process.assert_called_once_with(
             name=name,
-            target=mock_worker,
+            target=mock.ANY,
             args=(runner.result_queue, 'class', method, scenario_cfg,
                   context_cfg, runner.aborted, runner.output_queue))
+        target = mock_process.call_args[1]['target']
+        self.assertEqual((mock_worker, runner.profile_queue, None,
+                          runner.result_queue),
+                         target.args)
         mock_getpid.assert_called_once()
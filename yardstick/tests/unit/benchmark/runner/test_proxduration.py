@@ -68,9 +68,13 @@ class ProxDurationRunnerTest(unittest.TestCase):
                               {})
         mock_multiprocessing_process.assert_called_once_with(
             name='ProxDuration-some_type-101',
-            target=proxduration._worker_process,
+            target=mock.ANY,
             args=(runner.result_queue, benchmark_cls, 'my_method',
                   self.scenario_cfg, {}, runner.aborted, runner.output_queue))
+        target = mock_multiprocessing_process.call_args[1]['target']
+        self.assertEqual((proxduration._worker_process, runner.profile_queue, None,
+                          runner.result_queue),
+                         target.args)
 
     @mock.patch.object(os, 'getpid')
     def test__worker_process_runner_id(self, mock_os_getpid):
@@ -15,6 +15,8 @@ import unittest
 import os
 
 from yardstick.benchmark.scenarios.compute import cpuload
+from yardstick.benchmark.scenarios.compute import metrics_agent
+from yardstick.common import exceptions
 
 
 @mock.patch('yardstick.benchmark.scenarios.compute.cpuload.ssh')
@@ -254,6 +256,71 @@ class CPULoadTestCase(unittest.TestCase):
 
         self.assertDictEqual(self.result, expected_result)
 
+    @staticmethod
+    def _agent_sample(timestamp, jiffies):
+        return (timestamp,
+                {metrics_agent.SECTION_CPU: [[-1] + jiffies, [0] + jiffies],
+                 metrics_agent.SECTION_LOADAVG: [[150, 145, 151, 3, 813,
+                                                  14322]]})
+
+    @mock.patch.object(cpuload.metrics_agent_client, 'MetricsAgent')
+    def test_setup_agent(self, mock_agent, mock_ssh):
+        args = {'options': {"interval": 2}}
+        l = cpuload.CPULoad(args, self.ctx)
+        mock_ssh.SSH.from_node().execute.return_value = (1, '', '')
+
+        l.setup()
+        mock_agent.assert_called_once_with(l.client, interval=2)
+        mock_agent.return_value.start.assert_called_once()
+        self.assertEqual(mock_agent.return_value, l.agent)
+
+        l.teardown()
+        mock_agent.return_value.stop.assert_called_once()
+        self.assertIsNone(l.agent)
+
+    @mock.patch.object(cpuload.metrics_agent_client, 'MetricsAgent')
+    def test_setup_agent_failure(self, mock_agent, mock_ssh):
+        args = {'options': {"interval": 1}}
+        l = cpuload.CPULoad(args, self.ctx)
+        mock_ssh.SSH.from_node().execute.return_value = (1, '', '')
+        mock_agent.return_value.start.side_effect = \
+            exceptions.MetricsAgentError(host='host', error_msg='error')
+
+        l.setup()
+        mock_agent.return_value.stop.assert_called_once()
+        self.assertIsNone(l.agent)
+
+    def test_get_loadavg_agent(self, *args):
+        l = cpuload.CPULoad({'options': {}}, self.ctx)
+        l.agent = mock.Mock()
+        l.agent.get_samples.return_value = [self._agent_sample(1.0,
+                                                               [0] * 10)]
+
+        self.assertEqual(
+            {'loadavg': ['1.50', '1.45', '1.51', '3/813', '14322']},
+            l._get_loadavg())
+
+    def test_get_cpu_usage_agent(self, *args):
+        l = cpuload.CPULoad({'options': {}}, self.ctx)
+        l.interval = 1
+        l.agent = mock.Mock()
+        l.agent.get_samples.return_value = [
+            self._agent_sample(1.0, [100, 0, 100, 700, 100, 0, 0, 0, 0, 0]),
+            self._agent_sample(2.0, [150, 0, 150, 800, 100, 0, 0, 0, 50, 0])]
+
+        result = l._get_cpu_usage()
+        l.agent.get_samples.assert_called_once_with(2, newer_than=None)
+        self.assertEqual(1.0, l._cpu_timestamp)
+        expected = {'%usr': '0.00', '%nice': '0.00', '%sys': '25.00',
+                    '%idle': '50.00', '%iowait': '0.00', '%irq': '0.00',
+                    '%soft': '0.00', '%steal': '0.00', '%guest': '25.00',
+                    '%gnice': '0.00'}
+        self.assertEqual({'mpstat': {'cpu': expected, 'cpu0': expected}},
+                         result)
+
+        l._get_cpu_usage()
+        l.agent.get_samples.assert_called_with(2, newer_than=1.0)
+
     def _read_file(self, filename):
         curr_path = os.path.dirname(os.path.abspath(__file__))
         output = os.path.join(curr_path, filename)
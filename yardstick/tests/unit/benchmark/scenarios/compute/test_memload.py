@@ -15,6 +15,7 @@ import unittest
 import os
 
 from yardstick.benchmark.scenarios.compute import memload
+from yardstick.benchmark.scenarios.compute import metrics_agent
 
 
 @mock.patch('yardstick.benchmark.scenarios.compute.memload.ssh')
@@ -101,6 +102,40 @@ class MEMLoadTestCase(unittest.TestCase):
 
         self.assertEqual(result, expected_result)
 
+    @mock.patch.object(memload.metrics_agent_client, 'MetricsAgent')
+    def test_setup_agent(self, mock_agent, *args):
+        m = memload.MEMLoad({'options': {'interval': 2, 'count': 40}},
+                            self.ctx)
+
+        m.setup()
+        mock_agent.assert_called_once_with(m.client, interval=2, depth=80)
+        self.assertEqual(mock_agent.return_value, m.agent)
+
+        m.teardown()
+        mock_agent.return_value.stop.assert_called_once()
+
+    def test_get_mem_usage_agent(self, *args):
+        m = memload.MEMLoad({'options': {'count': 2}}, self.ctx)
+        m.agent = mock.Mock()
+        # MemTotal, MemFree, MemAvailable, Buffers, Cached, SReclaimable,
+        # Shmem
+        m.agent.get_samples.return_value = [
+            (1.0, {metrics_agent.SECTION_MEMINFO: [[1000, 500, 700, 50, 100,
+                                                    50, 10]]}),
+            (2.0, {metrics_agent.SECTION_MEMINFO: [[1000, 300, 500, 50, 100,
+                                                    50, 30]]})]
+
+        result = m._get_mem_usage()
+        m.agent.get_samples.assert_called_once_with(2, newer_than=None)
+        self.assertEqual(2.0, m._mem_timestamp)
+        self.assertEqual({'total': '1000', 'used': '300', 'free': '500',
+                          'shared': '10', 'buff/cache': '200',
+                          'available': '700'}, result['free']['memory0'])
+        self.assertEqual({'total': 1000, 'used': 400, 'free': 400,
+                          'shared': 20, 'buff/cache': 200},
+                         result['average'])
+        self.assertEqual(500, result['max']['used'])
+
     def _read_file(self, filename):
         curr_path = os.path.dirname(os.path.abspath(__file__))
         output = os.path.join(curr_path, filename)
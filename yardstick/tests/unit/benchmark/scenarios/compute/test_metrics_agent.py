@@ -0,0 +1,129 @@
+##############################################################################
+# Copyright (c) 2018 Intel Corporation
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+import mock
+import unittest
+
+from yardstick.benchmark.scenarios.compute import metrics_agent
+from yardstick.benchmark.scenarios.compute import metrics_agent_client
+from yardstick.common import exceptions
+
+
+SECTIONS = [(metrics_agent.SECTION_CPU, [[-1] + list(range(10)),
+                                         [0] + list(range(10, 20))]),
+            (metrics_agent.SECTION_LOADAVG, [[150, 145, 151, 3, 813, 14322]])]
+
+
+def _sample(timestamp):
+    return timestamp, dict(SECTIONS)
+
+
+class MetricsAgentTestCase(unittest.TestCase):
+
+    def test_encode_decode(self):
+        frames = (metrics_agent.encode_sample(1.5, SECTIONS) +
+                  metrics_agent.encode_sample(2.5, SECTIONS))
+
+        samples, consumed = metrics_agent.decode_frames(frames)
+
+        self.assertEqual([_sample(1.5), _sample(2.5)], samples)
+        self.assertEqual(len(frames), consumed)
+
+    def test_decode_partial_frame(self):
+        frame = metrics_agent.encode_sample(1.5, SECTIONS)
+
+        for size in (5, metrics_agent.FRAME_HEADER.size + 2, len(frame) - 1):
+            self.assertEqual(([], 0),
+                             metrics_agent.decode_frames(frame[:size]))
+
+        samples, consumed = metrics_agent.decode_frames(frame + frame[:10])
+        self.assertEqual([_sample(1.5)], samples)
+        self.assertEqual(len(frame), consumed)
+
+    def test_decode_invalid_frame(self):
+        frame = metrics_agent.encode_sample(1.5, SECTIONS)
+        with self.assertRaises(ValueError):
+            metrics_agent.decode_frames(b'XX' + frame[2:])
+
+    def test_read_loadavg(self):
+        with mock.patch.object(metrics_agent, 'open', create=True,
+                               new=mock.mock_open(
+                                   read_data='1.50 1.45 1.51 3/813 14322\n')):
+            self.assertEqual([[150, 145, 151, 3, 813, 14322]],
+                             metrics_agent.read_loadavg())
+
+    def test_read_cpu(self):
+        data = ('cpu  1 2 3 4 5 6 7 8 9 10\n'
+                'cpu0 1 2 3 4 5 6 7 8\n'
+                'intr 42\n')
+        with mock.patch.object(metrics_agent, 'open', create=True,
+                               new=mock.mock_open(read_data=data)):
+            self.assertEqual([[-1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
+                              [0, 1, 2, 3, 4, 5, 6, 7, 8, 0, 0]],
+                             metrics_agent.read_cpu())
+
+
+class MetricsAgentClientTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.client = mock.Mock(host='10.0.0.1')
+        self.agent = metrics_agent_client.MetricsAgent(self.client,
+                                                       interval=0.01,
+                                                       depth=3)
+
+    def test_frame_reader(self):
+        samples = []
+        reader = metrics_agent_client.FrameReader(samples.append)
+        frame = metrics_agent.encode_sample(1.5, SECTIONS)
+
+        reader.write(frame[:10])
+        self.assertEqual([], samples)
+        reader.write(frame[10:] + frame[:3])
+        self.assertEqual([_sample(1.5)], samples)
+
+    def _run(self, cmd, stdout, **kwargs):  # pylint: disable=unused-argument
+        for timestamp in range(1, 5):
+            stdout.write(metrics_agent.encode_sample(timestamp, SECTIONS))
+        return 0
+
+    def test_start_stop(self):
+        self.client.run.side_effect = self._run
+        self.agent.start()
+
+        self.client._put_file_shell.assert_called_once_with(
+            mock.ANY, self.agent.script)
+        self.assertIn('--interval 0.01 --depth 3 --pidfile ' +
+                      self.agent.pidfile,
+                      self.client.run.call_args[0][0])
+        # ring buffer of depth 3
+        self.assertEqual([_sample(2), _sample(3), _sample(4)],
+                         self.agent.get_samples(3))
+
+        self.agent.stop()
+        self.assertIn(self.agent.pidfile,
+                      self.client.execute.call_args[0][0])
+        self.assertFalse(self.agent.running)
+
+    def test_start_failure(self):
+        self.client.run.return_value = 127
+        with self.assertRaises(exceptions.MetricsAgentError):
+            self.agent.start()
+
+    def test_get_samples_newer_than(self):
+        self.client.run.side_effect = self._run
+        self.agent.start()
+
+        self.assertEqual([_sample(3), _sample(4)],
+                         self.agent.get_samples(2, newer_than=2))
+        with self.assertRaises(exceptions.MetricsAgentError):
+            self.agent.get_samples(2, newer_than=3, timeout=0.01)
+
+    def test_get_samples_depth(self):
+        with self.assertRaises(exceptions.MetricsAgentError):
+            self.agent.get_samples(4)
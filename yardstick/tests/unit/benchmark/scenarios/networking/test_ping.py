@@ -91,3 +91,42 @@ class PingTestCase(unittest.TestCase):
 
         mock_ssh.SSH.from_node().execute.return_value = (1, '', 'FOOBAR')
         self.assertRaises(RuntimeError, p.run, result)
+
+    @mock.patch('yardstick.benchmark.scenarios.networking.ping.ssh')
+    def test_ping_parallel(self, mock_ssh):
+
+        args = {
+            'options': {'packetsize': 200},
+            'sla': {'max_rtt': 50},
+            'targets': ['ares.demo', {'name': 'athena'}, 'zeus.demo']
+        }
+        self.ctx['target']['ipaddr'] = '10.0.0.1, 10.0.0.2, 10.0.0.3'
+        result = {}
+
+        p = ping.Ping(args, self.ctx)
+
+        mock_ssh.SSH.from_node().execute.return_value = (
+            0, '10.0.0.2 20\n10.0.0.1 10\n10.0.0.3 \n', '')
+        # the packet sent to zeus is lost
+        self.assertRaises(y_exc.SLAValidationError, p.run, result)
+        self.assertEqual(result, {'rtt.ares': 10.0, 'rtt.athena': 20.0,
+                                  'rtt.zeus': float(ping.Ping.PING_ERROR_RTT)})
+        mock_ssh.SSH.from_node().execute.assert_called_once_with(
+            "/bin/sh -s '-s 200' 10.0.0.1 10.0.0.2 10.0.0.3", stdin=mock.ANY)
+
+    @mock.patch('yardstick.benchmark.scenarios.networking.ping.ssh')
+    def test_ping_parallel_disabled(self, mock_ssh):
+
+        args = {
+            'options': {'packetsize': 200, 'parallel': False},
+            'targets': ['ares.demo', 'athena.demo']
+        }
+        self.ctx['target']['ipaddr'] = '10.0.0.1,10.0.0.2'
+        result = {}
+
+        p = ping.Ping(args, self.ctx)
+
+        mock_ssh.SSH.from_node().execute.return_value = (0, '100', '')
+        p.run(result)
+        self.assertEqual(result, {'rtt.ares': 100.0, 'rtt.athena': 100.0})
+        self.assertEqual(2, mock_ssh.SSH.from_node().execute.call_count)
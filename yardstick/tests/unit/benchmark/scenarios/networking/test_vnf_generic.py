@@ -443,6 +443,27 @@ class TestNetworkServiceTestCase(unittest.TestCase):
         self.assertIn('No implementation', exc_str)
         self.assertIn('found in', exc_str)
 
+    def test_get_vnf_impl_cached(self):
+        vnf_impl = mock.Mock()
+        with mock.patch.dict(self.s._vnf_impls, {'FakeVNF': vnf_impl}), \
+                mock.patch.object(utils, 'import_modules_from_package') \
+                as mock_import:
+            self.assertEqual(vnf_impl, self.s.get_vnf_impl('FakeVNF'))
+        mock_import.assert_not_called()
+
+    def test_load_vnf_models_shared_model(self):
+        model_file = self._get_file_abspath("tg_trex_tpl.yaml")
+        self.context_cfg["nodes"]['tg__1']['VNF model'] = model_file
+        self.context_cfg["nodes"]['vnf__1']['VNF model'] = model_file
+        self.s.get_vnf_impl = mock.Mock(return_value=mock.Mock())
+
+        with mock.patch.object(utils, 'open_relative_file',
+                               wraps=utils.open_relative_file) as mock_open:
+            vnfs = self.s.load_vnf_models(self.scenario_cfg, self.context_cfg)
+
+        self.assertEqual(2, len(vnfs))
+        mock_open.assert_called_once_with(model_file, "")
+
     def test_load_vnf_models_invalid(self):
         self.context_cfg["nodes"]['tg__1']['VNF model'] = \
             self._get_file_abspath("tg_trex_tpl.yaml")
@@ -553,6 +574,28 @@ class TestNetworkServiceTestCase(unittest.TestCase):
         self.s.run(result)
         self.assertDictEqual(result, {tgen.name: verified_dict})
 
+    def test_run_steady_state_samples(self):
+        samples = [{'timestamp': 1.0, 'rate': 50.0},
+                   {'timestamp': 2.0, 'rate': 60.0}]
+        self.s.collector = mock.Mock(autospec=Collector)
+        self.s.collector.get_kpi.return_value = {
+            'tgen__1': {'collect_stats': {}, 'steady_state': samples},
+            'vnf__1': {'collect_stats': {}}}
+        result = {}
+        with mock.patch.object(self.s, 'emit_record',
+                               side_effect=[True, False]) as mock_emit:
+            self.s.run(result)
+
+        mock_emit.assert_has_calls([
+            mock.call({'tgen__1': {'steady_state': samples[0]}},
+                      timestamp=1.0),
+            mock.call({'tgen__1': {'steady_state': samples[1]}},
+                      timestamp=2.0)])
+        # the samples not sent are kept in the result
+        self.assertEqual({
+            'tgen__1': {'collect_stats': {}, 'steady_state': [samples[1]]},
+            'vnf__1': {'collect_stats': {}}}, result)
+
     def test_setup(self):
         with mock.patch("yardstick.ssh.SSH") as ssh:
             ssh_mock = mock.Mock(autospec=ssh.SSH)
@@ -610,6 +653,18 @@ class TestNetworkServiceTestCase(unittest.TestCase):
             with self.assertRaises(RuntimeError):
                 self.s.setup()
 
+    @mock.patch.object(vnf_generic.host_topology, 'prefetch')
+    def test__probe_hosts(self, mock_prefetch):
+        bind_helper = vnf_generic.DpdkBindHelper(mock.Mock())
+        dpdk_vnf = mock.Mock()
+        dpdk_vnf.setup_helper.dpdk_bind_helper = bind_helper
+        self.s.vnfs = [dpdk_vnf, mock.Mock(spec=[])]
+
+        self.s._probe_hosts()
+
+        mock_prefetch.assert_called_once_with(
+            [(bind_helper.ssh_helper, bind_helper.dpdk_devbind)])
+
     def test__get_traffic_profile(self):
         self.scenario_cfg["traffic_profile"] = \
             self._get_file_abspath("ipv4_throughput_vpe.yaml")
@@ -669,6 +724,16 @@ class TestNetworkServiceTestCase(unittest.TestCase):
         )
         self.assertEqual(self.s.topology, 'fake_nsd')
 
+    def test__render_topology_scale_out(self):
+        self.s.scenario_cfg['topology'] = {
+            'num_vnfs': 3, 'vnf_model': '../../vnf_descriptors/acl_vnf.yaml'}
+        with mock.patch.object(self.s, '_get_topology') as mock_get_topology:
+            self.s._render_topology()
+
+        mock_get_topology.assert_not_called()
+        self.assertEqual('3-vnf-correlated', self.s.topology['id'])
+        self.assertEqual(6, len(self.s.topology['vld']))
+
     def test_get_mq_ids(self):
         self.assertEqual(self.s._mq_ids, self.s.get_mq_ids())
 
@@ -21,6 +21,18 @@ from yardstick.benchmark.scenarios.storage import fio
 from yardstick.common import exceptions as y_exc
 
 
+def _status_report(elapsed, kbytes, ios, lat_ns, clat_99_ns):
+    return {'jobs': [{'elapsed': elapsed, 'read': {
+        'io_kbytes': kbytes, 'total_ios': ios, 'runtime': elapsed * 1000,
+        'bw': kbytes // elapsed, 'iops': ios // elapsed,
+        'lat_ns': {'mean': lat_ns},
+        'clat_ns': {'percentile': {'99.000000': clat_99_ns}}}}]}
+
+
+STATUS_REPORTS = [_status_report(1, 1000, 250, 100000, 200000),
+                  _status_report(2, 3000, 750, 150000, 300000)]
+
+
 @mock.patch('yardstick.benchmark.scenarios.storage.fio.ssh')
 class FioTestCase(unittest.TestCase):
 
@@ -272,6 +284,65 @@ class FioTestCase(unittest.TestCase):
         mock_ssh.SSH.from_node().execute.return_value = (1, '', 'FOOBAR')
         self.assertRaises(RuntimeError, p.run, result)
 
+    def _run_streaming(self, cmd, stdout, **kwargs):
+        # pylint: disable=unused-argument
+        reports = ''.join(jsonutils.dumps(report, indent=4) + '\n'
+                          for report in STATUS_REPORTS)
+        stdout.write('note: both iodepth >= 1 and synchronous I/O engine\n')
+        stdout.write(reports[:100])
+        stdout.write(reports[100:])
+        return 0
+
+    def test_fio_successful_streaming(self, mock_ssh):
+        options = {
+            'filename': '/home/ubuntu/data.raw',
+            'rw': 'read',
+            'status_interval': 1,
+            'percentiles': True
+        }
+        p = fio.Fio({'options': options}, self.ctx)
+        p.client = mock_ssh.SSH.from_node()
+        p.client.run.side_effect = self._run_streaming
+        result = {}
+
+        with mock.patch.object(p, 'emit_record') as mock_emit_record:
+            p.run(result)
+
+        self.assertTrue(p.client.run.call_args[0][0].endswith(
+            ' --status-interval=1'))
+        mock_emit_record.assert_has_calls([
+            mock.call({'elapsed': 1, 'read_bw': 1000.0, 'read_iops': 250.0,
+                       'read_lat': 100.0,
+                       'read_clat_percentiles': {'99': 200.0}}),
+            mock.call({'elapsed': 2, 'read_bw': 2000.0, 'read_iops': 500.0,
+                       'read_lat': 175.0,
+                       'read_clat_percentiles': {'99': 300.0}})])
+        self.assertEqual({'read_bw': 1500, 'read_iops': 375, 'read_lat': 150.0,
+                          'read_clat_percentiles': {'99': 300.0}}, result)
+
+    def test_fio_unsuccessful_streaming(self, mock_ssh):
+        options = {'rw': 'read', 'status_interval': 1}
+        p = fio.Fio({'options': options}, self.ctx)
+        p.client = mock_ssh.SSH.from_node()
+
+        p.client.run.return_value = 1
+        self.assertRaises(RuntimeError, p.run, {})
+
+        # no report received
+        p.client.run.return_value = 0
+        self.assertRaises(RuntimeError, p.run, {})
+
+    def test_interval_stats_fio2(self, mock_ssh):
+        # pylint: disable=unused-argument
+        stats = jsonutils.loads(self._read_sample_output(
+            self.sample_output['read']))['jobs'][0]['read']
+
+        interval = fio.Fio._interval_stats('read', None, stats)
+
+        self.assertAlmostEqual(stats['bw'], interval['read_bw'], delta=1)
+        self.assertAlmostEqual(stats['iops'], interval['read_iops'], delta=1)
+        self.assertAlmostEqual(stats['lat']['mean'], interval['read_lat'])
+
     def _read_sample_output(self, file_name):
         curr_path = os.path.dirname(os.path.abspath(__file__))
         output = os.path.join(curr_path, file_name)
@@ -16,6 +16,7 @@
 import time
 
 import mock
+from six import moves
 
 from yardstick.benchmark.scenarios import base
 from yardstick.tests.unit import base as ut_base
@@ -115,6 +116,27 @@ class ScenarioTestCase(ut_base.BaseUnitTestCase):
         test_scenario.post_run_wait_time(100)
         mock_sleep.assert_called_once_with(100)
 
+    def test_emit_record(self):
+        record_queue = moves.queue.Queue()
+        base.set_record_queue(record_queue)
+        self.addCleanup(base.set_record_queue, None)
+
+        self.assertTrue(_TestScenario().emit_record({'bw': 10}, timestamp=5))
+        self.assertEqual({'timestamp': 5, 'sequence': None,
+                          'data': {'bw': 10}, 'errors': ''},
+                         record_queue.get_nowait())
+
+    def test_emit_record_no_queue(self):
+        self.assertFalse(_TestScenario().emit_record({'bw': 10}))
+
+    def test_emit_record_queue_full(self):
+        record_queue = mock.Mock()
+        record_queue.put.side_effect = moves.queue.Full
+        base.set_record_queue(record_queue)
+        self.addCleanup(base.set_record_queue, None)
+
+        self.assertFalse(_TestScenario().emit_record({'bw': 10}))
+
 
 class IterScenarioClassesTestCase(ut_base.BaseUnitTestCase):
 
@@ -18,6 +18,7 @@ import oslo_messaging
 
 from yardstick.common import messaging
 from yardstick.common.messaging import consumer
+from yardstick.common.messaging import unix
 from yardstick.tests.unit import base as ut_base
 
 
@@ -52,3 +53,15 @@ class MessagingConsumerTestCase(ut_base.BaseUnitTestCase):
                 'test_rpc_transport', 'test_Target', [TestEndPoint],
                 executor=messaging.RPC_SERVER_EXECUTOR,
                 access_policy=oslo_messaging.DefaultRPCAccessPolicy)
+
+    @mock.patch.object(unix, 'UnixSocketServer')
+    @mock.patch.object(oslo_messaging, 'get_rpc_transport')
+    def test__init_unix(self, mock_get_rpc_transport, mock_server):
+        msg_consumer = _MessagingConsumer(
+            'test_topic', 'test_pid', [TestEndPoint],
+            transport=messaging.TRANSPORT_UNIX)
+
+        mock_get_rpc_transport.assert_not_called()
+        mock_server.assert_called_once_with('test_topic', [TestEndPoint])
+        msg_consumer.start_rpc_server()
+        mock_server.return_value.start.assert_called_once()
@@ -18,6 +18,7 @@ import oslo_messaging
 
 from yardstick.common import messaging
 from yardstick.common.messaging import producer
+from yardstick.common.messaging import unix
 from yardstick.tests.unit import base as ut_base
 
 
@@ -51,3 +52,13 @@ class MessagingProducerTestCase(ut_base.BaseUnitTestCase):
                 mock.patch.object(oslo_messaging, 'Target'):
             msg_producer = _MessagingProducer('topic', 'id_to_check')
         self.assertEqual('id_to_check', msg_producer.id)
+
+    @mock.patch.object(unix, 'UnixSocketClient')
+    @mock.patch.object(oslo_messaging, 'get_rpc_transport')
+    def test__init_unix(self, mock_get_rpc_transport, mock_client):
+        msg_producer = _MessagingProducer(
+            'test_topic', 'test_pid', transport=messaging.TRANSPORT_UNIX)
+
+        mock_get_rpc_transport.assert_not_called()
+        mock_client.assert_called_once_with('test_topic')
+        self.assertEqual(mock_client.return_value, msg_producer._notifier)
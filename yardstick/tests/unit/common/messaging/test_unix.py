@@ -0,0 +1,111 @@
+# Copyright (c) 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import threading
+
+import mock
+
+from yardstick.common.messaging import unix
+from yardstick.tests.unit import base as ut_base
+
+
+class _Endpoint(object):
+
+    def __init__(self):
+        self.calls = []
+        self.called = threading.Event()
+
+    def info(self, ctxt, **kwargs):
+        self.calls.append((ctxt, kwargs))
+        self.called.set()
+
+    def _private(self, ctxt, **kwargs):
+        self.info(ctxt, **kwargs)
+
+
+class UnixSocketTestCase(ut_base.BaseUnitTestCase):
+
+    def setUp(self):
+        self.socket_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.socket_dir)
+        self.endpoint = _Endpoint()
+        self.server = unix.UnixSocketServer('topic', [self.endpoint],
+                                            socket_dir=self.socket_dir)
+        self.addCleanup(self.server.wait)
+        self.addCleanup(self.server.stop)
+        self.client = unix.UnixSocketClient('topic',
+                                            socket_dir=self.socket_dir)
+
+    def test_cast(self):
+        self.server.start()
+        self.client.cast({'id': 10}, 'info', data='message')
+
+        self.assertTrue(self.endpoint.called.wait(5))
+        self.assertEqual([({'id': 10}, {'data': 'message'})],
+                         self.endpoint.calls)
+
+    def test_cast_fanout(self):
+        endpoint = _Endpoint()
+        server = unix.UnixSocketServer('topic', [endpoint],
+                                       socket_dir=self.socket_dir)
+        self.server.start()
+        server.start()
+        self.client.cast({'id': 10}, 'info')
+        server.stop()
+        server.wait()
+
+        self.assertTrue(self.endpoint.called.wait(5))
+        self.assertTrue(endpoint.called.is_set())
+
+    def test_cast_no_consumer(self):
+        self.client.cast({'id': 10}, 'info')
+
+    def test_cast_stale_socket(self):
+        self.server.start()
+        path = self.server.path
+        self.server.stop()
+        self.server.wait()
+        # a consumer killed without removing its socket
+        with mock.patch.object(unix.utils, 'remove_file'):
+            server = unix.UnixSocketServer('topic', [],
+                                           socket_dir=self.socket_dir)
+            server.start()
+            path = server.path
+            server.stop()
+            server.wait()
+        self.assertTrue(os.path.exists(path))
+
+        self.client.cast({'id': 10}, 'info')
+        self.assertFalse(os.path.exists(path))
+
+    def test_private_method(self):
+        self.server.start()
+        self.client.cast({'id': 10}, '_private')
+        self.client.cast({'id': 11}, 'unknown')
+        self.client.cast({'id': 12}, 'info')
+
+        self.assertTrue(self.endpoint.called.wait(5))
+        self.assertEqual([({'id': 12}, {})], self.endpoint.calls)
+
+    def test_stop(self):
+        self.server.start()
+        path = self.server.path
+        self.assertTrue(os.path.exists(path))
+
+        self.server.stop()
+        self.server.wait()
+        self.assertFalse(os.path.exists(path))
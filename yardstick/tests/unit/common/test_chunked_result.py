@@ -0,0 +1,194 @@
+##############################################################################
+# Copyright (c) 2018 Intel Corporation
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+from oslo_serialization import jsonutils
+
+from yardstick.common import chunked_result
+
+
+RECORDS = [
+    {'timestamp': 1.5, 'sequence': 1, 'errors': '',
+     'data': {'rtt': {'ares': 0.5, 'athena': 0.7}}},
+    {'timestamp': 2.5, 'sequence': 2, 'errors': '',
+     'data': {'rtt': {'ares': 0.6}, 'hops': [1, 2]}},
+    {'timestamp': 3.5, 'sequence': 3, 'errors': 'timeout', 'data': {}},
+]
+
+RESULT = {'status': 1, 'result': {
+    'criteria': 'PASS', 'task_id': 'task_id',
+    'testcases': {'tc002': {'criteria': 'PASS', 'tc_data': RECORDS}}}}
+
+
+class ChunkedResultTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.path = os.path.join(self.tmp_dir, 'yardstick.out')
+
+    def _write(self, chunk_records=2, task_id='task_id'):
+        writer = chunked_result.ChunkedResultWriter(
+            self.path, task_id, chunk_records=chunk_records)
+        for record in RECORDS:
+            writer.add_record(record, 'tc002', 'Ping')
+        result = dict(RESULT, result=dict(RESULT['result'], task_id=task_id))
+        writer.write_result(result)
+        return chunked_result.ChunkedResultReader(self.path)
+
+    def test_encode_decode_columns(self):
+        columns = chunked_result._encode_columns(RECORDS)
+
+        self.assertIn([['data', 'rtt', 'ares'], [0, 1], [0.5, 0.6]], columns)
+        self.assertIn([['sequence'], None, [1, 2, 3]], columns)
+        self.assertIn([['data'], [2], [{}]], columns)
+        self.assertEqual(RECORDS,
+                         chunked_result._decode_columns(columns, 3))
+
+    def test_iter_records(self):
+        reader = self._write()
+
+        self.assertEqual([('tc002', 'Ping', record) for record in RECORDS],
+                         list(reader.iter_records()))
+        self.assertEqual([], list(reader.iter_records(case='tc001')))
+
+    def test_iter_column(self):
+        reader = self._write()
+
+        self.assertEqual([0.5, 0.6],
+                         list(reader.iter_column(['data', 'rtt', 'ares'])))
+
+    def test_get_result(self):
+        reader = self._write()
+
+        result = reader.get_result()
+        self.assertEqual([], result['result']['testcases']['tc002']['tc_data'])
+        self.assertEqual('PASS', result['result']['criteria'])
+        # the records of the task result are not modified
+        self.assertEqual(3, len(RECORDS))
+
+    def test_to_json(self):
+        self.assertEqual(RESULT, self._write().to_json())
+
+    def test_to_json_no_result(self):
+        writer = chunked_result.ChunkedResultWriter(self.path)
+        writer.add_record(RECORDS[0], 'tc002')
+        writer.flush()
+
+        self.assertEqual({'status': 0, 'result': {'testcases': {'tc002': {
+            'criteria': 'UNKNOWN', 'tc_data': [RECORDS[0]]}}}},
+            chunked_result.ChunkedResultReader(self.path).to_json())
+
+    def test_writer_flush(self):
+        writer = chunked_result.ChunkedResultWriter(self.path,
+                                                    chunk_records=2)
+        reader = chunked_result.ChunkedResultReader(self.path)
+
+        writer.add_record(RECORDS[0], 'tc002')
+        self.assertEqual([], list(reader.iter_records()))
+        writer.add_record(RECORDS[1], 'tc002')
+        self.assertEqual(2, len(list(reader.iter_records())))
+
+        writer.flush_interval = 0
+        writer.add_record(RECORDS[2], 'tc002')
+        self.assertEqual(3, len(list(reader.iter_records())))
+
+    def test_writer_replaces_json(self):
+        with open(self.path, 'w') as result_file:
+            result_file.write('{"status": 0, "result": {}}')
+        self.assertFalse(chunked_result.is_chunked(self.path))
+
+        self._write()
+        self.assertTrue(chunked_result.is_chunked(self.path))
+
+    def test_init_file(self):
+        self._write()
+
+        chunked_result.init_file(self.path)
+        self.assertTrue(chunked_result.is_chunked(self.path))
+        self.assertEqual(chunked_result.FILE_HEADER.size,
+                         os.path.getsize(self.path))
+
+    def test_init_file_resume(self):
+        self._write()
+
+        # a resumed task appends to the file
+        chunked_result.init_file(self.path, resume=True)
+        reader = self._write()
+        self.assertEqual(6, len(list(reader.iter_records())))
+
+    def test_reader_task_id(self):
+        self._write(task_id='task_a')
+        self._write(task_id='task_b')
+
+        reader = chunked_result.ChunkedResultReader(self.path)
+        self.assertEqual('task_b', reader.get_task_id())
+        self.assertEqual(3, len(list(reader.iter_records())))
+        self.assertEqual(3, len(list(reader.iter_column(['sequence']))))
+        self.assertEqual(3, len(reader.to_json()['result']['testcases'][
+            'tc002']['tc_data']))
+
+        reader = chunked_result.ChunkedResultReader(self.path,
+                                                    task_id='task_a')
+        self.assertEqual('task_a', reader.get_result()['result']['task_id'])
+        self.assertEqual(3, len(list(reader.iter_records(case='tc002'))))
+
+    def test_write_chunk_locked(self):
+        writer = chunked_result.ChunkedResultWriter(self.path, 'task_id')
+        with mock.patch.object(chunked_result.fcntl, 'flock') as mock_flock:
+            writer.add_record(RECORDS[0], 'tc002')
+            writer.flush()
+
+        mock_flock.assert_called_once_with(mock.ANY,
+                                           chunked_result.fcntl.LOCK_EX)
+        self.assertEqual(1, len(list(
+            chunked_result.ChunkedResultReader(self.path).iter_records())))
+
+    def test_flush_all(self):
+        self.addCleanup(chunked_result._WRITERS.clear)
+        writer = chunked_result.get_writer(self.path, task_id='task_id')
+        self.assertIs(writer, chunked_result.get_writer(self.path,
+                                                        task_id='task_id'))
+        writer.add_record(RECORDS[0], 'tc002')
+
+        chunked_result.flush_all()
+        self.assertEqual(1, len(list(
+            chunked_result.ChunkedResultReader(self.path).iter_records())))
+
+    def test_reader_truncated_chunk(self):
+        self._write(chunk_records=3)
+        with open(self.path, 'rb+') as result_file:
+            result_file.truncate(os.path.getsize(self.path) - 5)
+
+        reader = chunked_result.ChunkedResultReader(self.path)
+        self.assertEqual(3, len(list(reader.iter_records())))
+        self.assertIsNone(reader.get_result())
+
+    def test_reader_invalid_file(self):
+        with open(self.path, 'w') as result_file:
+            result_file.write('{"status": 0, "result": {}}')
+
+        with self.assertRaises(ValueError):
+            chunked_result.ChunkedResultReader(self.path).get_result()
+
+    def test_is_chunked_no_file(self):
+        self.assertFalse(chunked_result.is_chunked(self.path))
+
+    def test_main(self):
+        self._write()
+        json_path = os.path.join(self.tmp_dir, 'yardstick.json')
+
+        self.assertEqual(0, chunked_result.main([self.path, json_path]))
+        with open(json_path) as json_file:
+            self.assertEqual(RESULT, jsonutils.loads(json_file.read()))
@@ -23,38 +23,71 @@ from yardstick.common import kubernetes_utils
 from yardstick.tests.unit import base
 
 
-class GetExtensionsV1betaApiTestCase(base.BaseUnitTestCase):
+class GetApiClientTestCase(base.BaseUnitTestCase):
 
-    @mock.patch.object(client, 'ApiextensionsV1beta1Api', return_value='api')
+    def setUp(self):
+        kubernetes_utils.clear_api_client()
+        self.addCleanup(kubernetes_utils.clear_api_client)
+
+    @mock.patch.object(client, 'ApiClient', return_value='api_client')
     @mock.patch.object(config, 'load_kube_config')
-    def test_execute_correct(self, mock_load_kube_config, mock_api):
-        self.assertEqual('api', kubernetes_utils.get_extensions_v1beta_api())
+    def test_execute_correct(self, mock_load_kube_config, mock_api_client):
+        self.assertEqual('api_client', kubernetes_utils.get_api_client())
+        self.assertEqual('api_client', kubernetes_utils.get_api_client())
         mock_load_kube_config.assert_called_once_with(
             config_file=constants.K8S_CONF_FILE)
-        mock_api.assert_called_once()
+        mock_api_client.assert_called_once_with()
+
+    @mock.patch.object(client, 'ApiClient')
+    @mock.patch.object(config, 'load_kube_config')
+    @mock.patch.object(kubernetes_utils.os, 'getpid')
+    def test_execute_forked(self, mock_getpid, mock_load_kube_config,
+                            mock_api_client):
+        mock_getpid.return_value = 100
+        kubernetes_utils.get_api_client()
+        mock_getpid.return_value = 101
+        kubernetes_utils.get_api_client()
+        self.assertEqual(2, mock_load_kube_config.call_count)
+        self.assertEqual(2, mock_api_client.call_count)
 
     @mock.patch.object(config, 'load_kube_config')
     def test_execute_exception(self, mock_load_kube_config):
         mock_load_kube_config.side_effect = IOError
         with self.assertRaises(exceptions.KubernetesConfigFileNotFound):
-            kubernetes_utils.get_extensions_v1beta_api()
+            kubernetes_utils.get_api_client()
+
+
+class GetCoreApiTestCase(base.BaseUnitTestCase):
+
+    @mock.patch.object(client, 'CoreV1Api', return_value='api')
+    @mock.patch.object(kubernetes_utils, 'get_api_client',
+                       return_value='api_client')
+    def test_execute_correct(self, mock_get_api_client, mock_api):
+        self.assertEqual('api', kubernetes_utils.get_core_api())
+        mock_get_api_client.assert_called_once()
+        mock_api.assert_called_once_with('api_client')
+
+
+class GetExtensionsV1betaApiTestCase(base.BaseUnitTestCase):
+
+    @mock.patch.object(client, 'ApiextensionsV1beta1Api', return_value='api')
+    @mock.patch.object(kubernetes_utils, 'get_api_client',
+                       return_value='api_client')
+    def test_execute_correct(self, mock_get_api_client, mock_api):
+        self.assertEqual('api', kubernetes_utils.get_extensions_v1beta_api())
+        mock_get_api_client.assert_called_once()
+        mock_api.assert_called_once_with('api_client')
 
 
 class GetCustomObjectsApiTestCase(base.BaseUnitTestCase):
 
     @mock.patch.object(client, 'CustomObjectsApi', return_value='api')
-    @mock.patch.object(config, 'load_kube_config')
-    def test_execute_correct(self, mock_load_kube_config, mock_api):
+    @mock.patch.object(kubernetes_utils, 'get_api_client',
+                       return_value='api_client')
+    def test_execute_correct(self, mock_get_api_client, mock_api):
         self.assertEqual('api', kubernetes_utils.get_custom_objects_api())
-        mock_load_kube_config.assert_called_once_with(
-            config_file=constants.K8S_CONF_FILE)
-        mock_api.assert_called_once()
-
-    @mock.patch.object(config, 'load_kube_config')
-    def test_execute_exception(self, mock_load_kube_config):
-        mock_load_kube_config.side_effect = IOError
-        with self.assertRaises(exceptions.KubernetesConfigFileNotFound):
-            kubernetes_utils.get_custom_objects_api()
+        mock_get_api_client.assert_called_once()
+        mock_api.assert_called_once_with('api_client')
 
 
 class CreateCustomResourceDefinitionTestCase(base.BaseUnitTestCase):
@@ -445,3 +478,127 @@ class DeleteConfigMapTestCase(base.BaseUnitTestCase):
         mock_get_api.return_value = mock_api
         kubernetes_utils.delete_config_map(mock.ANY, skip_codes=[404])
         mock_log.info.assert_called_once()
+
+
+def _pod(name, app, phase='Pending', waiting_reason=None):
+    state = client.V1ContainerState(
+        waiting=client.V1ContainerStateWaiting(reason=waiting_reason))
+    return client.V1Pod(
+        metadata=client.V1ObjectMeta(name=name, labels={'app': app},
+                                     resource_version='2'),
+        status=client.V1PodStatus(
+            phase=phase, pod_ip='10.0.0.1', container_statuses=[
+                client.V1ContainerStatus(
+                    name='c', image='i', image_id='i', ready=False,
+                    restart_count=0, state=state)]))
+
+
+class GetPodFailureTestCase(base.BaseUnitTestCase):
+
+    def test_running(self):
+        self.assertIsNone(kubernetes_utils.get_pod_failure(
+            _pod('pod', 'app', phase='Running')))
+
+    def test_failed(self):
+        self.assertEqual('Failed', kubernetes_utils.get_pod_failure(
+            _pod('pod', 'app', phase='Failed')))
+
+    def test_container_failed(self):
+        self.assertEqual('ImagePullBackOff', kubernetes_utils.get_pod_failure(
+            _pod('pod', 'app', waiting_reason='ImagePullBackOff')))
+
+    def test_container_creating(self):
+        self.assertIsNone(kubernetes_utils.get_pod_failure(
+            _pod('pod', 'app', waiting_reason='ContainerCreating')))
+
+
+class NamespaceCacheTestCase(base.BaseUnitTestCase):
+
+    def setUp(self):
+        self._mock_get_api = mock.patch.object(kubernetes_utils,
+                                               'get_core_api')
+        self.mock_api = self._mock_get_api.start().return_value
+        self.addCleanup(self._mock_get_api.stop)
+        self._mock_watch = mock.patch.object(kubernetes_utils.watch, 'Watch')
+        self.mock_watch = self._mock_watch.start().return_value
+        self.addCleanup(self._mock_watch.stop)
+
+        self.pods = [_pod('host-k8s-a1b2c', 'host-k8s'),
+                     _pod('target-k8s-d3e4f', 'target-k8s', phase='Running')]
+        self.mock_api.list_namespaced_pod.return_value = client.V1PodList(
+            items=self.pods, metadata=client.V1ListMeta(resource_version='1'))
+        self.mock_api.list_namespaced_service.return_value = \
+            client.V1ServiceList(items=[client.V1Service(
+                metadata=client.V1ObjectMeta(name='host-k8s-service'),
+                spec=client.V1ServiceSpec(type='NodePort'))])
+        self.cache = kubernetes_utils.NamespaceCache()
+
+    def test_get_pod(self):
+        self.assertEqual(self.pods[0], self.cache.get_pod('host-k8s'))
+        self.assertEqual(self.pods[1], self.cache.get_pod('target-k8s'))
+        self.mock_api.list_namespaced_pod.assert_called_once_with('default')
+
+    def test_get_pod_missing(self):
+        self.assertIsNone(self.cache.get_pod('other-k8s'))
+        self.assertEqual(2, self.mock_api.list_namespaced_pod.call_count)
+
+    def test_get_pod_names(self):
+        self.assertEqual(['host-k8s-a1b2c', 'target-k8s-d3e4f'],
+                         self.cache.get_pod_names(['host-k8s', 'target-k8s']))
+
+    def test_get_service_spec(self):
+        self.assertEqual('NodePort', self.cache.get_service_spec(
+            'host-k8s-service').type)
+        self.assertIsNone(self.cache.get_service_spec('other-service'))
+        self.assertEqual(2, self.mock_api.list_namespaced_service.call_count)
+
+    def test_refresh_exception(self):
+        self.mock_api.list_namespaced_pod.side_effect = rest.ApiException
+        with self.assertRaises(exceptions.KubernetesApiException):
+            self.cache.refresh()
+
+    def test_wait_running(self):
+        running = _pod('host-k8s-a1b2c', 'host-k8s', phase='Running')
+        self.mock_watch.stream.return_value = iter([
+            {'type': 'ADDED', 'object': _pod('other', 'other')},
+            {'type': 'MODIFIED', 'object': running}])
+
+        self.cache.wait_running(['host-k8s', 'target-k8s'])
+        self.mock_watch.stream.assert_called_once_with(
+            self.mock_api.list_namespaced_pod, 'default',
+            resource_version='1', timeout_seconds=mock.ANY)
+        self.mock_watch.stop.assert_called_once()
+        self.assertEqual(running, self.cache.get_pod('host-k8s'))
+
+    def test_wait_running_already_running(self):
+        self.cache.wait_running(['target-k8s'])
+        self.mock_watch.stream.assert_not_called()
+
+    def test_wait_running_failed(self):
+        self.mock_watch.stream.return_value = iter([
+            {'type': 'MODIFIED', 'object': _pod(
+                'host-k8s-a1b2c', 'host-k8s', waiting_reason='ErrImageNeverPull')},
+            {'type': 'MODIFIED', 'object': _pod(
+                'host-k8s-a1b2c', 'host-k8s', phase='Running')}])
+
+        with self.assertRaises(exceptions.KubernetesPodFailed):
+            self.cache.wait_running(['host-k8s'])
+
+    def test_wait_running_error_event(self):
+        self.mock_watch.stream.side_effect = [
+            iter([{'type': 'ERROR', 'raw_object': {'code': 410}}]),
+            iter([{'type': 'MODIFIED', 'object': _pod(
+                'host-k8s-a1b2c', 'host-k8s', phase='Running')}])]
+
+        self.cache.wait_running(['host-k8s'])
+        self.assertEqual(2, self.mock_api.list_namespaced_pod.call_count)
+        self.assertEqual(2, self.mock_watch.stream.call_count)
+
+    @mock.patch.object(kubernetes_utils.time, 'time')
+    def test_wait_running_timeout(self, mock_time):
+        mock_time.side_effect = [0, 10, 20]
+        self.mock_watch.stream.return_value = iter([])
+
+        with self.assertRaises(exceptions.WaitTimeout):
+            self.cache.wait_running(['host-k8s'], timeout=15)
+        self.mock_watch.stream.assert_called_once()
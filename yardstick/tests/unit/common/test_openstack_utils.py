@@ -9,6 +9,10 @@
 
 import os
 
+from keystoneauth1 import access
+from keystoneauth1 import exceptions as ks_exceptions
+from keystoneauth1 import fixture
+from keystoneauth1.identity import generic
 import mock
 from oslo_utils import uuidutils
 import shade
@@ -42,6 +46,10 @@ class GetHeatApiVersionTestCase(unittest.TestCase):
 
 class GetShadeClientTestCase(unittest.TestCase):
 
+    def setUp(self):
+        openstack_utils.clear_clients()
+        self.addCleanup(openstack_utils.clear_clients)
+
     @mock.patch.object(shade, 'openstack_cloud', return_value='os_client')
     def test_get_shade_client(self, mock_openstack_cloud):
         os_cloud_config = {'param1': True, 'param2': 'value2'}
@@ -69,6 +77,155 @@ class GetShadeClientTestCase(unittest.TestCase):
             **constants.OS_CLOUD_DEFAULT_CONFIG)
 
 
+class ClientsCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        openstack_utils.clear_clients()
+        self.addCleanup(openstack_utils.clear_clients)
+        self._mock_getpid = mock.patch.object(os, 'getpid',
+                                              return_value=100)
+        self.mock_getpid = self._mock_getpid.start()
+        self.addCleanup(self._mock_getpid.stop)
+        openstack_utils._CLIENTS_PID[0] = 100
+
+    @mock.patch.object(openstack_utils.session, 'Session')
+    @mock.patch.object(openstack_utils.loading, 'get_plugin_loader')
+    def test_get_session(self, mock_get_plugin_loader, mock_session):
+        mock_session.side_effect = lambda **kwargs: mock.Mock()
+        auth = mock_get_plugin_loader.return_value.load_from_options. \
+            return_value
+        sess = openstack_utils.get_session()
+
+        self.assertIs(sess, openstack_utils.get_session())
+        mock_session.assert_called_once_with(auth=auth)
+        self.assertEqual({'auth': 0, 'hit': 1, 'miss': 1},
+                         openstack_utils.get_clients_stats())
+
+        # a forked process has its own session, with the same plugin
+        self.mock_getpid.return_value = 101
+        self.assertIsNot(sess, openstack_utils.get_session())
+        self.assertEqual(2, mock_session.call_count)
+        self.assertIs(auth, mock_session.call_args[1]['auth'])
+        mock_get_plugin_loader.assert_called_once_with('password')
+        self.assertEqual({'auth': 0, 'hit': 0, 'miss': 1},
+                         openstack_utils.get_clients_stats())
+
+    @mock.patch.object(openstack_utils.loading, 'get_plugin_loader')
+    def test_get_session_auth_count(self, mock_get_plugin_loader):
+        plugin = mock.Mock()
+        mock_get_plugin_loader.return_value.load_from_options.return_value = \
+            plugin
+        get_auth_ref = plugin.get_auth_ref
+
+        auth = openstack_utils.get_session_auth()
+        auth.get_auth_ref('session')
+        auth.get_auth_ref('session')
+
+        get_auth_ref.assert_called_with('session')
+        self.assertEqual(2, openstack_utils.get_clients_stats()['auth'])
+
+    @mock.patch.object(openstack_utils, 'get_session',
+                       return_value='session')
+    def test_get_nova_client(self, *args):
+        with mock.patch.object(openstack_utils.novaclient,
+                               'Client') as mock_client:
+            client = openstack_utils.get_nova_client()
+            self.assertIs(client, openstack_utils.get_nova_client())
+        mock_client.assert_called_once_with(
+            openstack_utils.get_nova_client_version(), session='session')
+
+    @mock.patch.object(shade, 'OpenStackCloud')
+    @mock.patch.object(shade, 'openstack_cloud')
+    @mock.patch.object(openstack_utils.cloud_config_module, 'CloudConfig')
+    def test_get_shade_client(self, mock_cloud_config, mock_openstack_cloud,
+                              mock_cloud_class):
+        cloud = mock_openstack_cloud.return_value
+        auth = cloud.cloud_config.get_auth.return_value
+        get_auth_ref = auth.get_auth_ref
+
+        self.assertIs(cloud, openstack_utils.get_shade_client())
+        self.assertIs(cloud, openstack_utils.get_shade_client())
+        mock_openstack_cloud.assert_called_once_with(
+            **constants.OS_CLOUD_DEFAULT_CONFIG)
+        auth.get_auth_ref('session')
+        get_auth_ref.assert_called_once_with('session')
+        self.assertEqual({'auth': 1, 'hit': 1, 'miss': 1},
+                         openstack_utils.get_clients_stats())
+
+        # a forked process reuses the cloud config authentication plugin
+        self.mock_getpid.return_value = 101
+        self.assertIs(mock_cloud_class.return_value,
+                      openstack_utils.get_shade_client())
+        mock_openstack_cloud.assert_called_once()
+        mock_cloud_config.assert_called_once_with(
+            cloud.cloud_config.name, cloud.cloud_config.region,
+            cloud.cloud_config.config,
+            force_ipv4=cloud.cloud_config.force_ipv4, auth_plugin=auth)
+        mock_cloud_class.assert_called_once_with(
+            cloud_config=mock_cloud_config.return_value)
+
+
+    def test_add_clients_stats(self):
+        openstack_utils.add_clients_stats({'auth': 1, 'hit': 2, 'miss': 3})
+        openstack_utils.add_clients_stats({'auth': 0, 'hit': 1, 'miss': 1})
+        self.assertEqual({'auth': 1, 'hit': 3, 'miss': 4},
+                         openstack_utils.get_clients_stats())
+
+
+class AuthenticateTestCase(unittest.TestCase):
+
+    ENV = {'OS_AUTH_URL': 'http://keystone:5000/v3',
+           'OS_USERNAME': 'admin',
+           'OS_PASSWORD': 'password',
+           'OS_PROJECT_NAME': 'admin',
+           'OS_USER_DOMAIN_NAME': 'Default',
+           'OS_PROJECT_DOMAIN_NAME': 'Default'}
+
+    def setUp(self):
+        openstack_utils.clear_clients()
+        self.addCleanup(openstack_utils.clear_clients)
+        self._mock_getpid = mock.patch.object(os, 'getpid',
+                                              return_value=100)
+        self.mock_getpid = self._mock_getpid.start()
+        self.addCleanup(self._mock_getpid.stop)
+        openstack_utils._CLIENTS_PID[0] = 100
+
+    @mock.patch.object(shade, 'openstack_cloud')
+    def test_authenticate_forked_process(self, mock_openstack_cloud):
+        auth_ref = access.create(body=fixture.V3Token(), auth_token='token')
+        with mock.patch.dict(os.environ, self.ENV, clear=True), \
+                mock.patch.object(generic.Password, 'get_auth_ref',
+                                  return_value=auth_ref) as mock_get_auth_ref:
+            openstack_utils.authenticate()
+            mock_get_auth_ref.assert_called_once()
+            mock_openstack_cloud.return_value.keystone_session.get_token. \
+                assert_called_once_with()
+
+            # a runner worker forked from the task process
+            self.mock_getpid.return_value = 101
+            self.assertEqual('token', openstack_utils.get_session().get_token())
+
+        mock_get_auth_ref.assert_called_once()
+        self.assertEqual({'auth': 0, 'hit': 0, 'miss': 1},
+                         openstack_utils.get_clients_stats())
+
+    @mock.patch.object(openstack_utils, 'get_session_auth')
+    def test_authenticate_no_credentials(self, mock_get_session_auth):
+        with mock.patch.dict(os.environ, {}, clear=True):
+            openstack_utils.authenticate()
+        mock_get_session_auth.assert_not_called()
+
+    @mock.patch.object(openstack_utils, 'get_shade_client')
+    @mock.patch.object(openstack_utils, 'log')
+    def test_authenticate_failed(self, mock_log, mock_get_shade_client):
+        with mock.patch.dict(os.environ, self.ENV, clear=True), \
+                mock.patch.object(generic.Password, 'get_auth_ref',
+                                  side_effect=ks_exceptions.ConnectFailure):
+            openstack_utils.authenticate()
+        mock_log.warning.assert_called_once()
+        mock_get_shade_client.assert_not_called()
+
+
 class DeleteNeutronNetTestCase(unittest.TestCase):
 
     def setUp(self):
@@ -0,0 +1,111 @@
+##############################################################################
+# Copyright (c) 2018 Intel Corporation
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+import unittest
+
+from yardstick.common import profiler
+
+
+class ProfilerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = profiler.Profiler()
+
+    def test_span_nested(self):
+        with self.profiler.span('testcase', case='tc002'):
+            with self.profiler.span('deploy', context='demo'):
+                pass
+            with self.profiler.span('runner'):
+                pass
+
+        spans = self.profiler.get_spans()
+        self.assertEqual(1, len(spans))
+        self.assertEqual('testcase', spans[0]['name'])
+        self.assertEqual({'case': 'tc002'}, spans[0]['tags'])
+        self.assertEqual(['deploy', 'runner'],
+                         [span['name'] for span in spans[0]['children']])
+        self.assertGreaterEqual(spans[0]['duration'],
+                                spans[0]['children'][0]['duration'])
+
+    def test_span_exception(self):
+        with self.assertRaises(ValueError):
+            with self.profiler.span('deploy'):
+                raise ValueError
+
+        self.assertIsNotNone(self.profiler.get_spans()[0]['duration'])
+        with self.profiler.span('undeploy'):
+            pass
+        self.assertEqual(2, len(self.profiler.get_spans()))
+
+    def test_add_span(self):
+        child = {'name': 'worker', 'tags': {}, 'start': 1.0, 'duration': 1.0,
+                 'timers': {}, 'children': []}
+        with self.profiler.span('testcase'):
+            self.profiler.add_span('runner', 0.5, 2.0, children=[child],
+                                   runner='Duration')
+
+        runner = self.profiler.get_spans()[0]['children'][0]
+        self.assertEqual(2.0, runner['duration'])
+        self.assertEqual({'runner': 'Duration'}, runner['tags'])
+        self.assertEqual([child], runner['children'])
+
+    def test_add_spans(self):
+        worker = {'name': 'testcase', 'tags': {}, 'start': 1.0,
+                  'duration': 1.0, 'timers': {}, 'children': []}
+        with self.profiler.span('suite'):
+            self.profiler.add_spans([worker])
+
+        self.assertEqual([worker], self.profiler.get_spans()[0]['children'])
+
+    def test_timer(self):
+        with self.profiler.span('testcase'):
+            for _ in range(3):
+                with self.profiler.timer('upload'):
+                    pass
+
+        timer = self.profiler.get_spans()[0]['timers']['upload']
+        self.assertEqual(3, timer['count'])
+        self.assertGreaterEqual(timer['total'], 0)
+
+    def test_add_time_no_span(self):
+        self.profiler.add_time('upload', 1.0)
+        self.assertEqual([], self.profiler.get_spans())
+
+    def test_reset(self):
+        with self.profiler.span('testcase'):
+            self.profiler.reset()
+            with self.profiler.span('worker'):
+                pass
+
+        self.assertEqual(['worker'],
+                         [span['name'] for span in self.profiler.get_spans()])
+
+
+class SpansTestCase(unittest.TestCase):
+
+    SPANS = [{'name': 'testcase', 'tags': {'case': 'tc002'}, 'start': 0,
+              'duration': 3.0, 'timers': {'upload': {'count': 2,
+                                                     'total': 0.5}},
+              'children': [{'name': 'deploy', 'tags': {}, 'start': 0,
+                            'duration': None, 'timers': {},
+                            'children': []}]},
+             {'name': 'output', 'tags': {}, 'start': 3.0, 'duration': 0.1,
+              'timers': {}, 'children': []}]
+
+    def test_iter_spans(self):
+        self.assertEqual(['testcase', 'testcase/deploy', 'output'],
+                         [path for path, _ in
+                          profiler.iter_spans(self.SPANS)])
+
+    def test_format_spans(self):
+        self.assertEqual('testcase 3.000s (case=tc002)\n'
+                         '  upload x2 0.500s\n'
+                         '  deploy open\n'
+                         'output 0.100s',
+                         profiler.format_spans(self.SPANS))
@@ -0,0 +1,102 @@
+##############################################################################
+# Copyright (c) 2018 Intel Corporation
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Apache License, Version 2.0
+# which accompanies this distribution, and is available at
+# http://www.apache.org/licenses/LICENSE-2.0
+##############################################################################
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+from oslo_serialization import jsonutils
+
+from yardstick.common import chunked_result
+from yardstick.dispatcher import file as file_dispatcher
+
+
+RECORD = {'timestamp': 1.5, 'sequence': 1, 'errors': '',
+          'data': {'rtt': 0.5}}
+RESULT = {'status': 1, 'result': {'criteria': 'PASS', 'testcases': {
+    'tc002': {'criteria': 'PASS', 'tc_data': [RECORD]}}}}
+
+
+class FileDispatcherTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.path = os.path.join(self.tmp_dir, 'yardstick.out')
+        self.addCleanup(chunked_result._WRITERS.clear)
+
+    def _get_dispatcher(self, **file_conf):
+        file_conf['file_path'] = self.path
+        return file_dispatcher.FileDispatcher({'dispatcher_file': file_conf})
+
+    def test_is_chunked(self):
+        self.assertTrue(file_dispatcher.is_chunked(
+            {'dispatcher_file': {'format': 'chunked'}}))
+        self.assertFalse(file_dispatcher.is_chunked(
+            {'dispatcher_file': {'format': 'json'}}))
+        self.assertFalse(file_dispatcher.is_chunked({}))
+
+    def test_flush_result_data(self):
+        dispatcher = self._get_dispatcher()
+        dispatcher.upload_one_record(RECORD, 'tc002', '')
+        dispatcher.flush_result_data(RESULT)
+
+        self.assertFalse(chunked_result.is_chunked(self.path))
+        with open(self.path) as result_file:
+            self.assertIn('"rtt": 0.5', result_file.read())
+
+    def test_flush_result_data_chunked(self):
+        dispatcher = self._get_dispatcher(format='chunked', chunk_records='1')
+        dispatcher.upload_one_record(RECORD, 'tc002', '', scenario='Ping')
+
+        reader = chunked_result.ChunkedResultReader(self.path)
+        self.assertEqual([('tc002', 'Ping', RECORD)],
+                         list(reader.iter_records()))
+
+        dispatcher.flush_result_data(RESULT)
+        self.assertEqual(RESULT, reader.to_json())
+
+    def test_flush_result_data_chunked_task_id(self):
+        dispatcher = self._get_dispatcher(format='chunked')
+        dispatcher.upload_one_record(RECORD, 'tc002', '', task_id='task_id')
+        result = dict(RESULT, result=dict(RESULT['result'],
+                                          task_id='task_id'))
+        dispatcher.flush_result_data(result)
+
+        reader = chunked_result.ChunkedResultReader(self.path)
+        self.assertEqual('task_id', reader.get_task_id())
+        self.assertEqual(result, reader.to_json())
+
+    def test_start_task(self):
+        self._get_dispatcher().start_task()
+
+        with open(self.path) as result_file:
+            self.assertEqual({'status': 0, 'result': {}},
+                             jsonutils.loads(result_file.read()))
+
+    def test_start_task_chunked(self):
+        dispatcher = self._get_dispatcher(format='chunked', chunk_records='1')
+        dispatcher.upload_one_record(RECORD, 'tc002', '')
+
+        dispatcher.start_task()
+        reader = chunked_result.ChunkedResultReader(self.path)
+        self.assertEqual([], list(reader.iter_records()))
+
+        dispatcher.upload_one_record(RECORD, 'tc002', '')
+        dispatcher.start_task(resume=True)
+        self.assertEqual(1, len(list(reader.iter_records())))
+
+    @mock.patch.object(file_dispatcher.utils, 'write_json_to_file')
+    def test_upload_one_record_json(self, mock_write):
+        self._get_dispatcher().upload_one_record(RECORD, 'tc002', '')
+
+        mock_write.assert_not_called()
+        self.assertFalse(os.path.exists(self.path))
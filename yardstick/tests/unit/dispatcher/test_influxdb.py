@@ -89,6 +89,34 @@ class InfluxdbDispatcherTestCase(unittest.TestCase):
         }
         self.assertEqual(influxdb.flush_result_data(data), 0)
 
+    @mock.patch('yardstick.dispatcher.influxdb.requests')
+    def test_upload_profile(self, mock_requests):
+        type(mock_requests.post.return_value).status_code = 204
+        influxdb = InfluxdbDispatcher(self.yardstick_conf)
+        data = {
+            'result': {
+                'info': {'pod_name': 'pod1'},
+                'task_id': 'task1',
+                'profile': [{
+                    'name': 'testcase', 'tags': {'case': 'tc002'},
+                    'start': 1451461248.0, 'duration': 2.5,
+                    'timers': {'influxdb': {'count': 2, 'total': 0.5}},
+                    'children': [{'name': 'deploy', 'tags': {},
+                                  'start': 1451461248.0, 'duration': None,
+                                  'timers': {}, 'children': []}]}]
+            }
+        }
+
+        influxdb.upload_profile(data)
+
+        line = mock_requests.post.call_args[1]['data'].decode('utf-8')
+        self.assertEqual(1, len(line.strip().split('\n')))
+        self.assertIn('yardstick_profile,', line)
+        self.assertIn('span=testcase', line)
+        self.assertIn('case=tc002', line)
+        self.assertIn('duration=2.5', line)
+        self.assertIn('timers.influxdb.count=2', line)
+
     def test__get_nano_timestamp(self):
         influxdb = InfluxdbDispatcher(self.yardstick_conf)
         results = {'timestamp': '1451461248.925574'}
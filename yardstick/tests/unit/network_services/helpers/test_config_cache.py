@@ -0,0 +1,87 @@
+# Copyright (c) 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from yardstick.network_services.helpers import config_cache
+
+
+class ConfigCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        self._mock_cache_dir = mock.patch.object(config_cache, 'CACHE_DIR',
+                                                 self.cache_dir)
+        self._mock_cache_dir.start()
+        self.addCleanup(self._mock_cache_dir.stop)
+        self.addCleanup(config_cache.clear)
+
+    def test_get_key(self):
+        key = config_cache.get_key('ACL', {'b': 1, 'a': [1, 2]}, None)
+
+        self.assertEqual(key, config_cache.get_key(
+            'ACL', {'a': [1, 2], 'b': 1}, None))
+        self.assertNotEqual(key, config_cache.get_key(
+            'ACL', {'a': [1, 2], 'b': 2}, None))
+        self.assertNotEqual(key, config_cache.get_key(
+            'CGNAPT', {'a': [1, 2], 'b': 1}, None))
+
+    def test_get_not_cached(self):
+        self.assertIsNone(config_cache.get('missing'))
+
+    def test_put_get(self):
+        config_cache.put('key', {'config': '[EAL]\n'})
+
+        self.assertEqual({'config': '[EAL]\n'}, config_cache.get('key'))
+        self.assertEqual(['key'], os.listdir(self.cache_dir))
+
+        # the next tasks read the cache directory
+        config_cache.clear()
+        self.assertEqual({'config': '[EAL]\n'}, config_cache.get('key'))
+
+    def test_get_invalid_file(self):
+        with open(os.path.join(self.cache_dir, 'key'), 'w') as cache_file:
+            cache_file.write('{"config": ')
+
+        self.assertIsNone(config_cache.get('key'))
+
+    def test_put_write_failure(self):
+        with mock.patch.object(config_cache.utils, 'makedirs',
+                               side_effect=OSError):
+            config_cache.put('key', 'value')
+
+        self.assertEqual('value', config_cache.get('key'))
+        self.assertEqual([], os.listdir(self.cache_dir))
+
+    def test_memoize(self):
+        build = mock.Mock(return_value=[['port 0', [['mac', 'hardware']]]])
+
+        self.assertEqual(build.return_value,
+                         config_cache.memoize('key', build))
+        self.assertEqual(build.return_value,
+                         config_cache.memoize('key', build))
+        build.assert_called_once_with()
+
+    def test_read_file(self):
+        path = os.path.join(self.cache_dir, 'acl.cfg')
+        with open(path, 'w') as template_file:
+            template_file.write('[PIPELINE0]\n')
+
+        self.assertEqual('[PIPELINE0]\n', config_cache.read_file(path))
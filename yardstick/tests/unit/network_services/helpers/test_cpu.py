@@ -18,6 +18,7 @@ import unittest
 import mock
 import subprocess
 
+from yardstick.network_services.helpers import host_topology
 from yardstick.network_services.helpers.cpu import \
     CpuSysCores
 
@@ -68,6 +69,22 @@ class TestCpuSysCores(unittest.TestCase):
                               'cores_per_socket': '2'},
                              cpu_topo.get_core_socket())
 
+    @mock.patch.object(host_topology, 'get')
+    def test_get_core_socket_topology(self, mock_get):
+        mock_get.return_value = host_topology.HostTopology({
+            'lscpu': 'Thread(s) per core:  2\nCore(s) per socket:  1\n',
+            'cpuinfo': 'processor\t: 0\nphysical id\t: 0\n\n'
+                       'processor\t: 1\nphysical id\t: 0\n\n'})
+        ssh_mock = mock.Mock()
+        cpu_topo = CpuSysCores(ssh_mock)
+
+        self.assertEqual({'thread_per_core': '2', 'cores_per_socket': '1',
+                          '0': ['0', '1']},
+                         cpu_topo.get_core_socket())
+        mock_get.assert_called_once_with(ssh_mock)
+        ssh_mock.execute.assert_not_called()
+        ssh_mock.get_file_obj.assert_not_called()
+
     def test_validate_cpu_cfg(self):
         with mock.patch("yardstick.ssh.SSH") as ssh:
             ssh_mock = mock.Mock(autospec=ssh.SSH)
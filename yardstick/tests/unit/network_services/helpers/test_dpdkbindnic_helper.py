@@ -18,6 +18,7 @@ import unittest
 import os
 
 from yardstick.common import exceptions
+from yardstick.network_services.helpers import host_topology
 from yardstick.network_services.helpers.dpdkbindnic_helper import DpdkInterface
 from yardstick.network_services.helpers.dpdkbindnic_helper import DpdkNode
 from yardstick.network_services.helpers.dpdkbindnic_helper import DpdkBindHelper
@@ -450,6 +451,29 @@ Other crypto devices
         result = dpdk_helper.kernel_bound_pci_addresses
         self.assertEqual(result, expected)
 
+    @mock.patch.object(host_topology, 'get')
+    def test_find_net_devices_topology(self, mock_get):
+        mock_get.return_value.netdevs = {'ens5f0': {'pci_bus_id': '0000:05:00.0'}}
+        conn = mock.Mock()
+
+        dpdk_helper = DpdkBindHelper(conn)
+
+        self.assertEqual({'ens5f0': {'pci_bus_id': '0000:05:00.0'}},
+                         dpdk_helper.find_net_devices())
+        conn.execute.assert_not_called()
+
+    @mock.patch.object(host_topology, 'get')
+    def test_get_real_kernel_driver_topology(self, mock_get):
+        mock_get.return_value.kernel_modules = {'0000:05:00.0': 'ixgbe'}
+        conn = mock.Mock()
+        conn.execute.return_value = (0, 'pre Kernel modules: i40e', '')
+
+        dpdk_helper = DpdkBindHelper(conn)
+
+        self.assertEqual('ixgbe', dpdk_helper.get_real_kernel_driver('0000:05:00.0'))
+        conn.execute.assert_not_called()
+        self.assertEqual('i40e', dpdk_helper.get_real_kernel_driver('0000:06:00.0'))
+
     def test_find_net_devices_negative(self):
         mock_ssh_helper = mock.Mock()
         mock_ssh_helper.execute.return_value = 1, 'error', 'debug'
@@ -467,6 +491,18 @@ Other crypto devices
 
         self.assertEqual(self.PARSED_EXAMPLE, dpdk_bind_helper.read_status())
 
+    @mock.patch.object(host_topology, 'get')
+    def test_read_status_topology(self, mock_get):
+        mock_get.return_value = host_topology.HostTopology(
+            {'dpdk_status': self.EXAMPLE_OUTPUT})
+        conn = mock.Mock()
+
+        dpdk_bind_helper = DpdkBindHelper(conn)
+
+        self.assertEqual(self.PARSED_EXAMPLE, dpdk_bind_helper.read_status())
+        mock_get.assert_called_once_with(conn, dpdk_bind_helper.dpdk_devbind)
+        conn.execute.assert_not_called()
+
     def test__get_bound_pci_addresses(self):
         conn = mock.Mock()
 
@@ -500,10 +536,12 @@ Other crypto devices
         dpdk_bind_helper = DpdkBindHelper(conn)
         dpdk_bind_helper.read_status = mock.Mock()
 
-        dpdk_bind_helper.bind(['0000:00:03.0', '0000:00:04.0'], 'my_driver')
+        with mock.patch.object(host_topology, 'invalidate') as mock_invalidate:
+            dpdk_bind_helper.bind(['0000:00:03.0', '0000:00:04.0'], 'my_driver')
 
         conn.execute.assert_called_with('sudo /opt/nsb_bin/dpdk-devbind.py --force '
                                         '-b my_driver 0000:00:03.0 0000:00:04.0')
+        mock_invalidate.assert_called_once_with(conn)
         dpdk_bind_helper.read_status.assert_called_once()
 
     def test_bind_single_pci(self):
@@ -520,12 +558,45 @@ Other crypto devices
                                         '-b my_driver 0000:00:03.0')
         dpdk_bind_helper.read_status.assert_called_once()
 
+    def test_bind_drivers(self):
+        conn = mock.Mock()
+        conn.execute = mock.Mock(return_value=(0, '', ''))
+        conn.join_bin_path.return_value = os.path.join(self.bin_path, DpdkBindHelper.DPDK_DEVBIND)
+
+        dpdk_bind_helper = DpdkBindHelper(conn)
+        dpdk_bind_helper.read_status = mock.Mock()
+        dpdk_bind_helper._parse_dpdk_status_output(self.EXAMPLE_OUTPUT)
+
+        with mock.patch.object(host_topology, 'invalidate'):
+            self.assertTrue(dpdk_bind_helper.bind_drivers({
+                'igb_uio': ['0000:00:04.0', '0000:00:03.0'],
+                'ixgbe': '0000:00:05.0'}))
+
+        conn.execute.assert_called_once_with(
+            'sudo /opt/nsb_bin/dpdk-devbind.py --force -b igb_uio 0000:00:03.0 && '
+            'sudo /opt/nsb_bin/dpdk-devbind.py --force -b ixgbe 0000:00:05.0')
+        dpdk_bind_helper.read_status.assert_called_once()
+
+    def test_bind_drivers_already_bound(self):
+        conn = mock.Mock()
+
+        dpdk_bind_helper = DpdkBindHelper(conn)
+        dpdk_bind_helper.read_status = mock.Mock()
+        dpdk_bind_helper._parse_dpdk_status_output(self.EXAMPLE_OUTPUT)
+
+        self.assertFalse(dpdk_bind_helper.bind_drivers({
+            'igb_uio': ['0000:00:04.0', '0000:00:05.0'],
+            'virtio-pci': ['0000:00:03.0']}))
+
+        conn.execute.assert_not_called()
+        dpdk_bind_helper.read_status.assert_not_called()
+
     def test_rebind_drivers(self):
         conn = mock.Mock()
 
         dpdk_bind_helper = DpdkBindHelper(conn)
 
-        dpdk_bind_helper.bind = mock.Mock()
+        dpdk_bind_helper.bind_drivers = mock.Mock()
         dpdk_bind_helper.used_drivers = {
             'd1': ['0000:05:00.0'],
             'd3': ['0000:05:01.0', '0000:05:02.0'],
@@ -533,8 +604,8 @@ Other crypto devices
 
         dpdk_bind_helper.rebind_drivers()
 
-        dpdk_bind_helper.bind.assert_any_call(['0000:05:00.0'], 'd1', True)
-        dpdk_bind_helper.bind.assert_any_call(['0000:05:01.0', '0000:05:02.0'], 'd3', True)
+        dpdk_bind_helper.bind_drivers.assert_called_once_with(
+            dpdk_bind_helper.used_drivers, True)
 
     def test_save_used_drivers(self):
         conn = mock.Mock()
@@ -617,7 +688,8 @@ Other crypto devices
         self.assertDictEqual(dpdk_helper.used_drivers, expected_used_drivers)
         self.assertDictEqual(dpdk_helper.real_kernel_drivers, {})
 
-    def test_get_real_kernel_driver(self):
+    @mock.patch.object(host_topology, 'get', return_value=None)
+    def test_get_real_kernel_driver(self, *args):
         mock_ssh_helper = mock.Mock()
         mock_ssh_helper.execute.side_effect = [
             (0, 'non-matching text', ''),
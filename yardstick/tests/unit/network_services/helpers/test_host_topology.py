@@ -0,0 +1,193 @@
+# Copyright (c) 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import subprocess
+import sys
+import unittest
+
+import mock
+
+from yardstick.network_services.helpers import host_topology
+
+
+CPUINFO = """\
+processor\t: 0
+physical id\t: 0
+core id\t: 0
+
+processor\t: 1
+physical id\t: 0
+core id\t: 1
+
+"""
+
+TOPOLOGY = {
+    'boot_id': 'boot-1',
+    'cpuinfo': CPUINFO,
+    'lscpu': 'Thread(s) per core:  1\nCore(s) per socket:  2\n',
+    'nodes': {'0': {'cpulist': '0-1', 'hugepages': {}}},
+    'hugepages': {'2048': {'total': 1024, 'free': 512}},
+    'nics': {'0000:05:00.0': {'driver': 'ixgbe', 'numa_node': 0,
+                              'interfaces': ['ens5f0'],
+                              'netdevs': {'ens5f0': {
+                                  'address': '90:e2:ba:7c:41:a8',
+                                  'operstate': 'up', 'ifindex': '4'}},
+                              'kernel_module': 'ixgbe',
+                              'vendor': '0x8086', 'device': '0x10fb',
+                              'subsystem_vendor': '0x8086',
+                              'subsystem_device': '0x000c'},
+             '0000:05:00.1': {'driver': 'igb_uio', 'numa_node': 0,
+                              'interfaces': [], 'netdevs': {},
+                              'kernel_module': 'ixgbe',
+                              'vendor': '0x8086', 'device': '0x10fb',
+                              'subsystem_vendor': '0x8086',
+                              'subsystem_device': '0x000c'}},
+    'lspci': True,
+    'dpdk_status': None,
+}
+
+
+class HostTopologyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = mock.Mock(host='10.0.0.1', port=22)
+        self.connection.execute.return_value = (0, json.dumps(TOPOLOGY), '')
+        self.addCleanup(host_topology._CACHE.clear)
+
+    def test_probe_script(self):
+        proc = subprocess.Popen([sys.executable, '-', 'echo', 'status'],
+                                stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        output = proc.communicate(host_topology.PROBE_SCRIPT.encode())[0]
+        topology = json.loads(output.decode())
+        self.assertEqual(set(TOPOLOGY), set(topology))
+        self.assertEqual('status\n', topology['dpdk_status'])
+
+    def test_probe(self):
+        topology = host_topology.probe(self.connection, 'dpdk-devbind.py')
+
+        self.assertEqual('boot-1', topology.boot_id)
+        self.assertEqual('dpdk-devbind.py', topology.dpdk_devbind)
+        self.connection.execute.assert_called_once_with(
+            host_topology.PROBE_CMD + ' dpdk-devbind.py --status',
+            stdin=host_topology.PROBE_SCRIPT)
+
+    def test_probe_failure(self):
+        self.connection.execute.return_value = (127, '', 'not found')
+        self.assertIsNone(host_topology.probe(self.connection))
+
+        self.connection.execute.return_value = (0, 'not json', '')
+        self.assertIsNone(host_topology.probe(self.connection))
+
+    def test_get_cached(self):
+        topology = host_topology.get(self.connection)
+
+        self.assertIs(topology, host_topology.get(self.connection))
+        self.assertIs(topology, host_topology.get(
+            mock.Mock(host='10.0.0.1', port=22)))
+        self.connection.execute.assert_called_once()
+
+        self.assertIsNot(topology,
+                         host_topology.get(self.connection, refresh=True))
+
+    def test_get_dpdk_devbind(self):
+        topology = host_topology.get(self.connection)
+
+        with_status = host_topology.get(self.connection, 'dpdk-devbind.py')
+        self.assertIsNot(topology, with_status)
+        self.assertIs(with_status, host_topology.get(self.connection))
+        self.assertIs(with_status,
+                      host_topology.get(self.connection, 'dpdk-devbind.py'))
+        self.assertEqual(2, self.connection.execute.call_count)
+
+    def test_get_failure_cached(self):
+        self.connection.execute.return_value = (1, '', '')
+
+        self.assertIsNone(host_topology.get(self.connection))
+        self.assertIsNone(host_topology.get(self.connection,
+                                            'dpdk-devbind.py'))
+        self.connection.execute.assert_called_once()
+
+    def test_invalidate(self):
+        topology = host_topology.get(self.connection)
+        host_topology.invalidate(self.connection)
+
+        self.assertIsNot(topology, host_topology.get(self.connection))
+        host_topology.invalidate(mock.Mock(host='10.0.0.2', port=22))
+
+    def test_check_boot(self):
+        topology = host_topology.get(self.connection)
+
+        self.connection.execute.return_value = (0, 'boot-1\n', '')
+        host_topology.check_boot(self.connection)
+        self.connection.execute.return_value = (0, json.dumps(TOPOLOGY), '')
+        self.assertIs(topology, host_topology.get(self.connection))
+
+        self.connection.execute.return_value = (0, 'boot-2\n', '')
+        host_topology.check_boot(self.connection)
+        self.assertNotIn(('10.0.0.1', 22), host_topology._CACHE)
+
+    def test_check_boot_not_cached(self):
+        host_topology.check_boot(self.connection)
+        self.connection.execute.assert_not_called()
+
+    def test_get_interface(self):
+        topology = host_topology.HostTopology(TOPOLOGY)
+
+        self.assertEqual('ens5f0', topology.get_interface('0000:05:00.0'))
+        self.assertIsNone(topology.get_interface('0000:05:00.1'))
+        self.assertIsNone(topology.get_interface('0000:06:00.0'))
+
+    def test_socket_topology(self):
+        topology = host_topology.HostTopology(TOPOLOGY)
+
+        self.assertEqual([0, 1], topology.socket_topology.processors())
+        self.assertIs(topology.socket_topology, topology.socket_topology)
+
+    def test_netdevs(self):
+        topology = host_topology.HostTopology(TOPOLOGY)
+
+        self.assertEqual({'ens5f0': {
+            'interface_name': 'ens5f0', 'pci_bus_id': '0000:05:00.0',
+            'driver': 'ixgbe', 'numa_node': '0',
+            'address': '90:e2:ba:7c:41:a8', 'operstate': 'up',
+            'ifindex': '4', 'vendor': '0x8086', 'device': '0x10fb',
+            'subsystem_vendor': '0x8086', 'subsystem_device': '0x000c'}},
+            topology.netdevs)
+
+    def test_kernel_modules(self):
+        topology = host_topology.HostTopology(TOPOLOGY)
+        self.assertEqual({'0000:05:00.0': 'ixgbe', '0000:05:00.1': 'ixgbe'},
+                         topology.kernel_modules)
+
+        topology = host_topology.HostTopology(dict(TOPOLOGY, lspci=False))
+        self.assertIsNone(topology.kernel_modules)
+
+    def test_prefetch(self):
+        other = mock.Mock(host='10.0.0.2', port=22)
+        other.execute.side_effect = IOError
+
+        host_topology.prefetch([
+            (self.connection, 'dpdk-devbind.py'),
+            (mock.Mock(host='10.0.0.1', port=22), 'dpdk-devbind.py'),
+            (other, None)])
+
+        self.connection.execute.assert_called_once()
+        self.assertEqual('dpdk-devbind.py',
+                         host_topology.get(self.connection).dpdk_devbind)
+        self.assertNotIn(('10.0.0.2', 22), host_topology._CACHE)
+
+    def test_prefetch_no_hosts(self):
+        host_topology.prefetch([])
+        self.assertEqual({}, host_topology._CACHE)
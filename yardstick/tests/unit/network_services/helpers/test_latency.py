@@ -0,0 +1,116 @@
+# Copyright (c) 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from yardstick.network_services.helpers import latency
+
+
+class LatencyHistogramTestCase(unittest.TestCase):
+
+    def test_record_exact_values(self):
+        histogram = latency.LatencyHistogram()
+        for value in range(1, 101):
+            histogram.record(value)
+
+        self.assertEqual(100, histogram.total)
+        self.assertEqual(50, histogram.get_value_at_percentile(50))
+        self.assertEqual(99, histogram.get_value_at_percentile(99))
+        self.assertEqual(100, histogram.get_value_at_percentile(99.99))
+
+    def test_record_relative_error(self):
+        histogram = latency.LatencyHistogram()
+        for value in (1000, 12345, 987654, 123456789):
+            histogram.record(value)
+            percentile = histogram.get_value_at_percentile(100)
+            self.assertLessEqual(value, percentile)
+            self.assertLess(percentile - value, value / 64.0)
+            histogram = latency.LatencyHistogram()
+
+    def test_fixed_memory(self):
+        histogram = latency.LatencyHistogram()
+        size = len(histogram.counts)
+        histogram.record(2 ** 50, count=10)
+        histogram.record(-5)
+
+        self.assertEqual(size, len(histogram.counts))
+        self.assertEqual(0, histogram.min)
+        self.assertEqual(2 ** 40 - 1, histogram.max)
+
+    def test_record_no_count(self):
+        histogram = latency.LatencyHistogram()
+        histogram.record(10, count=0)
+        self.assertEqual(0, histogram.total)
+        self.assertIsNone(histogram.get_value_at_percentile(50))
+        self.assertEqual({}, histogram.get_percentiles())
+
+    def test_merge(self):
+        histogram1 = latency.LatencyHistogram()
+        histogram1.record(10, count=98)
+        histogram2 = latency.LatencyHistogram()
+        histogram2.record(5)
+        histogram2.record(200000)
+
+        histogram1.merge(histogram2)
+        self.assertEqual(100, histogram1.total)
+        self.assertEqual(5, histogram1.min)
+        self.assertEqual(200000, histogram1.max)
+        self.assertEqual(10, histogram1.get_value_at_percentile(99))
+        self.assertEqual(200000, histogram1.get_value_at_percentile(99.9))
+
+    def test_merge_different_precision(self):
+        with self.assertRaises(ValueError):
+            latency.LatencyHistogram().merge(
+                latency.LatencyHistogram(sub_bucket_bits=8))
+
+    def test_get_percentiles(self):
+        histogram = latency.LatencyHistogram()
+        histogram.record(1000, count=9980)
+        histogram.record(5000, count=18)
+        histogram.record(100000, count=2)
+
+        percentiles = histogram.get_percentiles()
+        self.assertEqual({'p50', 'p99', 'p99_9', 'p99_99'},
+                         set(percentiles))
+        self.assertAlmostEqual(1.0, percentiles['p99'], delta=0.02)
+        self.assertAlmostEqual(5.0, percentiles['p99_9'], delta=0.1)
+        self.assertEqual(100.0, percentiles['p99_99'])
+
+
+class FromGeneratorsTestCase(unittest.TestCase):
+
+    def test_from_trex_latency(self):
+        histogram = latency.from_trex_latency([
+            {'histogram': {10: 3, '20': 1}}, None, {'histogram': {100: 1}}])
+
+        # upper bound of the buckets
+        self.assertEqual(5, histogram.total)
+        self.assertEqual(20000, histogram.min)
+        self.assertEqual(200000, histogram.max)
+
+    def test_from_trex_latency_bucket_upper_bound(self):
+        for bucket, upper_bound in ((0, 10), (10, 20), (90, 100),
+                                    (100, 200), (900, 1000), (1000, 2000)):
+            histogram = latency.from_trex_latency([
+                {'histogram': {bucket: 1}}])
+            self.assertEqual(upper_bound * 1000, histogram.max)
+
+    def test_from_prox_buckets(self):
+        # 2 GHz TSC: a bucket of 2 ** 11 cycles is 1024 nsec
+        histogram = latency.from_prox_buckets({0: 10, 3: 1}, 11, 2e9)
+
+        # upper bound of the buckets
+        self.assertEqual(11, histogram.total)
+        self.assertEqual(1024, histogram.min)
+        self.assertEqual(4096, histogram.max)
@@ -13,6 +13,8 @@
 # limitations under the License.
 #
 
+from collections import OrderedDict
+
 import mock
 import os
 import six
@@ -465,9 +467,21 @@ class TestMultiPortConfig(unittest.TestCase):
         opnfv_vnf.generate_config_data = mock.Mock()
         opnfv_vnf.write_parser = mock.MagicMock()
         opnfv_vnf.is_openstack = True
-        self.assertIsNone(opnfv_vnf.generate_config())
+        self.assertEqual('[EAL]\n\n', opnfv_vnf.generate_config())
         opnfv_vnf.is_openstack = False
-        self.assertIsNone(opnfv_vnf.generate_config())
+        self.assertEqual('[EAL]\n\n', opnfv_vnf.generate_config())
+
+    def test_render_config(self):
+        opnfv_vnf = samplevnf_helper.MultiPortConfig(
+            mock.Mock(), mock.Mock(), 'tmp_file', mock.MagicMock())
+        opnfv_vnf.write_parser = OrderedDict([
+            ('PIPELINE0', OrderedDict([('type', 'MASTER'), ('core', '0')])),
+            ('PIPELINE1', OrderedDict([('pktq_in', 'SWQ0\nSWQ1')])),
+        ])
+
+        self.assertEqual('[PIPELINE0]\ntype = MASTER\ncore = 0\n\n'
+                         '[PIPELINE1]\npktq_in = SWQ0\n\tSWQ1\n\n',
+                         opnfv_vnf.render_config())
 
     def test_get_config_tpl_data(self):
         topology_file = mock.Mock()
@@ -91,6 +91,112 @@ TRAFFIC_PARAMETERS = {
 }
 
 
+class FakeIxNet(object):
+    """Local stand-in of the IxNetwork API statistics views and traffic"""
+
+    def __init__(self, views, page_size=2):
+        self.views = views
+        self.page_size = page_size
+        self.current_page = {}
+        self.traffic_states = []
+        self.calls = 0
+
+    def _page_rows(self, page_obj):
+        rows = self.views[page_obj[:-len('/page')]]['rows']
+        first = (self.current_page.get(page_obj, 1) - 1) * self.page_size
+        return rows[first:first + self.page_size]
+
+    def getAttribute(self, obj, attribute):
+        self.calls += 1
+        if attribute == '-state':
+            return self.traffic_states.pop(0)
+        view = self.views[obj[:-len('/page')]]
+        if attribute == '-columnCaptions':
+            return view['captions']
+        elif attribute == '-totalPages':
+            return str(max(1, -(-len(view['rows']) // self.page_size)))
+        elif attribute == '-rowValues':
+            return [[row] for row in self._page_rows(obj)]
+
+    def setAttribute(self, obj, attribute, value):
+        self.calls += 1
+        if attribute == '-currentPage':
+            self.current_page[obj] = value
+
+    def commit(self):
+        self.calls += 1
+
+    def getRoot(self):
+        return '::ixNet::OBJ-/'
+
+    def getList(self, *args):
+        return ['::ixNet::OBJ-/traffic/trafficItem:1']
+
+    def execute(self, *args):
+        self.calls += 1
+
+
+class TestIxNextgenStats(unittest.TestCase):
+
+    PORT_VIEW = '::ixNet::OBJ-/statistics/view:"Port Statistics"'
+    FLOW_VIEW = '::ixNet::OBJ-/statistics/view:"Flow Statistics"'
+
+    def setUp(self):
+        port_captions = list(ixnet_api.IxNextgen.PORT_STATS_NAME_MAP.values())
+        flow_captions = (['Tx Port', 'Rx Port'] +
+                         list(ixnet_api.IxNextgen.LATENCY_NAME_MAP.values()))
+        self.ixnet = FakeIxNet({
+            self.PORT_VIEW: {
+                'captions': port_captions,
+                'rows': [[str(port * 100 + column)
+                          for column in range(len(port_captions))]
+                         for port in range(3)]},
+            self.FLOW_VIEW: {
+                'captions': flow_captions,
+                'rows': [['Port 1', 'Port 2', '10', '5', '20'],
+                         ['Port 2', 'Port 1', '11', '6', '21']]},
+        })
+        self.ixnet_gen = ixnet_api.IxNextgen()
+        self.ixnet_gen._ixnet = self.ixnet
+
+    def test_get_statistics(self):
+        stats = self.ixnet_gen.get_statistics()
+
+        index = list(self.ixnet_gen.PORT_STATS_NAME_MAP.values()).index(
+            'Frames Tx.')
+        self.assertEqual([str(index), str(100 + index), str(200 + index)],
+                         stats['Frames_Tx'])
+        self.assertEqual(['10', '11'], stats['Store-Forward_Avg_latency_ns'])
+        self.assertEqual(['20', '21'], stats['Store-Forward_Max_latency_ns'])
+        # port view: captions, pages, 2 x (set page, commit, rows);
+        # flow view: captions, pages, rows
+        self.assertEqual(11, self.ixnet.calls)
+
+    def test_get_statistics_missing_column(self):
+        self.ixnet.views[self.FLOW_VIEW]['captions'] = ['Tx Port', 'Rx Port']
+        self.ixnet.views[self.FLOW_VIEW]['rows'] = [['Port 1', 'Port 2']]
+
+        with self.assertRaises(exceptions.IxNetworkStatisticNotPresent) as \
+                raised:
+            self.ixnet_gen.get_statistics()
+        self.assertIn('Store-Forward Avg Latency (ns)', str(raised.exception))
+        self.assertIn(self.FLOW_VIEW, str(raised.exception))
+
+    def test_start_traffic_poll_interval(self):
+        self.ixnet.traffic_states = ['stopped', 'stopped', 'started']
+        self.ixnet_gen.poll_interval = 0.1
+        with mock.patch.object(ixnet_api.utils.time, 'sleep') as mock_sleep:
+            self.ixnet_gen.start_traffic()
+        mock_sleep.assert_called_once_with(0.1)
+
+    def test_get_poll_interval(self):
+        self.assertEqual(ixnet_api.POLL_INTERVAL_MAX,
+                         ixnet_api.get_poll_interval(60))
+        self.assertEqual(0.5, ixnet_api.get_poll_interval(5))
+        self.assertEqual(ixnet_api.POLL_INTERVAL_MIN,
+                         ixnet_api.get_poll_interval(0.2))
+
+
 class TestIxNextgen(unittest.TestCase):
 
     def setUp(self):
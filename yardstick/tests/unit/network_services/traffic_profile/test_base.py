@@ -82,6 +82,12 @@ class TrafficProfileConfigTestCase(unittest.TestCase):
         self.assertEqual({'64B': 100}, tp_config_obj.packet_sizes)
         self.assertEqual(base.TrafficProfileConfig.DEFAULT_DURATION,
                          tp_config_obj.duration)
+        self.assertFalse(tp_config_obj.steady_state)
+
+    def test__init_steady_state(self):
+        tp_config = {'traffic_profile': {'steady_state': True}}
+        tp_config_obj = base.TrafficProfileConfig(tp_config)
+        self.assertTrue(tp_config_obj.steady_state)
 
     def test__init_set_duration(self):
         tp_config = {'traffic_profile': {'duration': 15}}
@@ -82,10 +82,13 @@ class TestRFC2544Profile(base.BaseUnitTestCase):
     def test_stop_traffic(self):
         rfc2544_profile = rfc2544.RFC2544Profile(self.TRAFFIC_PROFILE)
         mock_generator = mock.Mock()
+        rfc2544_profile._ports = [10, 20]
         rfc2544_profile.stop_traffic(traffic_generator=mock_generator)
         mock_generator.client.stop.assert_called_once()
-        mock_generator.client.reset.assert_called_once()
-        mock_generator.client.remove_all_streams.assert_called_once()
+        mock_generator.client.clear_stats.assert_called_once_with(
+            ports=[10, 20])
+        mock_generator.client.reset.assert_not_called()
+        mock_generator.client.remove_all_streams.assert_not_called()
 
     def test_execute_traffic(self):
         rfc2544_profile = rfc2544.RFC2544Profile(self.TRAFFIC_PROFILE)
@@ -113,9 +116,48 @@ class TestRFC2544Profile(base.BaseUnitTestCase):
             mock.call(mock.ANY, ports=[20]),
             mock.call(mock.ANY, ports=[30]),
             mock.call(mock.ANY, ports=[40])])
-        mock_generator.client.start(ports=[10, 20, 30, 40],
-                                    duration=rfc2544_profile.config.duration,
-                                    force=True)
+        mock_generator.client.start.assert_called_once_with(
+            ports=[10, 20, 30, 40], mult='1.00000000',
+            duration=rfc2544_profile.config.duration, force=True)
+
+    def test_execute_traffic_reuse_streams(self):
+        rfc2544_profile = rfc2544.RFC2544Profile(self.TRAFFIC_PROFILE)
+        mock_generator = mock.Mock()
+        port_pg_id = rfc2544.PortPgIDMap()
+        with mock.patch.object(rfc2544_profile, '_add_streams',
+                               return_value=([10, 20], port_pg_id)) as \
+                mock_add_streams:
+            rfc2544_profile.execute_traffic(traffic_generator=mock_generator)
+            rfc2544_profile.rate = rfc2544_profile.rate / 4
+            self.assertEqual(([10, 20], port_pg_id),
+                             rfc2544_profile.execute_traffic())
+
+        mock_add_streams.assert_called_once()
+        mock_generator.client.start.assert_called_with(
+            ports=[10, 20], mult='0.25000000',
+            duration=rfc2544_profile.config.duration, force=True)
+
+        # a new generator removes the streams from the ports
+        with mock.patch.object(rfc2544_profile, '_add_streams',
+                               return_value=([10, 20], port_pg_id)) as \
+                mock_add_streams:
+            rfc2544_profile.register_generator(mock_generator)
+            rfc2544_profile.execute_traffic()
+        mock_add_streams.assert_called_once()
+        mock_generator.client.start.assert_called_with(
+            ports=[10, 20], mult='1.00000000',
+            duration=rfc2544_profile.config.duration, force=True)
+
+    def test_execute_traffic_steady_state(self):
+        rfc2544_profile = rfc2544.RFC2544Profile(self.TRAFFIC_PROFILE)
+        rfc2544_profile.config.steady_state = True
+        mock_generator = mock.Mock()
+        with mock.patch.object(rfc2544_profile, '_add_streams',
+                               return_value=([10, 20], mock.ANY)):
+            rfc2544_profile.execute_traffic(traffic_generator=mock_generator)
+
+        mock_generator.client.start.assert_called_once_with(
+            ports=[10, 20], mult='1.00000000', duration=-1, force=True)
 
     @mock.patch.object(trex_stl_streams, 'STLProfile')
     def test__create_profile(self, mock_stl_profile):
@@ -258,19 +300,22 @@ class TestRFC2544Profile(base.BaseUnitTestCase):
                      'rx_throughput_fps': 108,
                      'out_packets': 2110,
                      'in_packets': 2040,
-                     'latency': 'Latency1',
+                     'latency': {1: {'histogram': {10: 50}}},
                      'timestamp': datetime.datetime(2000, 1, 1, 1, 1, 1, 31)},
              'xe2': {'tx_throughput_fps': 253,
                      'rx_throughput_fps': 215,
                      'out_packets': 4150,
                      'in_packets': 4010,
-                     'latency': 'Latency2',
+                     'latency': {2: {'histogram': {30: 49, 500: 1}}},
                      'timestamp': datetime.datetime(2000, 1, 1, 1, 1, 1, 31)}}
         ]
         completed, output = rfc2544_profile.get_drop_percentage(
             samples, 0, 0, False)
         expected = {'DropPercentage': 50.0,
-                    'Latency': {'xe1': 'Latency1', 'xe2': 'Latency2'},
+                    'Latency': {'xe1': {1: {'histogram': {10: 50}}},
+                                'xe2': {2: {'histogram': {30: 49, 500: 1}}}},
+                    'LatencyPercentiles': {'p50': 20.223, 'p99': 40.447,
+                                           'p99_9': 600.0, 'p99_99': 600.0},
                     'RxThroughput': 1000000.0,
                     'TxThroughput': 2000000.0,
                     'CurrentDropPercentage': 50.0,
@@ -0,0 +1,72 @@
+# Copyright (c) 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+
+import jinja2
+
+from yardstick.common import exceptions
+from yardstick.common.yaml_loader import yaml_load
+from yardstick.network_services.vnf_generic import scale_out
+
+
+TOPOLOGY_TEMPLATE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', '..', '..',
+    'samples', 'vnf_samples', 'nsut', 'acl',
+    'acl-tg-topology-3node-scale-out.yaml')
+VNF_MODEL = '../../vnf_descriptors/acl_vnf.yaml'
+
+
+class ScaleOutTestCase(unittest.TestCase):
+
+    def test_generate_topology(self):
+        topology = scale_out.generate_topology(2, VNF_MODEL)
+
+        self.assertEqual('2-vnf-correlated', topology['id'])
+        self.assertEqual(['tg__0', 'tg__1', 'vnf__0', 'vnf__1'],
+                         [vnfd['vnfd-id-ref']
+                          for vnfd in topology['constituent-vnfd']])
+        self.assertEqual(['uplink_0', 'downlink_0', 'uplink_1', 'downlink_1'],
+                         [vld['id'] for vld in topology['vld']])
+        uplink_1 = topology['vld'][2]['vnfd-connection-point-ref']
+        self.assertEqual(('0', 'xe1'), (uplink_1[0]['member-vnf-index-ref'],
+                                        uplink_1[0]['vnfd-connection-point-ref']))
+        self.assertEqual(('3', 'xe0'), (uplink_1[1]['member-vnf-index-ref'],
+                                        uplink_1[1]['vnfd-connection-point-ref']))
+
+    def test_generate_topology_as_template(self):
+        # same topology as the one of the scale-out test case templates
+        with open(TOPOLOGY_TEMPLATE) as template_file:
+            rendered = jinja2.Template(template_file.read()).render(
+                num_vnfs=4)
+        expected = yaml_load(rendered)['nsd:nsd-catalog']['nsd'][0]
+
+        self.assertEqual(expected, scale_out.generate_topology(4, VNF_MODEL))
+
+    def test_generate_topology_no_vnf(self):
+        for num_vnfs in (0, -1, 'many', None):
+            with self.assertRaises(exceptions.IncorrectConfig):
+                scale_out.generate_topology(num_vnfs, VNF_MODEL)
+
+    def test_generate_nodes(self):
+        self.assertEqual(
+            {'tg__0': 'tg_0.demo', 'tg__1': 'tg_1.demo',
+             'vnf__0': 'vnf_0.demo', 'vnf__1': 'vnf_1.demo'},
+            scale_out.generate_nodes(2, context_name='demo'))
+
+    def test_generate_nodes_no_vnf(self):
+        for num_vnfs in (0, -1, 'many', None):
+            with self.assertRaises(exceptions.IncorrectConfig):
+                scale_out.generate_nodes(num_vnfs)
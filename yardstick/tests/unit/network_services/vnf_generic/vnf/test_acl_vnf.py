@@ -21,6 +21,7 @@ import copy
 from yardstick.common import utils
 from yardstick.common import exceptions
 from yardstick.benchmark.contexts import base as ctx_base
+from yardstick.network_services.helpers import config_cache
 from yardstick.network_services.vnf_generic.vnf import acl_vnf
 from yardstick.network_services.vnf_generic.vnf.base import VnfdHelper
 from yardstick.network_services.nfvi.resource import ResourceProfile
@@ -271,11 +272,8 @@ class TestAclApproxVnf(unittest.TestCase):
 
         vnfd = self.VNFD['vnfd:vnfd-catalog']['vnfd'][0]
         acl_approx_vnf = acl_vnf.AclApproxVnf(name, vnfd, 'task_id')
-        acl_approx_vnf.q_in = mock.MagicMock()
-        acl_approx_vnf.q_out = mock.MagicMock()
-        acl_approx_vnf.q_out.qsize = mock.Mock(return_value=0)
         cmd = "quit"
-        self.assertEqual("", acl_approx_vnf.vnf_execute(cmd))
+        self.assertEqual("", acl_approx_vnf.vnf_execute(cmd, 0))
 
     @mock.patch(SSH_HELPER)
     def test_get_stats(self, ssh, *args):
@@ -493,6 +491,9 @@ class TestAclApproxSetupEnvSetupEnvHelper(unittest.TestCase):
             result = re.findall(pattern, config, re.MULTILINE)
             self.assertEqual(len(result), num_of_match)
 
+    @mock.patch.object(config_cache, 'memoize',
+                       side_effect=lambda key, build: build())
+    @mock.patch.object(config_cache, 'read_file')
     @mock.patch('yardstick.network_services.vnf_generic.vnf.sample_vnf.open')
     @mock.patch.object(utils, 'find_relative_file')
     @mock.patch('yardstick.network_services.vnf_generic.vnf.sample_vnf.MultiPortConfig')
@@ -19,6 +19,7 @@ import uuid
 import mock
 from oslo_config import cfg
 import oslo_messaging
+from six import moves
 import unittest
 
 from yardstick.common import messaging
@@ -228,6 +229,52 @@ class TestQueueFileWrapper(unittest.TestCase):
         queue_file_wrapper.write("pipeline>")
         self.assertIsNotNone(queue_file_wrapper.q_out.empty())
 
+    def test_write_split_prompt(self):
+        q_out = moves.queue.Queue()
+        queue_file_wrapper = \
+            base.QueueFileWrapper(self.q_in, q_out, self.prompt)
+        queue_file_wrapper.write("output\r\npipe")
+        self.assertTrue(q_out.empty())
+        queue_file_wrapper.write("line>")
+        self.assertEqual("output\r\npipeline>", q_out.get_nowait())
+
+
+class VnfConsoleTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.q_in = moves.queue.Queue()
+        self.q_out = moves.queue.Queue()
+        self.console = base.VnfConsole(self.q_in, self.q_out, 'pipeline>')
+
+    def test_execute(self):
+        self.q_out.put('stale output')
+        self.console.clear()
+        self.q_out.put('output\r\npipe')
+        self.q_out.put('line>')
+        self.assertEqual('output\r\npipeline>',
+                         ''.join(self.console.iter_responses(1, 0)))
+
+        self.q_out.put('stale output')
+        self.assertEqual('', self.console.execute('cmd', 0))
+        self.assertEqual('cmd\r\n', self.q_in.get_nowait())
+
+    def test_execute_many(self):
+        self.q_out.put('out1\r\npipeline>out2\r\n')
+        self.q_out.put('pipeline>')
+        self.console.q_out = mock.Mock(wraps=self.q_out)
+        self.console.q_out.get_nowait.side_effect = moves.queue.Empty
+
+        responses = list(self.console.execute_many(['cmd1', 'cmd2'], 0))
+
+        self.assertEqual([('cmd1', 'out1\r\npipeline>'),
+                          ('cmd2', 'out2\r\npipeline>')], responses)
+        self.assertEqual('cmd1\r\ncmd2\r\n', self.q_in.get_nowait())
+
+    def test_iter_responses_timeout(self):
+        self.q_out.put('out1\r\npipeline>out2')
+        self.assertEqual(['out1\r\npipeline>', 'out2'],
+                         list(self.console.iter_responses(3, 0)))
+
 
 class TestGenericVNF(ut_base.BaseUnitTestCase):
 
@@ -21,6 +21,7 @@ import unittest
 from yardstick.benchmark.contexts import base as ctx_base
 from yardstick.common import utils
 from yardstick.common import process
+from yardstick.network_services.helpers import config_cache
 from yardstick.network_services.vnf_generic.vnf import cgnapt_vnf
 from yardstick.network_services.vnf_generic.vnf import sample_vnf
 from yardstick.network_services.nfvi import resource
@@ -74,6 +75,9 @@ link 1 up
         with self.assertRaises(NotImplementedError):
             helper.scale()
 
+    @mock.patch.object(config_cache, 'memoize',
+                       side_effect=lambda key, build: build())
+    @mock.patch.object(config_cache, 'read_file')
     @mock.patch('yardstick.network_services.vnf_generic.vnf.sample_vnf.open')
     @mock.patch.object(utils, 'find_relative_file')
     @mock.patch('yardstick.network_services.vnf_generic.vnf.sample_vnf.MultiPortConfig')
@@ -350,10 +354,7 @@ class TestCgnaptApproxVnf(unittest.TestCase):
     def test_vnf_execute_command(self, *args):
         vnfd = self.VNFD['vnfd:vnfd-catalog']['vnfd'][0]
         cgnapt_approx_vnf = cgnapt_vnf.CgnaptApproxVnf(name, vnfd, 'task_id')
-        cgnapt_approx_vnf.q_in = mock.Mock()
-        cgnapt_approx_vnf.q_out = mock.Mock()
-        cgnapt_approx_vnf.q_out.qsize = mock.Mock(return_value=0)
-        self.assertEqual("", cgnapt_approx_vnf.vnf_execute('quit'))
+        self.assertEqual("", cgnapt_approx_vnf.vnf_execute('quit', 0))
 
     def test_get_stats(self, *args):
         vnfd = self.VNFD['vnfd:vnfd-catalog']['vnfd'][0]
@@ -397,13 +398,16 @@ class TestCgnaptApproxVnf(unittest.TestCase):
         vnfd = self.VNFD['vnfd:vnfd-catalog']['vnfd'][0]
         self.scenario_cfg['options'][name]['napt'] = 'static'
         cgnapt_approx_vnf = cgnapt_vnf.CgnaptApproxVnf(name, vnfd, 'task_id')
-        cgnapt_approx_vnf.vnf_execute = mock.Mock()
+        cgnapt_approx_vnf.vnf_execute_many = mock.Mock()
         cgnapt_approx_vnf.scenario_helper.scenario_cfg = self.scenario_cfg
         with mock.patch.object(cgnapt_approx_vnf, 'setup_helper') as \
                 mock_setup_helper:
             mock_setup_helper._generate_ip_from_pool.return_value = ['ip1']
             mock_setup_helper._get_cgnapt_config.return_value = ['gw_ip1']
+            mock_setup_helper.SW_DEFAULT_CORE = 6
             cgnapt_approx_vnf._vnf_up_post()
+        cgnapt_approx_vnf.vnf_execute_many.assert_called_once_with(
+            ['p 5 entry addm gw_ip1 1 ip1 1 0 32 65535 65535 65535'])
 
     def test__vnf_up_post_short(self, *args):
         vnfd = self.VNFD['vnfd:vnfd-catalog']['vnfd'][0]
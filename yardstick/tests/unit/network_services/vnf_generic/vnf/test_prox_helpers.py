@@ -14,7 +14,9 @@
 
 from itertools import repeat, chain
 import os
+import shutil
 import socket
+import tempfile
 import time
 
 import mock
@@ -22,6 +24,8 @@ import unittest
 
 from yardstick.common import utils
 from yardstick.network_services import constants
+from yardstick.network_services.helpers import config_cache
+from yardstick.network_services.helpers import host_topology
 from yardstick.network_services.vnf_generic.vnf import base as vnf_base
 from yardstick.network_services.vnf_generic.vnf import prox_helpers
 from yardstick.network_services.vnf_generic.vnf import sample_vnf
@@ -188,6 +192,13 @@ class TestProxTestDataTuple(unittest.TestCase):
         result = prox_test_data.get_samples(64, 0.123)
         self.assertDictEqual(result, expected)
 
+    def test_get_samples_latency_percentiles(self):
+        prox_test_data = prox_helpers.ProxTestDataTuple(
+            1, 2, 3, 4, 5, [6.1, 6.9, 6.4], 7, 8, 9, {'p99': 6.8})
+
+        result = prox_test_data.get_samples(64)
+        self.assertEqual({'p99': 6.8}, result['LatencyPercentiles'])
+
     @mock.patch('yardstick.LOG_RESULT', create=True)
     def test_log_data(self, mock_logger):
         my_mock_logger = mock.MagicMock()
@@ -509,6 +520,28 @@ class TestProxSocketHelper(unittest.TestCase):
         self.assertEqual(mock_socket.sendall.call_count, 5)
         self.assertEqual(result, expected)
 
+    @mock.patch.object(prox_helpers, 'select')
+    def test_get_lines(self, mock_select):
+        mock_select.select.side_effect = [([1], [], []), ([1], [], []),
+                                          ([], [], [])]
+        mock_socket = mock.MagicMock()
+        mock_socket.recv.return_value.decode.side_effect = [
+            'Bucket [0]: 1\nBuck', 'et [1]: 2\n']
+        prox = prox_helpers.ProxSocketHelper(mock_socket)
+
+        self.assertEqual(['Bucket [0]: 1', 'Bucket [1]: 2'], prox.get_lines())
+
+    def test_lat_buckets(self):
+        mock_socket = mock.MagicMock()
+        prox = prox_helpers.ProxSocketHelper(mock_socket)
+        prox.get_lines = mock.Mock(side_effect=[
+            ['Bucket [0]: 10', 'Bucket [5]: 2', 'invalid'],
+            ['Bucket [5]: 3']])
+
+        self.assertEqual({0: 10, 5: 5}, prox.lat_buckets([3, 4], 1))
+        mock_socket.sendall.assert_has_calls([
+            mock.call(b'lat packets 3 1\n'), mock.call(b'lat packets 4 1\n')])
+
     def test_get_all_tot_stats_error(self):
         mock_socket = mock.MagicMock()
         prox = prox_helpers.ProxSocketHelper(mock_socket)
@@ -996,8 +1029,11 @@ class TestProxDpdkVnfSetupEnvHelper(unittest.TestCase):
         result = setup_helper.prox_config_data
         self.assertEqual(result, expected)
 
+    @mock.patch.object(config_cache, 'memoize',
+                       side_effect=lambda key, build: build())
+    @mock.patch.object(config_cache, 'read_file')
     @mock.patch.object(utils, 'find_relative_file')
-    def test_build_config_file_no_additional_file(self, mock_find_path):
+    def test_build_config_file_no_additional_file(self, mock_find_path, *args):
         vnf1 = {
             'prox_args': {'-c': ""},
             'prox_path': 'd',
@@ -1031,8 +1067,11 @@ class TestProxDpdkVnfSetupEnvHelper(unittest.TestCase):
         self.assertEqual(helper._prox_config_data, '4')
         self.assertEqual(helper.remote_path, '5')
 
+    @mock.patch.object(config_cache, 'memoize',
+                       side_effect=lambda key, build: build())
+    @mock.patch.object(config_cache, 'read_file')
     @mock.patch.object(utils, 'find_relative_file')
-    def test_build_config_file_additional_file_string(self, mock_find_path):
+    def test_build_config_file_additional_file_string(self, mock_find_path, *args):
         vnf1 = {
             'prox_args': {'-c': ""},
             'prox_path': 'd',
@@ -1064,8 +1103,11 @@ class TestProxDpdkVnfSetupEnvHelper(unittest.TestCase):
         helper.build_config_file()
         self.assertDictEqual(helper.additional_files, expected)
 
+    @mock.patch.object(config_cache, 'memoize',
+                       side_effect=lambda key, build: build())
+    @mock.patch.object(config_cache, 'read_file')
     @mock.patch.object(utils, 'find_relative_file')
-    def test_build_config_file_additional_file(self, mock_find_path):
+    def test_build_config_file_additional_file(self, mock_find_path, *args):
         vnf1 = {
             'prox_args': {'-c': ""},
             'prox_path': 'd',
@@ -1290,6 +1332,26 @@ class TestProxDpdkVnfSetupEnvHelper(unittest.TestCase):
         with self.assertRaises(Exception):
             helper.generate_prox_config_file('a/b')
 
+    @mock.patch.object(config_cache, 'read_file', return_value='[port 0]')
+    def test__get_prox_config(self, mock_read_file):
+        vnfd_helper = vnf_base.VnfdHelper(self.VNFD0)
+        helper = prox_helpers.ProxDpdkVnfSetupEnvHelper(
+            vnfd_helper, mock.MagicMock(), mock.MagicMock())
+        sections = [['port 0', [['mac', 'hardware']]]]
+        helper.generate_prox_config_file = mock.Mock(return_value=sections)
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        self.addCleanup(config_cache.clear)
+
+        with mock.patch.object(config_cache, 'CACHE_DIR', cache_dir):
+            self.assertEqual(sections, helper._get_prox_config('prox.cfg'))
+            self.assertEqual(sections, helper._get_prox_config('prox.cfg'))
+            helper.additional_files = {'ipv4.lua': '/tmp/ipv4.lua'}
+            self.assertEqual(sections, helper._get_prox_config('prox.cfg'))
+
+        self.assertEqual(2, helper.generate_prox_config_file.call_count)
+        mock_read_file.assert_called_with('prox.cfg')
+
     def test_put_string_to_file(self):
         vnfd_helper = mock.MagicMock()
         vnfd_helper.interfaces = []
@@ -1528,9 +1590,67 @@ class TestProxResourceHelper(unittest.TestCase):
         setup_helper = mock.MagicMock()
         helper = prox_helpers.ProxResourceHelper(setup_helper)
         traffic_profile = mock.MagicMock(**{"done": True})
+        traffic_profile.config.steady_state = False
         helper.run_traffic(traffic_profile)
         self.assertEqual(helper._terminated.value, 1)
 
+    def test_run_traffic_steady_state(self):
+        helper = prox_helpers.ProxResourceHelper(mock.MagicMock())
+        helper.client = mock.Mock()
+        traffic_profile = mock.MagicMock()
+        traffic_profile.config.steady_state = True
+        with mock.patch.object(helper, '_run_steady_state') as \
+                mock_run_steady_state:
+            helper.run_traffic(traffic_profile, 'mq_producer')
+
+        mock_run_steady_state.assert_called_once_with(traffic_profile,
+                                                      'mq_producer')
+        helper.client.stop_all.assert_called_once()
+        traffic_profile.execute_traffic.assert_not_called()
+
+    def test__start_steady_state(self):
+        helper = prox_helpers.ProxResourceHelper(mock.MagicMock())
+        helper.client = mock.Mock()
+        traffic_profile = mock.Mock(pkt_sizes=[60], min_pkt_size=78)
+        traffic_profile.make_profile_helper.return_value.test_cores = [1, 2]
+        traffic_profile.config.frame_rate = 50.0
+        traffic_profile.config.rate_unit = '%'
+
+        helper._start_steady_state(traffic_profile)
+        helper.client.set_pkt_size.assert_called_once_with([1, 2], 74)
+        helper.client.set_speed.assert_called_once_with([1, 2], 50.0)
+        helper.client.start_all.assert_called_once()
+
+        helper._pause_traffic()
+        helper.client.stop.assert_called_once_with([1, 2])
+        helper._resume_traffic()
+        helper.client.start.assert_called_once_with([1, 2])
+
+    def test__set_traffic_rate_fps(self):
+        helper = prox_helpers.ProxResourceHelper(mock.MagicMock())
+        helper.client = mock.Mock()
+        helper._steady_state_cores = [1, 2]
+        helper._steady_state_pkt_size = 64
+        helper._traffic_rate_unit = 'fps'
+
+        # 14880952 fps, 10 Gbps with 64B packets, from 2 cores
+        helper._set_traffic_rate(14880952)
+        cores, speed = helper.client.set_speed.call_args[0]
+        self.assertEqual([1, 2], cores)
+        self.assertAlmostEqual(50.0, speed, places=4)
+
+    def test__get_port_counters(self):
+        setup_helper = mock.MagicMock()
+        setup_helper.vnfd_helper.ports_iter.return_value = iter(
+            [('xe0', 0), ('xe1', 1)])
+        helper = prox_helpers.ProxResourceHelper(setup_helper)
+        helper.client = mock.Mock()
+        helper.client.multi_port_stats.return_value = [[0, 10, 20, 0, 0, 1],
+                                                       0]
+
+        self.assertEqual({'xe0': (10, 20)}, helper._get_port_counters())
+        helper.client.multi_port_stats.assert_called_once_with([0, 1])
+
     def test__run_traffic_once(self):
         setup_helper = mock.MagicMock()
         helper = prox_helpers.ProxResourceHelper(setup_helper)
@@ -1722,8 +1842,9 @@ class TestProxProfileHelper(unittest.TestCase):
         mock_utils.itersubclasses.return_value = []
         prox_helpers.ProxProfileHelper.get_cls('my_type')
 
+    @mock.patch.object(host_topology, 'get', return_value=None)
     @mock.patch('yardstick.network_services.vnf_generic.vnf.prox_helpers.SocketTopology')
-    def test_cpu_topology(self, mock_socket_topology):
+    def test_cpu_topology(self, mock_socket_topology, *args):
         mock_socket_topology.parse_cpuinfo.return_value = 432
 
         resource_helper = mock.MagicMock()
@@ -1923,6 +2044,20 @@ class TestProxProfileHelper(unittest.TestCase):
         result = helper.get_latency()
         self.assertIs(result, expected)
 
+    def test_get_latency_percentiles(self):
+        resource_helper = mock.MagicMock()
+        helper = prox_helpers.ProxProfileHelper(resource_helper)
+        helper._latency_cores = []
+        with mock.patch.object(helper, 'get_cores', return_value=[]):
+            self.assertEqual({}, helper.get_latency_percentiles(2e9))
+
+        helper._latency_cores = [1, 2]
+        helper.sut.lat_buckets.return_value = {0: 99, 100: 1}
+        result = helper.get_latency_percentiles(2e9)
+        helper.sut.lat_buckets.assert_called_once_with([1, 2])
+        self.assertAlmostEqual(1.024, result['p50'], delta=0.02)
+        self.assertAlmostEqual(103.4, result['p99_9'], delta=1)
+
     @mock.patch('yardstick.network_services.vnf_generic.vnf.prox_helpers.time')
     def test_traffic_context(self, *args):
         setup_helper = mock.MagicMock()
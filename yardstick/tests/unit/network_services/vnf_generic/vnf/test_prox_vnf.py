@@ -21,6 +21,7 @@ from copy import deepcopy
 
 from yardstick.tests import STL_MOCKS
 from yardstick.benchmark.contexts import base as ctx_base
+from yardstick.network_services.helpers import config_cache
 
 
 SSH_HELPER = 'yardstick.network_services.vnf_generic.vnf.sample_vnf.VnfSshHelper'
@@ -393,6 +394,9 @@ class TestProxApproxVnf(unittest.TestCase):
         file_path = os.path.join(curr_path, filename)
         return file_path
 
+    @mock.patch.object(config_cache, 'memoize',
+                       side_effect=lambda key, build: build())
+    @mock.patch.object(config_cache, 'read_file')
     @mock.patch('yardstick.common.utils.open', create=True)
     @mock.patch('yardstick.benchmark.scenarios.networking.vnf_generic.open', create=True)
     @mock.patch('yardstick.network_services.helpers.iniparser.open', create=True)
@@ -13,13 +13,16 @@
 # limitations under the License.
 
 from copy import deepcopy
-
+import shutil
+import tempfile
 import unittest
 import mock
 import six
 
 from yardstick.common import exceptions as y_exceptions
 from yardstick.common import utils
+from yardstick.network_services.helpers import config_cache
+from yardstick.network_services.helpers import host_topology
 from yardstick.network_services.nfvi.resource import ResourceProfile
 from yardstick.network_services.vnf_generic.vnf.base import VnfdHelper
 from yardstick.network_services.vnf_generic.vnf import sample_vnf
@@ -553,6 +556,9 @@ class TestDpdkVnfSetupEnvHelper(unittest.TestCase):
                 '%s', 1048576, 8, 100)
         mock_meminfo.assert_called_once_with(ssh_helper)
 
+    @mock.patch.object(config_cache, 'memoize',
+                       side_effect=lambda key, build: build())
+    @mock.patch.object(config_cache, 'read_file')
     @mock.patch('yardstick.network_services.vnf_generic.vnf.sample_vnf.open')
     @mock.patch.object(utils, 'find_relative_file')
     @mock.patch('yardstick.network_services.vnf_generic.vnf.sample_vnf.MultiPortConfig')
@@ -590,6 +596,40 @@ class TestDpdkVnfSetupEnvHelper(unittest.TestCase):
         mock_multi_port_config.generate_config.assert_called()
         mock_multi_port_config.generate_script.assert_called()
 
+    @mock.patch.object(utils, 'find_relative_file')
+    @mock.patch.object(sample_vnf, 'MultiPortConfig')
+    @mock.patch.object(config_cache, 'read_file', return_value='[PIPELINE0]')
+    def test_build_config_cached(self, mock_read_file,
+                                 mock_multi_port_config_class, *args):
+        mock_multi_port_config = mock_multi_port_config_class.return_value
+        mock_multi_port_config.generate_config.return_value = (
+            '[PIPELINE1]\ntraffic_type = 4\npkt_type = ipv4\n')
+        mock_multi_port_config.generate_script.return_value = 'link 0 up\n'
+        vnfd_helper = VnfdHelper(self.VNFD_0)
+        ssh_helper = mock.Mock()
+        scenario_helper = mock.Mock()
+        scenario_helper.vnf_cfg = {}
+        scenario_helper.options = {}
+        scenario_helper.all_options = {'traffic_type': 6}
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        self.addCleanup(config_cache.clear)
+
+        with mock.patch.object(config_cache, 'CACHE_DIR', cache_dir):
+            for _ in range(2):
+                DpdkVnfSetupEnvHelper(
+                    vnfd_helper, ssh_helper, scenario_helper).build_config()
+            # another template is another configuration
+            mock_read_file.return_value = '[PIPELINE0]\ncore = 0'
+            DpdkVnfSetupEnvHelper(
+                vnfd_helper, ssh_helper, scenario_helper).build_config()
+
+        self.assertEqual(2, mock_multi_port_config.generate_config.call_count)
+        ssh_helper.upload_config_file.assert_has_calls([
+            mock.call('sample_config',
+                      '[PIPELINE1]\ntraffic_type = 6\npkt_type = ipv6\n'),
+            mock.call('sample_script', 'link 0 up\n')] * 3)
+
     def test__build_pipeline_kwargs(self):
         vnfd_helper = VnfdHelper(self.VNFD_0)
         ssh_helper = mock.Mock()
@@ -615,6 +655,7 @@ class TestDpdkVnfSetupEnvHelper(unittest.TestCase):
 
     @mock.patch('yardstick.network_services.vnf_generic.vnf.sample_vnf.time')
     @mock.patch('yardstick.ssh.SSH')
+    @mock.patch.object(host_topology, 'get', return_value=None)
     def test_setup_vnf_environment(self, *args):
         def execute(cmd):
             if cmd.startswith('which '):
@@ -710,15 +751,15 @@ class TestDpdkVnfSetupEnvHelper(unittest.TestCase):
         scenario_helper = mock.Mock()
         scenario_helper.nodes = [None, None]
         dpdk_setup_helper = DpdkVnfSetupEnvHelper(vnfd_helper, ssh_helper, scenario_helper)
-        dpdk_setup_helper.dpdk_bind_helper.bind = mock.Mock()
+        dpdk_setup_helper.dpdk_bind_helper.bind_drivers = mock.Mock()
         dpdk_setup_helper.dpdk_bind_helper.used_drivers = {
             'd1': ['0000:05:00.0'],
             'd3': ['0000:05:01.0'],
         }
 
         self.assertIsNone(dpdk_setup_helper.tear_down())
-        dpdk_setup_helper.dpdk_bind_helper.bind.assert_any_call(['0000:05:00.0'], 'd1', True)
-        dpdk_setup_helper.dpdk_bind_helper.bind.assert_any_call(['0000:05:01.0'], 'd3', True)
+        dpdk_setup_helper.dpdk_bind_helper.bind_drivers.assert_called_once_with(
+            {'d1': ['0000:05:00.0'], 'd3': ['0000:05:01.0']}, True)
 
 
 class TestResourceHelper(unittest.TestCase):
@@ -1097,6 +1138,7 @@ class TestClientResourceHelper(unittest.TestCase):
         client_resource_helper = ClientResourceHelper(mock.Mock())
         client = mock.Mock()
         traffic_profile = mock.Mock()
+        traffic_profile.config.steady_state = False
         mq_producer = mock.Mock()
         with mock.patch.object(client_resource_helper, '_connect') \
                 as mock_connect, \
@@ -1122,6 +1164,7 @@ class TestClientResourceHelper(unittest.TestCase):
         client_resource_helper = ClientResourceHelper(mock.Mock())
         client = mock.Mock()
         traffic_profile = mock.Mock()
+        traffic_profile.config.steady_state = False
         mq_producer = mock.Mock()
         with mock.patch.object(client_resource_helper, '_connect') \
                 as mock_connect, \
@@ -1142,6 +1185,132 @@ class TestClientResourceHelper(unittest.TestCase):
         mq_producer.tg_method_finished.assert_not_called()
         mq_producer.tg_method_iteration.assert_not_called()
 
+    @mock.patch.object(ClientResourceHelper, '_build_ports')
+    @mock.patch.object(ClientResourceHelper, '_run_traffic_once')
+    @mock.patch.object(ClientResourceHelper, '_run_steady_state')
+    def test_run_traffic_steady_state(self, mock_run_steady_state,
+                                      mock_run_traffic_once, *args):
+        client_resource_helper = ClientResourceHelper(mock.Mock())
+        traffic_profile = mock.Mock()
+        traffic_profile.config.steady_state = True
+        mq_producer = mock.Mock()
+        with mock.patch.object(client_resource_helper, '_connect'):
+            client_resource_helper.run_traffic(traffic_profile, mq_producer)
+
+        mock_run_steady_state.assert_called_once_with(traffic_profile,
+                                                      mq_producer)
+        mock_run_traffic_once.assert_not_called()
+        client_resource_helper.client.stop.assert_called_once()
+        mq_producer.tg_method_finished.assert_called_once()
+
+    def _make_steady_state_helper(self):
+        vnfd_helper = VnfdHelper(self.VNFD_0)
+        dpdk_setup_helper = DpdkVnfSetupEnvHelper(
+            vnfd_helper, mock.Mock(), mock.Mock())
+        helper = ClientResourceHelper(dpdk_setup_helper)
+        helper.client = mock.Mock()
+        helper.all_ports = [0, 1]
+        helper._control_queue = six.moves.queue.Queue()
+        helper._samples_queue = six.moves.queue.Queue()
+        return helper
+
+    def test__run_steady_state(self):
+        helper = self._make_steady_state_helper()
+        helper.STEADY_STATE_INTERVAL = 0.01
+        helper._traffic_rate = 10.0
+        helper.send_traffic_command(sample_vnf.TRAFFIC_MARK, name='failover')
+        helper.send_traffic_command(sample_vnf.TRAFFIC_SET_RATE, rate=20.0)
+        mq_producer = mock.Mock()
+        with mock.patch.object(helper, '_start_steady_state') as mock_start, \
+                mock.patch.object(helper, '_set_traffic_rate') as mock_rate, \
+                mock.patch.object(helper, '_get_port_counters') as \
+                mock_counters, \
+                mock.patch.object(helper, '_terminated') as mock_terminated:
+            mock_counters.side_effect = [{'xe0': (0, 0)},
+                                         {'xe0': (100, 200)}]
+            type(mock_terminated).value = mock.PropertyMock(
+                side_effect=[0, 0, 0, 1])
+            helper._run_steady_state('profile', mq_producer)
+
+        mock_start.assert_called_once_with('profile')
+        mock_rate.assert_called_once_with(20.0)
+        self.assertEqual(1, helper.client_started.value)
+        samples = helper.get_steady_state_samples()
+        self.assertEqual(1, len(samples))
+        sample = samples[0]
+        self.assertEqual(20.0, sample['rate'])
+        self.assertFalse(sample['paused'])
+        self.assertEqual(['mark', 'set_rate'],
+                         [event['command'] for event in sample['events']])
+        self.assertEqual('failover', sample['events'][0]['name'])
+        self.assertEqual(100, sample['ports']['xe0']['in_packets'])
+        self.assertEqual(200, sample['ports']['xe0']['out_packets'])
+        mq_producer.tg_method_iteration.assert_called_once_with(1,
+                                                                kpi=sample)
+        self.assertEqual([], helper.get_steady_state_samples())
+
+    def test__get_counter_deltas(self):
+        deltas = ClientResourceHelper._get_counter_deltas(
+            {'xe0': (100, 200)}, {'xe0': (300, 600), 'xe1': (10, 20)}, 2.0)
+
+        self.assertEqual({
+            'xe0': {'in_packets': 200, 'out_packets': 400,
+                    'rx_throughput_fps': 100.0, 'tx_throughput_fps': 200.0},
+            'xe1': {'in_packets': 0, 'out_packets': 0,
+                    'rx_throughput_fps': 0.0, 'tx_throughput_fps': 0.0},
+        }, deltas)
+
+    def test__apply_traffic_command(self):
+        helper = self._make_steady_state_helper()
+        helper._steady_state_ports = [0, 1]
+        helper._traffic_rate_unit = '%'
+
+        helper._apply_traffic_command(sample_vnf.TRAFFIC_PAUSE, {})
+        helper._apply_traffic_command(sample_vnf.TRAFFIC_PAUSE, {})
+        self.assertTrue(helper._traffic_paused)
+        helper._apply_traffic_command(sample_vnf.TRAFFIC_SET_RATE,
+                                      {'rate': 25.5})
+        helper._apply_traffic_command(sample_vnf.TRAFFIC_RESUME, {})
+        self.assertFalse(helper._traffic_paused)
+        helper._apply_traffic_command(sample_vnf.TRAFFIC_MARK,
+                                      {'name': 'failover'})
+
+        helper.client.pause.assert_called_once_with(ports=[0, 1])
+        helper.client.update.assert_called_once_with(ports=[0, 1],
+                                                     mult='25.5%')
+        helper.client.resume.assert_called_once_with(ports=[0, 1])
+        self.assertEqual(25.5, helper._traffic_rate)
+
+    def test__start_steady_state(self):
+        helper = self._make_steady_state_helper()
+        helper.client.get_active_ports.return_value = [0, 1]
+        traffic_profile = mock.Mock()
+        traffic_profile.config.frame_rate = 1000.0
+        traffic_profile.config.rate_unit = 'fps'
+
+        helper._start_steady_state(traffic_profile)
+        traffic_profile.execute_traffic.assert_called_once_with(helper)
+        self.assertEqual(1000.0, helper._traffic_rate)
+
+        helper._set_traffic_rate(2000)
+        helper.client.update.assert_called_once_with(ports=[0, 1],
+                                                     mult='2000pps')
+
+    def test__get_port_counters(self):
+        helper = self._make_steady_state_helper()
+        helper.client.get_stats.return_value = {
+            0: {'ipackets': 10, 'opackets': 20}}
+
+        self.assertEqual({'xe0': (10, 20), 'xe1': (0, 0)},
+                         helper._get_port_counters())
+        helper.client.get_stats.assert_called_once_with([0, 1])
+
+    def test_send_traffic_command_not_supported(self):
+        helper = self._make_steady_state_helper()
+        with self.assertRaises(y_exceptions.TrafficCommandNotSupported):
+            helper.send_traffic_command('stop')
+        self.assertTrue(helper._control_queue.empty())
+
 
 class TestRfc2544ResourceHelper(unittest.TestCase):
 
@@ -1708,25 +1877,62 @@ class TestSampleVnf(unittest.TestCase):
 
     @mock.patch("yardstick.network_services.vnf_generic.vnf.sample_vnf.time")
     def test_vnf_execute_with_queue_data(self, *args):
-        queue_size_list = [
-            1,
-            1,
-            0,
-        ]
-
         queue_get_list = [
             'hello ',
-            'world'
+            'world\r\npipe',
+            'line>'
         ]
 
         vnfd = self.VNFD['vnfd:vnfd-catalog']['vnfd'][0]
         sample_vnf = SampleVNF('vnf1', vnfd, 'task_id')
         sample_vnf.APP_NAME = 'sample1'
-        sample_vnf.q_out = mock.Mock()
-        sample_vnf.q_out.qsize.side_effect = iter(queue_size_list)
-        sample_vnf.q_out.get.side_effect = iter(queue_get_list)
+        sample_vnf.console.q_in = mock.Mock()
+        sample_vnf.console.q_out = mock.Mock()
+        sample_vnf.console.q_out.get_nowait.side_effect = six.moves.queue.Empty
+        sample_vnf.console.q_out.get.side_effect = iter(queue_get_list)
 
-        self.assertEqual(sample_vnf.vnf_execute('my command'), 'hello world')
+        self.assertEqual(sample_vnf.vnf_execute('my command'),
+                         'hello world\r\npipeline>')
+        sample_vnf.console.q_in.put.assert_called_once_with('my command\r\n')
+
+    def test_vnf_execute_many(self, *args):
+        vnfd = self.VNFD['vnfd:vnfd-catalog']['vnfd'][0]
+        sample_vnf = SampleVNF('vnf1', vnfd, 'task_id')
+        sample_vnf.console.q_in = mock.Mock()
+        sample_vnf.console.q_out = mock.Mock()
+        sample_vnf.console.q_out.get_nowait.side_effect = six.moves.queue.Empty
+        sample_vnf.console.q_out.get.side_effect = [
+            'out1\r\npipeline>out2\r\npipe', 'line>out3',
+            six.moves.queue.Empty]
+
+        self.assertEqual(['out1\r\npipeline>', 'out2\r\npipeline>',
+                          'out3', ''],
+                         sample_vnf.vnf_execute_many(
+                             ['cmd1', 'cmd2', 'cmd3', 'cmd4'], 0))
+        sample_vnf.console.q_in.put.assert_called_once_with(
+            'cmd1\r\ncmd2\r\ncmd3\r\ncmd4\r\n')
+
+    def test_collect_kpi_re(self, *args):
+        vnfd = self.VNFD['vnfd:vnfd-catalog']['vnfd'][0]
+        sample_vnf = SampleVNF('vnf1', vnfd, 'task_id')
+        sample_vnf.COLLECT_KPI = r'(\d+)'
+        pattern = sample_vnf.collect_kpi_re
+
+        self.assertIs(pattern, sample_vnf.collect_kpi_re)
+        sample_vnf.COLLECT_KPI = r'(\w+)'
+        self.assertEqual(r'(\w+)', sample_vnf.collect_kpi_re.pattern)
+
+    def test_vnf_execute_timeout(self, *args):
+        vnfd = self.VNFD['vnfd:vnfd-catalog']['vnfd'][0]
+        sample_vnf = SampleVNF('vnf1', vnfd, 'task_id')
+        sample_vnf.console.q_in = mock.Mock()
+        sample_vnf.console.q_out = mock.Mock()
+        sample_vnf.console.q_out.get_nowait.side_effect = six.moves.queue.Empty
+        sample_vnf.console.q_out.get.side_effect = [
+            'partial output', six.moves.queue.Empty]
+
+        self.assertEqual('partial output',
+                         sample_vnf.vnf_execute('my command', 0))
 
     def test_terminate_without_vnf_process(self):
         vnfd = self.VNFD['vnfd:vnfd-catalog']['vnfd'][0]
@@ -1964,6 +2170,36 @@ class TestSampleVNFTrafficGen(unittest.TestCase):
 
         sample_vnf_tg.terminate()
 
+    def test_traffic_commands(self):
+        sample_vnf_tg = SampleVNFTrafficGen('tg1', self.VNFD_0, 'task_id')
+        with mock.patch.object(sample_vnf_tg.resource_helper,
+                               'send_traffic_command') as mock_send:
+            sample_vnf_tg.set_traffic_rate(50.0)
+            sample_vnf_tg.pause_traffic()
+            sample_vnf_tg.resume_traffic()
+            sample_vnf_tg.mark_traffic_event('failover', node='node1')
+
+        mock_send.assert_has_calls([
+            mock.call(sample_vnf.TRAFFIC_SET_RATE, rate=50.0),
+            mock.call(sample_vnf.TRAFFIC_PAUSE),
+            mock.call(sample_vnf.TRAFFIC_RESUME),
+            mock.call(sample_vnf.TRAFFIC_MARK, name='failover',
+                      node='node1')])
+
+    @mock.patch.object(ctx_base.Context, 'get_physical_node_from_server',
+                       return_value='mock_node')
+    def test_collect_kpi_steady_state(self, *args):
+        sample_vnf_tg = SampleVNFTrafficGen('tg1', self.VNFD_0, 'task_id')
+        sample_vnf_tg.scenario_helper.scenario_cfg = {
+            'nodes': {sample_vnf_tg.name: 'mock_node'}}
+        resource_helper = sample_vnf_tg.resource_helper
+        resource_helper._samples_queue = six.moves.queue.Queue()
+        resource_helper._samples_queue.put({'timestamp': 1.0})
+
+        result = sample_vnf_tg.collect_kpi()
+        self.assertEqual([{'timestamp': 1.0}], result['steady_state'])
+        self.assertNotIn('steady_state', sample_vnf_tg.collect_kpi())
+
     def test__wait_for_process(self):
         sample_vnf_tg = SampleVNFTrafficGen('tg1', self.VNFD_0, 'task_id')
         with mock.patch.object(sample_vnf_tg, '_check_status',
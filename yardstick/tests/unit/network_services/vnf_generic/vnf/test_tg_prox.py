@@ -391,6 +391,7 @@ class TestProxTrafficGen(unittest.TestCase):
         mock_traffic_profile.get_traffic_definition.return_value = "64"
         mock_traffic_profile.execute_traffic.return_value = "64"
         mock_traffic_profile.params = self.TRAFFIC_PROFILE
+        mock_traffic_profile.config.steady_state = False
 
         vnfd = self.VNFD['vnfd:vnfd-catalog']['vnfd'][0]
         sut = ProxTrafficGen(NAME, vnfd, 'task_id')
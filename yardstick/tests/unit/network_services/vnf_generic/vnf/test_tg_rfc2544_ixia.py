@@ -67,10 +67,28 @@ class TestIxiaResourceHelper(unittest.TestCase):
         with mock.patch.object(ixia_rhelper, 'generate_samples'), \
                 mock.patch.object(ixia_rhelper, '_build_ports'), \
                 mock.patch.object(ixia_rhelper, '_initialize_client'), \
-                mock.patch.object(utils, 'wait_until_true'):
+                mock.patch.object(utils, 'wait_until_true') as mock_wait:
             ixia_rhelper.run_traffic(mock_tprofile)
 
         self.assertEqual('fake_samples', ixia_rhelper._queue.get())
+        self.assertEqual(1, ixia_rhelper.client.poll_interval)
+        mock_wait.assert_called_once_with(mock.ANY, timeout=20, sleep=1)
+
+    def test_run_traffic_short_duration(self):
+        mock_tprofile = mock.Mock()
+        mock_tprofile.config.duration = 2
+        mock_tprofile.get_drop_percentage.return_value = True, 'fake_samples'
+        ixia_rhelper = tg_rfc2544_ixia.IxiaResourceHelper(mock.Mock())
+        ixia_rhelper.rfc_helper = mock.Mock()
+        ixia_rhelper.vnfd_helper = mock.Mock()
+        ixia_rhelper.vnfd_helper.port_pairs.all_ports = []
+        with mock.patch.object(ixia_rhelper, 'generate_samples'), \
+                mock.patch.object(ixia_rhelper, '_build_ports'), \
+                mock.patch.object(ixia_rhelper, '_initialize_client'), \
+                mock.patch.object(utils, 'wait_until_true') as mock_wait:
+            ixia_rhelper.run_traffic(mock_tprofile)
+
+        mock_wait.assert_called_once_with(mock.ANY, timeout=4, sleep=0.2)
 
 
 @mock.patch.object(tg_rfc2544_ixia, 'ixnet_api')
@@ -483,10 +483,10 @@ class TrexResourceHelperTestCase(unittest.TestCase):
         stats = {
             10: {'rx_pps': 5, 'ipackets': 200},
             20: {'rx_pps': 10, 'ipackets': 300},
-            'latency': {1: {'latency': 'latency_port_10_pg_id_1'},
-                        2: {'latency': 'latency_port_10_pg_id_2'},
-                        3: {'latency': 'latency_port_20_pg_id_3'},
-                        4: {'latency': 'latency_port_20_pg_id_4'}}
+            'latency': {1: {'latency': {'histogram': {10: 90}}},
+                        2: {'latency': {'histogram': {20: 9, 100: 1}}},
+                        3: {'latency': {'histogram': {}}},
+                        4: {'latency': {'histogram': {}}}}
         }
         port_pg_id = rfc2544.PortPgIDMap()
         port_pg_id.add_port(10)
@@ -506,11 +506,16 @@ class TrexResourceHelperTestCase(unittest.TestCase):
         interface = output['interface1']
         self.assertEqual(5.0, interface['rx_throughput_fps'])
         self.assertEqual(200, interface['in_packets'])
-        self.assertEqual('latency_port_10_pg_id_1', interface['latency'][1])
-        self.assertEqual('latency_port_10_pg_id_2', interface['latency'][2])
+        self.assertEqual({'histogram': {10: 90}}, interface['latency'][1])
+        self.assertEqual({'histogram': {20: 9, 100: 1}},
+                         interface['latency'][2])
+        # upper bound of the histogram buckets
+        self.assertEqual({'p50': 20.223, 'p99': 30.207, 'p99_9': 200.0,
+                          'p99_99': 200.0}, interface['latency_percentiles'])
 
         interface = output['interface2']
         self.assertEqual(10.0, interface['rx_throughput_fps'])
         self.assertEqual(300, interface['in_packets'])
-        self.assertEqual('latency_port_20_pg_id_3', interface['latency'][3])
-        self.assertEqual('latency_port_20_pg_id_4', interface['latency'][4])
+        self.assertEqual({'histogram': {}}, interface['latency'][3])
+        self.assertEqual({'histogram': {}}, interface['latency'][4])
+        self.assertNotIn('latency_percentiles', interface)
@@ -18,6 +18,7 @@ import os
 
 from yardstick.common import utils
 from yardstick.benchmark.contexts import base as ctx_base
+from yardstick.network_services.helpers import config_cache
 from yardstick.network_services.vnf_generic.vnf.vfw_vnf import FWApproxVnf
 from yardstick.network_services.nfvi.resource import ResourceProfile
 from yardstick.network_services.vnf_generic.vnf.vfw_vnf import FWApproxSetupEnvHelper
@@ -282,11 +283,8 @@ pipeline>
 
         vnfd = self.VNFD['vnfd:vnfd-catalog']['vnfd'][0]
         vfw_approx_vnf = FWApproxVnf(name, vnfd, 'task_id')
-        vfw_approx_vnf.q_in = mock.MagicMock()
-        vfw_approx_vnf.q_out = mock.MagicMock()
-        vfw_approx_vnf.q_out.qsize = mock.Mock(return_value=0)
         cmd = "quit"
-        self.assertEqual(vfw_approx_vnf.vnf_execute(cmd), "")
+        self.assertEqual(vfw_approx_vnf.vnf_execute(cmd, 0), "")
 
     @mock.patch(SSH_HELPER)
     def test_get_stats(self, ssh, *args):
@@ -348,6 +346,9 @@ pipeline>
 
 class TestFWApproxSetupEnvHelper(unittest.TestCase):
 
+    @mock.patch.object(config_cache, 'memoize',
+                       side_effect=lambda key, build: build())
+    @mock.patch.object(config_cache, 'read_file')
     @mock.patch('yardstick.network_services.vnf_generic.vnf.sample_vnf.open')
     @mock.patch.object(utils, 'find_relative_file')
     @mock.patch('yardstick.network_services.vnf_generic.vnf.sample_vnf.MultiPortConfig')
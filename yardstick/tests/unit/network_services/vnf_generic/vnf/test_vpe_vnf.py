@@ -567,9 +567,7 @@ class TestVpeApproxVnf(unittest.TestCase):
         vpe_approx_vnf.scenario_helper.scenario_cfg = {
             'nodes': {vpe_approx_vnf.name: "mock"}
         }
-        vpe_approx_vnf.q_in = mock.MagicMock()
-        vpe_approx_vnf.q_out = mock.MagicMock()
-        vpe_approx_vnf.q_out.qsize = mock.Mock(return_value=0)
+        vpe_approx_vnf.vnf_execute_many = mock.Mock(return_value=[''] * 4)
         vpe_approx_vnf.resource_helper.resource = resource
 
         expected = {
@@ -596,9 +594,7 @@ class TestVpeApproxVnf(unittest.TestCase):
         vpe_approx_vnf.scenario_helper.scenario_cfg = {
             'nodes': {vpe_approx_vnf.name: "mock"}
         }
-        vpe_approx_vnf.q_in = mock.MagicMock()
-        vpe_approx_vnf.q_out = mock.MagicMock()
-        vpe_approx_vnf.q_out.qsize = mock.Mock(return_value=0)
+        vpe_approx_vnf.vnf_execute_many = mock.Mock(return_value=[''] * 4)
         vpe_approx_vnf.resource_helper.resource = resource
 
         expected = {
@@ -611,13 +607,38 @@ class TestVpeApproxVnf(unittest.TestCase):
         }
         self.assertEqual(vpe_approx_vnf.collect_kpi(), expected)
 
+    @mock.patch.object(ctx_base.Context, 'get_physical_node_from_server',
+                       return_value='mock_node')
+    @mock.patch.object(sample_vnf, 'VnfSshHelper')
+    def test_collect_kpi_stats(self, ssh, *args):
+        test_base.mock_ssh(ssh)
+
+        vpe_approx_vnf = vpe_vnf.VpeApproxVnf(NAME, self.VNFD_0, 'task_id')
+        vpe_approx_vnf.scenario_helper.scenario_cfg = {
+            'nodes': {vpe_approx_vnf.name: "mock"}
+        }
+        vpe_approx_vnf.resource_helper = mock.Mock()
+        vpe_approx_vnf.resource_helper.collect_kpi.return_value = {}
+        stats = ('Pkts in:\t{}\r\n\tPkts dropped by AH:\t{}\r\n'
+                 '\tPkts dropped by other:\t{}\r\npipeline>')
+        vpe_approx_vnf.vnf_execute_many = mock.Mock(return_value=[
+            stats.format(10, 1, 2), stats.format(20, 0, 1),
+            stats.format(30, 3, 0), ''])
+
+        result = vpe_approx_vnf.collect_kpi()
+
+        vpe_approx_vnf.vnf_execute_many.assert_called_once_with(
+            ['p 5 stats port in 0', 'p 5 stats port out 0',
+             'p 9 stats port in 0', 'p 9 stats port out 0'])
+        self.assertEqual(30, result['pkt_in_up_stream'])
+        self.assertEqual(4, result['pkt_drop_up_stream'])
+        self.assertEqual(30, result['pkt_in_down_stream'])
+        self.assertEqual(3, result['pkt_drop_down_stream'])
+
     @mock.patch.object(sample_vnf, 'VnfSshHelper')
     def test_vnf_execute(self, ssh):
         test_base.mock_ssh(ssh)
         vpe_approx_vnf = vpe_vnf.VpeApproxVnf(NAME, self.VNFD_0, 'task_id')
-        vpe_approx_vnf.q_in = mock.MagicMock()
-        vpe_approx_vnf.q_out = mock.MagicMock()
-        vpe_approx_vnf.q_out.qsize = mock.Mock(return_value=0)
         self.assertEqual(vpe_approx_vnf.vnf_execute("quit", 0), '')
 
     @mock.patch.object(sample_vnf, 'VnfSshHelper')
@@ -813,5 +834,7 @@ class TestVpeApproxVnf(unittest.TestCase):
         vpe_approx_vnf._vnf_process = mock.MagicMock()
         vpe_approx_vnf._resource_collect_stop = mock.Mock()
         vpe_approx_vnf.resource_helper = mock.MagicMock()
+        vpe_approx_vnf.vnf_execute = mock.Mock()
 
         self.assertIsNone(vpe_approx_vnf.terminate())
+        vpe_approx_vnf.vnf_execute.assert_called_once_with('quit')
@@ -19,6 +19,7 @@ import unittest
 from yardstick.benchmark.contexts import node
 from yardstick.common import constants
 from yardstick.common import exceptions
+from yardstick.common import openstack_utils
 from yardstick.orchestrator import heat
 
 
@@ -34,6 +35,8 @@ class HeatStackTestCase(unittest.TestCase):
 
     def setUp(self):
         self.stack_name = 'STACK NAME'
+        openstack_utils.clear_clients()
+        self.addCleanup(openstack_utils.clear_clients)
         with mock.patch.object(shade, 'openstack_cloud'):
             self.heatstack = heat.HeatStack(self.stack_name)
         self._mock_stack_create = mock.patch.object(self.heatstack._cloud,
@@ -16,6 +16,7 @@
 import os
 import socket
 import unittest
+from io import BytesIO
 from io import StringIO
 from itertools import count
 
@@ -220,39 +221,37 @@ class SSHTestCase(unittest.TestCase):
         m_client.close.assert_called_once_with()
         self.assertFalse(self.test_client._client)
 
-    @mock.patch("yardstick.ssh.six.moves.StringIO")
-    def test_execute(self, mock_string_io):
-        mock_string_io.side_effect = stdio = [mock.Mock(), mock.Mock()]
-        stdio[0].read.return_value = "stdout fake data"
-        stdio[1].read.return_value = "stderr fake data"
-        with mock.patch.object(self.test_client, "run", return_value=0)\
-                as mock_run:
+    @staticmethod
+    def _fake_run(*args, **kwargs):  # pylint: disable=unused-argument
+        kwargs['stdout'].extend(b"stdout fake data")
+        kwargs['stderr'].extend(b"stderr fake data")
+        return 0
+
+    def test_execute(self):
+        with mock.patch.object(self.test_client, "run",
+                               side_effect=self._fake_run) as mock_run:
             status, stdout, stderr = self.test_client.execute(
                 "cmd",
                 stdin="fake_stdin",
                 timeout=43)
         mock_run.assert_called_once_with(
-            "cmd", stdin="fake_stdin", stdout=stdio[0],
-            stderr=stdio[1], timeout=43, raise_on_error=False)
+            "cmd", stdin="fake_stdin", stdout=mock.ANY,
+            stderr=mock.ANY, timeout=43, raise_on_error=False)
         self.assertEqual(0, status)
         self.assertEqual("stdout fake data", stdout)
         self.assertEqual("stderr fake data", stderr)
 
-    @mock.patch("yardstick.ssh.six.moves.StringIO")
-    def test_execute_raise_on_error_passed(self, mock_string_io):
-        mock_string_io.side_effect = stdio = [mock.Mock(), mock.Mock()]
-        stdio[0].read.return_value = "stdout fake data"
-        stdio[1].read.return_value = "stderr fake data"
-        with mock.patch.object(self.test_client, "run", return_value=0) \
-                as mock_run:
+    def test_execute_raise_on_error_passed(self):
+        with mock.patch.object(self.test_client, "run",
+                               side_effect=self._fake_run) as mock_run:
             status, stdout, stderr = self.test_client.execute(
                 "cmd",
                 stdin="fake_stdin",
                 timeout=43,
                 raise_on_error=True)
         mock_run.assert_called_once_with(
-            "cmd", stdin="fake_stdin", stdout=stdio[0],
-            stderr=stdio[1], timeout=43, raise_on_error=True)
+            "cmd", stdin="fake_stdin", stdout=mock.ANY,
+            stderr=mock.ANY, timeout=43, raise_on_error=True)
         self.assertEqual(0, status)
         self.assertEqual("stdout fake data", stdout)
         self.assertEqual("stderr fake data", stderr)
@@ -317,8 +316,8 @@ class SSHRunTestCase(unittest.TestCase):
         mock_select.select.return_value = ([], [], [])
         self.fake_session.recv_ready.side_effect = [1, 0, 0]
         self.fake_session.recv_stderr_ready.side_effect = [1, 0]
-        self.fake_session.recv.return_value = "ok"
-        self.fake_session.recv_stderr.return_value = "error"
+        self.fake_session.recv.return_value = b"ok"
+        self.fake_session.recv_stderr.return_value = b"error"
         self.fake_session.exit_status_ready.return_value = 1
         self.fake_session.recv_exit_status.return_value = 127
         self.assertEqual((127, "ok", "error"), self.test_client.execute("cmd"))
@@ -329,8 +328,8 @@ class SSHRunTestCase(unittest.TestCase):
         mock_select.select.return_value = ([], [], [])
         self.fake_session.recv_ready.side_effect = [1, 0, 0]
         self.fake_session.recv_stderr_ready.side_effect = [1, 0]
-        self.fake_session.recv.return_value = "ok"
-        self.fake_session.recv_stderr.return_value = "error"
+        self.fake_session.recv.return_value = b"ok"
+        self.fake_session.recv_stderr.return_value = b"error"
         self.fake_session.exit_status_ready.return_value = 1
         self.fake_session.recv_exit_status.return_value = 127
 
@@ -355,17 +354,49 @@ class SSHRunTestCase(unittest.TestCase):
     def test_run_stdout(self, mock_select):
         mock_select.select.return_value = ([], [], [])
         self.fake_session.recv_ready.side_effect = [True, True, False]
-        self.fake_session.recv.side_effect = ["ok1", "ok2"]
+        self.fake_session.recv.side_effect = [b"ok1", b"ok2"]
         stdout = mock.Mock()
         self.test_client.run("cmd", stdout=stdout)
         self.assertEqual([mock.call("ok1"), mock.call("ok2")],
                          stdout.write.mock_calls)
 
+    @mock.patch("yardstick.ssh.select")
+    def test_run_stdout_split_character(self, mock_select):
+        mock_select.select.return_value = ([], [], [])
+        self.fake_session.recv_ready.side_effect = [True, True, False]
+        data = u"\u00e9t\u00e9".encode("utf-8")
+        self.fake_session.recv.side_effect = [data[:1], data[1:]]
+        stdout = StringIO()
+        self.test_client.run("cmd", stdout=stdout)
+        self.assertEqual(u"\u00e9t\u00e9", stdout.getvalue())
+
+    @mock.patch("yardstick.ssh.select")
+    def test_run_stdout_bytearray(self, mock_select):
+        mock_select.select.return_value = ([], [], [])
+        self.fake_session.recv_ready.side_effect = [True, True, False]
+        self.fake_session.recv.side_effect = [b"ok1", b"ok2"]
+        stdout = bytearray()
+        self.test_client.run("cmd", stdout=stdout)
+        self.assertEqual(b"ok1ok2", stdout)
+        self.assertEqual(6, self.test_client.run_stats['stdout'])
+        self.fake_transport.open_session.assert_called_with(
+            window_size=ssh.SSH.WINDOW_SIZE)
+
+    @mock.patch("yardstick.ssh.select")
+    def test_run_stdout_binary_stream(self, mock_select):
+        mock_select.select.return_value = ([], [], [])
+        self.fake_session.recv_ready.side_effect = [True, True, False]
+        data = u"\u00e9t\u00e9".encode("utf-8")
+        self.fake_session.recv.side_effect = [data[:1], data[1:]]
+        stdout = BytesIO()
+        self.test_client.run("cmd", stdout=stdout)
+        self.assertEqual(data, stdout.getvalue())
+
     @mock.patch("yardstick.ssh.select")
     def test_run_stderr(self, mock_select):
         mock_select.select.return_value = ([], [], [])
         self.fake_session.recv_stderr_ready.side_effect = [True, False]
-        self.fake_session.recv_stderr.return_value = "error"
+        self.fake_session.recv_stderr.return_value = b"error"
         stderr = mock.Mock()
         self.test_client.run("cmd", stderr=stderr)
         stderr.write.assert_called_once_with("error")
@@ -394,6 +425,7 @@ class SSHRunTestCase(unittest.TestCase):
                       call(encodeutils.safe_encode("line2", "utf-8")),
                       call(encodeutils.safe_encode("e2", "utf-8"))]
         self.assertEqual(send_calls, self.fake_session.send.mock_calls)
+        self.assertEqual(10, self.test_client.run_stats['stdin'])
 
     @mock.patch("yardstick.ssh.select")
     def test_run_stdin_keep_open(self, mock_select):